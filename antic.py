@@ -0,0 +1,272 @@
+import argparse
+import sys
+
+import numpy as np
+
+from charset import BAK, PF0, PF1, PF2, CHARSET_SIZE, ROM_FONT, Font, load_charset_file, render_text
+from instrument import span, count
+
+# ANTIC display list interpreter and screen renderer.
+#
+# interpret() walks a display list in a 64K memory image and returns one
+# ScanLine per TV scanline: the ANTIC mode, the address the line's data is
+# fetched from, its width in bytes and, for multi-scanline modes, which row
+# of the mode line it is. compile_layout() groups consecutive lines of the
+# same mode and precomputes the memory gather indices for each group, so
+# render() is one gather plus one lookup-table pass per group:
+#
+#   memory = load_memory([(0x0600, dlist), (0x8150, bitmap)])
+#   layout = compile_layout(interpret(memory, 0x0600))
+#   indices = render(layout, memory)        # (scanlines, 320) color registers
+#   rgb = to_rgb(indices)
+#
+# The layout only depends on the display list, so it can be reused for every
+# frame that shares it (all the OP* pictures use DLIST.BIN).
+#
+# Rendered pixels are color register numbers on a 320 pixel (hi-res) grid:
+#   0 = COLBK, 1 = COLPF0, 2 = COLPF1, 3 = COLPF2, 4 = COLPF3
+# which matches the Mode 15 pixel values used by convert_images.py.
+#
+# The interpreter handles every mode (2-F), blank lines, JMP, JVB, LMS, the
+# 4K screen memory wrap and the 1K display list wrap. The renderer draws
+# every text and bitmap mode; text modes go through the glyph atlas in
+# charset.py. Fine scrolling and DLIs are ignored.
+
+# Playfield width (DMACTL bits 0-1) -> bytes per line for the 40 byte modes
+PLAYFIELD_BYTES = {"narrow": 32, "normal": 40, "wide": 48}
+
+# mode -> (bits per pixel, hi-res pixels per pixel, scanlines per mode line)
+# Bytes per line = playfield width in hi-res pixels / pixel width * bpp / 8.
+BITMAP_MODES = {
+    0x8: (2, 8, 8),
+    0x9: (1, 4, 4),
+    0xA: (2, 4, 4),
+    0xB: (1, 2, 2),
+    0xC: (1, 2, 1),
+    0xD: (2, 2, 2),
+    0xE: (2, 2, 1),
+    0xF: (1, 1, 1),
+}
+# mode -> (chars per normal line, scanlines per mode line)
+TEXT_MODES = {
+    0x2: (40, 8),
+    0x3: (40, 10),
+    0x4: (40, 8),
+    0x5: (40, 16),
+    0x6: (20, 8),
+    0x7: (20, 16),
+}
+
+MAX_SCANLINES = 240
+
+class ScanLine:
+    __slots__ = ("mode", "address", "width", "row")
+
+    def __init__(self, mode, address, width, row):
+        self.mode = mode        # 0 for blank lines
+        self.address = address  # first byte fetched for this mode line
+        self.width = width      # bytes fetched per mode line
+        self.row = row          # scanline within the mode line
+
+    def __repr__(self):
+        return f"ScanLine(mode={self.mode:X}, address=${self.address:04X}, width={self.width}, row={self.row})"
+
+def load_memory(segments, size=0x10000):
+    # segments: [(address, bytes), ...] -> flat uint8 memory image
+    memory = np.zeros(size, dtype=np.uint8)
+    for address, data in segments:
+        data = np.frombuffer(bytes(data), dtype=np.uint8)
+        end = min(size, address + len(data))
+        memory[address:end] = data[:end - address]
+    return memory
+
+def line_bytes(mode, playfield="normal"):
+    hires = PLAYFIELD_BYTES[playfield] * 8
+    if mode in TEXT_MODES:
+        return TEXT_MODES[mode][0] * PLAYFIELD_BYTES[playfield] // 40
+    bpp, pixel_width, _ = BITMAP_MODES[mode]
+    return hires // pixel_width * bpp // 8
+
+SCAN_BLOCK = 0x1000     # memory scan counter: 12 bits
+DLIST_BLOCK = 0x400     # display list counter: 10 bits
+
+def _advance(address, n, block=SCAN_BLOCK):
+    # ANTIC's counters don't carry into the upper address bits, so they wrap
+    # inside a 4K (screen memory) or 1K (display list) block
+    return (address & (0xFFFF ^ (block - 1))) | ((address + n) & (block - 1))
+
+def _operand(memory, pc):
+    # The address after a JMP/JVB/LMS instruction, read through the display
+    # list counter
+    return int(memory[_advance(pc, 1, DLIST_BLOCK)]) | (int(memory[_advance(pc, 2, DLIST_BLOCK)]) << 8)
+
+def interpret(memory, start, playfield="normal", max_scanlines=MAX_SCANLINES):
+    # Walk the display list at start until JVB (or max_scanlines).
+    lines = []
+    pc = start
+    scan = 0
+    jumps = 0
+    while len(lines) < max_scanlines:
+        ins = int(memory[pc])
+        mode = ins & 0x0F
+        if mode == 0:
+            # Blank lines: bits 4-6 + 1
+            for _ in range(((ins >> 4) & 0x07) + 1):
+                lines.append(ScanLine(0, 0, 0, 0))
+            pc = _advance(pc, 1, DLIST_BLOCK)
+        elif mode == 1:
+            target = _operand(memory, pc)
+            if ins & 0x40:
+                # JVB: wait for vertical blank, the frame ends here
+                break
+            jumps += 1
+            if jumps > 256:
+                raise ValueError(f"display list at ${start:04X} loops without JVB")
+            pc = target
+        else:
+            if ins & 0x40:
+                scan = _operand(memory, pc)
+                pc = _advance(pc, 3, DLIST_BLOCK)
+            else:
+                pc = _advance(pc, 1, DLIST_BLOCK)
+            width = line_bytes(mode, playfield)
+            height = TEXT_MODES[mode][1] if mode in TEXT_MODES else BITMAP_MODES[mode][2]
+            for row in range(height):
+                lines.append(ScanLine(mode, scan, width, row))
+            scan = _advance(scan, width)
+        count("dl_instructions")
+    return lines[:max_scanlines]
+
+def interpret_bytes(dlist, base=None, memory=None, playfield="normal"):
+    # Interpret a display list given as a file (e.g. DLIST.BIN). Without a
+    # base address, the JVB target at the end of the list is used, which is
+    # where the list expects to live.
+    if base is None:
+        base = 0
+        if len(dlist) >= 3 and dlist[-3] == 0x41:
+            base = dlist[-2] | (dlist[-1] << 8)
+    if memory is None:
+        memory = np.zeros(0x10000, dtype=np.uint8)
+    memory = memory.copy()
+    end = min(0x10000, base + len(dlist))
+    memory[base:end] = np.frombuffer(bytes(dlist), dtype=np.uint8)[:end - base]
+    return interpret(memory, base, playfield)
+
+# --- Rendering ---
+
+def _bitmap_lut(bpp, pixel_width, mode):
+    # byte -> hi-res pixels (color registers) for one bitmap mode
+    values = np.arange(256, dtype=np.uint8)
+    if bpp == 2:
+        shifts = np.array([6, 4, 2, 0], dtype=np.uint8)
+        pixels = (values[:, None] >> shifts) & 0x03       # 00 BAK, 01 PF0, 10 PF1, 11 PF2
+    else:
+        bits = np.unpackbits(values[:, None], axis=1)
+        if mode == 0xF:
+            pixels = np.where(bits, PF1, PF2)             # PF1 luminance on PF2
+        else:
+            pixels = np.where(bits, PF0, BAK)
+    return np.repeat(pixels, pixel_width, axis=1).astype(np.uint8)
+
+_LUTS = {mode: _bitmap_lut(bpp, pw, mode) for mode, (bpp, pw, _) in BITMAP_MODES.items()}
+
+class Group:
+    __slots__ = ("mode", "top", "height", "addresses", "scanlines")
+
+    def __init__(self, mode, top, height, addresses, scanlines):
+        self.mode = mode
+        self.top = top              # first output scanline
+        self.height = height        # output scanlines
+        self.addresses = addresses  # (mode lines, bytes) gather indices
+        self.scanlines = scanlines  # scanlines per mode line
+
+def compile_layout(lines, playfield="normal"):
+    groups = []
+    i = 0
+    while i < len(lines):
+        mode = lines[i].mode
+        j = i
+        while j < len(lines) and lines[j].mode == mode:
+            j += 1
+        if mode:
+            first_rows = [ln for ln in lines[i:j] if ln.row == 0]
+            width = first_rows[0].width
+            base = np.array([ln.address for ln in first_rows], dtype=np.int64)
+            offsets = np.arange(width, dtype=np.int64)
+            addresses = (base[:, None] & 0xF000) | ((base[:, None] + offsets) & 0x0FFF)
+            per_line = TEXT_MODES[mode][1] if mode in TEXT_MODES else BITMAP_MODES[mode][2]
+            groups.append(Group(mode, i, j - i, addresses, per_line))
+        i = j
+    return {"groups": groups, "height": len(lines), "width": PLAYFIELD_BYTES[playfield] * 8}
+
+def font_at(memory, chbase=0xE0):
+    # Character set at CHBASE * 256. Memory images built from files have no
+    # OS ROM, so an empty $E000 falls back to the ROM font.
+    start = chbase << 8
+    data = memory[start:start + CHARSET_SIZE]
+    if chbase == 0xE0 and not data.any():
+        return ROM_FONT
+    return Font(data)
+
+def render(layout, memory, chbase=0xE0, font=None):
+    out = np.zeros((layout["height"], layout["width"]), dtype=np.uint8)
+    for g in layout["groups"]:
+        data = memory[g.addresses]                       # (mode lines, bytes)
+        if g.mode in TEXT_MODES:
+            if font is None:
+                font = font_at(memory, chbase)
+            pixels = render_text(data, font, g.mode)
+        else:
+            pixels = _LUTS[g.mode][data].reshape(len(data), -1)
+            pixels = np.repeat(pixels, g.scanlines, axis=0)
+        out[g.top:g.top + g.height, :pixels.shape[1]] = pixels[:g.height]
+    count("frames_rendered")
+    return out
+
+def to_rgb(indices, colors=None):
+    # Color registers -> RGB. Defaults to the palette used by convert_images.
+    if colors is None:
+        colors = [(0, 0, 0), (255, 180, 140), (80, 80, 255), (255, 255, 255), (255, 255, 255)]
+    lut = np.array(colors, dtype=np.uint8)
+    return lut[indices]
+
+def render_frames(layout, memories, chbase=0xE0, font=None):
+    # Batch thumbnails: one layout, many memory images
+    with span("render_frames", frames=len(memories)):
+        return [render(layout, memory, chbase, font) for memory in memories]
+
+def main():
+    parser = argparse.ArgumentParser(description="Render an Atari screen from a display list and memory.")
+    parser.add_argument("dlist", help="display list file, e.g. extracted/DLIST.BIN")
+    parser.add_argument("--base", type=lambda s: int(s, 0), default=None,
+                        help="address of the display list (default: its JVB target)")
+    parser.add_argument("--load", action="append", default=[], metavar="ADDR:FILE",
+                        help="load FILE into memory at ADDR, e.g. 0x8150:extracted/TITLE2")
+    parser.add_argument("--chbase", type=lambda s: int(s, 0), default=0xE0)
+    parser.add_argument("--font", help="character set file for text modes, e.g. extracted/CARD.SET")
+    parser.add_argument("--playfield", choices=PLAYFIELD_BYTES, default="normal")
+    parser.add_argument("--out", help="write a PNG")
+    args = parser.parse_args()
+
+    with open(args.dlist, "rb") as f:
+        dlist = f.read()
+    segments = []
+    for item in args.load:
+        addr, _, path = item.partition(":")
+        with open(path, "rb") as f:
+            segments.append((int(addr, 0), f.read()))
+    memory = load_memory(segments)
+
+    lines = interpret_bytes(dlist, args.base, memory, args.playfield)
+    for n, ln in enumerate(lines):
+        if ln.mode and ln.row == 0:
+            print(f"{n:3d}: mode {ln.mode:X} ${ln.address:04X} {ln.width} bytes")
+    if args.out:
+        from PIL import Image
+        font = load_charset_file(args.font) if args.font else None
+        indices = render(compile_layout(lines, args.playfield), memory, args.chbase, font)
+        Image.fromarray(to_rgb(indices)).save(args.out)
+        print(f"Saved {args.out} ({indices.shape[1]}x{indices.shape[0]})", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import codecs
+
+# ATASCII <-> Unicode codec.
+#
+# Registered as "atascii" on import, so the tools can use
+# data.decode("atascii") / text.encode("atascii"). Decoding and encoding go
+# through codecs.charmap_*, which run in C.
+#
+#   00-1F  graphics characters (hearts, box drawing, arrows)
+#   20-5F  ASCII
+#   60     diamond, 61-7A a-z, 7B spade, 7C |
+#   7D-7F  clear screen, backspace, tab arrows
+#   80-FF  inverse video of 00-7F. Unicode has no inverse video, so these map
+#          to the private use area U+E080-U+E0FF, except 9B (EOL) -> "\n".
+#
+# Every byte maps to a distinct character, so decode/encode round-trips.
+
+_GRAPHICS = (
+    "♥┣┃┛┫┓╱╲"   # 00-07
+    "◢▗◣▝▘▔▁▖"   # 08-0F
+    "♣┏━╋●▄▎┳"   # 10-17
+    "┻▌┗␛↑↓←→"   # 18-1F
+)
+
+EOL = 0x9B
+INVERSE_BASE = 0xE000
+
+DECODING_TABLE = (
+    _GRAPHICS
+    + "".join(chr(c) for c in range(0x20, 0x60))
+    + "♦"
+    + "".join(chr(c) for c in range(0x61, 0x7B))
+    + "♠|↰◀▶"
+    + "".join("\n" if c == EOL else chr(INVERSE_BASE + c) for c in range(0x80, 0x100))
+)
+assert len(DECODING_TABLE) == 256
+
+ENCODING_TABLE = codecs.charmap_build(DECODING_TABLE)
+
+class Codec(codecs.Codec):
+    def encode(self, text, errors="strict"):
+        return codecs.charmap_encode(text, errors, ENCODING_TABLE)
+
+    def decode(self, data, errors="strict"):
+        return codecs.charmap_decode(data, errors, DECODING_TABLE)
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    def encode(self, text, final=False):
+        return codecs.charmap_encode(text, self.errors, ENCODING_TABLE)[0]
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+    def decode(self, data, final=False):
+        return codecs.charmap_decode(data, self.errors, DECODING_TABLE)[0]
+
+class StreamWriter(Codec, codecs.StreamWriter):
+    pass
+
+class StreamReader(Codec, codecs.StreamReader):
+    pass
+
+CODEC_INFO = codecs.CodecInfo(
+    name="atascii",
+    encode=Codec().encode,
+    decode=Codec().decode,
+    incrementalencoder=IncrementalEncoder,
+    incrementaldecoder=IncrementalDecoder,
+    streamwriter=StreamWriter,
+    streamreader=StreamReader,
+)
+
+def _search(name):
+    if name.replace("-", "_") == "atascii":
+        return CODEC_INFO
+    return None
+
+codecs.register(_search)
+
+def decode(data):
+    return codecs.charmap_decode(data, "strict", DECODING_TABLE)[0]
+
+def encode(text):
+    return codecs.charmap_encode(text, "strict", ENCODING_TABLE)[0]
+
+def strip_inverse(text):
+    # Map inverse video characters back to their normal form (EOL stays "\n")
+    return text.translate(_NORMAL_VIDEO)
+
+_NORMAL_VIDEO = {INVERSE_BASE + c: DECODING_TABLE[c - 0x80] for c in range(0x80, 0x100) if c != EOL}
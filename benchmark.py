@@ -0,0 +1,275 @@
+import argparse
+import io
+import json
+import os
+import pickle
+import platform
+import random
+import sys
+import tempfile
+import time
+
+from extract_atr import read_directory, read_file, walk_chain
+from decrypt_images import find_seed, decrypt
+from convert_images import unpack_mode15, pack_mode15
+from dump_basic import iter_lines, decode_basic_line
+from disasm_6502 import iter_segments, disassemble_block
+from filetype import classify_batch
+from framehash import hash_frames
+from generate_corpus import make_encrypted_frame, make_basic, make_xex, build_disk
+
+# Scaling benchmark for the Python tool chain.
+#
+# Every workload is synthetic and generated from a fixed seed, so two runs on
+# different machines (or before/after an optimization) time exactly the same
+# bytes. A scale of 1 is roughly the amount of data found on one single
+# density disk (Strip Poker.atr): a handful of encrypted Mode 15 frames, one
+# tokenized BASIC program and one binary.
+#
+#   python3 benchmark.py run --out bench.json
+#   python3 benchmark.py compare baseline.json bench.json --threshold 0.15
+
+BENCH_VERSION = 1
+DEFAULT_SEED = 1982
+DEFAULT_SCALES = [1, 10, 1000]
+
+SECTOR_SIZE = 128
+FRAMES_PER_DISK = 10
+BASIC_SIZE = 12000
+XEX_SIZE = 6000
+CHUNK_DISKS = 25       # disks held in memory at once
+
+def make_workload(seed, scale, tmp):
+    # Generates the workload in chunks of CHUNK_DISKS disks and spills each
+    # chunk to tmp (ATR images plus a pickle of the rest), so memory stays
+    # flat as the scale grows. Returns the chunk list for load_chunks().
+    rng = random.Random(seed * 1000003 + scale)
+    chunks = []
+    for first in range(0, scale, CHUNK_DISKS):
+        chunk = {"disk_paths": [], "frames": [], "basic": [], "xex": [], "pixels": []}
+        for d in range(first, min(scale, first + CHUNK_DISKS)):
+            files = []
+            for n in range(FRAMES_PER_DISK):
+                plain, key, encrypted = make_encrypted_frame(rng)
+                chunk["frames"].append((plain, key, encrypted))
+                chunk["pixels"].append((bytes(unpack_mode15(plain)), key))
+                files.append((f"OP{n // 5 + 1}.{n % 5 + 1}", encrypted))
+            chunk["basic"].append(make_basic(rng, BASIC_SIZE))
+            chunk["xex"].append(make_xex(rng, XEX_SIZE))
+            files.append(("SP", chunk["basic"][-1]))
+            files.append(("AUTORUN.SYS", chunk["xex"][-1]))
+            path = os.path.join(tmp, f"disk{d:05d}.atr")
+            with open(path, "wb") as f:
+                f.write(build_disk(files)[0])
+            chunk["disk_paths"].append(path)
+        path = os.path.join(tmp, f"chunk{len(chunks):04d}.pickle")
+        with open(path, "wb") as f:
+            pickle.dump(chunk, f, pickle.HIGHEST_PROTOCOL)
+        chunks.append(path)
+    return chunks
+
+def load_chunks(chunks):
+    # Yields one workload dict per chunk, with the disk images read back in
+    for path in chunks:
+        with open(path, "rb") as f:
+            work = pickle.load(f)
+        work["disks"] = []
+        for disk_path in work["disk_paths"]:
+            with open(disk_path, "rb") as f:
+                work["disks"].append(f.read())
+        yield work
+
+# --- Stages ---
+# Each stage takes one workload chunk and returns (bytes processed, items processed).
+
+def stage_atr_extract(work):
+    total = 0
+    files = 0
+    for path in work["disk_paths"]:
+        with open(path, "rb") as f:
+            f.read(16)
+            for name, start, flag in read_directory(f):
+                total += len(read_file(f, start))
+                files += 1
+    return total, files
+
+def stage_sector_chain(work):
+    sectors = 0
+    for image in work["disks"]:
+        f = io.BytesIO(image)
+        for name, start, flag in read_directory(f):
+            sectors += len(walk_chain(f, start))
+    return sectors * SECTOR_SIZE, sectors
+
+def stage_seed_search(work):
+    for plain, key, encrypted in work["frames"]:
+        find_seed(encrypted)
+    return len(work["frames"]) * 256 * 100, len(work["frames"])
+
+def stage_mode15_decode(work):
+    total = 0
+    for plain, key, encrypted in work["frames"]:
+        unpack_mode15(decrypt(encrypted, key))
+        total += len(encrypted)
+    return total, len(work["frames"])
+
+def stage_mode15_encode(work):
+    total = 0
+    for pixels, key in work["pixels"]:
+        decrypt(pack_mode15(pixels), key)
+        total += len(pixels) // 4
+    return total, len(work["pixels"])
+
+def stage_basic_detokenize(work):
+    total = 0
+    lines = 0
+    for prog in work["basic"]:
+        for ln, line_data in iter_lines(prog):
+            decode_basic_line(line_data)
+            lines += 1
+        total += len(prog)
+    return total, lines
+
+def stage_disasm(work):
+    total = 0
+    segments = 0
+    for xex in work["xex"]:
+        for start, end, seg_data in iter_segments(xex):
+            disassemble_block(seg_data, start)
+            segments += 1
+        total += len(xex)
+    return total, segments
+
+def stage_classify(work):
+    blobs = [enc for _, _, enc in work["frames"]] + work["basic"] + work["xex"]
+    classify_batch(blobs)
+    return sum(len(b) for b in blobs), len(blobs)
+
+def stage_frame_hash(work):
+    frames = [plain for plain, _, _ in work["frames"]]
+    hash_frames(frames)
+    return sum(len(f) for f in frames), len(frames)
+
+STAGES = {
+    "atr_extract": stage_atr_extract,
+    "sector_chain": stage_sector_chain,
+    "seed_search": stage_seed_search,
+    "mode15_decode": stage_mode15_decode,
+    "mode15_encode": stage_mode15_encode,
+    "basic_detokenize": stage_basic_detokenize,
+    "disasm": stage_disasm,
+    "classify": stage_classify,
+    "frame_hash": stage_frame_hash,
+}
+
+# --- Runner ---
+
+def time_stage(fn, chunks, repeat):
+    # Only the stage itself is timed, not loading the chunks
+    best = None
+    for _ in range(repeat):
+        elapsed = 0.0
+        nbytes = items = 0
+        for work in load_chunks(chunks):
+            t0 = time.perf_counter()
+            b, i = fn(work)
+            elapsed += time.perf_counter() - t0
+            nbytes += b
+            items += i
+        if best is None or elapsed < best:
+            best = elapsed
+    best = max(best, 1e-9)
+    return {
+        "seconds": best,
+        "bytes": nbytes,
+        "items": items,
+        "bytes_per_sec": nbytes / best,
+        "items_per_sec": items / best,
+    }
+
+def run(scales, stages, seed, repeat):
+    results = {name: {} for name in stages}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as tmp:
+            print(f"Generating workload x{scale}...", file=sys.stderr)
+            chunks = make_workload(seed, scale, tmp)
+            for name in stages:
+                # Big workloads are only timed once; small ones take the best of N.
+                r = time_stage(STAGES[name], chunks, repeat if scale < 100 else 1)
+                results[name][str(scale)] = r
+                print(f"{name:<18} x{scale:<5} {r['seconds']:9.4f}s "
+                      f"{r['bytes_per_sec'] / 1e6:10.3f} MB/s {r['items_per_sec']:12.1f} items/s",
+                      file=sys.stderr)
+    return {
+        "version": BENCH_VERSION,
+        "seed": seed,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+
+def compare(baseline, current, threshold):
+    # A stage regresses when its throughput dropped by more than threshold
+    # (0.10 = 10% slower) at any scale measured in both files.
+    regressions = []
+    for name, scales in sorted(current["results"].items()):
+        for scale, r in sorted(scales.items(), key=lambda kv: int(kv[0])):
+            old = baseline["results"].get(name, {}).get(scale)
+            if old is None:
+                continue
+            ratio = r["bytes_per_sec"] / old["bytes_per_sec"]
+            status = "ok"
+            if ratio < 1.0 - threshold:
+                status = "REGRESSION"
+                regressions.append((name, scale, ratio))
+            print(f"{name:<18} x{scale:<5} {ratio:7.2f}x  {status}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ATR / image / BASIC / 6502 tools.")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_run = sub.add_parser("run", help="run the benchmark and write JSON results")
+    p_run.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                       help="comma separated workload sizes in disks (default 1,10,1000)")
+    p_run.add_argument("--stages", default=",".join(STAGES),
+                       help="comma separated stage names")
+    p_run.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    p_run.add_argument("--repeat", type=int, default=3)
+    p_run.add_argument("--out", default="-", help="output JSON file (default stdout)")
+
+    p_cmp = sub.add_parser("compare", help="compare two result files")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=0.10,
+                       help="allowed throughput drop before failing (default 0.10)")
+
+    args = parser.parse_args()
+
+    if args.cmd == "run":
+        stages = [s for s in args.stages.split(",") if s]
+        for s in stages:
+            if s not in STAGES:
+                parser.error(f"unknown stage {s!r} (choose from {', '.join(STAGES)})")
+        scales = [int(s) for s in args.scales.split(",") if s]
+        result = run(scales, stages, args.seed, args.repeat)
+        text = json.dumps(result, indent=2)
+        if args.out == "-":
+            print(text)
+        else:
+            with open(args.out, "w") as f:
+                f.write(text + "\n")
+            print(f"Saved {args.out}", file=sys.stderr)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} stage(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
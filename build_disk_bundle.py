@@ -0,0 +1,146 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import zlib
+
+from convert_images import unpack_mode15
+from decrypt_images import decrypt_frame
+from extract_atr import DiskImage
+from filetype import classify_batch, BITMAP, ENCRYPTED_BITMAP, BITMAP_SIZE
+from instrument import span, count, setup_logging
+
+log = logging.getLogger(__name__)
+
+# Build step for the web editors: split an ATR image into per-file chunks
+# plus a small manifest, so the editor fetches what the user opens instead
+# of parsing the whole disk as inline base64 at startup.
+#
+#   python3 build_disk_bundle.py "Strip Poker.atr" --out vite-editor/public/disks/strip-poker
+#
+# Output:
+#   manifest.json       disk geometry and one entry per file (start sector,
+#                       sector count, flag, kind, chunks)
+#   chunks/<sha256>.z   zlib compressed chunk, named by the SHA-256 of its
+#                       uncompressed bytes (so unchanged chunks keep their
+#                       URL and cache entry across builds and disks)
+#
+# Every file gets a "data" chunk with its raw bytes. Mode 15 frames also get
+# a "frame" chunk: 160 x 140 bytes, one color index (0-3) per pixel, already
+# decrypted, with the seed and the 5 byte footer in the manifest so the
+# editor can re-encrypt on save. The whole image is an "atr" chunk, only
+# needed when the editor writes a modified disk.
+#
+# Chunks are zlib streams, which the browser's DecompressionStream("deflate")
+# reads directly; vite-editor/src/disk-bundle.js is the loader.
+
+BUNDLE_FORMAT = 1
+FRAME_WIDTH = 160
+
+def write_chunk(out_dir, data, level=9):
+    # Returns the manifest entry for one chunk; skips the write if a chunk
+    # with the same content is already there.
+    digest = hashlib.sha256(data).hexdigest()
+    name = f"chunks/{digest}.z"
+    path = os.path.join(out_dir, name)
+    if os.path.exists(path):
+        csize = os.path.getsize(path)
+        count("chunks_reused")
+    else:
+        packed = zlib.compress(bytes(data), level)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(packed)
+        os.replace(tmp, path)
+        csize = len(packed)
+        count("chunks_written")
+        count("chunk_bytes", csize)
+    return {"chunk": name, "sha256": digest, "size": len(data), "csize": csize}
+
+def frame_entry(out_dir, data, result, name):
+    # Decrypted color index buffer for one Mode 15 frame
+    seed = None
+    plain = data
+    if result.kind == ENCRYPTED_BITMAP:
+        plain, seed = decrypt_frame(data, name, result.details["seed"])
+    height = min(len(plain), BITMAP_SIZE) // (FRAME_WIDTH // 4)
+    pixels = bytes(unpack_mode15(plain[:height * FRAME_WIDTH // 4]))
+    entry = write_chunk(out_dir, pixels)
+    entry.update({"width": FRAME_WIDTH, "height": height, "seed": seed,
+                  "footer": bytes(data[BITMAP_SIZE:]).hex()})
+    return entry
+
+def build_bundle(atr_path, out_dir, level=9):
+    os.makedirs(os.path.join(out_dir, "chunks"), exist_ok=True)
+    with open(atr_path, "rb") as f:
+        image = f.read()
+    with DiskImage(image) as disk:
+        entries = list(disk.directory)     # deleted slots left out
+        blobs = []
+        for e in entries:
+            with span("extract_file", file=e.filename):
+                blobs.append(bytes(disk.read_file(e)))
+
+    results = classify_batch(blobs)
+    files = []
+    for e, data, result in zip(entries, blobs, results):
+        fname = e.filename
+        with span("bundle_file", file=fname, kind=result.kind):
+            entry = {"name": fname, "start": e.start, "sectors": e.sectors, "flag": e.flag,
+                     "kind": result.kind, "data": write_chunk(out_dir, data, level)}
+            if result.kind in (BITMAP, ENCRYPTED_BITMAP):
+                entry["frame"] = frame_entry(out_dir, data, result, fname)
+        log.debug(f"{fname}: {result.kind}, {len(data)} bytes")
+        files.append(entry)
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "name": os.path.basename(atr_path),
+        "sector_size": disk.sector_size,
+        "sector_count": disk.sector_count,
+        "atr": write_chunk(out_dir, image, level),
+        "files": files,
+    }
+    tmp = os.path.join(out_dir, "manifest.json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, os.path.join(out_dir, "manifest.json"))
+    count("files_bundled", len(files))
+    return manifest
+
+def prune(out_dir, manifest):
+    # Delete chunks the manifest no longer references (one disk per out_dir)
+    used = {manifest["atr"]["chunk"]}
+    for entry in manifest["files"]:
+        used.add(entry["data"]["chunk"])
+        if "frame" in entry:
+            used.add(entry["frame"]["chunk"])
+    removed = 0
+    for name in os.listdir(os.path.join(out_dir, "chunks")):
+        if f"chunks/{name}" not in used:
+            os.unlink(os.path.join(out_dir, "chunks", name))
+            removed += 1
+    return removed
+
+def main():
+    parser = argparse.ArgumentParser(description="Split an ATR image into a chunked asset bundle for the web editor.")
+    parser.add_argument("atr")
+    parser.add_argument("--out", required=True, help="bundle directory, e.g. vite-editor/public/disks/strip-poker")
+    parser.add_argument("--level", type=int, default=9, help="zlib level (default 9)")
+    parser.add_argument("--prune", action="store_true", help="delete chunks from earlier builds")
+    args = parser.parse_args()
+    setup_logging()
+
+    manifest = build_bundle(args.atr, args.out, args.level)
+    chunks = [manifest["atr"]] + [e["data"] for e in manifest["files"]] + \
+             [e["frame"] for e in manifest["files"] if "frame" in e]
+    raw = sum(c["size"] for c in chunks)
+    packed = sum(c["csize"] for c in chunks)
+    log.info(f"{manifest['name']}: {len(manifest['files'])} files, {len(chunks)} chunks, "
+             f"{raw / 1024:.1f} KB -> {packed / 1024:.1f} KB")
+    if args.prune:
+        log.info(f"Pruned {prune(args.out, manifest)} old chunks")
+
+if __name__ == "__main__":
+    main()
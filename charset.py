@@ -0,0 +1,208 @@
+import argparse
+import sys
+
+import numpy as np
+
+from xor_cipher import decrypt
+from instrument import count
+
+# Atari character sets as precomputed glyph atlases, and vectorized
+# character mode rendering.
+#
+# A Font holds every glyph of a 1024 byte character set unpacked once:
+#   bits   (128, 8, 8)  one bit per pixel (modes 2, 3, 6, 7)
+#   pairs  (128, 8, 4)  two bits per pixel (modes 4, 5)
+#   tall   (128, 10, 8) mode 3 rows, with the lowercase descender layout
+# so drawing a screen of character codes is one fancy-indexing gather into
+# the atlas plus a reshape, with no per-character loop:
+#
+#   font = load_charset_file("extracted/CARD.SET")
+#   pixels = render_text(codes, font, mode=4)   # codes: (rows, columns) uint8
+#
+# Pixels are color register numbers, the same as antic.py:
+#   0 = COLBK, 1 = COLPF0, 2 = COLPF1, 3 = COLPF2, 4 = COLPF3
+#
+# Glyphs are in ANTIC internal order (0 = space, 33 = 'A', 64 = heart, ...).
+# CARD.SET on the game disk is stored with the same rolling XOR as the OP*
+# pictures (seed 0x2F); load_charset_file() detects and removes it.
+
+BAK, PF0, PF1, PF2, PF3 = range(5)
+
+CHARSET_SIZE = 1024
+
+# Reproduction of the Atari 400/800 OS ROM character set ($E000), 8 bytes per
+# glyph in internal order. Use load_rom_charset() on an OS ROM image for the
+# exact bytes.
+ROM_CHARSET_HEX = (
+    # 00-1F: space ! " # $ % & ' ( ) * + , - . / 0-9 : ; < = > ?
+    "0000000000000000" "0018181818001800" "0066666600000000" "0066ff6666ff6600"
+    "183e603c067c1800" "00666c1830664600" "1c361c386f663b00" "0018181800000000"
+    "000e1c18181c0e00" "0070381818387000" "00663cff3c660000" "0018187e18180000"
+    "0000000000181830" "0000007e00000000" "0000000000181800" "00060c1830604000"
+    "003c666e76663c00" "0018381818187e00" "003c660c18307e00" "007e0c180c663c00"
+    "000c1c3c6c7e0c00" "007e607c06663c00" "003c607c66663c00" "007e060c18303000"
+    "003c663c66663c00" "003c663e060c3800" "0000181800181800" "0000181800181830"
+    "060c1830180c0600" "00007e00007e0000" "6030180c18306000" "003c660c18001800"
+    # 20-3F: @ A-Z [ \ ] ^ _
+    "003c666e6e603e00" "00183c66667e6600" "007c667c66667c00" "003c666060663c00"
+    "00786c66666c7800" "007e607c60607e00" "007e607c60606000" "003e60606e663e00"
+    "0066667e66666600" "007e181818187e00" "0006060606663c00" "00666c78786c6600"
+    "0060606060607e00" "0063777f6b636300" "0066767e7e6e6600" "003c666666663c00"
+    "007c66667c606000" "003c6666666c3600" "007c66667c6c6600" "003c603c06063c00"
+    "007e181818181800" "0066666666667e00" "00666666663c1800" "0063636b7f776300"
+    "0066663c3c666600" "0066663c18181800" "007e0c1830607e00" "001e181818181e00"
+    "00406030180c0600" "0078181818187800" "00081c3663000000" "000000000000ff00"
+    # 40-5F: graphics characters (ATASCII 00-1F)
+    "00367f7f3e1c0800" "1818181f1f181818" "0303030303030303" "181818f8f8000000"
+    "181818f8f8181818" "000000f8f8181818" "03070e1c3870e0c0" "c0e070381c0e0703"
+    "0103070f1f3f7fff" "000000000f0f0f0f" "80c0e0f0f8fcfeff" "0f0f0f0f00000000"
+    "f0f0f0f000000000" "ffff000000000000" "000000000000ffff" "00000000f0f0f0f0"
+    "001c1c7777081c00" "0000001f1f181818" "000000ffff000000" "181818ffff181818"
+    "00003c7e7e7e3c00" "00000000ffffffff" "c0c0c0c0c0c0c0c0" "000000ffff181818"
+    "181818ffff000000" "f0f0f0f0f0f0f0f0" "1818181f1f000000" "7860786e7e181e00"
+    "00183c7e18181800" "00181818783c1800" "0018307e30180000" "00180c7e0c180000"
+    # 60-7F: diamond a-z spade | clear backspace tab
+    "00183c7e7e3c1800" "00003c063e663e00" "0060607c66667c00" "00003c6060603c00"
+    "0006063e66663e00" "00003c667e603c00" "000e183e18181800" "00003e66663e067c"
+    "0060607c66666600" "0018003818183c00" "000600060606063c" "0060606c786c6600"
+    "0038181818183c00" "0000667f7f6b6300" "00007c6666666600" "00003c6666663c00"
+    "00007c66667c6060" "00003e66663e0606" "00007c6660606000" "00003e603c067c00"
+    "00187e1818180e00" "0000666666663e00" "00006666663c1800" "0000636b7f3e3600"
+    "0000663c183c6600" "00006666663e0c78" "00007e0c18307e00" "00183c7e7e183c00"
+    "1818181818181818" "007e787c6e660600" "0818387838180800" "10181c1e1c181000"
+)
+
+class Font:
+    __slots__ = ("data", "bits", "pairs", "tall")
+
+    def __init__(self, data):
+        data = np.frombuffer(bytes(data[:CHARSET_SIZE]), dtype=np.uint8)
+        if len(data) < CHARSET_SIZE:
+            raise ValueError(f"character set is {len(data)} bytes, need {CHARSET_SIZE}")
+        self.data = data
+        rows = data.reshape(128, 8)
+        self.bits = np.unpackbits(rows[:, :, None], axis=2)
+        self.pairs = (rows[:, :, None] >> np.array([6, 4, 2, 0], dtype=np.uint8)) & 0x03
+        # Mode 3: 10 scanlines per character. Codes 00-5F show rows 0-7 then
+        # two blank lines; 60-7F (lowercase) are shifted down for descenders:
+        # two blank lines, rows 2-7, then rows 0-1.
+        blank = np.zeros((128, 2, 8), dtype=np.uint8)
+        self.tall = np.concatenate([self.bits, blank], axis=1)
+        self.tall[0x60:] = np.concatenate([blank[0x60:], self.bits[0x60:, 2:], self.bits[0x60:, :2]], axis=1)
+
+def detect_seed(data):
+    # The space glyph is eight zero bytes in any usable character set, so a
+    # set stored with the rolling XOR starts with seed, seed+1, ... seed+7.
+    # Returns that seed, or None for a plain character set.
+    first = data[0]
+    if first == 0 or len(data) < 8:
+        return None
+    if all(data[i] == (first + i) & 0xFF for i in range(8)):
+        return first
+    return None
+
+def load_charset_file(path, seed=None):
+    with open(path, "rb") as f:
+        data = f.read()
+    if seed is None:
+        seed = detect_seed(data)
+    if seed is not None:
+        data = decrypt(data, seed)
+    return Font(data)
+
+def load_rom_charset(path):
+    # Character set from an OS ROM image: $E000 is 0x0800 into a 10K
+    # 400/800 ROM ($D800-$FFFF) and 0x2000 into a 16K XL/XE ROM ($C000-$FFFF).
+    with open(path, "rb") as f:
+        rom = f.read()
+    offsets = {0x2800: 0x0800, 0x4000: 0x2000}
+    if len(rom) not in offsets:
+        raise ValueError(f"{path}: expected a 10K or 16K OS ROM image, got {len(rom)} bytes")
+    start = offsets[len(rom)]
+    return Font(rom[start:start + CHARSET_SIZE])
+
+ROM_FONT = Font(bytes.fromhex("".join(ROM_CHARSET_HEX)))
+
+# --- Rendering ---
+
+def render_text(codes, font=ROM_FONT, mode=2, inverse=True):
+    # codes: (rows, columns) character codes. Returns (rows * scanlines,
+    # hi-res pixels) color registers. Mode 2/3/4/5 lines are 8 hi-res pixels
+    # per character, 6/7 are 16.
+    codes = np.asarray(codes, dtype=np.uint8)
+    nrows, ncols = codes.shape
+    if mode in (2, 3):
+        glyphs = (font.tall if mode == 3 else font.bits)[codes & 0x7F]   # (r, c, h, 8)
+        if inverse:
+            # CHACTL bit 1: codes with bit 7 set are shown inverted
+            glyphs = glyphs ^ (codes >> 7)[:, :, None, None]
+        pixels = np.where(glyphs, PF1, PF2).astype(np.uint8)         # PF1 luminance on PF2
+    elif mode in (4, 5):
+        pixels = font.pairs[codes & 0x7F].astype(np.uint8)             # 00 BAK .. 11 PF2
+        # Bit 7 switches the 11 pairs of that character from PF2 to PF3
+        pixels[(pixels == 3) & (codes >> 7).astype(bool)[:, :, None, None]] = PF3
+        pixels = np.repeat(pixels, 2, axis=3)
+        if mode == 5:
+            pixels = np.repeat(pixels, 2, axis=2)
+    elif mode in (6, 7):
+        glyphs = font.bits[codes & 0x3F]
+        # Bits 6-7 pick the color: PF0-PF3
+        color = (PF0 + (codes >> 6))[:, :, None, None]
+        pixels = np.where(glyphs, color, BAK).astype(np.uint8)
+        pixels = np.repeat(pixels, 2, axis=3)
+        if mode == 7:
+            pixels = np.repeat(pixels, 2, axis=2)
+    else:
+        raise ValueError(f"ANTIC mode {mode:X} is not a character mode")
+    count("chars_rendered", codes.size)
+    # (rows, cols, scanlines, px) -> (rows, scanlines, cols, px) -> screen
+    height, width = pixels.shape[2], pixels.shape[3]
+    return pixels.transpose(0, 2, 1, 3).reshape(nrows * height, ncols * width)
+
+def atascii_to_internal(code):
+    # ATASCII 20-5F -> 00-3F, 00-1F -> 40-5F, 60-7F unchanged; bit 7 kept
+    low = code & 0x7F
+    if low < 0x20:
+        low += 0x40
+    elif low < 0x60:
+        low -= 0x20
+    return (code & 0x80) | low
+
+def glyph_sheet(font, mode=2, columns=16):
+    # All 128 glyphs in a grid, for previews of a character set
+    codes = np.arange(128, dtype=np.uint8).reshape(-1, columns)
+    return render_text(codes, font, mode)
+
+def main():
+    parser = argparse.ArgumentParser(description="Preview an Atari character set.")
+    parser.add_argument("charset", nargs="?", help="1024 byte character set (default: ROM font)")
+    parser.add_argument("--seed", type=lambda s: int(s, 0), default=None,
+                        help="rolling XOR seed (default: detect)")
+    parser.add_argument("--rom", help="take the font from an OS ROM image instead")
+    parser.add_argument("--mode", type=lambda s: int(s, 16), default=2, help="ANTIC mode 2-7 (default 2)")
+    parser.add_argument("--text", help="render this ATASCII text instead of the glyph sheet")
+    parser.add_argument("--out", required=True, help="PNG file")
+    args = parser.parse_args()
+
+    if args.rom:
+        font = load_rom_charset(args.rom)
+    elif args.charset:
+        font = load_charset_file(args.charset, args.seed)
+    else:
+        font = ROM_FONT
+
+    if args.text:
+        import atascii
+        codes = np.array([atascii_to_internal(b) for b in atascii.encode(args.text)],
+                         dtype=np.uint8).reshape(1, -1)
+        pixels = render_text(codes, font, args.mode)
+    else:
+        pixels = glyph_sheet(font, args.mode)
+
+    from PIL import Image
+    from antic import to_rgb
+    Image.fromarray(to_rgb(pixels)).save(args.out)
+    print(f"Saved {args.out} ({pixels.shape[1]}x{pixels.shape[0]})", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,70 @@
 from PIL import Image
+import io
 import os
 import glob
+import logging
+from instrument import span, count, setup_logging
+from result_cache import get_cache, source_version
+from filetype import select, BITMAP
+
+log = logging.getLogger(__name__)
+
+# Simple palette
+# 00: Black
+# 01: Peach/Skin (R=255, G=180, B=140)
+# 10: Blue (R=80, G=80, B=255)
+# 11: White (R=255, G=255, B=255)
+PALETTE = [
+    0, 0, 0,
+    255, 180, 140, # Skin toneish
+    80, 80, 255,   # Blueish
+    255, 255, 255
+]
+
+def unpack_mode15(raw):
+    pixels = []
+    for byte in raw:
+        # Each byte is 4 pixels (2 bits each)
+        # 76543210
+        # p0: 76, p1: 54, p2: 32, p3: 10
+        p0 = (byte >> 6) & 0x03
+        p1 = (byte >> 4) & 0x03
+        p2 = (byte >> 2) & 0x03
+        p3 = byte & 0x03
+        pixels.extend([p0, p1, p2, p3])
+    count("pixels_unpacked", len(pixels))
+    return pixels
+
+def pack_mode15(pixels):
+    # Inverse of unpack_mode15: 4 color indices per byte, first pixel in the
+    # high bits (same packing as the encoder in atari_converter.js).
+    raw = bytearray()
+    for i in range(0, len(pixels) - 3, 4):
+        raw.append(((pixels[i] & 0x03) << 6) | ((pixels[i + 1] & 0x03) << 4) |
+                   ((pixels[i + 2] & 0x03) << 2) | (pixels[i + 3] & 0x03))
+    return raw
+
+def render_png(pixels, width, height, palette=PALETTE):
+    img = Image.new("P", (width, height))
+    # Pad to 256 colors
+    img.putpalette(palette + [0, 0, 0] * (256 - len(palette) // 3))
+    # Truncate pixels to match image buffer
+    img.putdata(pixels[:width * height])
+    out = io.BytesIO()
+    img.save(out, format="PNG")
+    return out.getvalue()
 
 def convert_atari_mode15(file_path, width=160, height=140):
     try:
         with open(file_path, "rb") as f:
             data = f.read()
     except Exception as e:
-        print(f"Error reading {file_path}: {e}")
+        log.error(f"Error reading {file_path}: {e}")
         return
 
     # Check size
     if len(data) < width * height // 4:
-        print(f"File {file_path} too small ({len(data)} bytes) for {width}x{height} mode 15")
+        log.warning(f"File {file_path} too small ({len(data)} bytes) for {width}x{height} mode 15")
         return
 
     # If slightly larger, maybe header?
@@ -27,50 +79,30 @@ def convert_atari_mode15(file_path, width=160, height=140):
         pass
 
     raw = data[start_offset : start_offset + 5600]
-    
-    img = Image.new("P", (width, height))
-    
-    # Simple palette
-    # 00: Black
-    # 01: Peach/Skin (R=255, G=200, B=150)
-    # 10: Blue (R=50, G=50, B=200)
-    # 11: White (R=255, G=255, B=255)
-    palette = [
-        0, 0, 0,
-        255, 180, 140, # Skin toneish
-        80, 80, 255,   # Blueish
-        255, 255, 255
-    ]
-    # Pad to 256 colors
-    palette.extend([0,0,0] * (256 - 4))
-    img.putpalette(palette)
-    
-    pixels = []
-    for byte in raw:
-        # Each byte is 4 pixels (2 bits each)
-        # 76543210
-        # p0: 76, p1: 54, p2: 32, p3: 10
-        p0 = (byte >> 6) & 0x03
-        p1 = (byte >> 4) & 0x03
-        p2 = (byte >> 2) & 0x03
-        p3 = byte & 0x03
-        pixels.extend([p0, p1, p2, p3])
+
+    cache = get_cache()
+    png = None
+    if cache:
+        key = cache.key("mode15_png", data, version=source_version(__name__),
+                        width=width, height=height, palette=PALETTE)
+        png = cache.get(key)
+
+    if png is None:
+        with span("unpack_mode15", file=file_path):
+            pixels = unpack_mode15(raw)
+        with span("render_png", file=file_path):
+            png = render_png(pixels, width, height)
+        if cache:
+            cache.put(key, png)
         
-    img.putdata(pixels)
-    
     out_name = os.path.basename(file_path) + ".png"
-    img.save(out_name)
-    print(f"Converted {file_path} to {out_name}")
+    with open(out_name, "wb") as f:
+        f.write(png)
+    count("images_written")
+    log.info(f"Converted {file_path} to {out_name}")
 
 if __name__ == "__main__":
-    targets = ["TITLE2", "OPP", "OP1.1", "OP1.2", "OP1.3", "OP1.4", "OP1.5"]
-    
-    # Also look for files in 'extracted' dir
-    files = glob.glob("extracted/*")
-    
-    for f in files:
-        fname = os.path.basename(f)
-        # Heuristic: size close to 5600
-        size = os.path.getsize(f)
-        if 5600 <= size <= 5700:
-            convert_atari_mode15(f)
+    setup_logging()
+    files = sorted(f for f in glob.glob("extracted/*") if os.path.isfile(f) and not f.endswith(".png"))
+    for f in select(files, BITMAP):
+        convert_atari_mode15(f)
@@ -1,5 +1,5 @@
-import sys
 import collections
+from filetype import fits_bitmap, BITMAP_SIZE
 
 def score_data(data):
     # Heuristic: Mode 15 images have lots of 00, 55, AA, FF (solid colors)
@@ -22,13 +22,15 @@ def try_crack(filepath):
     with open(filepath, 'rb') as f:
         full_data = f.read()
         
-    if len(full_data) <= 5600:
-        print("File too small for 5-byte header hypothesis")
-        payload = full_data
-    else:
-        # Assume 5 byte header
-        header = full_data[:5]
-        payload = full_data[5:]
+    # A frame under an unknown cipher classifies as unknown, so only the
+    # size decides (whole 40 byte lines, optionally with the 5 byte footer)
+    if not fits_bitmap(len(full_data)):
+        print("Not the size of a Mode 15 bitmap, skipping")
+        return
+
+    # Frames are 5600 bitmap bytes followed by a 5 byte footer
+    payload = full_data[:BITMAP_SIZE]
+    footer = full_data[BITMAP_SIZE:]
         
     print(f"Analyzing {filepath}, Payload: {len(payload)} bytes")
     
@@ -75,10 +77,10 @@ def try_crack(filepath):
         best_data = attempt
         
     # Algo 4: Seeded XOR?
-    # Maybe header contains the seed?
-    if len(full_data) > 5:
-        # Try using last byte of header as seed for Algo 3
-        seed = full_data[4]
+    # Maybe the footer contains the seed?
+    if footer:
+        # Try using last byte of footer as seed for Algo 3
+        seed = footer[-1]
         attempt = bytearray()
         prev = seed
         for x in payload:
@@ -88,7 +90,7 @@ def try_crack(filepath):
         s = score_data(attempt)
         if s > best_score:
             best_score = s
-            best_algo = f"XOR with Prev Output (Seed {seed:02X} from header)"
+            best_algo = f"XOR with Prev Output (Seed {seed:02X} from footer)"
             best_data = attempt
 
     print(f"Best Match: {best_algo} (Score: {best_score:.4f})")
@@ -1,5 +1,10 @@
 import struct
 import sys
+import logging
+import atascii  # registers the "atascii" codec
+from instrument import span, count, setup_logging
+
+log = logging.getLogger(__name__)
 
 # Atari BASIC Token Map (Approximation)
 STATEMENTS = {
@@ -96,7 +101,7 @@ def decompile(filepath):
     # Search for VNT manually?
     # VNT usually starts after the last line.
     
-    print("--- DECOMPILING ---")
+    log.info("--- DECOMPILING ---")
     pos = 2
     while pos < len(data):
         if pos + 4 > len(data): break
@@ -142,7 +147,7 @@ def decompile(filepath):
                 slen = line_data[i+1]
                 sval = line_data[i+2:i+2+slen]
                 # Escape quotes
-                s_str = sval.decode('ascii', errors='replace').replace('"', '""')
+                s_str = sval.decode('atascii').replace('"', '""')
                 output.append(f'"{s_str}"')
                 i += 2 + slen
             elif byte & 0x80: # Variable
@@ -166,6 +171,7 @@ def decompile(filepath):
                  output.append(f"<{byte:02X}>")
                  i += 1
                  
+        count("lines_parsed")
         print(f"{ln} {' '.join(output)}")
         
         pos = eol + 1
@@ -174,4 +180,6 @@ def decompile(filepath):
         # If not, we might be at VNT.
         
 if __name__ == "__main__":
-    decompile(sys.argv[1])
+    setup_logging()
+    with span("decompile", file=sys.argv[1]):
+        decompile(sys.argv[1])
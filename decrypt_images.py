@@ -1,7 +1,14 @@
 import os
 import glob
-from PIL import Image
 import collections
+import logging
+from convert_images import unpack_mode15, render_png, PALETTE
+from instrument import span, count, setup_logging
+from result_cache import get_cache, source_version
+from filetype import select, ENCRYPTED_BITMAP
+from xor_cipher import decrypt
+
+log = logging.getLogger(__name__)
 
 def score_decryption(data):
     # Score based on frequency of 0x00, 0x55, 0xAA, 0xFF
@@ -12,22 +19,13 @@ def score_decryption(data):
     solid = counts[0x00] + counts[0x55] + counts[0xAA] + counts[0xFF]
     return solid / total
 
-def decrypt_and_convert(filepath):
-    with open(filepath, 'rb') as f:
-        data = f.read()
-        
+def find_seed(payload, sample_size=100):
     # Heuristic: Find best StartSeed for: Out[i] = In[i] ^ (Seed + i)
     best_seed = 0
     best_score = -1
-    best_data = None
-    
-    # Handle header?
-    # Analysis suggests the header IS part of the image (decrypts to 55s)
-    # So we should NOT strip it, to maintain alignment.
-    payload = data
-        
+
     # Optimization: Check first 100 bytes of payload
-    sample = payload[:100]
+    sample = payload[:sample_size]
     
     for seed in range(256):
         attempt = bytearray()
@@ -40,65 +38,84 @@ def decrypt_and_convert(filepath):
         if score > best_score:
             best_score = score
             best_seed = seed
+    count("seeds_tried", 256)
+    return best_seed, best_score
 
-    print(f"File {os.path.basename(filepath)}: Best Seed {best_seed:02X} (Score {best_score:.2f})")
-    
-    # Full Decryption
-    decrypted = bytearray()
-    s = best_seed
-    for b in payload:
-        decrypted.append(b ^ s)
-        s = (s + 1) & 0xFF
+def cached_seed(payload, name=""):
+    # find_seed() through the result cache: (seed, score)
+    cache = get_cache()
+    seed_key = None
+    if cache:
+        seed_key = cache.key("find_seed", payload, version=source_version(__name__), sample_size=100)
+        seed_result = cache.get_json(seed_key)
+        if seed_result is not None:
+            return tuple(seed_result)
+
+    with span("find_seed", file=name) as sp:
+        best_seed, best_score = find_seed(payload)
+        sp.set(seed=best_seed, score=best_score)
+    if cache:
+        cache.put_json(seed_key, [best_seed, best_score])
+    return best_seed, best_score
+
+def decrypt_frame(payload, name="", seed=None):
+    # Decrypted bytes of one encrypted frame, plus the seed that was used.
+    # Pass seed when it is already known (e.g. from filetype.classify).
+    best_seed = seed
+    if best_seed is None:
+        best_seed, _ = cached_seed(payload, name)
+    with span("decrypt", file=name):
+        return decrypt(payload, best_seed), best_seed
+
+def decrypt_and_convert(filepath):
+    with open(filepath, 'rb') as f:
+        data = f.read()
         
+    # Handle header?
+    # Analysis suggests the header IS part of the image (decrypts to 55s)
+    # So we should NOT strip it, to maintain alignment.
+    payload = data
+        
+    cache = get_cache()
+    version = source_version(__name__, "convert_images", "xor_cipher")
+    best_seed, best_score = cached_seed(payload, filepath)
+
+    log.info(f"File {os.path.basename(filepath)}: Best Seed {best_seed:02X} (Score {best_score:.2f})")
+    
     # Skip small files
-    if len(decrypted) < 1000:
-        print(f"Skipping small file {filepath}")
+    if len(payload) < 1000:
+        log.debug(f"Skipping small file {filepath}")
         return
 
     # Convert to PNG
     width = 160
-    height = len(decrypted) // 40
-    
-    img = Image.new("P", (width, height))
-    
-    # ... Palette ...
-    # Palette
-    palette = [
-        0, 0, 0,
-        255, 180, 140, # Skin
-        80, 80, 255,   # Blue
-        255, 255, 255
-    ]
-    palette.extend([0,0,0] * (256 - 4))
-    img.putpalette(palette)
-    
-    pixels = []
-    for byte in decrypted:
-        p0 = (byte >> 6) & 0x03
-        p1 = (byte >> 4) & 0x03
-        p2 = (byte >> 2) & 0x03
-        p3 = byte & 0x03
-        pixels.extend([p0, p1, p2, p3])
-        
-    # Truncate pixels to match image buffer
-    expected_pixels = width * height
-    if len(pixels) > expected_pixels:
-        pixels = pixels[:expected_pixels]
+    height = len(payload) // 40
+
+    png = None
+    if cache:
+        png_key = cache.key("decrypt_png", payload, version=version, seed=best_seed,
+                            width=width, height=height, palette=PALETTE)
+        png = cache.get(png_key)
+
+    if png is None:
+        # Full Decryption
+        with span("decrypt", file=filepath):
+            decrypted = decrypt(payload, best_seed)
+
+        pixels = unpack_mode15(decrypted)
+        with span("render_png", file=filepath):
+            png = render_png(pixels, width, height)
+        if cache:
+            cache.put(png_key, png)
         
-    img.putdata(pixels)
     out_name = os.path.basename(filepath) + "_decrypted.png"
-    img.save(out_name)
-    print(f"Saved {out_name}")
+    with open(out_name, "wb") as f:
+        f.write(png)
+    count("images_written")
+    log.info(f"Saved {out_name}")
 
 if __name__ == "__main__":
-    files = glob.glob("extracted/OP*.1") + glob.glob("extracted/OP*.2") + glob.glob("extracted/OP*.3") + glob.glob("extracted/OP*.4") + glob.glob("extracted/OP*.5")
-    # And other OP* files
-    files = glob.glob("extracted/OP*")
-    
-    for f in files:
-        # Skip directories and non-image looking files
-        if os.path.isdir(f): continue
-        if f.endswith(".png") or f.endswith(".cracked"): continue
-        if "DOS" in f or "AUTORUN" in f or "SP" in f or "COM" in f or "DLIST" in f: continue
-        
+    setup_logging()
+    files = sorted(f for f in glob.glob("extracted/*") if os.path.isfile(f) and not f.endswith(".png"))
+    for f in select(files, ENCRYPTED_BITMAP):
         decrypt_and_convert(f)
@@ -1,5 +1,7 @@
 import sys
 import struct
+from instrument import span, count, setup_logging
+from result_cache import get_cache, source_version
 
 # Basic 6502 Opcodes map (Opcode -> (Mnemonic, Mode, Bytes))
 # Mode: impl, imm, zp, zpx, zpy, abs, absx, absy, ind, indx, indy, rel
@@ -70,12 +72,11 @@ def disassemble_block(data, start_addr):
         output.append(f"{addr:04X}  {bytes_hex:<8}  {mnemonic} {operand_str}")
         pc += length
         
+    count("instructions_decoded", len(output))
     return "\n".join(output)
 
-def process_file(filepath):
-    with open(filepath, 'rb') as f:
-        data = f.read()
-        
+def iter_segments(data):
+    # Yields (start, end, segment_bytes) for each load segment of a binary file
     pos = 0
     if len(data) >= 2:
         val = struct.unpack("<H", data[0:2])[0]
@@ -88,6 +89,7 @@ def process_file(filepath):
         val1 = struct.unpack("<H", data[pos:pos+2])[0]
         if val1 == 0xFFFF:
             pos += 2
+            if pos + 4 > len(data): break
             start = struct.unpack("<H", data[pos:pos+2])[0]
             end = struct.unpack("<H", data[pos+2:pos+4])[0]
             pos += 4
@@ -97,14 +99,35 @@ def process_file(filepath):
             pos += 4
             
         length = end - start + 1
-        seg_data = data[pos:pos+length]
-        
-        print(f"; Segment {start:04X}-{end:04X}")
-        print(disassemble_block(seg_data, start))
-        print(";")
+        yield start, end, data[pos:pos+length]
         
         pos += length
 
+def process_file(filepath):
+    with open(filepath, 'rb') as f:
+        data = f.read()
+        
+    cache = get_cache()
+    listing = None
+    if cache:
+        key = cache.key("disasm_listing", data, version=source_version(__name__))
+        listing = cache.get(key)
+
+    if listing is None:
+        out = []
+        for start, end, seg_data in iter_segments(data):
+            count("segments_parsed")
+            out.append(f"; Segment {start:04X}-{end:04X}\n")
+            with span("disassemble_segment", file=filepath, start=start, bytes=len(seg_data)):
+                out.append(disassemble_block(seg_data, start) + "\n")
+            out.append(";\n")
+        listing = "".join(out).encode()
+        if cache:
+            cache.put(key, listing)
+
+    sys.stdout.write(listing.decode())
+
 if __name__ == "__main__":
+    setup_logging()
     if len(sys.argv) > 1:
         process_file(sys.argv[1])
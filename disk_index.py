@@ -0,0 +1,157 @@
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import struct
+import sys
+
+from extract_atr import DiskImage, FLAG_DELETED, FLAG_LOCKED
+from instrument import span, count, worker_pool
+
+# Persisted directory index over many ATR images, for metadata queries
+# ("which disks contain a file called SP") without opening the images.
+#
+#   python3 disk_index.py build corpus/ --index dirs.json
+#   python3 disk_index.py find dirs.json SP
+#   python3 disk_index.py find dirs.json "OP*.?" --deleted
+#
+# Building reads only the ATR header, the VTOC and the 8 directory sectors
+# of each image (DiskImage.directory), never file data. Rebuilding skips
+# images whose mtime and size match the index, and drops images that no
+# longer exist, so one index can be built up from several directories.
+# Files that can't be read as ATR images are left out. Images are keyed by
+# absolute path, so the index can be rebuilt and queried from any directory.
+#
+# Index file: {"format": 2, "disks": {path: record}} where a record holds
+# the geometry, the VTOC sector counts and one entry per directory slot:
+#   [number, filename, flag, start sector, sector count]
+
+INDEX_FORMAT = 2
+
+def index_disk(path):
+    # Directory record for one image, or None if it can't be read as one
+    # (gone, not an ATR image, truncated)
+    try:
+        st = os.stat(path)
+        with DiskImage(path) as disk:
+            d = disk.directory
+            record = {
+                "mtime": st.st_mtime_ns,
+                "size": st.st_size,
+                "sector_size": disk.sector_size,
+                "sector_count": disk.sector_count,
+                "total_sectors": d.total_sectors,
+                "free_sectors": d.free_sectors,
+                "entries": [[e.number, e.filename, e.flag, e.start, e.sectors] for e in d.entries],
+            }
+    except (OSError, ValueError, IndexError, struct.error):
+        return path, None
+    return path, record
+
+class DirectoryIndex:
+    def __init__(self, disks=None):
+        self.disks = disks or {}
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        if data.get("format") != INDEX_FORMAT:
+            return cls()
+        return cls(data["disks"])
+
+    def save(self, path):
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"format": INDEX_FORMAT, "disks": self.disks}, f, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def update(self, paths, jobs=None):
+        # Index new or changed images; returns (indexed, removed)
+        stale = []
+        for p in map(os.path.abspath, paths):
+            known = self.disks.get(p)
+            try:
+                st = os.stat(p)
+            except OSError:
+                continue
+            if not known or known["mtime"] != st.st_mtime_ns or known["size"] != st.st_size:
+                stale.append(p)
+        # Images indexed by earlier builds stay until they are deleted
+        removed = [p for p in self.disks if not os.path.exists(p)]
+        for p in removed:
+            del self.disks[p]
+        with span("index_disks", disks=len(stale)):
+            if len(stale) > 64 and jobs != 1:
+                with worker_pool(jobs) as pool:
+                    results = list(pool.imap_unordered(index_disk, stale, chunksize=64))
+            else:
+                results = [index_disk(p) for p in stale]
+        indexed = 0
+        for p, record in results:
+            if record is None:
+                self.disks.pop(p, None)
+            else:
+                self.disks[p] = record
+                indexed += 1
+        count("disks_indexed", indexed)
+        return indexed, len(removed)
+
+    def find(self, pattern, deleted=False):
+        # [(disk path, entry dict)] for file names matching a DOS style
+        # pattern (case-insensitive)
+        pattern = pattern.upper()
+        found = []
+        for path in sorted(self.disks):
+            for number, filename, flag, start, sectors in self.disks[path]["entries"]:
+                if flag & FLAG_DELETED and not deleted:
+                    continue
+                if fnmatch.fnmatchcase(filename.upper(), pattern):
+                    found.append((path, {"number": number, "name": filename, "flag": flag,
+                                         "start": start, "sectors": sectors}))
+        return found
+
+def expand(inputs):
+    paths = []
+    for p in inputs:
+        if os.path.isdir(p):
+            paths.extend(sorted(glob.glob(os.path.join(p, "*.atr"))))
+        else:
+            paths.append(p)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Directory index over many ATR images.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_build = sub.add_parser("build", help="create or refresh an index")
+    p_build.add_argument("inputs", nargs="+", help="ATR images or directories of them")
+    p_build.add_argument("--index", required=True, help="index file (JSON)")
+    p_build.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+
+    p_find = sub.add_parser("find", help="list files matching a name or pattern")
+    p_find.add_argument("index")
+    p_find.add_argument("pattern", help='file name or pattern, e.g. SP or "OP*.?"')
+    p_find.add_argument("--deleted", action="store_true", help="include deleted files")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        index = DirectoryIndex.load(args.index)
+        indexed, removed = index.update(expand(args.inputs), args.jobs)
+        index.save(args.index)
+        print(f"{len(index.disks)} disks in {args.index} ({indexed} indexed, {removed} removed)",
+              file=sys.stderr)
+    else:
+        index = DirectoryIndex.load(args.index)
+        matches = index.find(args.pattern, args.deleted)
+        for path, e in matches:
+            flags = ("D" if e["flag"] & FLAG_DELETED else "-") + ("L" if e["flag"] & FLAG_LOCKED else "-")
+            print(f"{path}: {e['name']:12s} {flags} start {e['start']:4d}, {e['sectors']:3d} sectors")
+        print(f"{len(matches)} files on {len({p for p, _ in matches})} disks", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
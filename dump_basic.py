@@ -1,5 +1,8 @@
 import struct
 import sys
+import atascii  # registers the "atascii" codec
+from instrument import span, count, setup_logging
+from result_cache import get_cache, source_version
 
 def parse_number(data):
     # Atari BASIC Number format (6 bytes BCD/Float)
@@ -24,7 +27,7 @@ def decode_basic_line(line_data):
                 break
             slen = line_data[i+1]
             sval = line_data[i+2:i+2+slen]
-            output.append(f'"{sval.decode("ascii", "ignore")}"')
+            output.append(f'"{sval.decode("atascii")}"')
             i += 2 + slen
         elif token == 0x16: # EOL? usually stripped before calling this
             output.append("[EOL]")
@@ -37,10 +40,8 @@ def decode_basic_line(line_data):
             i += 1
     return " ".join(output)
 
-def list_basic(filepath):
-    with open(filepath, 'rb') as f:
-        data = f.read()
-    
+def iter_lines(data):
+    # Yields (line_number, token_bytes) for each line up to the next EOL
     pos = 2
     while pos < len(data):
         if pos + 4 > len(data): break
@@ -48,20 +49,38 @@ def list_basic(filepath):
         ptr = struct.unpack("<H", data[pos+2:pos+4])[0]
         
         start_data = pos + 4
-        eol = -1
-        for k in range(start_data, len(data)):
-            if data[k] == 0x16:
-                eol = k
-                break
+        eol = data.find(b"\x16", start_data)
         
         if eol == -1: break
         
-        line_data = data[start_data:eol]
-        decoded = decode_basic_line(line_data)
-        
-        print(f"{ln} {decoded}")
+        count("lines_parsed")
+        yield ln, data[start_data:eol]
         
         pos = eol + 1
 
+def list_basic(filepath):
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    
+    cache = get_cache()
+    listing = None
+    if cache:
+        key = cache.key("basic_listing", data, version=source_version(__name__))
+        listing = cache.get(key)
+
+    if listing is None:
+        lines = []
+        with span("list_basic", file=filepath, bytes=len(data)):
+            for ln, line_data in iter_lines(data):
+                decoded = decode_basic_line(line_data)
+                
+                lines.append(f"{ln} {decoded}\n")
+        listing = "".join(lines).encode()
+        if cache:
+            cache.put(key, listing)
+
+    sys.stdout.write(listing.decode())
+
 if __name__ == "__main__":
+    setup_logging()
     list_basic(sys.argv[1])
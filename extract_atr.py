@@ -1,101 +1,293 @@
+import fnmatch
+import io
 import struct
 import os
+import logging
+
+import atascii
+from instrument import span, count, setup_logging
+
+log = logging.getLogger(__name__)
+
+def read_header(f):
+    # 16 byte ATR header: magic 0x0296, image size in 16-byte paragraphs
+    # (low word + high byte at offset 6), sector size.
+    f.seek(0)
+    header = f.read(16)
+    if len(header) < 16:
+        return None
+    magic, paragraphs, sector_size = struct.unpack("<HHH", header[:6])
+    if magic != 0x0296:
+        return None
+    image_size = (paragraphs | (header[6] << 16)) * 16
+    if sector_size > 128:
+        # Double density: the 3 boot sectors are still stored as 128 bytes
+        sector_count = 3 + max(0, image_size - 3 * 128) // sector_size
+    else:
+        sector_count = image_size // sector_size
+    return sector_size, sector_count
 
 def read_sector(f, sector_num, sector_size=128):
     # Header is 16 bytes.
     # Sectors are 1-indexed.
-    offset = 16 + (sector_num - 1) * sector_size
+    if sector_num <= 3:
+        # Boot sectors are 128 bytes on every density
+        sector_size = 128
+    if sector_size > 128:
+        offset = 16 + 3 * 128 + (sector_num - 4) * sector_size
+    else:
+        offset = 16 + (sector_num - 1) * sector_size
+    count("sectors_read")
     f.seek(offset)
     return f.read(sector_size)
 
+def iter_chain(f, start_sector, sector_size=128, max_sector=720):
+    # Follow the DOS 2.0 link bytes from start_sector, yielding
+    # (sector number, sector bytes) for each sector of the file. Every
+    # sector is read once.
+    seen = set()
+    current_sector = start_sector
+    while current_sector != 0:
+        # Loop safety
+        if current_sector > max_sector: # Sanity check against disk size
+            log.warning(f"Sector {current_sector} out of bounds, stopping.")
+            break
+        if current_sector in seen:
+            log.warning(f"Sector chain from {start_sector} loops back to {current_sector}, stopping.")
+            break
+
+        seen.add(current_sector)
+        data = read_sector(f, current_sector, sector_size)
+        yield current_sector, data
+
+        # Link bytes
+        # Byte 125: (file_no << 2) | (next_sector_high)
+        # Byte 126: next_sector_low
+        # Byte 127: byte_count
+        link_byte = data[sector_size - 3]
+        next_sector_low = data[sector_size - 2]
+
+        next_sector_high = link_byte & 0x03
+        current_sector = (next_sector_high << 8) | next_sector_low
+        # In Atari DOS, next_sector points to 0 on the last sector.
+
+def walk_chain(f, start_sector, sector_size=128, max_sector=720):
+    # The list of sectors that make up the file
+    return [sector for sector, _ in iter_chain(f, start_sector, sector_size, max_sector)]
+
+def read_file(f, start_sector, sector_size=128, max_sector=720):
+    file_data = bytearray()
+    for sector, data in iter_chain(f, start_sector, sector_size, max_sector):
+        byte_count = data[sector_size - 1]
+
+        # Sanity check on byte_count
+        if byte_count > sector_size - 3:
+            byte_count = sector_size - 3 # Should be max 125 for data
+
+        file_data.extend(data[:byte_count])
+    return file_data
+
+# --- Directory model ---
+
+VTOC_SECTOR = 360
+DIR_START = 361
+DIR_LEN = 8
+DIR_ENTRY = struct.Struct("<BHH8s3s")   # flag, sector count, start, name, ext
+
+FLAG_OPEN = 0x01        # open for output
+FLAG_DOS2 = 0x02        # created by DOS 2
+FLAG_LOCKED = 0x20
+FLAG_IN_USE = 0x40
+FLAG_DELETED = 0x80
+
+class DirEntry:
+    __slots__ = ("number", "flag", "sectors", "start", "name", "ext", "filename")
+
+    def __init__(self, number, flag, sectors, start, name, ext):
+        self.number = number    # directory slot = file number in the link bytes
+        self.flag = flag
+        self.sectors = sectors  # sector count from the directory
+        self.start = start
+        self.name = name
+        self.ext = ext
+        full_name = f"{name}.{ext}" if ext else name
+        # Sanitized, as used for the extracted file names
+        self.filename = "".join(c for c in full_name if c.isalnum() or c in "._-")
+
+    @property
+    def deleted(self):
+        return bool(self.flag & FLAG_DELETED)
+
+    @property
+    def locked(self):
+        return bool(self.flag & FLAG_LOCKED)
+
+    @property
+    def in_use(self):
+        return bool(self.flag & FLAG_IN_USE)
+
+    def __repr__(self):
+        return (f"DirEntry({self.number}, {self.filename!r}, flag=${self.flag:02X}, "
+                f"start={self.start}, sectors={self.sectors})")
+
+class Directory:
+    __slots__ = ("entries", "total_sectors", "free_sectors", "_by_name")
+
+    def __init__(self, entries, total_sectors=0, free_sectors=0):
+        self.entries = entries              # every slot with a file, deleted ones included
+        self.total_sectors = total_sectors  # from the VTOC
+        self.free_sectors = free_sectors
+        self._by_name = {}
+        for e in entries:
+            if not e.deleted:
+                self._by_name.setdefault(e.filename.upper(), e)
+
+    @classmethod
+    def parse(cls, dir_data, vtoc=None):
+        # dir_data: the first 128 bytes of each of the 8 directory sectors
+        entries = []
+        for number, (flag, sectors, start, name, ext) in enumerate(DIR_ENTRY.iter_unpack(dir_data)):
+            if flag == 0 or start == 0:
+                continue
+            name = atascii.strip_inverse(name.decode("atascii")).strip()
+            ext = atascii.strip_inverse(ext.decode("atascii")).strip()
+            entries.append(DirEntry(number, flag, sectors, start, name, ext))
+        total = free = 0
+        if vtoc:
+            total, free = struct.unpack_from("<HH", vtoc, 1)
+        return cls(entries, total, free)
+
+    def __iter__(self):
+        # Files that are not deleted
+        return (e for e in self.entries if not e.deleted)
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __contains__(self, name):
+        return name.upper() in self._by_name
+
+    def __getitem__(self, name):
+        return self._by_name[name.upper()]
+
+    def find(self, name):
+        return self._by_name.get(name.upper())
+
+    def glob(self, pattern, deleted=False):
+        # DOS style wildcards (* and ?), case-insensitive: glob("OP*.?")
+        pattern = pattern.upper()
+        entries = self.entries if deleted else list(self)
+        return [e for e in entries if fnmatch.fnmatchcase(e.filename.upper(), pattern)]
+
+    @property
+    def used_sectors(self):
+        return sum(e.sectors for e in self)
+
+def parse_directory(f, sector_size=128):
+    vtoc = read_sector(f, VTOC_SECTOR, sector_size)
+    dir_data = b"".join(read_sector(f, DIR_START + i, sector_size)[:128] for i in range(DIR_LEN))
+    return Directory.parse(dir_data, vtoc)
+
+def read_directory(f, sector_size=128):
+    # [(name, start sector, flag), ...] for every directory slot in use,
+    # deleted files included
+    return [(e.filename, e.start, e.flag) for e in parse_directory(f, sector_size).entries]
+
+class DiskImage:
+    # An open ATR image. Only the header is read up front; the directory is
+    # parsed on first use and kept, file data is read on request.
+    #
+    #   with DiskImage("Strip Poker.atr") as disk:
+    #       entry = disk.directory["OP2.3"]
+    #       data = disk.read_file(entry)
+
+    def __init__(self, source):
+        # source: path, bytes or a binary file object
+        self.path = None
+        self._owned = False
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.f = io.BytesIO(bytes(source))
+        elif isinstance(source, (str, os.PathLike)):
+            self.path = os.fspath(source)
+            self.f = open(source, "rb")
+            self._owned = True
+        else:
+            self.f = source
+        geometry = read_header(self.f)
+        if geometry is None:
+            self.close()
+            raise ValueError(f"{self.path or 'image'}: not an ATR image")
+        self.sector_size, self.sector_count = geometry
+        # DOS 2.0 links are 10 bits wide
+        self.max_sector = min(self.sector_count, 1023)
+        self._directory = None
+
+    @property
+    def directory(self):
+        if self._directory is None:
+            with span("read_directory", atr=self.path):
+                self._directory = parse_directory(self.f, self.sector_size)
+        return self._directory
+
+    def _entry(self, entry):
+        if isinstance(entry, str):
+            found = self.directory.find(entry)
+            if found is None:
+                raise FileNotFoundError(f"{entry} is not on {self.path or 'the disk'}")
+            return found
+        return entry
+
+    def read_sector(self, sector_num):
+        return read_sector(self.f, sector_num, self.sector_size)
+
+    def sector_chain(self, entry):
+        return walk_chain(self.f, self._entry(entry).start, self.sector_size, self.max_sector)
+
+    def read_file(self, entry):
+        # entry: DirEntry or file name
+        return read_file(self.f, self._entry(entry).start, self.sector_size, self.max_sector)
+
+    def close(self):
+        if self._owned:
+            self.f.close()
+            self._owned = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
 def extract_files(atr_path):
     output_dir = "extracted"
     os.makedirs(output_dir, exist_ok=True)
     
-    with open(atr_path, "rb") as f:
-        # Check header
-        header = f.read(16)
-        magic = struct.unpack("<H", header[:2])[0]
-        if magic != 0x0296:
-            print("Not a valid ATR file.")
-            return
-
-        # Assume 128 byte sectors for now based on header analysis
-        SECTOR_SIZE = 128
-        
-        # Directory starts at sector 361, length 8 sectors
-        DIR_START = 361
-        DIR_LEN = 8
-        
-        files = []
-        
-        print("Reading directory...")
-        for i in range(DIR_LEN):
-            sec_data = read_sector(f, DIR_START + i, SECTOR_SIZE)
-            # 8 entries per sector (16 bytes each)
-            for entry_idx in range(0, SECTOR_SIZE, 16):
-                entry = sec_data[entry_idx : entry_idx + 16]
-                flag = entry[0]
-                if flag == 0: continue # Deleted/Empty
-                
-                cnt = struct.unpack("<H", entry[1:3])[0]
-                start_sector = struct.unpack("<H", entry[3:5])[0]
-                name = entry[5:13].decode('ascii', errors='ignore').strip()
-                ext = entry[13:16].decode('ascii', errors='ignore').strip()
-                
-                full_name = f"{name}.{ext}" if ext else name
-                
-                # Sanitize filename to remove null bytes or invalid chars
-                full_name = "".join(c for c in full_name if c.isalnum() or c in "._-")
-                
-                if flag != 0 and start_sector != 0:
-                    files.append((full_name, start_sector, flag))
-                    print(f"Found file: {full_name} (Start: {start_sector}, Flag: {flag:02x})")
+    try:
+        disk = DiskImage(atr_path)
+    except ValueError:
+        log.error("Not a valid ATR file.")
+        return
+
+    with disk:
+        log.debug("Reading directory...")
+        files = disk.directory.entries
+        for e in files:
+            log.debug(f"Found file: {e.filename} (Start: {e.start}, Flag: {e.flag:02x})")
+        count("files_found", len(files))
 
         # Extract
-        for fname, start, flag in files:
-            print(f"Extracting {fname}...")
-            file_data = bytearray()
-            current_sector = start
-            
-            while current_sector != 0:
-                # Loop safety
-                if current_sector > 720: # Sanity check for SD disk
-                    print(f"Sector {current_sector} out of bounds, stopping.")
-                    break
-                    
-                data = read_sector(f, current_sector, SECTOR_SIZE)
-                
-                # Link bytes
-                # Byte 125: (file_no << 2) | (next_sector_high)
-                # Byte 126: next_sector_low
-                # Byte 127: byte_count
-                
-                link_byte = data[125]
-                next_sector_low = data[126]
-                byte_count = data[127]
-                
-                next_sector_high = link_byte & 0x03
-                next_sector = (next_sector_high << 8) | next_sector_low
-                
-                # Sanity check on byte_count
-                if byte_count > 125:
-                    byte_count = 125 # Should be max 125 for data
-                
-                file_data.extend(data[:byte_count])
-                
-                current_sector = next_sector
-                # Link 0 means end of file usually, or strictly last sector logic?
-                # In Atari DOS, next_sector usually points to 0 on the last sector.
-                # Or sometimes bit 0x80 in link byte? No, standard is next_sector field.
-                
-                if current_sector == 0:
-                    break
-
-            out_path = os.path.join(output_dir, fname)
+        for e in files:
+            log.debug(f"Extracting {e.filename}...")
+            with span("extract_file", file=e.filename) as sp:
+                file_data = disk.read_file(e)
+                sp.set(bytes=len(file_data))
+            count("bytes_extracted", len(file_data))
+
+            out_path = os.path.join(output_dir, e.filename)
             with open(out_path, "wb") as out_f:
                 out_f.write(file_data)
-            print(f"Saved {out_path} ({len(file_data)} bytes)")
+            log.info(f"Saved {out_path} ({len(file_data)} bytes)")
 
 if __name__ == "__main__":
+    setup_logging()
     extract_files("Strip Poker.atr")
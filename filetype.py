@@ -0,0 +1,313 @@
+import argparse
+import os
+
+import numpy as np
+
+from instrument import span, count
+
+# File type classifier for files extracted from Atari disks.
+#
+# classify_batch() sorts a whole batch of files in one call, so only the
+# files a decoder can use are handed to it:
+#
+#   for path, result in zip(paths, classify_files(paths)):
+#       if result.kind == ENCRYPTED_BITMAP:
+#           decrypt_and_convert(path)
+#
+# Each file gets a kind, a confidence between 0 and 1 and a few details
+# (e.g. the likely seed of an encrypted frame). Two kinds of evidence are
+# combined:
+#
+#   * byte statistics, computed for the whole batch at once with NumPy:
+#     a 256 bin histogram per file (one bincount over all files), the share
+#     of printable ATASCII, of "solid" bitmap bytes (00 55 AA FF, runs of one
+#     color) and of bytes that repeat their neighbour (run score). For the
+#     rolling XOR the solid score is computed for all 256 seeds at once on a
+#     sample of each file.
+#   * structural probes on the first bytes: XEX segment headers that add up
+#     to the file length, the Atari BASIC pointer table, a display list that
+#     ends in JVB, the space glyph of a character set.
+#
+# Kinds:
+BASIC = "basic"                     # tokenized Atari BASIC (SAVE format)
+XEX = "xex"                         # binary load file ($FFFF segments)
+BITMAP = "mode15"                   # raw Mode 15 bitmap
+ENCRYPTED_BITMAP = "mode15_xor"     # Mode 15 frame under the rolling XOR
+CHARSET = "charset"                 # 1024 byte character set (maybe encrypted)
+DISPLAY_LIST = "display_list"       # ANTIC display list
+TEXT = "atascii_text"               # ATASCII text / string tables
+UNKNOWN = "unknown"
+
+KINDS = (BASIC, XEX, BITMAP, ENCRYPTED_BITMAP, CHARSET, DISPLAY_LIST, TEXT)
+
+BITMAP_SIZE = 5600      # 160x140, 2 bits per pixel
+FRAME_SIZE = 5605       # bitmap + 5 byte footer, as stored on the game disk
+CHARSET_SIZE = 1024
+
+SEED_SAMPLE = 512       # bytes per file tried against every seed
+SEED_CHUNK = 64         # files per seed search block (memory: 64 * 256 * 512)
+MIN_CONFIDENCE = 0.5
+
+_SOLID = np.zeros(256, dtype=bool)
+_SOLID[[0x00, 0x55, 0xAA, 0xFF]] = True
+
+_PRINTABLE = np.zeros(256, dtype=bool)
+_PRINTABLE[0x20:0x7D] = True        # ASCII, diamond, a-z, spade, |
+_PRINTABLE[0xA0:0xFD] = True        # the same in inverse video
+_PRINTABLE[0x9B] = True             # EOL
+
+class Classification:
+    __slots__ = ("kind", "confidence", "details")
+
+    def __init__(self, kind, confidence, details=None):
+        self.kind = kind
+        self.confidence = confidence
+        self.details = details or {}
+
+    def __repr__(self):
+        return f"Classification({self.kind!r}, {self.confidence:.2f}, {self.details!r})"
+
+# --- Structural probes ---
+# Each returns (confidence, details) for one kind, 0 if it does not apply.
+
+def probe_xex(data):
+    # $FFFF, then segments of start, end, data; the last one must end
+    # exactly at the end of the file.
+    if len(data) < 7 or data[0] != 0xFF or data[1] != 0xFF:
+        return 0.0, None
+    pos = 2
+    segments = 0
+    while pos + 4 <= len(data):
+        if data[pos] == 0xFF and data[pos + 1] == 0xFF:
+            pos += 2
+            continue
+        start = data[pos] | (data[pos + 1] << 8)
+        end = data[pos + 2] | (data[pos + 3] << 8)
+        if end < start:
+            return 0.3, {"segments": segments}
+        pos += 4 + end - start + 1
+        segments += 1
+    if pos == len(data):
+        return 1.0, {"segments": segments}
+    # Truncated last segment or trailing junk
+    return 0.6, {"segments": segments}
+
+def probe_basic(data):
+    # SAVE format: 7 little-endian pointers (LOMEM VNTP VNTD VVTP STMTAB
+    # STMCUR STARP), relative to LOMEM = 0 with the variable name table at
+    # $0100. The file ends at STARP, i.e. STARP - $0100 + 14 bytes.
+    if len(data) < 14:
+        return 0.0, None
+    ptrs = [data[i] | (data[i + 1] << 8) for i in range(0, 14, 2)]
+    lomem, vntp = ptrs[0], ptrs[1]
+    if lomem != 0 or vntp != 0x0100:
+        return 0.0, None
+    if any(b < a for a, b in zip(ptrs[1:], ptrs[2:])):
+        return 0.2, None
+    expected = ptrs[6] - 0x0100 + 14
+    details = {"starp": ptrs[6], "stmtab": ptrs[4]}
+    if expected == len(data):
+        return 1.0, details
+    if expected <= len(data):
+        return 0.7, details
+    return 0.4, details
+
+def probe_display_list(data):
+    # Step through the instructions; a display list ends in JVB ($41 addr).
+    if not 4 <= len(data) <= 1024:
+        return 0.0, None
+    pos = 0
+    lms = 0
+    lines = 0
+    while pos < len(data):
+        ins = data[pos]
+        mode = ins & 0x0F
+        if mode == 1:
+            if pos + 3 > len(data):
+                return 0.0, None
+            if ins & 0x40:
+                if pos + 3 != len(data):
+                    return 0.3, None
+                return (1.0 if lms and lines else 0.6), {"lines": lines,
+                                                          "jvb": data[pos + 1] | (data[pos + 2] << 8)}
+            pos += 3
+        elif mode == 0:
+            pos += 1        # 1-8 blank lines
+        else:
+            if ins & 0x40:
+                lms += 1
+                pos += 3
+            else:
+                pos += 1
+            lines += 1
+    return 0.0, None
+
+def probe_charset(data):
+    # 1024 bytes (a trailing byte is tolerated), space glyph first: eight
+    # zero bytes, or seed..seed+7 under the rolling XOR.
+    if len(data) not in (CHARSET_SIZE, CHARSET_SIZE + 1):
+        return 0.0, None
+    first = data[0]
+    if all(b == 0 for b in data[:8]):
+        return 0.9, {"seed": None}
+    if first and all(data[i] == (first + i) & 0xFF for i in range(8)):
+        return 0.9, {"seed": first}
+    return 0.2, {"seed": None}
+
+# --- Batch statistics ---
+
+def _batch_stats(blobs):
+    # One concatenated array for the whole batch; per-file sums via
+    # np.add.reduceat over the file boundaries.
+    sizes = np.array([len(b) for b in blobs], dtype=np.int64)
+    flat = np.frombuffer(b"".join(blobs), dtype=np.uint8)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    ids = np.repeat(np.arange(len(blobs)), sizes)
+    hist = np.bincount(ids * 256 + flat, minlength=len(blobs) * 256).reshape(len(blobs), 256)
+
+    safe = np.maximum(sizes, 1)
+    printable = hist[:, _PRINTABLE].sum(axis=1) / safe
+    solid = hist[:, _SOLID].sum(axis=1) / safe
+    p = hist / safe[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        entropy = np.where(p > 0, -p * np.log2(p), 0).sum(axis=1)
+
+    # Run score: share of bytes equal to the next byte of the same file
+    same = np.zeros(len(flat), dtype=np.int64)
+    if len(flat) > 1:
+        same[:-1] = flat[:-1] == flat[1:]
+        same[np.cumsum(sizes)[sizes > 0] - 1] = 0
+    nonempty = sizes > 0
+    runs = np.zeros(len(blobs))
+    if nonempty.any():
+        runs[nonempty] = np.add.reduceat(same, starts[nonempty]) / safe[nonempty]
+    return {"hist": hist, "printable": printable, "solid": solid, "entropy": entropy, "runs": runs}
+
+def _seed_scores(blobs):
+    # Best rolling XOR seed per file: solid share of a sample decrypted with
+    # every seed at once. Returns (best seed, its solid share, median solid
+    # share over all seeds) arrays.
+    n = len(blobs)
+    samples = np.zeros((n, SEED_SAMPLE), dtype=np.uint8)
+    lengths = np.zeros(n, dtype=np.int64)
+    for i, b in enumerate(blobs):
+        s = b[:SEED_SAMPLE]
+        samples[i, :len(s)] = np.frombuffer(s, dtype=np.uint8)
+        lengths[i] = len(s)
+    valid = np.arange(SEED_SAMPLE)[None, :] < lengths[:, None]
+    keys = ((np.arange(256)[:, None] + np.arange(SEED_SAMPLE)[None, :]) & 0xFF).astype(np.uint8)
+    best_seed = np.zeros(n, dtype=np.int64)
+    best_score = np.zeros(n)
+    median = np.zeros(n)
+    for lo in range(0, n, SEED_CHUNK):
+        dec = samples[lo:lo + SEED_CHUNK, None, :] ^ keys[None, :, :]    # (files, seeds, bytes)
+        hits = (_SOLID[dec] & valid[lo:lo + SEED_CHUNK, None, :]).sum(axis=2)
+        best_seed[lo:lo + SEED_CHUNK] = hits.argmax(axis=1)
+        total = np.maximum(lengths[lo:lo + SEED_CHUNK], 1)
+        best_score[lo:lo + SEED_CHUNK] = hits.max(axis=1) / total
+        median[lo:lo + SEED_CHUNK] = np.median(hits, axis=1) / total
+    count("seeds_tried", 256 * n)
+    return best_seed, best_score, median
+
+# --- Classification ---
+
+def fits_bitmap(size):
+    # How well a file size fits a Mode 15 bitmap: 1.0 for a full frame,
+    # 0.6 for whole 40 byte lines, 0.0 if it can't be one
+    if size in (BITMAP_SIZE, FRAME_SIZE):
+        return 1.0
+    if size >= 40 * 8 and size % 40 in (0, 5):
+        return 0.6     # whole 40 byte lines, maybe another height
+    return 0.0
+
+def classify_batch(blobs, names=None):
+    # blobs: list of bytes. Returns one Classification per blob.
+    blobs = [bytes(b) for b in blobs]
+    if not blobs:
+        return []
+    with span("classify_batch", files=len(blobs)):
+        stats = _batch_stats(blobs)
+        seeds, seed_solid, seed_median = _seed_scores(blobs)
+        results = []
+        for i, data in enumerate(blobs):
+            scores = {}
+            details = {}
+
+            for kind, probe in ((XEX, probe_xex), (BASIC, probe_basic),
+                                (DISPLAY_LIST, probe_display_list), (CHARSET, probe_charset)):
+                conf, det = probe(data)
+                if conf:
+                    scores[kind] = conf
+                    details[kind] = det or {}
+
+            fit = fits_bitmap(len(data))
+            if fit:
+                solid, runs = stats["solid"][i], stats["runs"][i]
+                # Plain: the bytes themselves are mostly solid colors / runs
+                scores[BITMAP] = fit * min(1.0, 0.5 * solid + 0.7 * runs + 0.2)
+                details[BITMAP] = {"solid": round(float(solid), 3), "runs": round(float(runs), 3)}
+                # Encrypted: solid only after removing the key stream, and
+                # the raw bytes must not already look like a bitmap. The
+                # more the best seed stands out from the rest, the surer.
+                if seed_solid[i] - solid > 0.2:
+                    margin = seed_solid[i] - seed_median[i]
+                    scores[ENCRYPTED_BITMAP] = fit * min(1.0, 0.5 + 2 * margin)
+                    details[ENCRYPTED_BITMAP] = {"seed": int(seeds[i]),
+                                                 "solid": round(float(seed_solid[i]), 3)}
+                    scores[BITMAP] *= 0.5
+
+            printable = stats["printable"][i]
+            if printable > 0.8 and len(data):
+                scores[TEXT] = float(printable)
+                details[TEXT] = {"printable": round(float(printable), 3)}
+
+            kind, conf = UNKNOWN, 0.0
+            if scores:
+                kind = max(scores, key=scores.get)
+                conf = float(scores[kind])
+                if conf < MIN_CONFIDENCE:
+                    kind = UNKNOWN
+            det = dict(details.get(kind, {}))
+            det["size"] = len(data)
+            det["entropy"] = round(float(stats["entropy"][i]), 3)
+            if names is not None:
+                det["name"] = names[i]
+            results.append(Classification(kind, round(conf, 3), det))
+        count("files_classified", len(blobs))
+        return results
+
+def classify(data):
+    return classify_batch([data])[0]
+
+def classify_files(paths):
+    # Regular files only; directories and unreadable paths come back UNKNOWN.
+    blobs = []
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                blobs.append(f.read())
+        except (IsADirectoryError, PermissionError):
+            blobs.append(b"")
+    return classify_batch(blobs, names=[os.path.basename(p) for p in paths])
+
+def select(paths, kinds):
+    # Paths whose classification is one of kinds, in the given order
+    if isinstance(kinds, str):
+        kinds = (kinds,)
+    return [p for p, r in zip(paths, classify_files(paths)) if r.kind in kinds]
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify files extracted from Atari disks.")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--kind", choices=KINDS + (UNKNOWN,), help="only print files of this kind")
+    args = parser.parse_args()
+
+    paths = [p for p in args.files if os.path.isfile(p)]
+    for path, result in zip(paths, classify_files(paths)):
+        if args.kind and result.kind != args.kind:
+            continue
+        extra = " ".join(f"{k}={v}" for k, v in result.details.items() if k not in ("name", "size"))
+        print(f"{path:32s} {result.kind:14s} {result.confidence:.2f}  {extra}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from convert_images import PALETTE
+from decrypt_images import decrypt_frame
+from extract_atr import read_header, read_directory, read_file
+from filetype import classify_batch, BITMAP, ENCRYPTED_BITMAP
+from instrument import span, count, worker_pool
+
+# Perceptual hashes of Mode 15 frames and a Hamming distance index over them,
+# for finding the same artwork across many disks: the same opponent frame
+# encrypted with another seed decrypts to the same bytes and hashes to the
+# same value, a lightly edited one lands a few bits away.
+#
+# The hash is a 64 bit difference hash computed from the packed 2 bpp bytes:
+# a 256 entry table gives the summed luminance of the four pixels in each
+# byte, the (rows, 40) luminance grid is averaged into 8 x 9 blocks with
+# np.add.reduceat, and bit i is set when a block is brighter than its right
+# neighbour. Pixels are never unpacked, and a batch of frames is hashed in
+# one pass.
+#
+#   hashes = hash_frames([decrypted, ...])          # uint64 array
+#   index = HashIndex(hashes, names)
+#   index.query(hashes[0], k=6)                     # [(name, distance), ...]
+#
+# HashIndex is a multi-index hash: each hash is split into four 16 bit
+# chunks with one table per chunk. Two hashes within distance k agree to
+# within k // 4 bits on at least one chunk, so a query only probes the chunk
+# values within that radius and checks the candidates with a vectorized
+# popcount, instead of comparing against every frame.
+
+HASH_BITS = 64
+GRID_ROWS = 8
+GRID_COLS = 9           # 9 columns -> 8 horizontal differences per row
+LINE_BYTES = 40         # 160 pixels, 4 per byte
+CHUNKS = 4
+CHUNK_BITS = HASH_BITS // CHUNKS
+
+def _luma_table(palette=PALETTE):
+    # byte -> summed luminance of its four pixels (00, 01, 10, 11 -> colors)
+    rgb = np.array(palette, dtype=np.float64).reshape(4, 3)
+    luma = rgb @ np.array([0.299, 0.587, 0.114])
+    values = np.arange(256)
+    return sum(luma[(values >> shift) & 0x03] for shift in (6, 4, 2, 0)).astype(np.float32)
+
+_LUMA = _luma_table()
+
+if hasattr(np, "bitwise_count"):
+    def popcount(values):
+        return np.bitwise_count(values)
+else:
+    _POP8 = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+    def popcount(values):
+        values = np.ascontiguousarray(values, dtype=np.uint64)
+        return _POP8[values.view(np.uint8)].reshape(values.shape + (8,)).sum(axis=-1)
+
+def hamming(a, b):
+    return popcount(np.bitwise_xor(np.asarray(a, dtype=np.uint64), np.asarray(b, dtype=np.uint64)))
+
+def _hash_block(frames, rows):
+    # frames: (n, rows, 40) uint8 -> (n,) uint64
+    luma = _LUMA[frames]
+    row_edges = np.linspace(0, rows, GRID_ROWS + 1).astype(np.int64)
+    col_edges = np.linspace(0, LINE_BYTES, GRID_COLS + 1).astype(np.int64)
+    grid = np.add.reduceat(luma, row_edges[:-1], axis=1)
+    grid = np.add.reduceat(grid, col_edges[:-1], axis=2)
+    grid /= np.outer(np.diff(row_edges), np.diff(col_edges))
+    bits = grid[:, :, :-1] > grid[:, :, 1:]                 # (n, 8, 8)
+    packed = np.packbits(bits.reshape(len(frames), HASH_BITS), axis=1)
+    return packed.view(">u8").ravel().astype(np.uint64)
+
+def hash_frames(frames):
+    # Decrypted (or raw) frames, any number of 40 byte lines; trailing bytes
+    # such as the 5 byte footer are ignored. Frames of the same height are
+    # hashed together.
+    hashes = np.zeros(len(frames), dtype=np.uint64)
+    by_rows = {}
+    for i, frame in enumerate(frames):
+        rows = len(frame) // LINE_BYTES
+        if rows < GRID_ROWS:
+            raise ValueError(f"frame {i} is {len(frame)} bytes, need at least {GRID_ROWS} lines")
+        by_rows.setdefault(rows, []).append(i)
+    for rows, ids in by_rows.items():
+        block = np.frombuffer(b"".join(bytes(frames[i][:rows * LINE_BYTES]) for i in ids),
+                              dtype=np.uint8).reshape(len(ids), rows, LINE_BYTES)
+        hashes[ids] = _hash_block(block, rows)
+    count("frames_hashed", len(frames))
+    return hashes
+
+def frame_hash(frame):
+    return int(hash_frames([frame])[0])
+
+# --- Index ---
+
+def _masks(radius):
+    # All CHUNK_BITS-bit values with at most radius bits set
+    values = np.arange(1 << CHUNK_BITS, dtype=np.uint64)
+    return values[popcount(values) <= radius]
+
+class HashIndex:
+    def __init__(self, hashes=(), names=()):
+        self.hashes = np.zeros(0, dtype=np.uint64)
+        self.names = []
+        self.tables = [{} for _ in range(CHUNKS)]
+        self._mask_cache = {}
+        if len(hashes):
+            self.add(hashes, names)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def add(self, hashes, names):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(hashes) != len(names):
+            raise ValueError(f"{len(hashes)} hashes but {len(names)} names")
+        first = len(self.hashes)
+        self.hashes = np.concatenate([self.hashes, hashes])
+        self.names.extend(names)
+        for c in range(CHUNKS):
+            chunk = (hashes >> np.uint64(c * CHUNK_BITS)) & np.uint64(0xFFFF)
+            table = self.tables[c]
+            for i, value in enumerate(chunk.tolist()):
+                table.setdefault(value, []).append(first + i)
+
+    def _candidates(self, h, k):
+        radius = k // CHUNKS
+        if radius not in self._mask_cache:
+            self._mask_cache[radius] = _masks(radius).tolist()
+        masks = self._mask_cache[radius]
+        found = set()
+        for c in range(CHUNKS):
+            value = (h >> (c * CHUNK_BITS)) & 0xFFFF
+            table = self.tables[c]
+            for mask in masks:
+                ids = table.get(value ^ mask)
+                if ids:
+                    found.update(ids)
+        return np.fromiter(found, dtype=np.int64, count=len(found))
+
+    def query_ids(self, h, k):
+        # [(position, distance), ...] within distance k, nearest first
+        h = int(h)
+        ids = self._candidates(h, k)
+        count("hash_candidates", len(ids))
+        if not len(ids):
+            return []
+        dist = hamming(self.hashes[ids], h)
+        keep = dist <= k
+        ids, dist = ids[keep], dist[keep]
+        order = np.lexsort((ids, dist))
+        return [(int(ids[i]), int(dist[i])) for i in order]
+
+    def query(self, h, k=6):
+        return [(self.names[i], d) for i, d in self.query_ids(h, k)]
+
+    def clusters(self, k=6):
+        # Groups of near-duplicates (connected components at distance <= k),
+        # largest first; singletons are left out.
+        parent = list(range(len(self.hashes)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for i, h in enumerate(self.hashes.tolist()):
+            for j, _ in self.query_ids(h, k):
+                if j > i:
+                    parent[find(j)] = find(i)
+        groups = {}
+        for i in range(len(parent)):
+            groups.setdefault(find(i), []).append(self.names[i])
+        return sorted((g for g in groups.values() if len(g) > 1), key=len, reverse=True)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            np.savez_compressed(f, hashes=self.hashes, names=np.array(json.dumps(self.names)))
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as z:
+            return cls(z["hashes"], json.loads(str(z["names"])))
+
+# --- Corpus ---
+
+def _read_inputs(path):
+    # [(name, bytes)] for a file, or for every file on an ATR image
+    if path.lower().endswith(".atr"):
+        items = []
+        with open(path, "rb") as f:
+            geometry = read_header(f)
+            if geometry is None:
+                return []
+            sector_size, sector_count = geometry
+            for fname, start, flag in read_directory(f, sector_size):
+                data = read_file(f, start, sector_size, min(sector_count, 1023))
+                items.append((f"{path}:{fname}", bytes(data)))
+        return items
+    with open(path, "rb") as f:
+        return [(path, f.read())]
+
+def hash_path(path):
+    # Frames in one file or disk image: [(name, kind, hash), ...]
+    with span("hash_path", path=path):
+        items = _read_inputs(path)
+        results = classify_batch([data for _, data in items])
+        names, kinds, frames = [], [], []
+        for (name, data), result in zip(items, results):
+            if result.kind == ENCRYPTED_BITMAP:
+                # The classifier already searched all seeds for this frame
+                data, _ = decrypt_frame(data, name, result.details["seed"])
+            elif result.kind != BITMAP:
+                continue
+            names.append(name)
+            kinds.append(result.kind)
+            frames.append(data)
+        if not frames:
+            return []
+        return list(zip(names, kinds, hash_frames(frames).tolist()))
+
+def build_index(paths, jobs=None):
+    index = HashIndex()
+    names, hashes = [], []
+    with worker_pool(jobs) as pool:
+        for entries in pool.imap(hash_path, paths, chunksize=8):
+            for name, kind, h in entries:
+                names.append(name)
+                hashes.append(h)
+    index.add(np.array(hashes, dtype=np.uint64), names)
+    return index
+
+def main():
+    parser = argparse.ArgumentParser(description="Find duplicate and near-duplicate Mode 15 frames.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_index = sub.add_parser("index", help="hash every frame in files / ATR images")
+    p_index.add_argument("inputs", nargs="+", help="ATR images or extracted files")
+    p_index.add_argument("--out", required=True, help="index file (.npz)")
+    p_index.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+
+    p_query = sub.add_parser("query", help="frames within distance k of the given files")
+    p_query.add_argument("index")
+    p_query.add_argument("inputs", nargs="+")
+    p_query.add_argument("-k", type=int, default=6)
+
+    p_dupes = sub.add_parser("dupes", help="list groups of near-duplicate frames")
+    p_dupes.add_argument("index")
+    p_dupes.add_argument("-k", type=int, default=6)
+    args = parser.parse_args()
+
+    if args.command == "index":
+        paths = [p for p in args.inputs if os.path.isfile(p)]
+        index = build_index(paths, args.jobs)
+        index.save(args.out)
+        print(f"Indexed {len(index)} frames from {len(paths)} inputs -> {args.out}", file=sys.stderr)
+    elif args.command == "query":
+        index = HashIndex.load(args.index)
+        for path in args.inputs:
+            for name, kind, h in hash_path(path):
+                print(f"{name} ({h:016x}):")
+                for match, dist in index.query(h, args.k):
+                    print(f"  {dist:2d}  {match}")
+    else:
+        index = HashIndex.load(args.index)
+        for group in index.clusters(args.k):
+            print(f"{len(group)} frames:")
+            for name in group:
+                print(f"  {name}")
+
+if __name__ == "__main__":
+    main()
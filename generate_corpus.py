@@ -0,0 +1,446 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+
+from xor_cipher import decrypt
+from disasm_6502 import OPCODES
+from instrument import worker_pool
+
+# Synthetic disk corpus generator for load testing the extractor and decoders.
+#
+# Every disk is a valid ATR image with a DOS 2.0 layout (boot sectors, VTOC at
+# 360, directory at 361-368, linked data sectors) filled with:
+#   - Mode 15 frames (5600 bytes + 5 byte footer) encrypted with the rolling
+#     seed cipher used for the OP* files: Enc[i] = Raw[i] ^ ((Seed + i) & 0xFF)
+#   - tokenized Atari BASIC programs in SAVE format
+#   - XEX binaries (0xFFFF header, load segments, RUNAD)
+#
+# Disk N is generated from (seed, N) only, so the corpus is identical no
+# matter how many worker processes are used.
+#
+#   python3 generate_corpus.py corpus/ --disks 10000 --jobs 8 --faults 0.05
+
+HEADER_SIZE = 16
+VTOC_SECTOR = 360
+DIR_START = 361
+DIR_LEN = 8
+VTOC2_SECTOR = 1024
+
+FRAME_SIZE = 5605       # 5600 bytes of bitmap + 5 byte footer
+
+# name -> (sector size, sector count)
+DENSITIES = {
+    "single": (128, 720),
+    "enhanced": (128, 1040),
+    "double": (256, 720),
+}
+
+FAULT_KINDS = ("cycle", "crosslink", "bytecount")
+
+# --- File contents ---
+
+def make_frame(rng, size=FRAME_SIZE):
+    # Mode 15 art is mostly runs of solid color bytes, with rows that repeat
+    # the row above (40 bytes per line). The seed search relies on this.
+    raw = bytearray()
+    row = bytearray()
+    while len(raw) < size:
+        if raw and rng.random() < 0.6:
+            row = bytearray(raw[-40:])
+            for _ in range(rng.randint(0, 4)):
+                row[rng.randrange(len(row))] = rng.choice((0x00, 0x55, 0xAA, 0xFF))
+        else:
+            row = bytearray()
+            while len(row) < 40:
+                if rng.random() < 0.8:
+                    row.extend([rng.choice((0x00, 0x55, 0xAA, 0xFF))] * rng.randint(2, 20))
+                else:
+                    row.extend(rng.randrange(256) for _ in range(rng.randint(1, 4)))
+            row = row[:40]
+        raw.extend(row)
+    return bytes(raw[:size])
+
+def make_encrypted_frame(rng):
+    # Returns (plain, seed, encrypted). The 5 byte footer is encrypted along
+    # with the bitmap, like the files on the original disk.
+    key = rng.randrange(256)
+    plain = make_frame(rng)
+    return plain, key, bytes(decrypt(plain, key))
+
+# Token bytes that can't appear inside a generated statement body:
+# 0x0E/0x0F start constants, 0x14 ends a statement, 0x16 ends a line.
+_BASIC_OPERATORS = [t for t in range(0x12, 0x55) if t not in (0x14, 0x16)]
+_BCD_DIGITS = [d for d in range(0x100) if d & 0x0F < 10 and d >> 4 < 10 and d != 0x16]
+
+def make_basic(rng, size):
+    # Atari BASIC SAVE format:
+    #   7 pointer words (LOMEM, VNTP, VNTD, VVTP, STMTAB, STMCUR, STARP),
+    #   relative to 0x0100 = file offset 14
+    #   variable name table (last char | 0x80, terminated by 0x00)
+    #   variable value table (8 bytes per variable)
+    #   statement table: [line lo hi][line len][stmt offset][token ...][0x14|0x16]
+    #   immediate line 32768 at STMCUR
+    nvars = rng.randint(4, 60)
+    vnt = bytearray()
+    for i in range(nvars):
+        name = chr(ord("A") + i % 26) + "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789")
+                                               for _ in range(rng.randint(0, 5)))
+        if rng.random() < 0.2:
+            name += "$"
+        encoded = bytearray(name.encode("ascii"))
+        encoded[-1] |= 0x80
+        vnt.extend(encoded)
+    vnt.append(0x00)
+    vvt = bytearray()
+    for i in range(nvars):
+        vvt.extend(bytes([0x00, i]) + bytes(6))
+
+    stmts = bytearray()
+    ln = 10
+    while len(stmts) < size:
+        bodies = []
+        length = 4
+        for _ in range(rng.randint(1, 4)):
+            body = bytearray([rng.choice([t for t in range(0x02, 0x37) if t != 0x16])])
+            for _ in range(rng.randint(1, 10)):
+                kind = rng.random()
+                if kind < 0.2:
+                    body.append(0x0E)
+                    body.extend(rng.choice(_BCD_DIGITS) for _ in range(6))
+                elif kind < 0.3:
+                    text = bytes(rng.randrange(0x20, 0x7B) for _ in range(rng.randint(1, 30)))
+                    body.extend(bytes([0x0F, len(text)]) + text)
+                elif kind < 0.65:
+                    body.append(0x80 + rng.randrange(nvars))
+                else:
+                    body.append(rng.choice(_BASIC_OPERATORS))
+            # Lines are at most 255 bytes (the length is a single byte)
+            if bodies and length + len(body) + 2 > 255:
+                break
+            bodies.append(body)
+            length += len(body) + 2
+        line = bytearray()
+        for n, body in enumerate(bodies):
+            body.append(0x16 if n == len(bodies) - 1 else 0x14)
+            # stmt offset counts from the start of the line
+            line.append(3 + len(line) + 1 + len(body))
+            line.extend(body)
+        stmts.extend(ln.to_bytes(2, "little"))
+        stmts.append(3 + len(line))
+        stmts.extend(line)
+        ln += 10
+    immediate = bytes([0x00, 0x80, 0x06, 0x06, 0x19, 0x16])
+
+    vntp = 0x0100
+    vntd = vntp + len(vnt) - 1
+    vvtp = vntp + len(vnt)
+    stmtab = vvtp + len(vvt)
+    stmcur = stmtab + len(stmts)
+    starp = stmcur + len(immediate)
+    header = b"".join(v.to_bytes(2, "little") for v in (0, vntp, vntd, vvtp, stmtab, stmcur, starp))
+    program = bytes(header + vnt + vvt + stmts + immediate)
+    check_basic(program)
+    return program
+
+def check_basic(data):
+    # Walk the statement table by line length (and each line's statements by
+    # statement offset); the walk must land exactly on STMCUR.
+    ptrs = [data[i] | (data[i + 1] << 8) for i in range(0, 14, 2)]
+    pos = ptrs[4] - 0x0100 + 14
+    end = ptrs[5] - 0x0100 + 14
+    while pos < end:
+        length = data[pos + 2]
+        if length < 4 or pos + length > end:
+            raise ValueError(f"BASIC line at offset {pos} has bad length {length}")
+        offset = 3
+        while offset < length:
+            nxt = data[pos + offset]
+            if nxt <= offset or nxt > length:
+                raise ValueError(f"BASIC line at offset {pos} has bad statement offset {nxt}")
+            offset = nxt
+        pos += length
+    if pos != end:
+        raise ValueError(f"BASIC statement table ends at {pos}, STMCUR is at {end}")
+
+def make_xex(rng, size):
+    opcodes = sorted(OPCODES)
+    xex = bytearray(b"\xff\xff")
+    addr = rng.choice((0x2000, 0x3000, 0x4000, 0x0600))
+    run = addr
+    while len(xex) < size:
+        code = bytearray()
+        for _ in range(rng.randint(50, 400)):
+            op = rng.choice(opcodes)
+            code.append(op)
+            code.extend(rng.randrange(256) for _ in range(OPCODES[op][2] - 1))
+        xex.extend(addr.to_bytes(2, "little"))
+        xex.extend((addr + len(code) - 1).to_bytes(2, "little"))
+        xex.extend(code)
+        addr = (addr + len(code) + 0x100) & 0xBFFF
+    # RUNAD
+    xex.extend(b"\xe0\x02\xe1\x02" + run.to_bytes(2, "little"))
+    return bytes(xex)
+
+# --- Disk layout ---
+
+def data_sectors(density):
+    # Sectors DOS 2.0 hands out to files, in allocation order. Enhanced
+    # density disks use the DOS 2.5 layout: sectors up to 1023, VTOC2 at 1024.
+    sector_size, sector_count = DENSITIES[density]
+    last = min(sector_count, VTOC2_SECTOR - 1)
+    return [s for s in range(4, last + 1)
+            if not VTOC_SECTOR <= s < DIR_START + DIR_LEN and s != 720]
+
+def sector_offset(sector, sector_size):
+    if sector <= 3:
+        sector_size = 128       # boot sectors are 128 bytes on every density
+    if sector_size > 128:
+        return HEADER_SIZE + 3 * 128 + (sector - 4) * sector_size
+    return HEADER_SIZE + (sector - 1) * sector_size
+
+def new_image(density):
+    sector_size, sector_count = DENSITIES[density]
+    if sector_size > 128:
+        image_size = 3 * 128 + (sector_count - 3) * sector_size
+    else:
+        image_size = sector_count * sector_size
+    image = bytearray(HEADER_SIZE + image_size)
+    paragraphs = image_size // 16
+    image[0:2] = (0x0296).to_bytes(2, "little")
+    image[2:4] = (paragraphs & 0xFFFF).to_bytes(2, "little")
+    image[4:6] = sector_size.to_bytes(2, "little")
+    image[6] = paragraphs >> 16
+
+    # Boot record: flags, sector count, load address, init address. Not a
+    # working DOS, but enough for tools that look at sector 1.
+    image[HEADER_SIZE:HEADER_SIZE + 6] = bytes([0x00, 0x03, 0x00, 0x07, 0x40, 0x15])
+    return image
+
+def write_vtoc(image, density, used):
+    sector_size, sector_count = DENSITIES[density]
+    usable = data_sectors(density)
+    free = [s for s in usable if s not in used]
+
+    vtoc = bytearray(sector_size)
+    vtoc[0] = 2                             # DOS 2.0
+    vtoc[1:3] = len([s for s in usable if s < 720]).to_bytes(2, "little")
+    vtoc[3:5] = len([s for s in free if s < 720]).to_bytes(2, "little")
+    # Bitmap for sectors 0-719, 1 = free, MSB first
+    for s in free:
+        if s < 720:
+            vtoc[10 + s // 8] |= 0x80 >> (s % 8)
+    off = sector_offset(VTOC_SECTOR, sector_size)
+    image[off:off + sector_size] = vtoc
+
+    if sector_count > VTOC2_SECTOR:
+        # DOS 2.5 VTOC2: copy of the bitmap for sectors 48-719, then 720-1023,
+        # then the free count above 719.
+        vtoc2 = bytearray(128)
+        vtoc2[0:84] = vtoc[16:100]
+        for s in free:
+            if s >= 720:
+                vtoc2[84 + (s - 720) // 8] |= 0x80 >> (s % 8)
+        vtoc2[122:124] = len([s for s in free if s >= 720]).to_bytes(2, "little")
+        off = sector_offset(VTOC2_SECTOR, sector_size)
+        image[off:off + 128] = vtoc2
+
+def write_file(image, density, file_no, sectors, data):
+    sector_size = DENSITIES[density][0]
+    payload = sector_size - 3
+    chunks = [data[i:i + payload] for i in range(0, len(data), payload)] or [b""]
+    for n, chunk in enumerate(chunks):
+        nxt = sectors[n + 1] if n + 1 < len(chunks) else 0
+        off = sector_offset(sectors[n], sector_size)
+        image[off:off + len(chunk)] = chunk
+        image[off + payload] = (file_no << 2) | (nxt >> 8)
+        image[off + payload + 1] = nxt & 0xFF
+        image[off + payload + 2] = len(chunk)
+
+def write_dir_entry(image, density, file_no, flag, count, start, name):
+    sector_size = DENSITIES[density][0]
+    base, _, ext = name.partition(".")
+    entry = bytearray(16)
+    entry[0] = flag
+    entry[1:3] = count.to_bytes(2, "little")
+    entry[3:5] = start.to_bytes(2, "little")
+    entry[5:13] = base.ljust(8).encode("ascii")
+    entry[13:16] = ext.ljust(3).encode("ascii")
+    # 8 entries in the first 128 bytes of each directory sector
+    off = sector_offset(DIR_START + file_no // 8, sector_size) + (file_no % 8) * 16
+    image[off:off + 16] = entry
+
+def build_disk(files, density="single"):
+    # files: list of (name, data). Returns (image bytes, layout) where layout
+    # is a list of (name, start sector, sector list) per file.
+    sector_size = DENSITIES[density][0]
+    if len(files) > DIR_LEN * 8:
+        raise ValueError(f"{len(files)} files do not fit in a DOS 2.0 directory")
+    image = new_image(density)
+    free = data_sectors(density)
+    layout = []
+    used = set()
+    for file_no, (name, data) in enumerate(files):
+        count = max(1, -(-len(data) // (sector_size - 3)))
+        if count > len(free):
+            raise ValueError(f"{name} ({len(data)} bytes) does not fit on a {density} density disk")
+        sectors, free = free[:count], free[count:]
+        used.update(sectors)
+        write_file(image, density, file_no, sectors, data)
+        # 0x42 = in use, created by DOS 2; 0x03 marks DOS 2.5 files above 719
+        flag = 0x03 if sectors[-1] >= 720 else 0x42
+        write_dir_entry(image, density, file_no, flag, count, sectors[0], name)
+        layout.append((name, sectors[0], sectors))
+    write_vtoc(image, density, used)
+    return bytes(image), layout
+
+# --- Faults ---
+
+def set_link(image, density, sector, nxt, file_no=None):
+    sector_size = DENSITIES[density][0]
+    off = sector_offset(sector, sector_size) + sector_size - 3
+    if file_no is None:
+        file_no = image[off] >> 2
+    image[off] = (file_no << 2) | (nxt >> 8)
+    image[off + 1] = nxt & 0xFF
+
+def inject_fault(image, density, layout, kind, rng):
+    # Mutates image in place and returns a description for the manifest,
+    # or None if the disk has no file the fault can be applied to.
+    sector_size = DENSITIES[density][0]
+    multi = [entry for entry in layout if len(entry[2]) >= 2]
+    if kind == "cycle" and multi:
+        name, start, sectors = rng.choice(multi)
+        target = rng.choice(sectors[:-1])
+        set_link(image, density, sectors[-1], target)
+        return {"kind": kind, "file": name, "sector": sectors[-1], "target": target}
+    if kind == "crosslink" and len(multi) >= 2:
+        (a_name, _, a), (b_name, _, b) = rng.sample(multi, 2)
+        src = rng.choice(b[:-1])
+        target = rng.choice(a[1:])
+        set_link(image, density, src, target)
+        return {"kind": kind, "file": b_name, "sector": src, "target": target, "into": a_name}
+    if kind == "bytecount" and layout:
+        name, start, sectors = rng.choice(layout)
+        sector = rng.choice(sectors)
+        bad = rng.randint(min(sector_size - 2, 254), 255)
+        off = sector_offset(sector, sector_size) + sector_size - 1
+        image[off] = bad
+        return {"kind": kind, "file": name, "sector": sector, "count": bad}
+    return None
+
+# --- Disk generation ---
+
+def random_name(rng, taken):
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    while True:
+        base = rng.choice(letters) + "".join(rng.choice(letters + "0123456789")
+                                             for _ in range(rng.randint(0, 7)))
+        ext = "".join(rng.choice(letters) for _ in range(rng.randint(0, 3)))
+        name = f"{base}.{ext}" if ext else base
+        if name not in taken:
+            taken.add(name)
+            return name
+
+def generate_disk(seed, index, densities=("single",), fault_rate=0.0, fault_kinds=FAULT_KINDS):
+    # Returns (image bytes, manifest entry)
+    rng = random.Random(f"{seed}:{index}")
+    density = rng.choice(densities)
+    sector_size = DENSITIES[density][0]
+    capacity = len(data_sectors(density)) * (sector_size - 3)
+
+    files = []
+    meta = []
+    taken = set()
+    used = 0
+    while len(files) < DIR_LEN * 8:
+        kind = rng.choices(("frame", "basic", "xex"), weights=(6, 1, 1))[0]
+        info = {"kind": kind}
+        if kind == "frame":
+            plain, key, data = make_encrypted_frame(rng)
+            name = f"OP{len(files) // 5 + 1}.{len(files) % 5 + 1}"
+            taken.add(name)
+            info["seed"] = key
+            info["plain_sha1"] = hashlib.sha1(plain).hexdigest()
+        elif kind == "basic":
+            data = make_basic(rng, rng.randint(2000, 16000))
+            name = random_name(rng, taken)
+        else:
+            data = make_xex(rng, rng.randint(500, 8000))
+            name = random_name(rng, taken)
+        need = max(1, -(-len(data) // (sector_size - 3))) * (sector_size - 3)
+        if used + need > capacity:
+            break
+        used += need
+        files.append((name, data))
+        info.update(name=name, size=len(data), sha1=hashlib.sha1(data).hexdigest())
+        meta.append(info)
+
+    image, layout = build_disk(files, density)
+    image = bytearray(image)
+    for info, (name, start, sectors) in zip(meta, layout):
+        info["start"] = start
+        info["sectors"] = len(sectors)
+
+    faults = []
+    if fault_kinds and rng.random() < fault_rate:
+        fault = inject_fault(image, density, layout, rng.choice(fault_kinds), rng)
+        if fault:
+            faults.append(fault)
+
+    entry = {"index": index, "density": density, "files": meta, "faults": faults}
+    return bytes(image), entry
+
+def _write_disk(job):
+    out_dir, seed, index, densities, fault_rate, fault_kinds = job
+    image, entry = generate_disk(seed, index, densities, fault_rate, fault_kinds)
+    name = f"disk_{index:06d}.atr"
+    with open(os.path.join(out_dir, name), "wb") as f:
+        f.write(image)
+    entry["path"] = name
+    entry["bytes"] = len(image)
+    return entry
+
+def generate_corpus(out_dir, disks, seed=0, densities=("single",), fault_rate=0.0,
+                    fault_kinds=FAULT_KINDS, jobs=None):
+    os.makedirs(out_dir, exist_ok=True)
+    work = [(out_dir, seed, i, tuple(densities), fault_rate, tuple(fault_kinds)) for i in range(disks)]
+    total = 0
+    with open(os.path.join(out_dir, "manifest.jsonl"), "w") as manifest:
+        with worker_pool(jobs) as pool:
+            # imap keeps the manifest in disk order
+            for entry in pool.imap(_write_disk, work, chunksize=16):
+                manifest.write(json.dumps(entry) + "\n")
+                total += entry["bytes"]
+    return total
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic DOS 2.0 ATR corpus.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--disks", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--density", default="single",
+                        help="comma separated: single, enhanced, double (default single)")
+    parser.add_argument("--faults", type=float, default=0.0,
+                        help="fraction of disks that get one injected fault (default 0)")
+    parser.add_argument("--fault-kinds", default=",".join(FAULT_KINDS),
+                        help="comma separated: cycle, crosslink, bytecount")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    densities = [d for d in args.density.split(",") if d]
+    for d in densities:
+        if d not in DENSITIES:
+            parser.error(f"unknown density {d!r}")
+    kinds = [k for k in args.fault_kinds.split(",") if k]
+    for k in kinds:
+        if k not in FAULT_KINDS:
+            parser.error(f"unknown fault kind {k!r}")
+
+    total = generate_corpus(args.out_dir, args.disks, args.seed, densities, args.faults, kinds, args.jobs)
+    print(f"Wrote {args.disks} disks ({total / 1e6:.1f} MB) to {args.out_dir}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
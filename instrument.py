@@ -0,0 +1,186 @@
+import atexit
+import contextlib
+import json
+import logging
+import multiprocessing
+import multiprocessing.util
+import os
+import random
+import threading
+import time
+
+# Lightweight instrumentation shared by the tools.
+#
+#   with span("decrypt", file=name):
+#       ...
+#   count("bytes_decrypted", len(data))
+#
+# Nothing is recorded until enable() is called, or the ATARI_TRACE
+# environment variable names an output file:
+#
+#   ATARI_TRACE=trace.json ATARI_TRACE_FORMAT=chrome python3 decrypt_images.py
+#
+# Formats: "jsonl" (one span/counter per line) or "chrome" (trace event
+# format, open in chrome://tracing or Perfetto). ATARI_TRACE_SAMPLE=0.1 keeps
+# one span in ten; counters are always exact. While disabled, span() returns a
+# shared no-op context manager and count() is a single flag check.
+#
+# Each process records its own events and writes them at exit: the process
+# that enabled tracing to the given file, other processes (pool workers) to
+# <file>.<pid>. Worker processes don't run atexit handlers, so pools must be
+# created with worker_pool() (or initializer=init_worker, initargs=
+# (worker_config(),)) and shut down cleanly for their events to be written:
+#
+#   with worker_pool(jobs) as pool:
+#       results = pool.map(work, items)
+
+_enabled = False
+_path = None
+_format = "jsonl"
+_sample = 1.0
+_owner = None
+_events = []
+_counters = {}
+_epoch = time.perf_counter_ns()
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("name", "attrs", "start")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _events.append((self.name, self.start - _epoch, end - self.start,
+                        threading.get_ident(), self.attrs))
+        return False
+
+    def set(self, **attrs):
+        # Attach attributes only known once the work is done (e.g. best seed)
+        self.attrs.update(attrs)
+
+def span(name, **attrs):
+    if not _enabled or (_sample < 1.0 and random.random() >= _sample):
+        return _NULL_SPAN
+    return _Span(name, attrs)
+
+def count(name, n=1):
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+def counters():
+    return dict(_counters)
+
+def enable(path=None, fmt="jsonl", sample=1.0, owner=None):
+    # owner: pid of the process that writes to path itself (default: this one)
+    global _enabled, _path, _format, _sample, _owner
+    if fmt not in ("jsonl", "chrome"):
+        raise ValueError(f"unknown trace format {fmt!r}")
+    _enabled = True
+    _path = path
+    _format = fmt
+    _sample = sample
+    _owner = owner or os.getpid()
+
+def disable():
+    global _enabled
+    _enabled = False
+
+def reset():
+    _events.clear()
+    _counters.clear()
+
+def trace_path():
+    # Output file of this process: the trace file, or <file>.<pid> in workers
+    if not _path or os.getpid() == _owner:
+        return _path
+    return f"{_path}.{os.getpid()}"
+
+def flush(path=None):
+    path = path or trace_path()
+    if not path or not (_events or _counters):
+        return
+    pid = os.getpid()
+    with open(path, "w") as f:
+        if _format == "chrome":
+            events = [{"name": name, "ph": "X", "ts": ts / 1000, "dur": dur / 1000,
+                       "pid": pid, "tid": tid, "args": attrs}
+                      for name, ts, dur, tid, attrs in _events]
+            now = (time.perf_counter_ns() - _epoch) / 1000
+            events.extend({"name": name, "ph": "C", "ts": now, "pid": pid,
+                           "args": {name: value}} for name, value in _counters.items())
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        else:
+            for name, ts, dur, tid, attrs in _events:
+                f.write(json.dumps({"type": "span", "name": name, "ts_us": ts / 1000,
+                                    "dur_us": dur / 1000, "pid": pid, "tid": tid,
+                                    "attrs": attrs}) + "\n")
+            for name, value in _counters.items():
+                f.write(json.dumps({"type": "counter", "name": name, "value": value,
+                                    "pid": pid}) + "\n")
+
+# --- Worker processes ---
+
+def worker_config():
+    # Picklable tracing settings to pass to init_worker()
+    if not _enabled:
+        return None
+    return (_path, _format, _sample, _owner)
+
+def init_worker(config=None):
+    # Pool initializer: trace like the parent (also under the spawn start
+    # method), drop events inherited through fork and write this worker's
+    # own events when it exits.
+    if config:
+        enable(*config)
+    reset()
+    multiprocessing.util.Finalize(None, flush, exitpriority=10)
+
+@contextlib.contextmanager
+def worker_pool(processes=None):
+    # multiprocessing.Pool whose workers' spans and counters are written.
+    # Leaving the block normally closes the pool and waits for the workers
+    # to exit; an exception terminates them.
+    pool = multiprocessing.Pool(processes, initializer=init_worker, initargs=(worker_config(),))
+    try:
+        yield pool
+        pool.close()
+        pool.join()
+    finally:
+        pool.terminate()
+
+def setup_logging(level=None):
+    # Progress messages go through logging. ATARI_LOG=DEBUG shows per-file
+    # detail, ATARI_LOG=WARNING only problems.
+    level = level or os.environ.get("ATARI_LOG", "INFO")
+    logging.basicConfig(level=level.upper(), format="%(message)s")
+
+if os.environ.get("ATARI_TRACE"):
+    # ATARI_TRACE_OWNER is inherited by spawned children, which then write
+    # to their own <file>.<pid>
+    enable(os.environ["ATARI_TRACE"],
+           os.environ.get("ATARI_TRACE_FORMAT", "jsonl"),
+           float(os.environ.get("ATARI_TRACE_SAMPLE", "1.0")),
+           int(os.environ.setdefault("ATARI_TRACE_OWNER", str(os.getpid()))))
+
+atexit.register(flush)
@@ -0,0 +1,188 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+
+from instrument import count
+
+try:
+    import fcntl
+except ImportError: # Windows: eviction runs without the cross-process lock
+    fcntl = None
+
+# On-disk cache for stage results (seeds, PNGs, listings).
+#
+# A key is the SHA-256 of the stage name, the stage parameters, the code
+# version and the SHA-256 of the input bytes, so a hit is only possible for
+# the exact same input processed by the exact same code:
+#
+#   cache = get_cache()
+#   key = cache.key("decrypt_png", data, version=source_version(__name__), width=160)
+#   png = cache.get(key)
+#   if png is None:
+#       png = render(...)
+#       cache.put(key, png)
+#
+# Entries are plain files under <dir>/<key[:2]>/<key>. Writes go to a temp
+# file in the same directory followed by os.replace, so readers in other
+# processes see either the old entry, the new one or none. Reads bump the
+# file's mtime, and once the cache grows past its byte budget the least
+# recently used entries are deleted under an flock on <dir>/.lock.
+#
+# Environment:
+#   ATARI_CACHE=0                 disable
+#   ATARI_CACHE_DIR=path          default $XDG_CACHE_HOME/atari-tools or ~/.cache/atari-tools
+#   ATARI_CACHE_MAX_BYTES=n       default 512 MB
+
+CACHE_FORMAT = 1
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_source_versions = {}
+
+def source_version(*module_names):
+    # Hash of the source files of the given modules, so editing the code
+    # that produced a result invalidates it.
+    key = tuple(module_names)
+    if key not in _source_versions:
+        h = hashlib.sha256(str(CACHE_FORMAT).encode())
+        for name in module_names:
+            path = getattr(sys.modules[name], "__file__", None)
+            if path:
+                with open(path, "rb") as f:
+                    h.update(f.read())
+        _source_versions[key] = h.hexdigest()[:16]
+    return _source_versions[key]
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+class ResultCache:
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+        # Size at the last scan plus what this process wrote since. Other
+        # processes also write, so this is only a trigger for a real scan.
+        self._size = None
+        self._written = 0
+
+    def key(self, stage, data, version="", **params):
+        h = hashlib.sha256()
+        h.update(json.dumps([stage, version, params], sort_keys=True).encode())
+        h.update(content_hash(data).encode())
+        return h.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def get(self, key):
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                value = f.read()
+        except FileNotFoundError:
+            count("cache_misses")
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError: # evicted by another process meanwhile
+            pass
+        count("cache_hits")
+        return value
+
+    def put(self, key, value):
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        self._written += len(value)
+        if self._size is None or self._size + self._written > self.max_bytes:
+            self.evict()
+
+    def get_json(self, key):
+        value = self.get(key)
+        return None if value is None else json.loads(value)
+
+    def put_json(self, key, obj):
+        self.put(key, json.dumps(obj).encode())
+
+    def _entries(self):
+        for sub in os.scandir(self.path):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                yield st.st_mtime, st.st_size, entry.path
+
+    def evict(self):
+        # Delete least recently used entries until the cache fits the budget.
+        with open(os.path.join(self.path, ".lock"), "w") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            for mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                    count("cache_evictions")
+                except FileNotFoundError:
+                    pass
+                total -= size
+            self._size = total
+            self._written = 0
+
+    def clear(self):
+        with open(os.path.join(self.path, ".lock"), "w") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            for _, _, path in list(self._entries()):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            self._size = 0
+            self._written = 0
+
+_default = None
+
+def get_cache():
+    # Shared cache configured from the environment, or None if disabled.
+    global _default
+    if os.environ.get("ATARI_CACHE", "1") == "0":
+        return None
+    if _default is None:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        path = os.environ.get("ATARI_CACHE_DIR") or os.path.join(base, "atari-tools")
+        max_bytes = int(os.environ.get("ATARI_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        _default = ResultCache(path, max_bytes)
+    return _default
+
+if __name__ == "__main__":
+    # python3 result_cache.py [clear]
+    cache = get_cache()
+    if cache is None:
+        print("Cache disabled (ATARI_CACHE=0)")
+    elif sys.argv[1:] == ["clear"]:
+        cache.clear()
+        print(f"Cleared {cache.path}")
+    else:
+        entries = list(cache._entries())
+        total = sum(size for _, size, _ in entries)
+        print(f"{cache.path}: {len(entries)} entries, {total / 1e6:.1f} MB of {cache.max_bytes / 1e6:.1f} MB")
@@ -0,0 +1,31 @@
+import glob
+import os
+
+from filetype import select, classify_files, BITMAP, ENCRYPTED_BITMAP
+
+# Regression test for the input selection of decrypt_images.py and
+# convert_images.py, which is decided by the classifier:
+#
+#   python3 -m pytest test_filetype.py
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def extracted(*names):
+    return [os.path.join(HERE, "extracted", n) for n in names]
+
+def all_extracted():
+    return sorted(f for f in glob.glob(os.path.join(HERE, "extracted", "*"))
+                  if os.path.isfile(f) and not f.endswith(".png"))
+
+def test_encrypted_frames_selected_for_decrypt():
+    assert select(all_extracted(), ENCRYPTED_BITMAP) == extracted(
+        "OP1.1", "OP1.2", "OP1.3", "OP1.4", "OP1.5", "OP2.1", "OP2.2", "OP2.3", "OP2.4")
+
+def test_raw_bitmaps_selected_for_convert():
+    assert select(all_extracted(), BITMAP) == extracted("OPP", "OPP.cracked", "TITLE2")
+
+def test_other_files_not_frames():
+    others = extracted("AUTORUN.SYS", "CARD.SET", "COM1", "COM2", "DLIST.BIN", "DOS.SYS",
+                       "OPN", "SP", "SPM")
+    kinds = {os.path.basename(p): r.kind for p, r in zip(others, classify_files(others))}
+    assert not {n: k for n, k in kinds.items() if k in (BITMAP, ENCRYPTED_BITMAP)}
@@ -0,0 +1,155 @@
+import argparse
+import sys
+
+import atascii
+from instrument import count
+
+# Fixed-width ATASCII string tables, such as the opponent taunts in COM1/COM2.
+#
+# COM1 and COM2 are 1000 byte files; the first 900 bytes are 30 records of
+# 30 characters, padded with spaces (the web editor edits the same 30x30
+# block). The remaining 100 bytes hold clothing names and data and are left
+# untouched.
+#
+# A RecordTable is a view over a bytearray (or any writable buffer): reads
+# decode the whole table in one codec call, writes go straight into the
+# buffer through a memoryview, so patching many tables means no per-string
+# copies of the file.
+#
+#   table = load_table("extracted/COM1")
+#   texts = table.read_all()
+#   table.replace({3: "I'M ON FIRE TONIGHT!"})
+#   save_table(table, "extracted/COM1")
+
+COM_RECORD_SIZE = 30
+COM_RECORD_COUNT = 30
+
+class RecordTable:
+    def __init__(self, buf, record_size=COM_RECORD_SIZE, records=COM_RECORD_COUNT, offset=0, pad=0x20):
+        self.buf = buf
+        self.view = memoryview(buf)
+        self.record_size = record_size
+        self.records = records
+        self.offset = offset
+        self.pad = pad
+        end = offset + record_size * records
+        if end > len(self.view):
+            raise ValueError(f"{records} records of {record_size} bytes at {offset} need {end} bytes, "
+                             f"buffer has {len(self.view)}")
+
+    def __len__(self):
+        return self.records
+
+    def _span(self, index):
+        if not -self.records <= index < self.records:
+            raise IndexError(f"record {index} out of range (0-{self.records - 1})")
+        if index < 0:
+            index += self.records
+        start = self.offset + index * self.record_size
+        return start, start + self.record_size
+
+    def raw(self, index):
+        start, end = self._span(index)
+        return self.view[start:end]
+
+    def __getitem__(self, index):
+        return atascii.decode(self.raw(index))
+
+    def __setitem__(self, index, text):
+        self.replace({index: text})
+
+    def __iter__(self):
+        return iter(self.read_all())
+
+    def read_all(self, strip=False):
+        # One decode for the whole table, then slice the string
+        text = atascii.decode(self.view[self.offset:self.offset + self.record_size * self.records])
+        size = self.record_size
+        records = [text[i:i + size] for i in range(0, len(text), size)]
+        if strip:
+            pad = atascii.decode(bytes([self.pad]))
+            records = [r.rstrip(pad) for r in records]
+        return records
+
+    def fit(self, text):
+        # Encode and pad one record, or raise ValueError if it doesn't fit
+        data = atascii.encode(text)
+        if len(data) > self.record_size:
+            raise ValueError(f"{text!r} is {len(data)} characters, the limit is {self.record_size}")
+        return data + bytes([self.pad]) * (self.record_size - len(data))
+
+    def replace(self, updates):
+        # updates: {index: text} or [(index, text), ...]. Every record is
+        # checked before anything is written, so a bad entry leaves the
+        # buffer unchanged.
+        items = updates.items() if hasattr(updates, "items") else updates
+        encoded = []
+        errors = []
+        for index, text in items:
+            try:
+                start, end = self._span(index)
+                encoded.append((start, end, self.fit(text)))
+            except (IndexError, ValueError, UnicodeEncodeError) as e:
+                errors.append(f"record {index}: {e}")
+        if errors:
+            raise ValueError("; ".join(errors))
+        for start, end, data in encoded:
+            self.view[start:end] = data
+        count("records_patched", len(encoded))
+        return len(encoded)
+
+    def replace_text(self, mapping):
+        # Replace records by their current text, e.g. a translation table
+        # {"YOUR LUCK HAS TO RUN OUT...": "..."} applied to many disks.
+        # Returns the number of records changed.
+        current = self.read_all(strip=True)
+        updates = [(i, mapping[text]) for i, text in enumerate(current) if text in mapping]
+        if not updates:
+            return 0
+        return self.replace(updates)
+
+def load_table(path, record_size=COM_RECORD_SIZE, records=COM_RECORD_COUNT, offset=0):
+    with open(path, "rb") as f:
+        return RecordTable(bytearray(f.read()), record_size, records, offset)
+
+def save_table(table, path):
+    with open(path, "wb") as f:
+        f.write(table.view)
+
+def localize(paths, mapping, record_size=COM_RECORD_SIZE, records=COM_RECORD_COUNT, offset=0):
+    # Apply one translation table to many string files in place.
+    # Returns {path: records changed}.
+    changed = {}
+    for path in paths:
+        table = load_table(path, record_size, records, offset)
+        n = table.replace_text(mapping)
+        if n:
+            save_table(table, path)
+        changed[path] = n
+    return changed
+
+def main():
+    parser = argparse.ArgumentParser(description="List or patch fixed-width ATASCII string tables (COM1/COM2).")
+    parser.add_argument("file")
+    parser.add_argument("--record-size", type=int, default=COM_RECORD_SIZE)
+    parser.add_argument("--count", type=int, default=COM_RECORD_COUNT)
+    parser.add_argument("--offset", type=int, default=0)
+    parser.add_argument("--set", nargs=2, action="append", metavar=("INDEX", "TEXT"), default=[],
+                        help="replace record INDEX with TEXT (repeatable)")
+    args = parser.parse_args()
+
+    table = load_table(args.file, args.record_size, args.count, args.offset)
+    if args.set:
+        try:
+            n = table.replace([(int(i), text) for i, text in args.set])
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        save_table(table, args.file)
+        print(f"Updated {n} record(s) in {args.file}")
+    else:
+        for i, text in enumerate(table.read_all()):
+            print(f"{i:3d}: {text}")
+
+if __name__ == "__main__":
+    main()
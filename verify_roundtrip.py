@@ -0,0 +1,384 @@
+import argparse
+import glob
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from convert_images import unpack_mode15, pack_mode15
+from decrypt_images import find_seed, decrypt
+from extract_atr import read_header, read_directory, read_file, iter_chain, FLAG_DELETED
+from filetype import classify, classify_batch, BITMAP, ENCRYPTED_BITMAP, BITMAP_SIZE
+from generate_corpus import sector_offset
+from instrument import span, count, worker_pool
+
+# Bit-exact checks of candidate implementations (e.g. a vectorized or
+# native rewrite) against the reference pure Python functions, for every
+# file in a corpus of ATR images, before production switches to them.
+#
+#   python3 verify_roundtrip.py corpus/ --jobs 8 --report report.json
+#   python3 verify_roundtrip.py corpus/ --impl unpack_mode15=fastmode15:unpack
+#
+# Stages and their reference functions:
+#
+#   read_file      extract_atr.read_file(f, start, sector_size, max_sector)
+#   find_seed      decrypt_images.find_seed(payload); compared by the frame
+#                  each seed decrypts to, since seeds can tie
+#   decrypt        xor_cipher.decrypt(payload, seed)
+#   unpack_mode15  convert_images.unpack_mode15(bitmap)
+#   pack_mode15    convert_images.pack_mode15(pixels)
+#
+# A candidate is "module:function" taking the same arguments as the
+# reference; --impl stage=module:function registers one. find_seed defaults
+# to the vectorized seed search of filetype.py. Only stages with a
+# candidate are checked.
+#
+# Identities need no candidate and are always checked (unless --stages
+# leaves them out):
+#
+#   unpack_pack    pack_mode15(unpack_mode15(bitmap)) == bitmap for every
+#                  frame, decrypted first if needed
+#   rebuild_image  clearing the data bytes of every file's sectors and
+#                  writing the extracted files back gives the original image
+#
+# Disks are checked in a process pool. Outputs are compared by SHA-256; a
+# mismatch is reported with the first differing byte, an exception as an
+# error for that file (or disk). The exit status is 1 if anything failed.
+
+def sha256(data):
+    return hashlib.sha256(bytes(data)).hexdigest()
+
+def first_difference(expected, actual):
+    # Offset of the first differing byte (or the shorter length)
+    n = min(len(expected), len(actual))
+    for i in range(n):
+        if expected[i] != actual[i]:
+            return i
+    return n
+
+def compare(check, name, expected, actual):
+    # None when equal, else a failure record
+    count("roundtrip_checks")
+    if len(expected) == len(actual) and sha256(expected) == sha256(actual):
+        return None
+    count("roundtrip_failures")
+    offset = first_difference(expected, actual)
+    failure = {"check": check, "file": name, "offset": offset,
+               "expected_sha256": sha256(expected), "actual_sha256": sha256(actual),
+               "expected_size": len(expected), "actual_size": len(actual)}
+    if offset < len(expected):
+        failure["expected_byte"] = expected[offset]
+    if offset < len(actual):
+        failure["actual_byte"] = actual[offset]
+    return failure
+
+def as_bytes(result):
+    # bytes, bytearray, a list of ints or a NumPy array of 0-255 values
+    if isinstance(result, (bytes, bytearray, memoryview)):
+        return bytes(result)
+    return np.asarray(result, dtype=np.uint8).tobytes()
+
+def classifier_seed(payload):
+    # Default find_seed candidate: the 256-seed search of filetype.py
+    return classify(payload).details.get("seed")
+
+# --- Stages ---
+# inputs(disk, entry) yields the argument tuples a stage is checked with;
+# output(entry, result) turns a result into the bytes that are compared.
+
+def reference_seed(entry):
+    # find_seed() once per file, shared by the stages
+    if "reference_seed" not in entry:
+        entry["reference_seed"] = find_seed(entry["data"])[0]
+    return entry["reference_seed"]
+
+def bitmap(entry):
+    if entry["kind"] == ENCRYPTED_BITMAP:
+        return bytes(decrypt(entry["data"], reference_seed(entry))[:BITMAP_SIZE])
+    if entry["kind"] == BITMAP:
+        return entry["data"][:BITMAP_SIZE]
+    return None
+
+def read_file_inputs(disk, entry):
+    yield io.BytesIO(disk["image"]), entry["start"], disk["sector_size"], disk["max_sector"]
+
+def payload_inputs(disk, entry):
+    if entry["kind"] == ENCRYPTED_BITMAP:
+        yield (entry["data"],)
+
+def decrypt_inputs(disk, entry):
+    if entry["kind"] == ENCRYPTED_BITMAP:
+        yield entry["data"], reference_seed(entry)
+
+def bitmap_inputs(disk, entry):
+    data = bitmap(entry)
+    if data is not None:
+        yield (data,)
+
+def pixel_inputs(disk, entry):
+    data = bitmap(entry)
+    if data is not None:
+        yield (unpack_mode15(data),)
+
+def seed_output(entry, result):
+    seed = result[0] if isinstance(result, tuple) else result
+    if seed is None:
+        return b""
+    return bytes(decrypt(entry["data"], seed))
+
+class Stage:
+    __slots__ = ("name", "reference", "inputs", "output", "default")
+
+    def __init__(self, name, reference, inputs, output=None, default=None):
+        self.name = name
+        self.reference = reference
+        self.inputs = inputs
+        self.output = output or (lambda entry, result: as_bytes(result))
+        self.default = default      # candidate spec used without --impl
+
+STAGES = {s.name: s for s in (
+    Stage("read_file", read_file, read_file_inputs),
+    Stage("find_seed", find_seed, payload_inputs, seed_output, default="verify_roundtrip:classifier_seed"),
+    Stage("decrypt", decrypt, decrypt_inputs),
+    Stage("unpack_mode15", unpack_mode15, bitmap_inputs),
+    Stage("pack_mode15", pack_mode15, pixel_inputs),
+)}
+
+# --- Identities ---
+# check(disk, entries) yields (file name or None for the whole disk,
+# expected bytes, actual bytes).
+
+def unpack_pack(disk, entries):
+    for entry in entries:
+        data = bitmap(entry)
+        if data is not None:
+            yield entry["name"], data, as_bytes(pack_mode15(unpack_mode15(data)))
+
+def rebuild_image(disk, entries):
+    # Files are written back over their own chains; link bytes, slack after
+    # the byte count and sectors outside any file stay as they are
+    image = disk["image"]
+    sector_size = disk["sector_size"]
+    f = io.BytesIO(image)
+    chains = []
+    for entry in entries:
+        if entry["flag"] & FLAG_DELETED:
+            continue        # its sectors may belong to another file by now
+        chain = []
+        for sector, data in iter_chain(f, entry["start"], sector_size, disk["max_sector"]):
+            chain.append((sector_offset(sector, sector_size), min(data[sector_size - 1], sector_size - 3)))
+        chains.append((entry, chain))
+    rebuilt = bytearray(image)
+    for _, chain in chains:
+        for offset, n in chain:
+            rebuilt[offset:offset + n] = bytes(n)
+    for entry, chain in chains:
+        data = entry["data"]
+        pos = 0
+        for offset, n in chain:
+            rebuilt[offset:offset + n] = data[pos:pos + n].ljust(n, b"\0")
+            pos += n
+        if pos < len(data):
+            raise ValueError(f"{entry['name']}: {len(data) - pos} bytes don't fit its sector chain")
+    yield None, image, bytes(rebuilt)
+
+IDENTITIES = {
+    "unpack_pack": unpack_pack,
+    "rebuild_image": rebuild_image,
+}
+
+_resolved = {}
+
+def resolve(spec):
+    # "module:function" -> callable (cached per process)
+    if spec not in _resolved:
+        module, _, func = spec.partition(":")
+        if not module or not func:
+            raise ValueError(f"candidate {spec!r} is not module:function")
+        _resolved[spec] = getattr(importlib.import_module(module), func)
+    return _resolved[spec]
+
+def check_stage(stage, candidate, disk, entry, name):
+    # (number of checks, failure records) for one file
+    checks = 0
+    failures = []
+    for args in stage.inputs(disk, entry):
+        checks += 1
+        expected = stage.output(entry, stage.reference(*args))
+        try:
+            actual = stage.output(entry, candidate(*args))
+        except Exception as e:
+            count("roundtrip_failures")
+            failures.append({"check": stage.name, "file": name, "error": f"{e.__class__.__name__}: {e}"})
+            continue
+        failure = compare(stage.name, name, expected, actual)
+        if failure:
+            failures.append(failure)
+    return checks, failures
+
+def check_identity(name, check, disk, entries, path):
+    checks = 0
+    failures = []
+    try:
+        for fname, expected, actual in check(disk, entries):
+            checks += 1
+            failure = compare(name, f"{path}:{fname}" if fname else path, expected, actual)
+            if failure:
+                failures.append(failure)
+    except Exception as e:
+        count("roundtrip_failures")
+        failures.append({"check": name, "file": path, "error": f"{e.__class__.__name__}: {e}"})
+    return checks, failures
+
+def verify_disk(job):
+    path, candidates, identities = job
+    start = time.perf_counter()
+    result = {"path": path, "files": 0, "checks": 0, "failures": []}
+    try:
+        with span("verify_disk", path=path):
+            verify_image(path, candidates, identities, result)
+    except Exception as e:
+        # A truncated or corrupt image fails on its own, not the whole run
+        result["failures"].append({"check": "open", "file": path, "error": f"{e.__class__.__name__}: {e}"})
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+def verify_image(path, candidates, identities, result):
+    with open(path, "rb") as f:
+        image = f.read()
+    f = io.BytesIO(image)
+    geometry = read_header(f)
+    if geometry is None:
+        raise ValueError("not an ATR image")
+    sector_size, sector_count = geometry
+    disk = {"image": image, "sector_size": sector_size, "max_sector": min(sector_count, 1023)}
+    entries = []
+    for fname, start_sector, flag in read_directory(f, sector_size):
+        data = bytes(read_file(f, start_sector, sector_size, disk["max_sector"]))
+        entries.append({"name": fname, "start": start_sector, "flag": flag, "data": data})
+    for entry, cls in zip(entries, classify_batch([e["data"] for e in entries])):
+        entry["kind"] = cls.kind
+
+    stages = [(STAGES[name], resolve(spec)) for name, spec in candidates]
+    for entry in entries:
+        result["files"] += 1
+        for stage, candidate in stages:
+            checks, failures = check_stage(stage, candidate, disk, entry, f"{path}:{entry['name']}")
+            result["checks"] += checks
+            result["failures"].extend(failures)
+    for name in identities:
+        checks, failures = check_identity(name, IDENTITIES[name], disk, entries, path)
+        result["checks"] += checks
+        result["failures"].extend(failures)
+
+def expand(inputs):
+    paths = []
+    for p in inputs:
+        if os.path.isdir(p):
+            paths.extend(sorted(glob.glob(os.path.join(p, "*.atr"))))
+        else:
+            paths.append(p)
+    return paths
+
+def default_candidates():
+    return {name: stage.default for name, stage in STAGES.items() if stage.default}
+
+def verify(paths, candidates=None, identities=None, jobs=None, progress=None):
+    # candidates: {stage name: "module:function"} (default: the built-in
+    # ones); identities: names from IDENTITIES (default: all).
+    # Returns {"disks", "files", "checks", "failures": [...]}.
+    if candidates is None:
+        candidates = default_candidates()
+    if identities is None:
+        identities = list(IDENTITIES)
+    for name, spec in candidates.items():
+        if name not in STAGES:
+            raise ValueError(f"unknown stage {name!r}")
+        resolve(spec)       # fail early on a bad module or function name
+    for name in identities:
+        if name not in IDENTITIES:
+            raise ValueError(f"unknown identity {name!r}")
+    summary = {"disks": 0, "files": 0, "checks": 0, "failures": []}
+    work = [(p, tuple(candidates.items()), tuple(identities)) for p in paths]
+    with worker_pool(jobs) as pool:
+        for result in pool.imap_unordered(verify_disk, work, chunksize=4):
+            summary["disks"] += 1
+            summary["files"] += result["files"]
+            summary["checks"] += result["checks"]
+            summary["failures"].extend(result["failures"])
+            if progress:
+                progress(summary)
+    summary["failures"].sort(key=lambda f: (f["file"], f["check"]))
+    return summary
+
+def describe(failure):
+    if "error" in failure:
+        return f"{failure['file']}: {failure['error']}"
+    text = f"{failure['file']}: {failure['check']} differs at byte {failure['offset']}"
+    if "expected_byte" in failure and "actual_byte" in failure:
+        text += f" (expected {failure['expected_byte']:02X}, got {failure['actual_byte']:02X})"
+    elif failure["expected_size"] != failure["actual_size"]:
+        text += f" (size {failure['expected_size']} vs {failure['actual_size']})"
+    return text
+
+def main():
+    parser = argparse.ArgumentParser(description="Bit-exact checks of candidate implementations against the reference functions.")
+    parser.add_argument("inputs", nargs="+", help="ATR images or directories of them")
+    parser.add_argument("--impl", action="append", default=[], metavar="STAGE=MODULE:FUNC",
+                        help=f"candidate for a stage ({', '.join(STAGES)}); repeatable")
+    parser.add_argument("--stages", help="comma separated stages and identities to check "
+                                         "(default: all identities and all stages with a candidate)")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--report", help="write all failures as JSON")
+    args = parser.parse_args()
+
+    candidates = default_candidates()
+    identities = list(IDENTITIES)
+    choices = ", ".join(list(STAGES) + identities)
+    for impl in args.impl:
+        name, _, spec = impl.partition("=")
+        if name not in STAGES:
+            parser.error(f"unknown stage {name!r} (choose from {', '.join(STAGES)})")
+        candidates[name] = spec
+    if args.stages:
+        stages = [s for s in args.stages.split(",") if s]
+        for name in stages:
+            if name not in STAGES and name not in IDENTITIES:
+                parser.error(f"unknown stage {name!r} (choose from {choices})")
+            if name in STAGES and name not in candidates:
+                parser.error(f"stage {name!r} has no candidate (use --impl {name}=module:function)")
+        candidates = {name: candidates[name] for name in stages if name in STAGES}
+        identities = [name for name in stages if name in IDENTITIES]
+    try:
+        for spec in candidates.values():
+            resolve(spec)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(f"bad candidate: {e}")
+    paths = expand(args.inputs)
+
+    def progress(summary):
+        if summary["disks"] % 100 == 0:
+            print(f"{summary['disks']}/{len(paths)} disks, {len(summary['failures'])} failures",
+                  file=sys.stderr)
+
+    start = time.perf_counter()
+    print("Checking " + ", ".join([f"{name}={spec}" for name, spec in candidates.items()] + identities),
+          file=sys.stderr)
+    summary = verify(paths, candidates, identities, args.jobs, progress)
+    elapsed = time.perf_counter() - start
+    for failure in summary["failures"]:
+        print(describe(failure))
+    print(f"{summary['disks']} disks, {summary['files']} files, {summary['checks']} checks, "
+          f"{len(summary['failures'])} failures in {elapsed:.1f}s", file=sys.stderr)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(summary, f, indent=1)
+    sys.exit(1 if summary["failures"] else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+// Lazy loader for disk bundles written by build_disk_bundle.py.
+//
+// A bundle is a manifest.json plus zlib compressed chunks named by the
+// SHA-256 of their contents. Only the manifest is fetched up front; file
+// data, decrypted frames and the full ATR image are fetched, checked and
+// decompressed the first time they are asked for.
+//
+//   const disk = await openDiskBundle('./disks/strip-poker/');
+//   disk.files                          // [{ name, kind, start, flag, data, frame? }]
+//   const frame = await disk.loadFrame('OP1.1');   // { pixels, width, height, seed, footer }
+//   const atr = await disk.loadAtr();   // Uint8Array, e.g. before saving
+
+const BUNDLE_FORMAT = 1;
+
+async function sha256Hex(bytes) {
+    const digest = await crypto.subtle.digest('SHA-256', bytes);
+    return Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+}
+
+async function inflate(response) {
+    const stream = response.body.pipeThrough(new DecompressionStream('deflate'));
+    return new Uint8Array(await new Response(stream).arrayBuffer());
+}
+
+function hexToBytes(hex) {
+    const out = new Uint8Array(hex.length / 2);
+    for (let i = 0; i < out.length; i++) out[i] = parseInt(hex.substr(i * 2, 2), 16);
+    return out;
+}
+
+export async function openDiskBundle(baseUrl) {
+    const base = baseUrl.endsWith('/') ? baseUrl : baseUrl + '/';
+    const response = await fetch(base + 'manifest.json');
+    if (!response.ok) throw new Error(`Manifest not found: ${base}manifest.json (${response.status})`);
+    const manifest = await response.json();
+    if (manifest.format !== BUNDLE_FORMAT) {
+        throw new Error(`Unsupported bundle format ${manifest.format} (expected ${BUNDLE_FORMAT})`);
+    }
+
+    // One promise per chunk, so concurrent requests share a fetch
+    const chunks = new Map();
+
+    function loadChunk(entry) {
+        if (!chunks.has(entry.chunk)) {
+            const promise = (async () => {
+                const res = await fetch(base + entry.chunk);
+                if (!res.ok) throw new Error(`Chunk ${entry.chunk}: HTTP ${res.status}`);
+                const bytes = await inflate(res);
+                if (bytes.length !== entry.size || await sha256Hex(bytes) !== entry.sha256) {
+                    throw new Error(`Chunk ${entry.chunk} is corrupt`);
+                }
+                return bytes;
+            })();
+            promise.catch(() => chunks.delete(entry.chunk));   // allow a retry
+            chunks.set(entry.chunk, promise);
+        }
+        return chunks.get(entry.chunk);
+    }
+
+    function findFile(name) {
+        const file = manifest.files.find(f => f.name === name);
+        if (!file) throw new Error(`${name} is not on ${manifest.name}`);
+        return file;
+    }
+
+    return {
+        name: manifest.name,
+        sectorSize: manifest.sector_size,
+        sectorCount: manifest.sector_count,
+        files: manifest.files,
+
+        // Raw file bytes as stored on the disk
+        loadFile(name) {
+            return loadChunk(findFile(name).data);
+        },
+
+        // Decrypted Mode 15 frame: one color index (0-3) per pixel
+        async loadFrame(name) {
+            const file = findFile(name);
+            if (!file.frame) throw new Error(`${name} is not a Mode 15 frame (${file.kind})`);
+            const f = file.frame;
+            return {
+                pixels: await loadChunk(f),
+                width: f.width,
+                height: f.height,
+                seed: f.seed,
+                footer: hexToBytes(f.footer),
+            };
+        },
+
+        // The whole ATR image, for writing a modified disk
+        loadAtr() {
+            return loadChunk(manifest.atr);
+        },
+    };
+}
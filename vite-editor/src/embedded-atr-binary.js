@@ -1,5792 +0,0 @@
-// Embedded Strip Poker.atr file (binary array)
-// Auto-generated - do not edit manually
-// File size: 92176 bytes
-
-export const EMBEDDED_ATR_DATA = new Uint8Array([
-    150,  2,128, 22,128,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,
-      0,  3,  0,  7, 64, 21, 76, 20,  7,  3,  3,  0,124, 26,  1,  4,
-      0,125,203,  7,172, 14,  7,240, 54,173, 18,  7,133, 67,141,  4,
-      3,173, 19,  7,133, 68,141,  5,  3,173, 16,  7,172, 15,  7, 24,
-    174, 14,  7, 32,108,  7, 48, 23,172, 17,  7,177, 67, 41,  3, 72,
-    200, 17, 67,240, 14,177, 67,168, 32, 87,  7,104, 76, 47,  7,169,
-    192,208,  1,104, 10,168, 96, 24,165, 67,109, 17,  7,141,  4,  3,
-    133, 67,165, 68,105,  0,141,  5,  3,133, 68, 96,141, 11,  3,140,
-     10,  3,169, 82,160, 64,144,  4,169, 80,160,128,141,  2,  3,140,
-      3,  3,169, 49,160, 15,141,  0,  3,140,  6,  3,169,  3,141,255,
-     18,169,  0,160,128,202,240,  4,169,  1,160,  0,141,  9,  3,140,
-      8,  3, 32, 89,228, 16, 29,206,255, 18, 48, 24,162, 64,169, 82,
-    205,  2,  3,240,  9,169, 33,205,  2,  3,240,  2,162,128,142,  3,
-      3, 76,162,  7,174,  1, 19,173,  3,  3, 96,170,  8, 20, 11,190,
-     10,203,  9,  0, 11,166, 11,  7,133, 68,173, 10,  7,141,214, 18,
-    173, 12,  7,133, 67,173, 13,  7,133, 68,173, 10,  7,141, 12, 19,
-    162,  7,142, 13, 19, 14, 12, 19,176, 13,169,  0,157, 17, 19,157,
-     41, 19,157, 49, 19,240, 54,160,  5,169,  0,145, 67,232,142,  1,
-      3,169, 83,141,  2,  3, 32, 83,228,160,  2,173,234,  2, 41, 32,
-    208,  1,136,152,174, 13, 19,157, 17, 19,165, 67,157, 41, 19,165,
-     68,157, 49, 19, 32,112,  8,136,240,  3, 32,112,  8,202, 16,178,
-    172,  9,  7,162,  0,169,  0,136, 16,  1,152,157, 25, 19,152, 48,
-     13,165, 67,157, 57, 19,165, 68,157, 73, 19, 32,112,  8,232,224,
-     16,208,226,165, 67,141,231,  2,165, 68,141,232,  2, 76,126,  8,
-     24,165, 67,105,128,133, 67,165, 68,105,  0,133, 68, 96,160,127,
-    170,  8, 20, 11,190, 10,203,  9,  0, 11,166, 11,  7,133, 68,173,
-     10,  7,141,214, 18,173, 12,  7,133, 67,173, 13,  7,133, 68,173,
-     10,  7,141, 12, 19,162,  7,142, 13, 19, 14, 12, 19,176, 13,169,
-      0,157, 17, 19,157, 41, 19,157, 49, 19,240, 54,160,  5,169,  0,
-    145, 67,232,142,  1,  3,169, 83,141,  2,  3, 32, 83,228,160,  2,
-    173,234,  2, 41, 32,208,  1,136,152,174, 13, 19,157, 17, 19,165,
-     67,157, 41, 19,165, 68,157, 49, 19, 32,112,  8,136,240,  3, 32,
-    112,  8,202, 16,178,172,  9,  7,162,  0,169,  0,136,  0,  5,125,
-     16,  1,152,157, 25, 19,152, 48, 13,165, 67,157, 57, 19,165, 68,
-    157, 73, 19, 32,112,  8,232,224, 16,208,226,165, 67,141,231,  2,
-    165, 68,141,232,  2, 76,126,  8, 24,165, 67,105,128,133, 67,165,
-     68,105,  0,133, 68, 96,160,127,169,  0,153,129, 19,136,208,250,
-    160,  0,185, 26,  3,240, 12,201, 68,240,  8,200,200,200,192, 30,
-    208,240,  0,169, 68,153, 26,  3,169,203,153, 27,  3,169,  7,153,
-     28,  3, 96, 32,100, 17, 32,158, 14,189, 74,  3,157,130, 19, 41,
-      2,240,  3, 76,173, 13, 32, 33, 15,  8,189,130, 19,  0,  6,125,
-    201,  4,240, 15,201,  8,240, 68,201, 12,240, 12,201,  9,240, 23,
-     76,191, 18, 40,176, 14,144,  6, 40,176,  9, 32,172, 12, 32,174,
-      9, 76,240, 18, 76,187, 18, 40,176,250,172,  5, 19,185,  1, 20,
-     41,  2,240, 21, 32,172, 12, 32,191, 16, 32,  6, 17,157,142, 19,
-    189,139, 19,157,141, 19, 76,124,  9, 76,183, 18, 40,176,  9, 32,
-     83, 12,172,  5, 19, 76, 72,  9,173,  2, 19, 48,112,141,  6, 19,
-     32,110, 16,173,  3, 19,141,  5, 19,173,  4, 19,141,  7, 19, 32,
-    191, 16,172,  5, 19,162, 10,169, 32,153,  6, 20,200,  0,  7,125,
-    202, 16,249,174,  1, 19, 32,  6, 17,172,  5, 19,153,  5, 20,189,
-    139, 19,153,  4, 20,169, 67,153,  1, 20,169,  0,153,  3, 20,153,
-      2, 20,162,  0,189, 89, 19,201, 63,240,  3,153,  6, 20,200,232,
-    224, 11,144,240,174,  1, 19, 32,113, 16, 32,149,  9, 32,226, 15,
-    169,128,157,133, 19, 32,155, 18,208,  3, 76, 10, 18, 76,240, 18,
-     32,189, 18,169,  0,157,133, 19,173,  7, 19, 10, 10,157,129, 19,
-    169,  0,157,135, 19,157,143, 19,157,144, 19, 96, 32,149,  9,172,
-      5, 19,185,  1, 20, 41,  2,157,132, 19,185,  4, 20,  0,  8,125,
-    157,139, 19,185,  5, 20,157,140, 19, 32, 23, 16, 96,141,  8, 19,
-    189, 65,  3,133, 33, 32,100, 17,172,  0, 19,185,  2,  1,201,223,
-    176,  4,169,  0,133, 34,189,130, 19, 41,  8,240, 45,188,135, 19,
-    152,221,134, 19,144, 17, 32,148, 15,176, 34, 32, 31, 10,160,  0,
-    176,  5,177, 36,141,  8, 19,254,135, 19,173,  8, 19,145, 71,169,
-     64, 29,133, 19,157,133, 19, 76,240, 18, 76,191, 18, 76,244, 18,
-    189,133, 19, 16, 38, 48,  2,169,  0,141, 16, 19,165, 34, 41,  2,
-    240, 25, 32,174, 10,176, 20,165, 36,133, 71,165, 37,  0,  9,125,
-    133, 72,173, 16, 19, 48,  9, 32, 15, 16,144, 51,176, 83, 56, 96,
-    173,248, 18,157,135, 19,168,177, 71,141,  9, 19,200,177, 71,141,
-     10, 19,200,177, 71,141, 11, 19, 32,148, 15,172,248, 18,173,  9,
-     19,145, 71,200,173, 10, 19,145, 71,200,173, 11, 19,145, 71, 24,
-    165, 71,125,134, 19,133, 71,165, 72,105,  0,133, 72, 56,165, 40,
-    253,134, 19,133, 40,165, 41,233,  0,234,133, 41, 32,174, 10,144,
-    161,165, 71,133, 36,165, 72,133, 37,188,136, 19,136, 32,208, 17,
-     24, 96,173,254, 18,201,  1,208,  4,165, 40, 48,243,  0, 10,125,
-    165, 41,208,239, 56, 96, 32,100, 17,189,130, 19, 41,  2,240,  3,
-     76,185, 13,189,135, 19,221,134, 19,144, 11, 32, 38, 10, 32, 15,
-     16,144,240, 76,244, 18,168,177, 71,141,  8, 19,200,152,157,135,
-     19,188,139, 19,208, 15,188,140, 19,208, 10,221,134, 19,144,  5,
-    169,  3, 76,211, 18, 76,240, 18, 32,100, 17, 32,158, 14, 32, 33,
-     15,176,  6, 32,172, 12, 76,240, 18, 76,187, 18, 32,100, 17,189,
-    130, 19, 41,  8,240, 78, 62,133, 19,144, 81, 32,171, 15, 32,128,
-     11,189,144, 19, 72,189,143, 19, 72,189,130, 19, 41,  0, 11,125,
-      1,240, 23, 32,174,  9, 32, 15, 16,144,251,189,141, 19,157,139,
-     19,189,142, 19,157,140, 19, 32,179, 15,172,  5, 19, 24,104,121,
-      2, 20,153,  2, 20,104,121,  3, 20,153,  3, 20,169, 66,153,  1,
-     20, 32,113, 16, 32,149, 16,169,  0,157,130, 19, 76,234, 18, 62,
-    133, 19,144,243, 32,248, 15, 76,109, 11,189,129, 19, 74, 74,141,
-      7, 19, 32,155, 11,141,  6, 19, 32,155, 11, 32,157, 11, 10,141,
-      5, 19, 76,110, 16,169,  0,160,  3, 30,129, 19, 42,136,208,249,
-     96, 32,100, 17,189, 66,  3,201,254,240, 37,201, 39,  0, 12,125,
-    176, 30, 56,233, 32,144, 25, 10,168,185,197, 11, 72,185,198, 11,
-     72, 96, 11,216, 12, 49, 11,210, 12,123, 12,130, 12,185, 13,  2,
-     76,191, 18, 76, 24, 13, 32,158, 14,140, 13, 19, 32, 33, 15,144,
-      3, 76,187, 18, 32,172, 12, 32,155, 18,208,  3, 32, 25, 18,172,
-     13, 19, 32,180, 14, 32,155, 18,208, 15,172,  5, 19,185,  5, 20,
-     72,185,  4, 20,168,104, 32, 83, 18,162,  0,172,  5, 19,189, 89,
-     19,201, 63,240,  3,153,  6, 20,200,232,224, 11,144,240,174,  1,
-     19, 32,113, 16, 32,158, 14, 32, 49, 15,144,184, 76,  0, 13,125,
-    234, 18, 32,158, 14, 32, 33, 15,176, 63, 32, 83, 12, 32,155, 18,
-    208,  3, 32, 25, 18, 32,113, 16, 32, 49, 15,144,237, 32,149, 16,
-     76,234, 18, 32,191, 16,172,  5, 19, 32,172, 12,169,128,153,  1,
-     20, 32,174,  9, 76,108, 12, 32, 15, 16,176,  6, 32,197, 16, 76,
-    103, 12,160,  5,169,255,145, 69, 96, 76,187, 18,169, 32,141, 15,
-     19,208,  5,169,  0,141, 15, 19, 32,158, 14, 32, 33, 15,144,  3,
-     76,187, 18,172,  5, 19,185,  1, 20, 41,223, 13, 15, 19,153,  1,
-     20, 32,113, 16, 32, 49, 15,144,234, 76,234, 18,172,  0, 14,125,
-      5, 19,185,  1, 20, 41, 32,208,  1, 96, 76,193, 18,189,133, 19,
-     48, 65,189, 77,  3,221,138, 19,208,  8,189, 76,  3,221,137, 19,
-    240, 30,189,133, 19,240,  8, 32,248, 15,169,  0,157,133, 19,189,
-     77,  3,157,140, 19,189, 76,  3,157,139, 19, 32, 23, 16,176, 10,
-    189, 78,  3,221,134, 19,144,  5,240,  3, 76,195, 18,157,135, 19,
-     76,240, 18, 76,185, 18,189,135, 19,157, 78,  3,189,137, 19,157,
-     76,  3,189,138, 19,157, 77,  3, 76,240, 18,165, 72,141,  5,  3,
-    165, 71,141,  4,  3,169, 33,141,  2,  3,169, 64,141,  0, 15,125,
-      3,  3,174,254, 18,169, 49,172, 70,  2, 32,134,  7, 16, 25,192,
-    144,208, 18,160,  0,177, 71,201,255,208,  7,200,177, 71,201,255,
-    240,  3, 76,181, 18, 76,211, 18,169,  0,168,145, 69,200, 16,251,
-    160,  0,169,  2,145, 69,200,169,195,145, 69,200,200,145, 69,169,
-      2,136,145, 69,200,200,145, 69,160, 10,169,255,145, 69,200,192,
-    100,208,249,169, 15,160, 10,145, 69,160, 55,169,  0,145, 69,200,
-    169,127,145, 69, 32,149, 16,169,  0,168,153,  1, 20,200, 16,250,
-    169,  7,141,  6, 19, 32,113, 16,206,  6, 19, 16,248,  0, 16,125,
-     32, 25, 18, 76,234, 18,169,  0,141, 15, 19, 32, 33, 15,144, 44,
-    176, 48, 44, 15, 19, 48, 83,172, 15, 19,177, 71,141,  8, 19,238,
-     15, 19,201,155,208,  9,192, 17,176,  8,169,128,141, 15, 19, 76,
-    240, 18,169,  0,141, 15, 19, 32, 49, 15,176,  6, 32, 33, 14, 76,
-    240, 18, 32,139, 16,160,  4,177, 69, 72,136,177, 69,168,104, 32,
-     87, 14,160,  3,162, 12,189, 20, 14,145, 71,200,202, 16,247, 32,
-    103, 14,169,  0,141, 15, 19, 76,234, 18, 76,244, 18, 83, 82, 79,
-     84, 67, 69, 83, 32, 69, 69, 82, 70, 32,160,  0,169,  0, 17,125,
-     32,145, 71,174,  5, 19,189,  1, 20, 41, 32,240,  4,169, 42,145,
-     71,200,169, 32,145, 71,200,189,  6, 20,145, 71,232,200,192, 13,
-    144,245,169, 32,145, 71,200,140, 15, 19,174,  5, 19,188,  2, 20,
-    189,  3, 20,162,100, 32,113, 14,162, 10, 32,113, 14,152, 32,141,
-     14,160, 17,169,155,145, 71,160,  0,140, 15, 19, 96,142, 14, 19,
-    162,255,141, 13, 19,140, 12, 19,232, 56,173, 12, 19,237, 14, 19,
-    168,173, 13, 19,233,  0,176,234,138,  9, 48,172, 15, 19,145, 71,
-    238, 15, 19,173, 13, 19,172, 12, 19, 96,189, 68,  3,  0, 18,125,
-    133, 67,189, 69,  3,133, 68,160,  2,177, 67,136, 48, 88,201, 58,
-    208,247,200,162, 11,169, 32,157, 89, 19,202, 16,250,162,  0,142,
-     12, 19,200,177, 67,201, 42,208, 11,169, 63, 32, 10, 15,144,249,
-     16,240, 48, 46,201, 46,208, 12, 44, 12, 19, 48, 37,162,  8,110,
-     12, 19,144,222,201, 63,240, 20,201, 65,144,  4,201, 91,144, 12,
-    224,  0,240, 18,201, 48,144, 10,201, 58,176,  6, 32, 10, 15, 76,
-    195, 14,174,  1, 19, 96, 76,197, 18,224,  8,144, 13,240,  5,224,
-     12,144,  7, 96, 44, 12, 19, 48,  1, 96,157, 89, 19,  0, 19,125,
-    232, 24, 96,169,255,141,  2, 19,141,  6, 19,141,  7, 19,169,112,
-    141,  5, 19,238,  7, 19, 24,173,  5, 19,105, 16, 16, 17,238,  6,
-     19,169,  8,205,  6, 19,144,  2,240, 72, 32,110, 16,169,  0,141,
-      5, 19,168,185,  1, 20,240, 29, 48, 27, 41,  1,208,213,162,  0,
-    189, 89, 19,201, 63,240,  5,217,  6, 20,208,199,232,200,224, 11,
-    208,238, 24,144, 29,173,  2, 19, 16, 18,173,  6, 19,141,  2, 19,
-    173,  5, 19,141,  3, 19,173,  7, 19,141,  4, 19,185,  1, 20, 48,
-    162, 56,174,  1, 19, 96,189,133, 19, 48, 15, 10, 16,  0, 20,125,
-      9, 10,157,133, 19, 32,248, 15, 48, 36, 76, 15, 16, 32,  6, 17,
-    189,135, 19,172,251, 18,145, 71,189,140, 19, 29,129, 19,172,248,
-     18,145, 71,200,189,139, 19,145, 71, 32,248, 15, 16, 17,173,  3,
-      3,141, 15, 19,169,  0,157,130, 19,173, 15, 19, 76,211, 18,254,
-    143, 19,208,  3,254,144, 19, 32,  2, 16,169,  0,157,139, 19,157,
-    140, 19,157,135, 19,173,248, 18,157,134, 19, 24, 96, 56,189,138,
-     19,188,137, 19, 76,247, 17,189,139, 19,157,137, 19,189,140, 19,
-    157,138, 19, 96,189,133, 19,240,  3, 76,148, 15,189,  0, 21,125,
-    139, 19, 29,140, 19,208,  2, 56, 96, 32,  2, 16, 24, 32,249, 15,
-     48, 53,172,248, 18,177, 71, 41,252,221,129, 19,208, 44,177, 71,
-     41,  3,157,140, 19,200,177, 71,157,139, 19,200,177, 71, 72,189,
-    132, 19,208,  8,104, 48,  2,169,125, 41,127, 72,104,157,134, 19,
-    169,  0,157,135, 19, 24, 96, 32,229, 18,189, 66,  3,201, 33,240,
-      3, 32,199, 18, 56, 96, 24,144,  1, 56,  8,169, 20,141,  5,  3,
-    169,  1,141,  4,  3, 24,173,  6, 19,105,105,168,169,  1,105,  0,
-     76,171, 16,160,  5,177, 69,240,  1, 96, 24,144,  7,  0, 22,125,
-    160,  5,169,  0,145, 69, 56,  8,165, 70,141,  5,  3,165, 69,141,
-      4,  3,160,104,169,  1, 40,174,254, 18, 32,108,  7, 48,  1, 96,
-    201,131,240,  3, 76,229, 18, 76,201, 18, 32,139, 16, 76,149, 16,
-    189,137, 19, 29,138, 19,240, 56,169,  0,160,  3, 94,138, 19,126,
-    137, 19,106,136,208,246,160,  5,106,136,208,252,168,169,  0, 56,
-    106,136, 16,252, 72,189,137, 19,105, 10,168,104, 17, 69,145, 69,
-    160,  3,177, 69, 24,105,  1,145, 69,200,177, 69,105,  0,145, 69,
-     96,160,  9,200,192,100,176, 84,177, 69,240,247,140,  0, 23,125,
-     12, 19, 72, 56,160,  3,177, 69,233,  1,145, 69,200,177, 69,233,
-      0,145, 69,200,169,255,145, 69,104,160,255,200, 10,144,252,140,
-     13, 19, 74,136, 16,252,172, 12, 19,145, 69, 56,173, 12, 19,233,
-     10,160,  0,140, 12, 19, 10, 46, 12, 19,200,192,  3,144,247, 24,
-    109, 13, 19,157,139, 19,173, 12, 19,105,  0,157,140, 19, 96, 76,
-    203, 18,169,159,133, 73,142,  1, 19,186,232,232,142,  0, 19,174,
-      1, 19,164, 33,140,  1,  3,136,185, 41, 19,133, 69,185, 49, 19,
-    133, 70,185, 17, 19,240, 82,141,254, 18,168,185,248,  0, 24,125,
-     18,141,248, 18,185,251, 18,141,251, 18,188,136, 19,136, 16, 49,
-    160,  0,185, 25, 19,240,  8,200,192, 16,144,246, 76,205, 18,173,
-    254, 18, 74,176, 16,200,192, 16,176,242,185, 25, 19,208,232,136,
-    169,128,153, 26, 19,169,128,153, 25, 19,152,157,136, 19,254,136,
-     19,185, 57, 19,133, 71,185, 73, 19,133, 72, 96, 76,207, 18,188,
-    136, 19,240, 19,136,169,  0,157,136, 19,153, 25, 19,173,254, 18,
-     74,176,  4, 74,153, 26, 19, 96, 72,165, 71,141,  4,  3,165, 72,
-    141,  5,  3,104,174,254, 18, 32,108,  7, 96,188,137,  0, 25,125,
-     19,189,138, 19, 32, 83, 18, 32,103, 18, 76,240, 18,169,  0,141,
-     14,  7,169,  7,141,  5,  3,169,  0,141,  4,  3,169,  0,141, 10,
-      3,141, 11,  3,238, 10,  3,162,  1, 56, 32,114,  7, 24,173,  4,
-      3,105,128,141,  4,  3,173,  5,  3,105,  0,141,  5,  3,173, 10,
-      3,205,  1,  7,208,222, 96,140, 15,  7,141, 16,  7,173,254, 18,
-    141, 14,  7,172,248, 18,140, 17,  7,208,180,173, 18,  7,133, 67,
-    173, 19,  7,133, 68,160,  0,177, 67,145, 71,200,204,248, 18,144,
-    246,152,157,135, 19, 32, 87,  7,205, 13,  7,144, 11,  0, 26,125,
-    208, 15,165, 67,205, 12,  7,144,  2,208,  6, 32,148, 15, 76,113,
-     18, 96,160, 11,185, 88, 19,217,168, 18,208,  3,136,208,245, 96,
-     68, 79, 83, 32, 32, 32, 32, 32, 83, 89, 83, 32,230, 73,230, 73,
-    230, 73,230, 73,230, 73,230, 73,230, 73,230, 73,230, 73,230, 73,
-    230, 73,230, 73,230, 73,230, 73,165, 73,174,  1, 19,157, 67,  3,
-    174,  0, 19,154,174,  1, 19,168,173,  8, 19, 96,173,  3,  3, 48,
-    233,174,  1, 19, 32,222, 17,169,  1,208,223,169,136, 48,219,125,
-    125,253,127,127,255,  1,  3,247, 16,  0,  0,  0,  0,  0, 27,125,
-      0,  0,155, 32, 72, 69,  0,  3, 10,128,192,  1,  1,  0,  0,  0,
-      0,  0,  0,128,  0,  0,255,254,253,252,251,250,249,248,247,246,
-    245,244,243,252,124,  0,  0,  0,  0,  0,  0, 26, 26,  0,  0,  0,
-      0,  0,  0,124,252,124,202,  0,  0, 68, 68, 79, 83, 32, 32, 32,
-     28, 28, 29, 27, 27, 28, 27,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-     68, 79, 83, 68, 79, 83, 32, 32, 32, 32, 32, 83, 89, 83, 32, 32,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  8,  0,  0,128,125,  0,  0,  0,  0,  0,  0, 28,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8,
-      0,  2,128,125,  0,  1, 28,  0,  0,  0,  0,  0, 24,  0,  4,  0,
-      0,  0,  0,125,  0,  0, 10,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 24,  0,
-      0,  2,  0,111,111,  0, 67,  1,  0,  0,  0,  0,  0,  0, 29,125,
-      0, 67,  0,  0,  4,  0, 68, 79, 83, 32, 32, 32, 32, 32, 83, 89,
-     83,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 30,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0, 32,141, 22, 48, 21,160,  0, 96,169,  3,
-    157, 66,  3,169,155,157, 68,  3,169, 20,157, 69,  3, 76, 86,228,
-    140,252, 20, 32,141, 22,169, 33,157, 66,  3, 32,219,  0, 31,125,
-     20,160,  0, 96, 76, 86,169,  0,141, 85, 21,169, 81,133, 10,169,
-     23,133, 11,169,154,141, 10,  2,169, 25,141, 11,  2,169, 93,141,
-     12,  2,169, 25,141, 13,  2, 32,224,  7,165,  8,208, 21,169,192,
-    141, 84,  3,169, 22,141, 85,  3, 32, 74, 21,169,192, 32, 93, 21,
-     76, 33, 25,173, 84, 21,169,  0,141,158, 21,169,159,133, 10,169,
-     23,133, 11,169, 35,141, 10,  2,169, 26,141, 11,  2,169,230,141,
-     12,  2,169, 25,141, 13,  2, 32,224,  7,165,  8,208, 21,169, 12,
-    141, 84,  3,169, 23,141, 85,  3, 32,147, 21,169,192,  0, 32,125,
-     32,166, 21, 76,170, 25,173,157, 21,240, 17,173,158, 23,240, 18,
-     32, 63, 25, 32, 46, 25, 32,147, 21, 32,116,228,169,  0,141,157,
-     21, 96,133,  8,240,246,255,  0,  0,224,  2,225,  2,169,128,141,
-    159, 21,169, 71,141,224,  2,169, 22,141,225,  2,162, 16,169,  3,
-    157, 66,  3,169,  4,157, 74,  3, 32, 86,228, 16,  4,169,  1,208,
-    126,162, 16,169,244,157, 68,  3,169, 29,157, 69,  3,169,  2,157,
-     72,  3,169,  0,157, 73,  3,141, 11, 23,169,  7,157, 66,  3, 32,
-     86,228, 48,100,169,255,205,244, 29,208, 86,205,245,  0, 33,125,
-     29,208, 81,162, 16,169,160,157, 68,  3,169, 21,157, 69,  3,169,
-      4,157, 72,  3,169,  0,157, 73,  3, 32, 86,228, 16, 70,192,136,
-    208, 57, 32,170, 25, 44,158, 21, 48,  3, 32,  8, 23,169,  0, 44,
-    159, 21,141,159, 21, 48, 27, 32,115, 24, 48,  5,104,104, 76,184,
-     23,173,157, 21,208, 10,169, 27,162, 23, 32,190, 25, 76,  1, 24,
-    169,  0,170, 96, 32,170, 25,169,  3,208,247,152, 72, 32,170, 25,
-    104,168,208,238,162, 16,173,160, 21,157, 68,  3, 72,173,161, 21,
-    157, 69,  3,168,104,200,208, 31,168,200,208, 27,173,  0, 34,125,
-    162, 21,141,160, 21,173,163, 21,141,161, 21,169,162,157, 68,  3,
-    169, 21,157, 69,  3,169,  2, 76,  5, 22,173,162, 21, 56,237,160,
-     21,157, 72,  3,173,163, 21,237,161, 21,157, 73,  3,173,161, 21,
-     32,250, 22,176, 21,173,163, 21, 32,250, 22,176, 13,173, 11, 23,
-     48,  8,169,128, 13,159, 21,141,159, 21,254, 72,  3,208,  3,254,
-     73,  3, 44,159, 21, 48, 19,173, 11, 23, 48, 14,206, 11, 23, 32,
-     57, 25,169,  0,141,157, 21, 32, 46, 25,162, 16,169, 71,141,226,
-      2,169, 22,141,227,  2, 32, 86,228, 16,  3, 76, 79,  0, 35,125,
-     22, 44,158, 21, 48,  3, 32,  5, 23, 76,247, 21,201, 29,144,  6,
-    201, 52, 42, 73,  1, 74, 96,108,226,  2,108,224,  2,  0, 68, 49,
-     58, 65, 85, 84, 79, 82, 85, 78, 46, 83, 89, 83,155, 78, 69, 69,
-     68, 32, 77, 69, 77, 46, 83, 65, 86, 32, 84, 79, 32, 76, 79, 65,
-     68, 32, 84, 72, 73, 83, 32, 70, 73, 76, 69, 46,155, 68, 49, 58,
-     77, 69, 77, 46, 83, 65, 86,155, 32,170, 25,169,  8,157, 74,  3,
-     32,121, 23, 48, 56,169, 11,157, 66,  3,169,124,157, 68,  3,169,
-     29,157, 69,  3,169,138,157, 72,  3,169, 21,157, 73,  0, 36,125,
-      3, 32, 86,228, 48, 26, 32,170, 25, 48, 21,160,  0, 96,169,  3,
-    157, 66,  3,169, 59,157, 68,  3,169, 23,157, 69,  3, 76, 86,228,
-    140,154, 23, 32,170, 25,169, 33,157, 66,  3, 32,121, 23,160,  0,
-     96, 64, 21,  0,162,  0,142,158, 23,142,159, 21,202,134,  8, 32,
-    118, 25, 32,115, 24, 16,  6,169,  0,133,  8,240, 63, 32, 70, 23,
-     48,  5,206,158, 23, 48, 53,169, 58,162, 24, 32,190, 25,169, 91,
-    162, 24, 32,190, 25,169,  5,141, 66,  3,169,  0,141, 68,  3,169,
-      1,141, 69,  3,169,  2,141, 72,  3,169,  0,141, 73,  0, 37,125,
-      3, 32, 86,228,173,  0,  1,201, 89,208, 56,169,  0,133,  8,162,
-     32,169, 12,157, 66,  3, 32, 86,228,165, 12,141,156, 23,165, 13,
-    141,157, 23,169, 64,133, 12,169, 21,133, 13,169, 47,162, 16,157,
-     68,  3,169, 24,157, 69,  3,160,  0,140,158, 21,136,140,157, 21,
-     32,164, 21, 96, 69, 58,155, 68, 49, 58, 68, 85, 80, 46, 83, 89,
-     83,155, 69, 82, 82, 79, 82, 45, 83, 65, 86, 73, 78, 71, 32, 85,
-     83, 69, 82, 32, 77, 69, 77, 79, 82, 89, 32, 79, 78, 32, 68, 73,
-     83, 75,155, 84, 89, 80, 69, 32, 89, 32, 84, 79, 32,  0, 38,125,
-     83, 84, 73, 76, 76, 32, 82, 85, 78, 32, 68, 79, 83,155, 32,180,
-     25,169,  3,157, 66,  3,169, 59,157, 68,  3,169, 23,157, 69,  3,
-    169, 12,157, 74,  3, 32, 86,228,  8, 32,180, 25, 40, 96,169,  0,
-    240,  3, 32, 57, 25,162, 16, 32, 86,228,169,  0,240, 26,238,160,
-     24,173,226,  2,141,228, 25,173,227,  2,141,229, 25,169,226,170,
-    141,224, 25,169,  2, 32,239, 24,169,  0,240, 26,238,190, 24,173,
-    224,  2,141,228, 25,173,225,  2,141,229, 25,169,224,170,141,224,
-     25,169,  2, 32,239, 24, 32,170, 25,173,158, 23, 45,  0, 39,125,
-    148, 24,240,  6,238,148, 24, 76, 19, 24, 76,117, 32,141,225, 25,
-    232,142,226, 25,141,227, 25,162, 16,169,224,157, 68,  3,169, 25,
-    157, 69,  3,169,  6,157, 72,  3,169,  0,157, 73,  3, 76, 86,228,
-     32, 57, 25,169,  0,141,157, 21, 32, 46, 25,108,250,191, 32, 57,
-     25,169,  0,141,157, 21, 32, 46, 25,108, 26,  0,173,156, 23,133,
-     12,173,157, 23,133, 13, 96,173,158, 23,208,  1, 96, 32,115, 24,
-     16,  6,169,  0,133,  8,240, 36,169,  3,157, 66,  3, 32, 86,228,
-    169,  7,157, 66,  3,169,138,157, 72,  3,169, 21,157,  0, 40,125,
-     73,  3,169,124,157, 68,  3,169, 29,157, 69,  3, 32, 86,228,169,
-     12,157, 66,  3, 76, 86,228, 32,110,228,162,  0,169,  3,157, 66,
-      3,169, 44,157, 68,  3,169, 24,157, 69,  3,169, 12,157, 74,  3,
-     32, 86,228,162,  0,142, 28,  2,142, 29,  2,160,  1,169,  3,141,
-     42,  2, 32, 92,228,173, 42,  2,208,251, 96,169, 12,162, 16,157,
-     66,  3, 32, 86,228,162, 32,169, 12,157, 66,  3, 76, 86,228,141,
-     68,  3,142, 69,  3,169,128,141, 72,  3,162,  0,142, 73,  3,169,
-      9,141, 66,  3,173,157, 21,208,  3, 76, 86,228, 76,  0, 41,125,
-    170, 49,255,255,224,  2,225,  2,117, 32,152, 72,230, 50,208,  2,
-    230, 51,165, 50,197, 52,165, 51,229, 53,144, 26,165, 59,208,  9,
-    165, 49,141, 13,210,198, 59,208,  9,165, 16,  9,  8,133, 16,141,
-     14,210,104,168,104, 64,160,  0,177, 50,141, 13,210, 24,101, 49,
-    105,  0,133, 49, 76, 14, 26,152, 72,173, 15,210,141, 10,210, 48,
-      4,160,140,132, 48, 41, 32,208,  4,160,142,132, 48,165, 56,240,
-     19,173, 13,210,197, 49,240,  4,160,143,132, 48,169,255,133, 57,
-    104,168,104, 64,173, 13,210,160,  0,145, 50, 24,101,  0, 42,125,
-     49,105,  0,133, 49,230, 50,208,  2,230, 51,165, 50,197, 52,165,
-     51,229, 53,144,222,165, 60,240,  6,169,  0,133, 60,240,208,198,
-     56,208,208,  2,195,  2,156,  2,255,  0,  0,  0,  0,  0,  0,  0,
-      0,  0, 31,255,255,255,255,255,255,255,255,255,255,255,255,255,
-    255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,
-    255,255,255,255,255,255,255,255,255,255,  0,127,255,255,255,255,
-    255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,255,
-    255,255,255,255,255,255,255,255,255,255,255,255,255,  0,  0,125,
-      0,  0,  0,  1, 58,  2, 59,  2, 35,  6,239, 69, 59, 70,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125, 16, 44,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125, 16, 45,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,
-    125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  0,  0,  0,  0,  0,
-      2,  0,  0,  0,  0,  0,  0,  0,  3,  0,  0,  0,  0,  0,  0,  0,
-      4,  0,  0,  0,  0,  0,  0,  0,  5,  0,  0,  0,  0, 16, 46,125,
-      0,  0,  0,  6,  0,  0,  0,  0,  0,  0,  0,  7,  0,  0,  0,  0,
-      0,  0,  0,  8,  0,  0,  0,  0,  0,  0,  0,  9,  0,  0,  0,  0,
-      0,  0,  0, 10,  0,  0,  0,  0,  0,  0,  0, 11,  0,  0,  0,  0,
-      0,  0,  0, 12,  0,  0,  0,  0,  0,  0,  0, 13,  0,  0,  0,  0,
-      0,  0,  0, 14,  0,  0,  0,  0,  0,  0,128, 15,  0,  0,  0,  0,
-      0,  0, 64, 16,  0,  0,  0,  0,  0,  0,128, 17,  0,  0,  0,  0,
-      0,  0,128, 18,  0,  0,  0,  0,  0,  0,128, 19,  0,  0,  0,  0,
-      0,  0, 64, 20,  0,  0,  0,  0,  0,  0,  0, 21,  0, 16, 47,125,
-      0,  0,  0,  0,  0,  0, 22,  0,  0,  0,  0,  0,  0,  0, 23,  0,
-      0,  0,  0,  0,  0,128, 24,  0,  0,  0,  0,  0,  0,  0, 25,  0,
-      0,  0,  0,  0,  0,  0, 26,  0,  0,  0,  0,  0,  0,128, 27,  0,
-      0,  0,  0,  0,  0, 64, 28,  0,  0,  0,  0,  0,  0,128, 29,  0,
-      0,  0,  0,  0,  0,128, 30,  0,  0,  0,  0,  0,  0,128, 31,  0,
-      0,  0,  0,  0,  0,128, 32,  0,  0,  0,  0,  0,  0, 64, 33,  0,
-      0,  0,  0,  0,  0, 64, 34,  0,  0,  0,  0,  0,  0, 64, 35,  0,
-      0,  0,  0,  0,  0, 64, 36,  0,  0,  0,  0,  0,  0, 16, 48,125,
-     64, 37,  0,  0,  0,  0,  0,  0, 64, 38,  0,  0,  0,  0,  0,  0,
-     64, 39,  0,  0,  0,  0,  0,  0, 64, 40,  0,  0,  0,  0,  0,  0,
-     64, 41,  0,  0,  0,  0,  0,  0, 64, 42,  0,  0,  0,  0,  0,  0,
-     64, 43,  0,  0,  0,  0,  0,  0, 64, 44,  0,  0,  0,  0,  0,  0,
-     64, 45,  0,  0,  0,  0,  0,  0,  0, 46, 65,121,145,  0,  0,  0,
-      0, 47,  0,  0,  0,  0,  0,  0,  0, 48,  0,  0,  0,  0,  0,  0,
-      0, 49,  0,  0,  0,  0,  0,  0,  0, 50,  0,  0,  0,  0,  0,  0,
-      0, 51,  0,  0,  0,  0,  0,  0,  0, 52,  0,  0,  0, 16, 49,125,
-      0,  0,  0,  0, 53,  0,  0,  0,  0,  0,  0,  0, 54,  0,  0,  0,
-      0,  0,  0,  0, 55,  0,  0,  0,  0,  0,  0,  0, 56,  0,  0,  0,
-      0,  0,  0,128, 57,  0,  0,  0,  0,  0,  0,128, 58,  0,  0,  0,
-      0,  0,  0,128, 59,  0,  0,  0,  0,  0,  0,128, 60,  0,  0,  0,
-      0,  0,  0,128, 61,  0,  0,  0,  0,  0,  0,  0, 62,  0,  0,  0,
-      0,  0,  0,  0, 63,  0,  0,  0,  0,  0,  0,  0, 64,  0,  0,  0,
-      0,  0,  0,  0, 65,  0,  0,  0,  0,  0,  0,  0, 66,  0,  0,  0,
-      0,  0,  0,  0, 67,  0,  0,  0,  0,  0,  0,  0, 68, 16, 50,125,
-      0,  0,  0,  0,  0,  0,  0, 69,  0,  0,  0,  0,  0,  0,  0, 70,
-      0,  0,  0,  0,  0,  0,  0, 71,  0,  0,  0,  0,  0,  0,  0, 72,
-      0,  0,  0,  0,  0,  0,  0, 73,  0,  0,  0,  0,  0,  0,  0, 74,
-      0,  0,  0,  0,  0,  0,  0, 75,  0,  0,  0,  0,  0,  0,  0, 76,
-      0,  0,  0,  0,  0,  0,  0, 77,  0,  0,  0,  0,  0,  0,128, 78,
-      0,  0,  0,  0,  0,  0,  0, 79,  0,  0,  0,  0,  0,  0,  0, 80,
-      0,  0,  0,  0,  0,  0,  0, 81,  0,  0,  0,  0,  0,  0,  0, 82,
-      0,  0,  0,  0,  0,  0,  0, 83,  0,  0,  0,  0,  0, 16, 51,125,
-      0,  0, 84,  0,  0,  0,  0,  0,  0,  0, 85,  0,  0,  0,  0,  0,
-      0,  0, 86,  0,  0,  0,  0,  0,  0,  0, 87,  0,  0,  0,  0,  0,
-      0,  0, 88,  0,  0,  0,  0,  0,  0,  0, 89,  0,  0,  0,  0,  0,
-      0,  0, 90,  0,  0,  0,  0,  0,  0,  0, 91,  0,  0,  0,  0,  0,
-      0,  0, 92,  0,  0,  0,  0,  0,  0,  0, 93,  0,  0,  0,  0,  0,
-      0,  0, 94,  0,  0,  0,  0,  0,  0,  0, 95,  0,  0,  0,  0,  0,
-      0,  0, 96,  0,  0,  0,  0,  0,  0,  0, 97,  0,  0,  0,  0,  0,
-      0,  0, 98,  0,  0,  0,  0,  0,  0,  0, 99,  0,  0, 16, 52,125,
-      0,  0,  0,  0,  0,100,  0,  0,  0,  0,  0,  0,  0,101,  0,  0,
-      0,  0,  0,  0,  0,102,  0,  0,  0,  0,  0,  0,  0,103,  0,  0,
-      0,  0,  0,  0,  0,104,  0,  0,  0,  0,  0,  0,  0,105,  0,  0,
-      0,  0,  0,  0,  0,106,  0,  0,  0,  0,  0,  0,  0,107,  0,  0,
-      0,  0,  0,  0,  0,108,  0,  0,  0,  0,  0,  0,  0,109,  0,  0,
-      0,  0,  0,  0,  0,110,  0,  0,  0,  0,  0,  0,  0,111,  0,  0,
-      0,  0,  0,  0,  0,112,  0,  0,  0,  0,  0,  0,  0,113,  0,  0,
-      0,  0,  0,  0,  0,114,  0,  0,  0,  0,  0,  0,  0, 16, 53,125,
-    115,  0,  0,  0,  0,  0,  0,  0,116,  0,  0,  0,  0,  0,  0,  0,
-    117,  0,  0,  0,  0,  0,  0,128,118,  0,  0,  0,  0,  0,  0,  0,
-    119,  0,  0,  0,  0,  0,  0,  0,120,  0,  0,  0,  0,  0,  0,  0,
-    121,  0,  0,  0,  0,  0,  0,  0,122,  0,  0,  0,  0,  0,  0,  0,
-    123,  0,  0,  0,  0,  0,  0,  0,124,  0,  0,  0,  0,  0,  0,  0,
-      0,183, 15, 54,128, 45, 14, 64,  1,  0,  0,  0,  0, 20, 27, 54,
-    129, 45, 14, 64,  2,  0,  0,  0,  0, 20, 39, 54,130, 45, 14, 64,
-      3,  0,  0,  0,  0, 20, 51, 54,131, 45, 14, 64,  5, 16, 54,125,
-      0,  0,  0,  0, 20, 63, 54,132, 45, 14,  0,  0,  0,  0,  0,  0,
-     20, 75, 54,133, 45, 14, 64,  8,  0,  0,  0,  0, 20, 87, 54,134,
-     45, 14, 64,  9,  0,  0,  0,  0, 20, 99, 54,135, 45, 14, 64, 16,
-      0,  0,  0,  0, 20,111, 54,136, 45, 14, 64, 19,  0,  0,  0,  0,
-     20,123, 54,137, 45, 14, 64, 21,  0,  0,  0,  0, 20,135, 54,138,
-     45, 14, 64,  4,  0,  0,  0,  0, 20,147, 54,139, 45, 14, 64,  6,
-      0,  0,  0,  0, 20,159, 54,140, 45, 14, 64, 64,  0,  0,  0,  0,
-     20,171, 54,141, 45, 14, 65,  1,  0,  0,  0,  0, 20, 16, 55,125,
-    183, 54,142, 45, 14, 64, 16,  0,  0,  0,  0, 22,  3,  0, 95, 53,
-     20,143, 59,128, 44, 18,144, 57,131, 44, 18,145, 59, 14, 64, 36,
-      0,  0,  0,  0, 44, 18,146, 59, 14, 65, 16,  0,  0,  0,  0, 44,
-     18,147, 59, 14, 64, 24,  0,  0,  0,  0, 44, 18,148, 57,136, 44,
-     20, 63, 12, 14, 66,  2, 64,  0,  0,  0, 20, 73, 12, 14, 66,  3,
-      0,  0,  0,  0, 20, 79, 54,149, 45,128, 20, 85, 54,150, 45,128,
-     20, 95, 10, 14, 64, 32,  0,  0,  0,  0, 22,  5,  0, 37,  9,  7,
-    151, 34,128, 27, 15, 54,145, 46,152, 20, 23,  8,151, 16, 56,125,
-     45,128, 25,131, 20, 27, 12,153, 20, 31,  9,151, 20, 37, 54,151,
-     45,128, 22,  6,  0,  6,  6, 36, 22, 10,  0, 52,  9, 54,154, 45,
-    138, 20, 48, 54,155, 46, 15, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 20, 52, 10,140, 22, 20,  0, 67,
-     67, 20,156, 57,131, 44, 18,157, 59,135, 44, 18,158, 59,137, 44,
-     18,159, 59,131, 44, 18,160, 59,133, 44, 18,155, 59, 14, 64, 57,
-      0,  0,  0,  0, 44, 18,161, 57,131, 44, 18,162, 57, 16, 57,125,
-     14, 64, 20,  0,  0,  0,  0, 44, 18,163, 57,131, 44, 18,164, 57,
-    131, 44, 22, 30,  0, 66, 56, 20,165, 57, 14, 64, 82,  0,  0,  0,
-      0, 44, 18,166, 57,131, 44, 18,167, 57,131, 44, 18,168, 57,137,
-     44, 18,169, 57,131, 44, 18,170, 57,131, 44, 18,171, 57,137, 44,
-     18,172, 57,137, 44, 18,173, 57,135, 44, 20, 66, 10, 14, 65,  2,
-      0,  0,  0,  0, 22, 40,  0, 56, 14,  8,174, 45,128, 25, 66, 58,
-    155, 44, 20, 39, 54,175, 45, 79, 58, 64, 58,155, 55,174, 60,174,
-     44, 44, 38, 14, 64, 50,  0,  0,  0,  0, 44, 20, 49, 16, 58,125,
-     31,176, 37,154, 37,174, 18,175, 20, 53,  9,174, 20, 56, 36, 22,
-     41,  0, 64, 19,  8,174, 45,132, 25, 14, 64, 85,  0,  0,  0,  0,
-     26,129, 20, 30, 54,177, 45, 70, 58,178, 37,174, 44, 20, 43, 54,
-    179, 45, 70, 58,178, 37,174, 37,128, 44, 20, 49, 54,180, 45,137,
-     20, 58,  7, 84, 58,132, 44, 34,132, 27, 61, 39, 20, 64, 36, 22,
-     42,  0, 44, 20,  8,181, 45,179, 25,132, 26, 54, 14, 64,  1, 32,
-      0,  0,  0, 20, 30, 50,132, 18,177, 18,135, 18,180, 20, 36,  7,
-    180, 33,129, 27, 44, 54,180, 45,180, 38,129, 22, 44, 16, 59,125,
-      0, 35, 25,  7,174, 34, 14, 64, 70,  0,  0,  0,  0, 41,174, 34,
-     14, 64, 80,  0,  0,  0,  0, 27, 35, 50,128, 18,138, 18,133, 18,
-    180, 22, 45,  0, 46,  7,  9,181, 20, 17, 50,182, 18,182, 18,182,
-     18,182, 20, 25,  8,179, 45,182, 25,129, 20, 29,  9,179, 20, 39,
-     50,128, 18,182, 18,182, 18,182, 20, 43,  9,174, 20, 46, 36, 22,
-     47,  0, 67, 25,  8,174, 45, 14, 64, 68,  0,  0,  0,  0, 25, 14,
-     64, 85,  0,  0,  0,  0, 26,129, 20, 36, 54,177, 45, 70, 58,178,
-     37,174, 44, 20, 49, 54,179, 45, 70, 58,178, 37,174, 16, 60,125,
-     37,128, 44, 20, 55, 54,180, 45,137, 20, 64,  7, 84, 58,132, 44,
-     34,132, 27, 67, 36, 22, 48,  0, 13, 13, 10, 14, 64, 66,  0,  0,
-      0,  0, 22, 80,  0, 39, 11,  8,181, 45,129, 25,131, 20, 19,  8,
-    183, 45,128, 25,138, 20, 39,  7,163, 56,181, 44, 31,163, 56,183,
-     44, 27, 14, 64,131,  0,  0,  0,  0, 22, 81,  0, 63, 12, 54,184,
-     45,163, 56,181, 44, 20, 24, 54,163, 56,181, 44, 45,163, 56,183,
-     44, 20, 33, 54,163, 56,183, 44, 45,184, 20, 42, 54,184, 45,164,
-     56,181, 44, 20, 54, 54,164, 56,181, 44, 45,164, 56, 16, 61,125,
-    183, 44, 20, 63, 54,164, 56,183, 44, 45,184, 22, 83,  0, 14,  7,
-      9,183, 20, 11,  9,181, 20, 14, 36, 22, 84,  0, 51, 11,  8,174,
-     45,128, 25,131, 20, 33,  7,163, 56,174, 44, 30,173, 56,133, 44,
-     42,163, 56,174, 44, 30,173, 56,134, 44, 27, 51, 54,162, 56, 14,
-     64, 17,  0,  0,  0,  0, 44, 45,163, 56,174, 44, 22, 85,  0, 10,
-      7,  9,174, 20, 10, 36, 22, 86,  0, 55, 15, 54,184, 45, 14, 64,
-     17,  0,  0,  0,  0, 20, 23,  8,174, 45,128, 25,131, 20, 35,  7,
-    163, 56,174, 44, 30,173, 56,134, 44, 27, 47, 54,162, 16, 62,125,
-     56,184, 44, 45,163, 56,174, 44, 20, 55, 54,184, 45,184, 37,128,
-     22, 87,  0, 61,  7,  9,174, 20, 21,  8,174, 45, 14, 64, 18,  0,
-      0,  0,  0, 25,136, 20, 41,  8,181, 45, 14, 64, 17,  0,  0,  0,
-      0, 25, 14, 64, 18,  0,  0,  0,  0, 20, 61,  7,162, 56,174, 44,
-     32,162, 56,181, 44, 27, 14, 64,137,  0,  0,  0,  0, 22, 88,  0,
-     33, 12, 54,183, 45,162, 56,174, 44, 20, 24, 54,162, 56,174, 44,
-     45,162, 56,181, 44, 20, 33, 54,162, 56,181, 44, 45,183, 22, 89,
-      0, 14,  7,  9,181, 20, 11,  9,174, 20, 14, 36, 22, 16, 63,125,
-     98,  0, 72, 21, 54,162, 56, 14, 64, 17,  0,  0,  0,  0, 44, 45,
-    163, 56,138, 44, 20, 39, 54,162, 56, 14, 64, 18,  0,  0,  0,  0,
-     44, 45,163, 56,130, 44, 20, 51, 54,162, 56,136, 44, 45,162, 56,
-    129, 44, 20, 69, 54,162, 56, 14, 64, 20,  0,  0,  0,  0, 44, 45,
-    164, 56,128, 44, 20, 72, 36, 22,100,  0, 29, 11, 54,150, 45,150,
-     38,128, 20, 17, 54,180, 45,182, 20, 23,  7,149, 34,136, 27, 29,
-     54,149, 45,182, 22,101,  0, 61, 27, 54,145, 55,128, 60,129, 44,
-     46,185, 55,149, 36,129, 37,128, 60,149, 36,129, 37, 16, 64,125,
-    129, 44, 20, 37,  7,150, 34,182, 41,150, 34,130, 27, 61, 54,145,
-     55,128, 60,129, 44, 46,186, 55,149, 36,129, 37,128, 60,149, 36,
-    129, 37,129, 44, 22,102,  0, 73, 21, 54,145, 55,130, 60,133, 44,
-     46, 15,  6,  0,  0,  0,  0,  0,  0, 20, 45, 54,145, 55,134, 60,
-    135, 44, 46,187, 55,150, 36,129, 37,128, 60,150, 36,129, 37,129,
-     44, 20, 61,  7,149, 33,134, 42, 43,150, 34,182, 41,150, 34,130,
-     44, 27, 73, 54,180, 45, 14, 64, 66,  0,  0,  0,  0, 22,104,  0,
-     71, 57, 54,145, 55, 14, 64, 17,  0,  0,  0,  0, 60, 16, 65,125,
-     14, 64, 36,  0,  0,  0,  0, 44, 46,188, 55,149, 36, 14, 64, 20,
-      0,  0,  0,  0, 37,128, 37,180, 60, 43,149, 37,128, 44, 36, 14,
-     64, 20,  0,  0,  0,  0, 37,180, 44, 20, 71,  7,149, 33,134, 27,
-     14, 65,  1, 80,  0,  0,  0, 22,106,  0, 67, 25,  8,174, 45, 14,
-     64, 17,  0,  0,  0,  0, 25, 14, 64, 35,  0,  0,  0,  0, 26,129,
-     20, 41,  7,145, 55,174, 60,174, 37,128, 44, 52, 15,  2, 96, 96,
-     27, 67, 54,145, 55,174, 60,174, 37,128, 44, 46,189, 55,150, 36,
-    129, 37,128, 60,150, 36,129, 37,129, 44, 22,108,  0, 16, 66,125,
-      7,  7,  9,174, 22,150,  0, 77, 12, 54,190, 45,144, 56,151, 44,
-     20, 34, 54,191, 45, 63, 58,192, 60,190, 60, 67, 58,145, 44, 60,
-    133, 60,130, 60,140, 44, 20, 59, 31, 14, 66,  5, 55, 96,  0,  0,
-     18, 14, 64, 32,  0,  0,  0,  0, 36, 72, 58,182, 44, 37,131, 20,
-     77, 31, 14, 66,  5, 55,104,  0,  0, 18, 14, 64,100,  0,  0,  0,
-      0, 22,151,  0, 78, 11,  8,179, 45,182, 25,135, 20, 23, 31, 14,
-     66,  5, 55, 97,  0,  0, 18,179, 20, 27,  9,179, 20, 39, 31, 14,
-     66,  5, 55, 97,  0,  0, 18,182, 20, 48, 54,180, 45, 16, 67,125,
-     71, 58,134, 44, 20, 66, 31, 14, 66,  5, 55, 97,  0,  0, 18, 14,
-     64,117,  0,  0,  0,  0, 20, 78, 31, 14, 66,  5, 55, 97,  0,  0,
-     18,182, 22,152,  0, 18, 11,  8,174, 45,182, 25,135, 20, 15,  9,
-    174, 20, 18, 36, 22,160,  0, 46, 27, 54,193, 45, 80, 58, 72, 58,
-    132, 44, 36, 14, 64,  4,144,  0,  0,  0, 44, 36,131, 37,131, 20,
-     37, 12, 14, 65,146, 64,  0,  0,  0, 20, 43, 54,194, 45,128, 20,
-     46, 36, 22,165,  0, 42, 15, 54,193, 45, 14, 64, 32,  0,  0,  0,
-      0, 20, 30,  7, 72, 58,132, 44, 33, 14, 63, 69,  0, 16, 68,125,
-      0,  0,  0, 27, 42, 54,193, 45, 14, 64, 37,  0,  0,  0,  0, 22,
-    166,  0, 22,  9, 54,194, 45,128, 20, 19, 12, 14, 65,146, 64,  0,
-      0,  0, 20, 22, 36, 22,170,  0, 37, 17,  8,174, 45, 14, 64, 17,
-      0,  0,  0,  0, 25,137, 20, 37,  7,168, 56,174, 44, 33,171, 56,
-    174, 44, 27, 14, 65, 81, 48,  0,  0,  0, 22,172,  0, 23, 23,  7,
-    168, 56,174, 44, 32,171, 56,174, 44, 27, 14, 65, 80,144,  0,  0,
-      0, 22,173,  0, 21,  7,  9,174, 20, 11, 12,142, 20, 21, 10, 14,
-     65, 81,144,  0,  0,  0, 22,180,  0, 54,  9, 54,195, 16, 69,125,
-     45,182, 20, 17,  8,174, 45,182, 25,138, 20, 26, 54,172, 56,174,
-     44, 45,182, 20, 30,  9,174, 20, 38,  8,174, 45,128, 25,135, 20,
-     47, 54,173, 56,174, 44, 45,182, 20, 51,  9,174, 20, 54, 36, 22,
-    185,  0, 39, 11,  8,174, 45,128, 25,138, 20, 19,  8,181, 45,182,
-     25,130, 20, 39,  7,148, 56,174, 44, 31,148, 56,181, 44, 27, 14,
-     65,  1,136,  0,  0,  0, 22,186,  0, 33, 12, 54,183, 45,148, 56,
-    174, 44, 20, 24, 54,148, 56,174, 44, 45,148, 56,181, 44, 20, 33,
-     54,148, 56,181, 44, 45,183, 22,188,  0, 53,  7,  9, 16, 70,125,
-    181, 20, 11,  9,174, 20, 19,  8,174, 45,182, 25,138, 20, 35,  7,
-    148, 56,174, 44, 37,128, 34,148, 56,174, 37,128, 44, 27, 43, 54,
-    196, 45,196, 37,128, 20, 53, 10, 14, 65,  1,150,  0,  0,  0, 22,
-    192,  0, 15,  9,  7,196, 32,129, 27, 15, 54,196, 45,182, 22,194,
-      0, 13,  7,  7,196, 27, 13, 54,174, 45,139, 22,196,  0, 10,  7,
-      9,174, 20, 10, 36, 22,199,  0, 24,  9, 54,197, 45,182, 20, 15,
-     54,198, 45,182, 20, 21, 54,194, 45,182, 20, 24, 36, 22,200,  0,
-     71, 15, 31, 14, 65,  5, 89,  0,  0,  0, 18,205, 20, 16, 71,125,
-     25, 12, 14, 64, 65,  0,  0,  0,  0, 20, 31, 54,154, 45,132, 20,
-     71, 54,155, 46, 15, 33, 32, 32, 32, 32, 80, 85, 83, 72, 32, 77,
-     89, 32, 84, 82, 73, 71, 71, 69, 82, 32, 70, 79, 82, 32, 79, 80,
-     80, 79, 78, 69, 78, 84, 83, 22,210,  0, 27,  7, 12,140, 20, 13,
-     54,174, 45,128, 20, 27, 54,206, 46, 15,  7, 68, 58, 79, 80, 49,
-     46, 49, 22,211,  0, 72, 17, 31,176, 37, 14, 64, 53,  0,  0,  0,
-      0, 18,132, 20, 24,  7, 84, 58,132, 44, 27, 32, 54,174, 45,174,
-     37,128, 20, 52, 31,176, 37, 14, 64, 53,  0,  0,  0, 16, 72,125,
-      0, 18, 14, 64,132,  0,  0,  0,  0, 20, 72,  7,174, 32, 14, 65,
-      5,  0,  0,  0,  0, 27, 14, 65,  2, 17,  0,  0,  0, 22,212,  0,
-     20, 20,  7, 84, 58,132, 44, 34,132, 27, 14, 65,  2, 22,  0,  0,
-      0, 22,213,  0, 51, 21, 54,206, 55, 14, 64,  7,  0,  0,  0,  0,
-     44, 46, 61, 58,207, 44, 20, 31, 12, 14, 66,  3, 32, 16,  0,  0,
-     20, 39, 54,207, 45,207, 37,128, 20, 51, 31, 14, 65,  5, 89,  0,
-      0,  0, 18,205, 22,214,  0, 37,  9,  7,207, 32,138, 27, 19, 12,
-     14, 64, 65,  0,  0,  0,  0, 20, 27, 54,174, 45,131, 16, 73,125,
-     36,141, 20, 37, 10, 14, 65,  2, 17,  0,  0,  0, 22,215,  0, 83,
-      9, 54,154, 45,132, 20, 49, 54,155, 46, 15, 33, 84, 72, 65, 84,
-     39, 83, 32, 65, 83, 32, 70, 65, 82, 32, 65, 83, 32, 73, 32, 71,
-     79, 32, 70, 79, 82, 32, 70, 82, 69, 69, 33, 33, 33, 20, 53, 12,
-    140, 20, 63, 12, 14, 64, 65,  0,  0,  0,  0, 20, 73, 12, 14, 66,
-      3, 32,  0,  0,  0, 20, 83, 10, 14, 65,  2,  0,  0,  0,  0, 22,
-    216,  0, 76, 15, 54,206, 46, 15,  5, 68, 58, 79, 80, 80, 20, 25,
-     12, 14, 66,  3, 32, 16,  0,  0, 20, 42, 23, 28,130, 16, 74,125,
-     18,138, 18,132, 18, 15,  5, 68, 58, 79, 80, 78, 20, 49,  2, 28,
-    130, 18,155, 20, 54, 17, 28,130, 20, 60, 54,154, 45,132, 20, 72,
-     31, 14, 65,  5, 89,  0,  0,  0, 18,205, 20, 76, 12,140, 22,217,
-      0, 79, 21, 31, 14, 65,  7,100,  0,  0,  0, 18, 14, 65,  2, 85,
-      0,  0,  0, 20, 31, 13, 14, 66,  2, 85,  0,  0,  0, 20, 38, 41,
-     28,129, 18,208, 20, 52, 54,208, 45,208, 38, 14, 64, 72,  0,  0,
-      0,  0, 20, 62,  7,208, 32,128, 41,208, 33,138, 27, 69, 40, 15,
-      1,253, 21, 20, 79, 10, 14, 65,  2, 23,  0,  0,  0, 16, 75,125,
-     22,218,  0, 81,  9,  7,208, 34,138, 27, 15, 54,154, 45,132, 20,
-     60, 54,155, 46, 15, 38, 32, 76, 79, 65, 68, 32, 78, 69, 87, 32,
-     79, 80, 80, 79, 78, 69, 78, 84, 32, 68, 73, 83, 75, 46, 46, 46,
-     80, 82, 69, 83, 83, 32, 82, 69, 84, 85, 82, 78, 20, 64, 12,140,
-     20, 71, 41, 28,129, 18,208, 20, 81, 10, 14, 65,  2, 22,  0,  0,
-      0, 22,219,  0, 63, 11, 54,199, 45,138, 36,141, 20, 17, 54,200,
-     45,141, 20, 23, 54,201, 45,182, 20, 29, 54,202, 45,141, 20, 35,
-     54,203, 45,182, 20, 41, 54,204, 45,182, 20, 47, 54, 16, 76,125,
-    211, 45,182, 20, 53, 54,238, 45,182, 20, 63, 10, 14, 66,  2, 96,
-      0,  0,  0, 22,220,  0, 13, 13, 12, 14, 65,148,  0,  0,  0,  0,
-     22,222,  0, 39,  7, 12,142, 20, 17, 12, 14, 66,  1, 16,  0,  0,
-      0, 20, 21, 12,131, 20, 27, 54,209, 45,131, 20, 33, 54,210, 45,
-    182, 20, 39, 54,193, 45,182, 22,224,  0,102,  9, 54,212, 45,182,
-     20, 15, 54,213, 45,182, 20, 24, 54,156, 56,128, 44, 45,182, 20,
-     30, 54,214, 45,182, 20, 36, 54,196, 45,182, 20, 42, 54,215, 45,
-    182, 20, 48, 54,216, 45,182, 20, 54, 54,217, 45,182, 16, 77,125,
-     20, 60, 54,218, 45,182, 20, 66, 54,194, 45,182, 20, 72, 54,219,
-     45,182, 20, 78, 54,198, 45,182, 20, 84, 54,197, 45,182, 20, 90,
-     54,220, 45,182, 20, 96, 54,221, 45,182, 20,102, 54,222, 45,182,
-     22,230,  0, 95,  9, 54,154, 45,135, 20, 22, 54,155, 46, 15,  6,
-     65, 78, 84, 69, 61, 36, 20, 39, 54,155, 55, 66, 58,155, 44, 37,
-    128, 44, 46, 61, 58,209, 44, 20, 43, 12,140, 20, 51, 54,200, 45,
-    200, 38,131, 20, 59, 54,201, 45,201, 37,131, 20, 69, 12, 14, 65,
-    149,  0,  0,  0,  0, 20, 77, 54,202, 45,202, 38,131, 16, 78,125,
-     20, 85, 54,204, 45,204, 37,131, 20, 95, 12, 14, 65,133,  0,  0,
-      0,  0, 22, 14,  1, 98, 17,  8,174, 45,128, 25, 14, 64, 82,  0,
-      0,  0,  0, 20, 26, 54,165, 56,174, 44, 45,174, 20, 30,  9,174,
-     20, 38,  8,174, 45,128, 25,131, 20, 48, 12, 14, 65,129,  0,  0,
-      0,  0, 20, 57, 54,166, 56,174, 44, 45,149, 20, 66, 54,167, 56,
-    174, 44, 45,150, 20, 76, 12, 14, 65,129,  0,  0,  0,  0, 20, 85,
-     54,169, 56,174, 44, 45,149, 20, 94, 54,170, 56,174, 44, 45,150,
-     20, 98,  9,174, 22, 19,  1, 19, 13, 12, 14, 65,  2, 16, 79,125,
-    128,  0,  0,  0, 20, 19, 10,138, 36,141, 22, 24,  1, 45,  9, 54,
-    151, 45,128, 20, 17,  8,181, 45,129, 25,131, 20, 25,  8,183, 45,
-    128, 25,138, 20, 45,  7,166, 56,181, 44, 31,166, 56,183, 44, 27,
-     14, 65,  3,  0,  0,  0,  0, 22, 34,  1, 63, 12, 54,184, 45,166,
-     56,181, 44, 20, 24, 54,166, 56,181, 44, 45,166, 56,183, 44, 20,
-     33, 54,166, 56,183, 44, 45,184, 20, 42, 54,184, 45,167, 56,181,
-     44, 20, 54, 54,167, 56,181, 44, 45,167, 56,183, 44, 20, 63, 54,
-    167, 56,183, 44, 45,184, 22, 44,  1, 60,  7,  9,183, 16, 80,125,
-     20, 11,  9,181, 20, 19,  8,181, 45,128, 25,131, 20, 25, 54,151,
-     45,181, 20, 34, 54,149, 45,166, 56,181, 44, 20, 43, 54,150, 45,
-    167, 56,181, 44, 20, 47, 12,223, 20, 51,  9,181, 20, 57, 54,151,
-     45,128, 20, 60, 36, 22,144,  1, 87, 13, 12, 14, 65, 64,  0,  0,
-      0,  0, 20, 23, 12, 14, 65, 98,  0,  0,  0,  0, 20, 29,  7,219,
-     42,198, 27, 33, 12,142, 20, 39, 54,154, 45,139, 20, 71, 54,155,
-     46, 15, 25, 87, 69, 32, 66, 79, 84, 72, 32, 83, 84, 65, 89, 69,
-     68, 32, 45, 32, 78, 69, 87, 32, 68, 69, 65, 76, 20, 16, 81,125,
-     75, 12,140, 20, 83, 54,209, 45,209, 37,131, 20, 87, 12,131, 22,
-    169,  1, 45,  9,  7,198, 42,219, 27, 19, 12, 14, 65,144,  0,  0,
-      0,  0, 20, 23, 12,142, 20, 29, 54,198, 45,132, 20, 35, 54,219,
-     45,132, 20, 45, 10, 14, 65,  2, 36,  0,  0,  0, 22,174,  1, 73,
-      9, 54,197, 45,182, 20, 15, 54,219, 45,182, 20, 21, 54,194, 45,
-    182, 20, 27, 54,198, 45,182, 20, 33, 54,218, 45,182, 20, 37,  7,
-    224, 27, 43, 54,224, 45,132, 20, 53, 12, 14, 65,112,  0,  0,  0,
-      0, 20, 63, 12, 14, 65, 80,144,  0,  0,  0, 20, 73, 16, 82,125,
-     10, 14, 65,  2, 32,  0,  0,  0, 22,244,  1, 59,  9,  7,217, 34,
-    129, 27, 19, 12, 14, 65,146, 80,  0,  0,  0, 20, 29, 12, 14, 65,
-    144,  0,  0,  0,  0, 20, 39, 12, 14, 65,112,  0,  0,  0,  0, 20,
-     49, 12, 14, 65, 81, 48,  0,  0,  0, 20, 59, 10, 14, 65,  2, 32,
-      0,  0,  0, 22,254,  1, 19,  9, 54,183, 45,182, 20, 19, 12, 14,
-     65, 68,  0,  0,  0,  0, 22,  3,  2, 68,  7, 12,142, 20, 13, 54,
-    154, 45,135, 20, 27, 54,155, 46, 15,  7, 73, 32, 68, 82, 69, 87,
-     32, 20, 36, 54,160, 46, 61, 58,183, 44, 20, 50, 54, 16, 83,125,
-    155, 55, 66, 58,155, 44, 37,128, 44, 46,160, 20, 54, 12,140, 20,
-     64, 12, 14, 65,  2,128,  0,  0,  0, 20, 68, 12,142, 22, 30,  2,
-     36, 12, 54,156, 56,128, 44, 45,182, 20, 18, 54,214, 45,182, 20,
-     24, 54,196, 45,182, 20, 30, 54,215, 45,182, 20, 36, 54,212, 45,
-    182, 22, 31,  2, 81, 17,  8,174, 45,128, 25, 14, 64, 20,  0,  0,
-      0,  0, 20, 26, 54,171, 56,174, 44, 45,182, 20, 35, 54,162, 56,
-    174, 44, 45,182, 20, 39,  9,174, 20, 47,  8,174, 45,128, 25,131,
-     20, 59, 54,163, 56,174, 44, 45,169, 56,174, 44, 20, 16, 84,125,
-     71, 54,164, 56,174, 44, 45,170, 56,174, 44, 20, 75,  9,174, 20,
-     81, 12,135, 36,141, 22, 32,  2,109, 17,  8,174, 45,128, 25, 14,
-     64, 20,  0,  0,  0,  0, 20, 29, 54,171, 56,174, 44, 45,162, 56,
-    174, 44, 20, 33,  9,174, 20, 41,  8,174, 45,128, 25,131, 20, 53,
-     54,169, 56,174, 44, 45,163, 56,174, 44, 20, 65, 54,170, 56,174,
-     44, 45,164, 56,174, 44, 20, 69,  9,174, 20, 75, 54,218, 45,182,
-     20, 81, 54,194, 45,182, 20, 87, 54,219, 45,182, 20, 93, 54,198,
-     45,182, 20, 99, 54,197, 45,182, 20,109, 12, 14, 65, 16,140,125,
-     85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85,
-     85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85, 85,
-     85, 85, 85, 85, 85, 85, 85, 85,106,170,170,170,170,170,170,170,
-    170,170,170,170,170,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,
-    106,170,170,170,170,170,170,170,170,170,170,170,170,160,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,  8, 86,125,
-    170,170,170,170,170,170,170,170,128,  0,  0,  0,  0,  0,  0,  0,
-      0, 15,255,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170,170,170,170,170,170,170,170,170,170,170,168,
-      0,  0,  0,  0,  0,  0,  0,  0,  0, 15,255,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,
-    170,170,170,170,170,170,170,160,  0,  0,  0,  0,  0,  0,  0,  0,
-      0, 14,171,  0,  0,  3,255,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170,170,170,170,170,170,170,170,170,  8, 87,125,
-    170,170,128,  0,  0,  0,  0,  0,  0,  0,  0,  0, 14,171,  0,  0,
-      3,255,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,
-    170,170,170,170,170,170,170,170,170,170,128,  0,  0,  0,  0,  0,
-      0,  0,  0,  0, 58,171,  0,  0,  3,255,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  1,106,170,170,170,170,170,170,170,170,170,
-    170,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 58,171,  0,  0,
-      3,171,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,
-    170,170,170,170,170,170,170,170,170,170,  0,  0,  0,  8, 88,125,
-      0,  0,  0,  0,  0,  0,  0, 58,170,192,  0,  3,171,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,170,170,
-    170,170,170,170,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 58,
-    170,192,  0,  3,171,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      1,106,170,170,170,170,170,170,170,170,170,170,160,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0, 58,170,192,  0,  3,171,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,170,170,
-    170,170,170,170,128,  0,  0,  0,  0,  0,  0,  0,  0,  8, 89,125,
-      0,  0,250,170,192,  0,  3,171,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,170,170,170,170,170,170,170,170,170,170,128,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,234,234,195,255,255,171,
-    252, 15,240,  0,  3,192,  0,  0,  0,  0,  0,  1,106,170,170,170,
-    170,170,170,170,170,170,170,160,  0, 20,  0,  0,  0,  0,  0,  0,
-      0,  0,234,234,179,255,255,171,252, 14,176, 63,207,252, 63,195,
-    240, 15,252,  1,106,170,170,170,170,170,170,170,170,170,170,160,
-      0,  1, 64,  0,  0,  0,  0,  0,  0,  0,234,234,179,  8, 90,125,
-    171,170,170,175, 14,176, 59,254,175, 63,255,252, 15,252,  1,106,
-    170,170,170,170,170,170,170,170,170,170,168,  0,  0, 16,  0,  0,
-      0,  0,  0,  0,  0,234,234,179,171,170,170,171, 14,176, 58,234,
-    171,250,250,172, 62,188,  1,106,170,170,170,170,170,170,170,170,
-    170,170,168,  0,  0,  4,  0,  0,  0,  0,  0,  0,  0,234,234,179,
-    170,170,170,171, 62,176, 58,234,170,250,234,171, 58,188,  1,106,
-    170,170,170,170,170,170,170,170,170,170,170,  0,  0,  4,  0,  0,
-      0,  0,  0,  0,  3,171,250,179,170,170,170,171, 58,  8, 91,125,
-    172,234,170,170,250,170,171,250,176,  1,106,170,170,170,170,170,
-    170,170,168,  0,170,170,128,  0,  1,  0,  0,  0,  0,  0,  0,  3,
-    171, 58,179,170,170,174,171, 58,172,234,171,234,186,170,171,234,
-    176,  1,106,170,170,170,170,170,170,154,160,  0,  0,170,168,  0,
-      1,  0,  0,  0,  0,  0,  0,  3,171, 58,191,170,254,175,171, 58,
-    172,234,175,234,186,171,170,234,192,  1,106,170,170,170,170,170,
-    170,154,128,  0,  0, 10,165, 64,  1,  0,  0,  0,  0,  0,  0,  3,
-    171, 58,175,171,206,175,171, 58,172,234,172, 58,170,  8, 92,125,
-    175,170,170,192,  1,106,170,170,170,170,170,170,154,128,  0,  0,
-      0,170, 84,  0, 64,  0,  0,  0,  0,  0,  3,175, 14,175,171, 14,
-    175,171,234,172,234,172, 58,170,191,234,171,  0,  1,106,170,170,
-    170,170,170,170, 90,128,  0,  0,  0, 10,165, 64, 64,  0,  0,  0,
-      0,  0, 14,172, 14,175,172, 14,172,234,234,175,170,176, 14,170,
-    240,234,171,  0,  1,106,170,170,170,170,170,170,106,  0,  0,  0,
-      0,  0,170, 80, 64,  0,  0,  0,  0,  0, 14,175,254,175,172, 14,
-    172,234,235,175,170,176, 14,170,192,250,172,  0,  1,  8, 93,125,
-    106,170,170,170,170,170,170,106,  0,  0,  0,  0,  0,138,148, 16,
-      0,  0,  0,  0,  0, 14,175,254,175,172, 14,172,234,235,171,170,
-    176, 14,170,192, 58,172,  0,  1,106,170,170,170,170,170,170,104,
-      0,  0,  0,  0,  0, 42,165, 16,  0,  0,  0,  0,  0, 14,170,170,
-    171,172, 14,172,234,235,171,170,176, 14,170,192, 62,188,  0,  1,
-    106,170,170,170,170,170,169,168,  0,  0,  0,  0,  0,  8,169, 16,
-      0,  0,  0,  0,  0, 14,170,170,171,172, 14,172,234,235,171,170,
-    176, 14,170,192, 58,172,  0,  1,106,170,170,170,170,  8, 94,125,
-    170,165,160,  0,  0,  0,  0,  0,  2, 41, 80,  0,  0,  0,  0,  0,
-     58,170,170,171,172, 14,172, 58,235,171,170,176, 14,170,192, 58,
-    172,  0,  1,106,170,170,170,170,170,148,160,  0,  0,  0,  0,  0,
-      0, 42, 80,  0,  0,  0,  0,  0, 58,170,170,171,172, 14,172, 58,
-    235,171,174,176, 14,170,192,250,171,  0,  1,106,170,170,170,170,
-    170, 82,128,  0,  0,  0,  0,  0,  2, 42, 84,  0,  0,  0,  0,  0,
-     58,191,255,171,172, 14,172, 58,171,170,174,176, 62,170,192,234,
-    171,  0,  1,106,170,170,170,170,165,106,128,  0,  0,  8, 95,125,
-      0,  0,  0,  2,170,148,  0,  0,  0,  0,  0, 58,191,255,171,172,
-     14,172, 58,172,234,174,176, 62,170,192,235,171,  0,  1,106,170,
-    170,170,170,148,  8,  0,  0,  0,  0,  0,  0,  0, 10,148,  0,  0,
-      0,  0,  0,234,176,  3,170,172, 14,175,250,172,234,190,175,250,
-    170,195,235,170,192,  1,106,170,170,170,170, 90,128,  0,  0,  0,
-      0,  0,  0,  0,  0,148,  0,  0,  0,  0,  0,234,176,  3,170,172,
-     14,170,250,172,234,190,175,250,170,195,171,234,192,  1,106,170,
-    170,170,165, 89,160,  0,  0,  0,  0,  0,  0,170,168,  8, 96,125,
-    164,  0,  0,  0,  0,  0,234,192,  3,170,172, 14,170,250,172,234,
-    190,171,234,234,207,172,234,192,  1,106,170,170,170,149,150, 88,
-      0,  0,  0,  0,  0,  2,153, 90, 36,  0,  0,  0,  0,  0,234,192,
-      0,234,172, 14,170,250,172,234,191,170,170,234,206,172,250,176,
-      1,106,170,170,170, 90,170, 86,  0,  0,  0,  0,  0,  9, 90,166,
-    164,  0,  0,  0,  0,  3,234,192,  0,234,172, 15,170,254,188, 58,
-    179,170,171,234,254,172, 58,176,  1,106,170,170,169,106, 42,165,
-    128,  0,  0,  0,  0, 25,170,169,101,  0,  0,  0,  0,  8, 97,125,
-      3,255,192,  0,255,252,  3,234,206,176, 58,195,234,171,234,250,
-    188, 58,188,  1,106,170,170,169,168,136,169, 80,  0,  0,  0,  0,
-     90,170,170, 85,  0,  0,  0,  0,  3,255,192,  0,255,252,  0,255,
-    207,240, 63,192,250,175,255,255,240, 63,252,  1,106,170,170,165,
-    130, 34,138,152,  0,  0,  0,  1, 98, 34, 42,165,  0,  0,  0,  0,
-      0,  0,  0,  0,255,252,  0, 63, 15,192, 63,192, 63,252,255,255,
-    240, 63,255,  1,106,170,170,166,160,  0, 42,160,  0,  0,  0, 21,
-      8,  8,138,165,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8, 98,125,
-      0,  0,  0,  0,  0,  0,  0, 15,192,  0,  0,  0,  0,  0,  1,106,
-    170,170,166, 34,  0, 10,170,  0,  0,  0, 43,  0,162, 10,169,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  1,106,170,170,154,138,153,  2,168,  0,
-      0,  0, 48,  2, 42,162,169,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,
-    170,170,152,169,170,168,170,  0,  0,  3,  0, 42,170,170,169, 64,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8, 99,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170, 90,169,102,
-     26,170,128,  0,  3,192,162,106,170,170, 64,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  1,106,170,170,106,153, 25,148,170,160,  0, 15,  2,154, 70,
-    170,170, 80,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,169,106,164, 21,
-    101, 42,128,  0, 12, 42,149,100, 90, 34, 16,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8,100,125,
-      0,  0,  0,  0,  1,106,170,169,170, 85, 85, 86,130,160,  0, 60,
-    170, 85, 81,106,138,148,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,169,
-    170,149,  5,116, 42,160,  0, 50,139,151, 92, 88,  0,148,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  1,106,170,165,138, 86, 53,119,234,160,  0, 50,
-     35, 87, 94, 90,  2,148,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  8,101,125,
-    106,170,165,168,  7,245, 87,206,160,  0,  2, 47, 85, 93, 80,  0,
-    149,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,165,136,149,245, 87,246,
-    160,  0, 51, 31,149,121, 96,  0,149,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,
-    106,170,149,162, 37,125, 95, 36,160,  0, 12, 27,213, 85, 96,  2,
-    149,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,149,128,  1,  8,102,125,
-     80,  2,  0,160,  0, 15, 15,128, 58,  0,  0,149, 64,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170, 85,  0,  0, 42, 40,  0, 32,  0,  0,  0, 42,
-    224,  0,  0,149, 64,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170, 85,  0,  0,
-      0,  0,  0, 32,  0,  0, 48,  0,  0,  0,  0,149, 80,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170, 84,  0,  0,  0,  0,  0, 32,  0,  8,103,125,
-      0,  0,  0,  0,  0,  0,149, 84,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,169,
-     84,  0,  0,  0,  0,  0, 32,  0,  0,  0,  0,  0,  0,  0,149,  5,
-     64,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  1,106,169, 84,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,148,  0, 84,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,169,
-     84,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8,104,125,
-      0,148, 48,  1, 80,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,169, 84,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,144,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      1,106,169, 84,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,144,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,165, 84,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0, 80,  0,  0,  0,  8,105,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,165, 84,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0, 64,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,165, 84,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 64,  0,  0,  0,
-      0,  0,  0,  0,  9,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,165, 84,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0, 64,  0,  0,  0,  0,  0, 42,128,  9,  8,106,125,
-      0,  0,  0,  2,160,  4,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,
-    169, 84,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 64,
-      3,  0,  0,  0,  0,149, 64,  9,  2,  0,  0,  8, 36, 36,  0,  0,
-      0,  0,  0,  0,  0,  0,  1,106,169, 84,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  1, 96,  0,  0,  0,  0,  2, 80,  0,  9,
-     36,  0, 64,  8,  8, 36,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,
-    169, 84,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1, 96,
-      0,  0,  0,  0,  9, 64,  0,  9,144,  0,  0,160,  9,  8,107,125,
-     36,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,169, 84,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1, 96,  0,  0,  0,  0, 37,
-      0,  0,  9, 64,  0,  0,144,  9, 20,  0,  0,  0,  0,  0,  0,  0,
-      0,  1,106,169, 84,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  1, 96,  0,  0,  0,  0, 36,  0,  0, 37,  0,  0,  0,144,  9,
-    144,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170, 84,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1, 96,  0,  0,  0,  0, 16,
-      0,  0,146,  0,  0,128,160, 37,144,  0,  0,  0,  0,  8,108,125,
-      0,  0,  0,  0,  1,106,170, 86,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  1,168,  0,  0,  0,  0,144,  0,  2, 66, 64,  0,
-    144,160, 38,144,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170, 86,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,136,  0,  0,
-      0,  0,144,  0,  0,  2, 74,  0,144,146,170,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  1,106,170, 86,  0,  0,  0,  0,  2,  0,  0,  0,
-      0,  0,  0,  0,  1,136,  0,  0,  0,  0,144,  0,  0,  2, 66,160,
-    144,144,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  8,109,125,
-    106,170,150,  0,  0,  0,  0, 10,  0,  0,  0,  0,  0,  0,  0,  1,
-    184,  0,  0,  0,  0,144,  0,  0,  2, 66, 32,144,144,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,150,  0,  0,  0,  0,  8,
-      0,  0,  0,  0,  0,  0,  0,  1,136,  0,  0,  0,  0,164, 10,169,
-      2, 66, 36, 10, 36,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,
-    106,170,150,128,  0,  0,  0,  8,  0,  0,  0,  0,  0,  0,  0,  1,
-     10,  0,  0,  0,  0, 41, 96,  2,  2, 66, 36,144, 36,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,150,128,  0,  8,110,125,
-      0,  0,  8,  0,  0,  0,  0,  0,  0,  0,  1,130,  0,  0,  0,  0,
-     10,160,  2, 66, 66, 10,128, 36,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170,150,128,  0,  0,  0,  8,  5,  0,  5,  0,  0,
-      0,  0,  1,130,  0,  0,  0,  0,  0,  0,  0,144,130,  0,  0, 36,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,150,128,  0,
-      0,  0, 10, 17, 64, 17,  0,  0,  0,  0,  1,130,  0,  0,  0,  0,
-      0,  0,  0,144,146,  0,  0, 36,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170,150,128,  0,  0,  0,  2,  0, 64,  8,111,125,
-      0,  0,  0,  0,  0,  1,130,  0,  0,  0,  0,  0,  0,  0,144, 40,
-      0,  0, 36,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,
-    150,128,  0,  0,  0,  2,128,  0,  0,  0,  0,  0,  0,  1,130,128,
-      0,  0,  0,  0,  0,  0,144,  0,  0,  0,  4,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  1,106,170,166,128,  0,  0,  0,  0,128,  0,
-      0,  0,  0,  0,  0,  5,128,128,  0,  0,  0,  0,  0,  0,144,  0,
-      0,  0,  8,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,
-    166,128,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8,112,125,
-      6,128,128,  0,  0,  0,  0,  0,  2, 64,  0,  0,  0,  8,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,166,128,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  6,  0,160,  0,  0,  0,  0,  0,
-      2, 64,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      1,106,170,166,128,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      6,  0, 32,  0,  0,  0,  0,  0, 41,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,166,128,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  6,  0, 40,  0,  0,  8,113,125,
-      0,  2,170,144,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,170,166,128,  0,  0,  0,  0,  0,  2,  0,  0,
-      0,  0,  0,  6,  0,  8,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,166,128,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  6,  0, 10,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,170,166,128,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  6,  0,  2,128,  0,  0,  0,  0,  0,  0,  8,114,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,
-    170,166,128,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  6,  0,
-      0,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  1,106,170,165,128,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  6,  0,  0, 10,128,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,
-    170,165,128,  0,  0,  0,  0, 10,128,  0,  0,  0,  0,  0,  6,  0,
-      0,  0,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8,115,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,165,128,  0,  0,
-      0,  0,170,160,170,  0,  0,  0,  0, 22,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  1,106,170,165,128,  0,  0,  0,  2,170,170,170,128,  0,  0,
-      0, 26,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,128,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,165,128,  0,  0,
-      0, 10, 88,130, 20,160,  0,  0,  0, 26,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,160,  0,  0,  0,  0,  0,  8,116,125,
-      0,  0,  0,  0,  1,106,170,165,160,  0,  0,  0, 41,131, 12,  2,
-    104,  0,  0,  0, 24,  0,  0,  0,  0,  0,  0,  0,  0,  0,  2,168,
-      0,  0,144,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,169,
-    160,  0,  0,  0,167, 48,207,204, 90,  0,  0,  0, 24,  0,  0,  0,
-      0,  0,  0,  0,  0,  0, 10,  2,  0,  0,144,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  1,106,170,169, 96,  0,  0,  5, 17, 63,207,205,
-     85,  0,  0,  0, 24,  0,  0,  0,  0,  0,  0,  0,  0,  0, 10,  2,
-     64,  0,144,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  8,117,125,
-    106,170,170, 96,  0,  0,  0, 42, 63,207,194,160,  0,  0,  0, 88,
-      0,  0,  0,  0,  0,  0,  0,  0,  0, 40,  0,128,  0,144,  0,  8,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,170, 96,  0,  0,  0,  2,
-    171,  3,202,128,  0,  0,  0,104,  0,  0,  0,  0,  0,  0,  0,  0,
-      0, 36,  0,144,  0,144,  0,  8,  0,  0,  0,  0,  0,  0,  0,  1,
-    106,170,170,104,  0,  0,  0,  0, 42,170,170,130,  0,  0,  0,104,
-      0,  0,  0,  0,  0,  0,  0,  0,  0, 36,  0,144,  0,144, 10,  9,
-    144,  0,  0,  0,  0,  0,  0,  1,106,170,170,104,  0,  8,118,125,
-      0,  0,128,  0, 10,170,  0,  0,  0,  0,104,  0,  0,  0,  0,  0,
-      0,  0,  0,  0, 36,  0,144,  0,146, 36,146, 16,  0,  0,  0,  0,
-      0,  0,  1,106,170,170,152,  0,  0,  0, 32,  0,  0, 10,168,  0,
-      0,  0,104,  0,  0,  0,  0,  0,  0,  0,  0,  0,164,  0,144,  2,
-    153,100,146, 36,  0,  0,  0,  0,  0,  0,  1,106,170,170,154,  0,
-      0,  0, 40,  0,  0,  2,160,  0,  0,  1,104,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,164,  0,146,136,152, 36,146, 36,  2, 64,  0,  0,
-      0,  0,  1,106,170,170,150,  0,  0,  0, 10,  0,  0,  8,119,125,
-      2,160,  0,  0,  1,170,  0,  0,  0,  0,  0,  0,  0,  0,  2, 36,
-      2, 73,168,144, 36,146, 36,  1,  0,  0,  0,  0,  0,  1,106,170,
-    170,166,  0,  0,  0,  2,160,  0,  2,  0,  0,  0,  1,170,  0,  0,
-      0,  0,  0,  0,  0,  0,  0, 36,  2, 72, 20,164, 36,146, 36,  9,
-      0,  0,  0,  0,  0,  1,106,170,170,166,  0,  0,  0,  0,168,  0,
-     42,  0,  0,  0,  6,170,128,  0,  0,  0,  0,  0,  0,  0,  0, 36,
-      9, 36, 36,164,  0,145,  9, 36,  0,  0,  0,  0,  0,  1,106,170,
-    170,165,  0,  0,  0,  0, 42,170,168,  0,  0,  0,  6,  8,120,125,
-    170,128,  0,  0,  0,  0,  0,  0,  0,  0, 36,  4, 36, 36,164, 10,
-     65,  2,160,  0,  0,  0,  0,  0,  1,106,170,170,165,  0,  0,  0,
-      0,  2,170,160,  0,  0,  0,  6,170,128,  0,  0,  0,  0,  0,  0,
-      0,  0, 37, 36, 36, 36,153,  9,  9,  0,  0,  0,  0,  0,  0,  0,
-      1,106,170,170,169, 64,  0,  0,  0,  0,  0,  0,  0,  0,  0, 22,
-    170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  9,164, 36, 36,146,170,
-    168,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,169, 64,  0,  0,
-      0,  0,  0,  0,  0,  0,  0, 26,168,  0,  0,  0,  0,  8,121,125,
-      0,  0,  0,  0,  0,  9,  0, 36, 36,144,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,170,170,170, 80,  0,  0,  0,  0,  0,  0,  0,
-      0,  0, 90,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  9,  0, 36,
-     36,144,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,
-     80,  0,  0,  0,  0,  0,  0,  0,  0,  0,106,170,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  9,  0, 36, 36,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,170,170,170,148,  0,  0,  0,  0,  0,  0,  0,
-      0,  1,106,160,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8,122,125,
-      9,  0, 10,144,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,
-    170,170,170,148,  0,  0,  0,  0,  0,  0,  0,  0,  1,170,160,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  9,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  1,106,170,170,170,165,  0,  0,  0,  0,
-      0,  0,  0,  0,  5,170,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      9,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,
-    170,170,170,165, 64,  0,  0,  0,  0,  0,  0,  0,  6,170,160,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  9,  0,  0,  0,  0,  8,123,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,169, 64,
-      0,  0,  0,  0,  0,  0,  0, 22,170,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  8,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  1,106,170,170,170,170, 80,  0,  0,  0,  0,  0,  0,  0, 26,
-    170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,148,
-      0,  0,  0,  0,  0,  0,  0, 90,160,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  8,124,125,
-      0,  0,  0,  0,  1,106,170,170,170,170,148,  0,  0,  0,  0,  0,
-      0,  1,106,160,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,
-    170,170,165,  0,  0,  0,  0,  0,  0,  1,170,160,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  1,106,170,170,170,170,169, 64,  0,  0,  0,  0,
-      0,  5,170,160,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  8,125,125,
-    106,170,170,170,170,169, 80,  0,  0,  0,  0,  0, 22,160,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,170,148,  0,
-      0,  0,  0,  0, 90,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,
-    106,170,170,170,170,170,165,  0,  0,  0,  0,  0,106,160,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,  8,126,125,
-    170,169, 64,  0,  0,  0,  1,106,160,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170,170,170,170,170,170, 80,  0,  0,  0, 22,170,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,
-    170,170,148,  0,  0,  0,106,170,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  1,106,170,170,170,170,170,170,165, 64,  0,  8,127,125,
-      1,170,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,
-    170,170,170,170,170,170, 85,  0, 21,170,160,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  1,106,170,170,170,170,170,170,170,170,149,
-     90,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,
-    170,170,170,170,170,170,170,170,170,128,  0,  0,  0,  8,128,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,170,170,
-    170,170,170,170,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      1,106,170,170,170,170,170,170,170,170,170,170,170,160,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,170,170,
-    170,170,170,170,170,170,  0,  0,  0,  0,  0,  0,  0,  8,129,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,106,170,170,170,170,170,170,170,170,170,170,170,
-    170,128,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,
-    170,170,170,170,170,170,170,170,170,160,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  1,106,170,170,170,170,  8,  0,100,
-      0,  0,  0,106,172,  0, 37, 85, 85, 85, 85, 85, 85, 85, 85, 85,
-      0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 85, 85, 85,
-     85, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,106,172,  0, 37,153,
-    153, 85, 85,153,153, 89,153,153,  0,  0,  0,  0,  0,  0,  0,  0,
-     85, 85, 85, 85, 85, 85, 85, 85, 85, 90,170,170,129,  0,  0,  0,
-      0,  0,  0, 90,172,  0, 69, 86, 86,102, 86, 85,101,102,102,101,
-      0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 85, 85, 85,
-     85,106,170,  3, 49,  0,  0,  0,  0,  0,  0, 90,172,  4,232,125,
-     47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 54,  5,  4, 51, 62, 62,
-     63, 64,125,189,188,184,181,134, 71, 72, 74, 69,116,115, 78, 65,
-     79,144,161,174,172,171,165,170, 87, 91, 90,102,100, 99, 93, 93,
-     95,144,145,173,156, 91,165,150,103,104,106,101, 84, 99,110,110,
-    111,176,129,142,140,136,133,182,247,248,249,250,251,252,253,254,
-    213,  0,  9,  9,  9, 14, 15, 12, 45,137,140,139,187, 60, 61, 61,
-     37,245, 59,253,110,161,144, 99, 61, 14, 51, 71,206, 65,192,195,
-     53,249,  8, 91,220,120,245,249, 13,168,233,170,171, 12,132,125,
-    172,173,174, 47, 51, 62, 14, 15, 11,  9, 10,183,120, 73,134,135,
-     64,129,130, 63, 79,125, 66, 67, 75,121,121,199, 56,245,246, 59,
-     12,205, 50, 79, 95,109, 82, 80, 84,105, 89,215, 40,229,230, 43,
-    224,225, 46, 95, 96, 98,109, 95, 91,101,102,231, 24, 25, 26, 27,
-     16, 29, 30,111, 79, 77, 78, 76,116, 73,121,247,  4,249,250, 11,
-    192,193, 14,127,143,189,190,188,184,185,137,  7,248, 53, 10,251,
-     48, 49,254,143,175,145,146,147,151,154,153, 23,228, 37, 38,235,
-    220, 29, 30,159,175,157,158,172,152,153,169, 39,216, 12,133,125,
-     21, 22,219, 16, 17,222,175,191,141,142,188,180,137,185, 55,200,
-      5,  6,199,  0,  1,206,191,207,254,205,204,203,202,201, 71,119,
-    122,121,120,127,126,113,207,208,209,210,211,212,233,217, 87,100,
-    101,102,103, 96, 97,174,223,239,221,222,223,216,217,233,103,152,
-     85, 86, 87,144, 93,146,239,204,205,206,204,200,201,202,119, 68,
-     69,138,187,140, 65, 66,245,  8,  1,  2,  3,  7,  9, 53,178,121,
-    116,125,118,126,120,115,122,229,200,  4,118,253, 79,208,194,229,
-    204,207, 48,247,203, 11,194,255,223, 25, 78, 27, 11, 12,134,125,
-     13, 39, 24, 17,209, 69, 27,112, 93, 47, 48, 62, 13, 12, 59, 54,
-     54,183,184,133, 69, 68, 64, 77,126, 63, 64, 66, 77,124,123, 70,
-     73,199,  8, 57, 54, 52, 51, 61, 50, 79, 83, 82,110,108,107, 85,
-     85,215, 40, 41, 21, 36,227, 29, 46, 95, 96, 98,109, 92,107,102,
-    102,231, 40, 25, 22, 20, 16, 29, 46, 69, 85,107,107,106,109,111,
-     83, 93,174, 80,163, 98,165, 84,168, 85,165,155,155,154,157,159,
-    163,173, 94,160, 83,146, 85,164, 88,165,181,139,139,138,141,143,
-    179,189, 78,176, 67,130, 69,180, 72, 31, 32, 33, 34, 12,135,125,
-     35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46,133,176,177,128,
-    189,186,134,181,157, 56, 57, 10,251,252, 14, 50,149, 25, 84, 87,
-    124,185,176,179,237, 45, 28,157, 30, 25,146, 19,229,197,  5,  6,
-    175, 43, 10,  9,253, 88, 89, 90, 91, 92, 93, 94,245,225,224,232,
-    233,238,228,231,205, 41, 41,202,203,204, 45, 44,197, 33,130, 72,
-    124, 73,200, 75,221, 44,133,208,132, 41, 40, 13,213,213,126, 40,
-    124,211,208,179, 45,157,181, 58, 75,124,125,126, 37, 16, 17, 18,
-     16, 27, 22, 21, 61,152,153, 90,171,160,173, 46, 53, 12,136,125,
-    245, 31,136,182,163,176,243, 13,253, 87,  0,244,251,248,251,  5,
-    229, 75, 26, 79, 72, 74, 73, 29,184,185,186,187,188,189,190, 21,
-     64, 73, 64, 73, 70, 77, 70,109,200, 65,170,147,172, 69, 14,101,
-    193,212,197,236, 41,226,211,125,201,140, 37,142,137,145, 27,117,
-    241,181,183, 26,154,154,187, 77,232,233,234,171,188,121, 11, 69,
-    112,114,112,121, 94, 95,125, 93,248, 57,122, 91, 84, 85, 30, 85,
-     17, 23,  7, 12, 59, 58,251,173, 76,111, 95,244,217, 88, 83,165,
-     65, 72,183,236, 67, 64,203,189,  9,141, 74,203,236, 12,137,125,
-    237,238,159,160,161,162,163,164,165,166, 39, 40, 41, 42, 43, 44,
-     45, 46,173,178,179,176,177,182,187,133, 52, 52, 10,244,  0,242,
-     15,242, 10,181,180,171,225,129,111,236, 26, 29, 32, 31, 30,230,
-     20,219, 16, 15, 14, 45,236,200, 55,254,151,152,169,230,164,178,
-    147,161,222,225,224,235,194,225,208,227, 47, 10, 38, 20, 17, 51,
-    243,209,210, 77,156,219,216,223,223,220, 32, 47, 36, 11,190, 67,
-    248,251,106,149, 68,247,220,119,215,220,119,116,119, 96, 97,102,
-     39, 37, 12, 19, 17, 18, 19, 23, 25,  1,103,104, 88, 12,138,125,
-     85, 84, 99,104,193,149,181,248, 52, 70, 93, 91, 89,240,223,214,
-      5,  1,197,248, 69, 82, 79, 68, 37,232,219, 10, 73,119, 72,  5,
-    197,101, 75, 66, 65, 63, 64, 65, 65, 66, 69, 72,103,  7,  8, 10,
-     52,176,130,175,166,250, 37, 36, 43,113, 45,255,127, 18,141,124,
-    143,140,113,139,139,128,191,158, 21, 12,168, 75, 77, 30,150,  6,
-     85, 20, 34, 19, 33,108,115,114,113,116,115,126, 67, 52, 59, 54,
-      4,  1, 35, 19,161, 66,253,236,189,172,174,175,172, 82, 93, 94,
-     87,222,243,130,173,218,197,228, 79,196,235,231,220, 12,139,125,
-    231,228,231,224,241,246,183,181,159,160,161,162,163,164,165,166,
-     39, 40, 41, 42, 43, 44, 45, 46, 47, 72, 74, 69,116,115, 78, 65,
-     79,144,161,174,172,171,165,170, 87, 91, 90,102,100, 99, 93, 93,
-     95,144,145,173,156, 91,165,150,103,104,106,101, 84, 99,110,110,
-    111,176,129,142,140,136,133,182,247,248,249,250,251,252,253,254,
-    213,  0,  9,  9,  9, 14, 15, 12, 45,137,140,139,187, 60, 61, 61,
-     37,245, 59,253,110,161,144, 99, 61, 14, 51, 71,206, 65,192,195,
-     53,249,  8, 91,220,120,245,249, 13,168,233,170,171, 12,  0, 25,
-     98, 21,  0,  0,  0, 22, 34,  2, 43,  7,  7,224, 27, 13, 54,224,
-     45,132, 20, 23, 12, 14, 65,112,  0,  0,  0,  0, 20, 33, 12, 14,
-     65, 80,144,  0,  0,  0, 20, 43, 10, 14, 65,  2, 32,  0,  0,  0,
-     22, 35,  2, 59,  9,  7,217, 34,129, 27, 19, 12, 14, 65,146, 80,
-      0,  0,  0, 20, 29, 12, 14, 65,144,  0,  0,  0,  0, 20, 39, 12,
-     14, 65,112,  0,  0,  0,  0, 20, 49, 12, 14, 65, 81, 48,  0,  0,
-      0, 20, 59, 10, 14, 65,  2, 32,  0,  0,  0, 22, 38,  2,108, 12,
-     54,156, 56,128, 44, 45,182, 20, 18, 54,214, 45,182, 16,141,125,
-     20, 24, 54,196, 45,182, 20, 30, 54,215, 45,182, 20, 36, 54,212,
-     45,182, 20, 50,  8,174, 45,128, 25, 14, 64, 20,  0,  0,  0,  0,
-     20, 59, 54,168, 56,174, 44, 45,182, 20, 68, 54,162, 56,174, 44,
-     45,182, 20, 72,  9,174, 20, 80,  8,174, 45,128, 25,131, 20, 92,
-     54,163, 56,174, 44, 45,166, 56,174, 44, 20,104, 54,164, 56,174,
-     44, 45,167, 56,174, 44, 20,108,  9,174, 22, 48,  2, 93, 13, 12,
-     14, 65, 16,  0,  0,  0,  0, 20, 27,  8,174, 45,128, 25, 14, 64,
-     20,  0,  0,  0,  0, 20, 39, 54,168, 56,174, 44, 45, 16,142,125,
-    162, 56,174, 44, 20, 43,  9,174, 20, 51,  8,174, 45,128, 25,131,
-     20, 63, 54,166, 56,174, 44, 45,163, 56,174, 44, 20, 75, 54,167,
-     56,174, 44, 45,164, 56,174, 44, 20, 79,  9,174, 20, 89, 12, 14,
-     65,112,  0,  0,  0,  0, 20, 93, 12,131, 22, 73,  2, 97,  7, 12,
-    142, 20, 13, 54,154, 45,135, 20, 27, 54,155, 46, 15,  7, 77, 89,
-     32, 72, 65, 78, 68, 20, 31, 12,140, 20, 39,  8,181, 45,128, 25,
-    131, 20, 51, 54,166, 56,181, 44, 45,169, 56,181, 44, 20, 63, 54,
-    167, 56,181, 44, 45,170, 56,181, 44, 20, 67,  9,181, 16,143,125,
-     20, 77, 12, 14, 65,  2,128,  0,  0,  0, 20, 87, 12, 14, 65, 80,
-      0,  0,  0,  0, 20, 97, 10, 14, 65,  2, 32,  0,  0,  0, 22,232,
-      3, 67, 13, 12, 14, 65,  1,128,  0,  0,  0, 20, 27,  8,174, 45,
-    128, 25, 14, 64, 19,  0,  0,  0,  0, 20, 35,  8,181, 45,128, 25,
-    131, 20, 44,  7,163, 56,181, 44, 34,174, 27, 58, 54,172, 56,195,
-     44, 45,172, 56,195, 44, 37,128, 20, 67, 54,148, 56,195, 44, 45,
-    174, 22,242,  3, 28,  7,  9,181, 20, 14,  7,172, 56,195, 44, 27,
-     28, 54,195, 45,195, 37, 14, 64,  1,  0,  0,  0,  0, 16,144,125,
-     22,252,  3, 48,  7,  9,174, 20, 15,  8,174, 45,132, 25,138, 20,
-     24,  7,172, 56,174, 44, 34,138, 27, 36, 54,173, 56,130, 44, 45,
-    148, 56,174, 44, 20, 48, 54,162, 56,130, 44, 45,148, 56,174, 44,
-     22,  6,  4, 48, 12,  7,172, 56,174, 44, 34,130, 27, 30, 54,173,
-     56, 14, 64,  7,  0,  0,  0,  0, 44, 45,148, 56,174, 44, 20, 48,
-     54,162, 56, 14, 64,  7,  0,  0,  0,  0, 44, 45,148, 56,174, 44,
-     22, 16,  4, 41, 17,  7,172, 56,174, 44, 34,129, 42,173, 56,134,
-     44, 27, 29, 54,173, 56,133, 44, 45,173, 56,134, 44, 16,145,125,
-     20, 41, 54,162, 56,133, 44, 45,173, 56,134, 44, 22, 26,  4, 36,
-     12,  7,172, 56,174, 44, 34,129, 27, 24, 54,173, 56,134, 44, 45,
-    148, 56,174, 44, 20, 36, 54,162, 56,134, 44, 45,148, 56,174, 44,
-     22, 36,  4, 55,  7,  9,174, 20, 25,  7,173, 56, 14, 64,  7,  0,
-      0,  0,  0, 44, 42,173, 56,134, 44, 27, 34, 54,173, 56,138, 44,
-     45,128, 20, 52, 54,162, 56,138, 44, 45,162, 56, 14, 64,  7,  0,
-      0,  0,  0, 44, 20, 55, 36, 22, 46,  4, 24, 21,  7,173, 56,130,
-     44, 41,173, 56, 14, 64,  7,  0,  0,  0,  0, 44, 27, 16,146,125,
-     24, 36, 22, 56,  4, 60, 20,  7,173, 56,133, 44, 42,162, 56,134,
-     44, 33,162, 56,133, 44, 27, 29, 54,183, 45,162, 56,133, 44, 20,
-     41, 54,162, 56,133, 44, 45,162, 56,134, 44, 20, 50, 54,162, 56,
-    134, 44, 45,183, 20, 60, 10, 14, 64,132,  0,  0,  0,  0, 22, 58,
-      4, 20, 10,  7,173, 56,134, 44, 27, 20, 10, 14, 64,134,  0,  0,
-      0,  0, 22, 61,  4, 13, 13, 12, 14, 65,  1,133,  0,  0,  0, 22,
-    106,  4, 51, 11,  8,174, 45,128, 25,131, 20, 19,  8,181, 45,128,
-     25,131, 20, 31,  7,164, 56,174, 44, 34,164, 56,181, 16,147,125,
-     44, 27, 39, 54,214, 45,214, 37,128, 20, 51, 54,156, 56,128, 44,
-     45,164, 56,174, 44, 22,116,  4, 29,  7,  9,181, 20, 13,  7,214,
-     33,129, 27, 19, 54,174, 45,139, 20, 29, 10, 14, 65, 17, 96,  0,
-      0,  0, 22,126,  4,  9,  9, 54,214, 45,132, 22,136,  4,  7,  7,
-      9,174, 22,146,  4, 41, 20,  7,214, 34,131, 42,196, 34,138, 42,
-    148, 56,138, 44, 34,136, 27, 29, 54,173, 56,128, 44, 45,136, 20,
-     38, 54,162, 56,128, 44, 45,136, 20, 41, 36, 22,156,  4, 40, 13,
-      7,214, 34,131, 42,196, 34,138, 27, 25, 54,173, 56, 16,148,125,
-    129, 44, 45,148, 56,138, 44, 20, 37, 54,162, 56,129, 44, 45,148,
-     56,138, 44, 20, 40, 36, 22,166,  4, 59,  9,  7,214, 34,131, 27,
-     19, 12, 14, 64,128,  0,  0,  0,  0, 20, 31, 54,173, 56,131, 44,
-     45,163, 56,131, 44, 20, 49, 54,162, 56,131, 44, 45,163, 56, 14,
-     64,  5,  0,  0,  0,  0, 44, 20, 59, 10, 14, 64,152,  0,  0,  0,
-      0, 22,176,  4, 36,  9,  7,196, 34,138, 27, 21, 54,173, 56,139,
-     44, 45,148, 56,138, 44, 20, 33, 54,162, 56,139, 44, 45,148, 56,
-    138, 44, 20, 36, 36, 22,186,  4, 47, 13, 12, 14, 64, 16,149,125,
-    128,  0,  0,  0,  0, 20, 25, 54,173, 56,135, 44, 45,163, 56,131,
-     44, 20, 37, 54,162, 56,135, 44, 45,163, 56,131, 44, 20, 47, 10,
-     14, 64,152,  0,  0,  0,  0, 22, 60, 15, 88, 13, 13, 14, 66,  2,
-     85,  0,  0,  0, 20, 24, 23, 28,128, 18,138, 18,182, 18,206, 20,
-     44, 54,225, 45, 14, 65,  8, 50,  0,  0,  0, 37, 14, 64, 22,  0,
-      0,  0,  0, 20, 58, 31,225, 37,129, 18, 14, 64,  7,  0,  0,  0,
-      0, 20, 73, 54,191, 45, 63, 58,226, 60,225, 37,138, 60,227, 44,
-     20, 88, 54,191, 45, 63, 58,226, 60,225, 37,133, 60, 16,150,125,
-    228, 44, 22,100, 15, 48, 31, 54,174, 45, 63, 58, 67, 58, 15,  7,
-    104,104,104,170, 76, 86,228, 44, 60, 14, 64, 22,  0,  0,  0,  0,
-     44, 20, 48,  7, 66, 58,206, 44, 32,139, 27, 14, 65, 57, 96,  0,
-      0,  0, 22,105, 15, 24, 24,  7,206, 55,139, 60,139, 44, 48, 15,
-      1, 46, 27, 14, 65, 57, 96,  0,  0,  0, 22,110, 15, 72, 10, 41,
-     28,128, 18,174, 20, 22, 31, 14, 65,  7, 18,  0,  0,  0, 18,174,
-     20, 30,  8,174, 45,182, 25,129, 20, 37, 41, 28,128, 18,180, 20,
-     51, 31, 14, 65,  7,  8,  0,  0,  0, 37,174, 18,180, 16,151,125,
-     20, 55,  9,174, 20, 62, 41, 28,128, 18,174, 20, 72, 12, 14, 66,
-      3, 34,  0,  0,  0, 22,120, 15, 11,  8, 17, 28,128, 20, 11, 36,
-     22,160, 15, 61, 13, 12, 14, 65,  1,128,  0,  0,  0, 20, 21,  8,
-    174, 45,128, 25,136, 20, 29,  8,181, 45,128, 25,131, 20, 38,  7,
-    169, 56,181, 44, 34,174, 27, 52, 54,172, 56,195, 44, 45,172, 56,
-    195, 44, 37,128, 20, 61, 54,148, 56,195, 44, 45,174, 22,170, 15,
-     22,  7,  9,181, 20, 14,  7,172, 56,195, 44, 27, 22, 54,195, 45,
-    195, 37,128, 22,180, 15, 42,  7,  9,174, 20, 15,  8, 16,152,125,
-    174, 45,132, 25,138, 20, 24,  7,172, 56,174, 44, 34,138, 27, 36,
-     54,173, 56,130, 44, 45,148, 56,174, 44, 20, 42, 54,217, 45,132,
-     22,190, 15, 30, 12,  7,172, 56,174, 44, 34,130, 27, 30, 54,173,
-     56, 14, 64,  7,  0,  0,  0,  0, 44, 45,148, 56,174, 44, 22,200,
-     15, 29, 17,  7,172, 56,174, 44, 34,129, 42,173, 56,134, 44, 27,
-     29, 54,173, 56,133, 44, 45,173, 56,134, 44, 22,210, 15, 24, 12,
-      7,172, 56,174, 44, 34,129, 27, 24, 54,173, 56,134, 44, 45,148,
-     56,174, 44, 22,220, 15, 43,  7,  9,174, 20, 25,  7, 16,153,125,
-    173, 56, 14, 64,  7,  0,  0,  0,  0, 44, 42,173, 56,134, 44, 27,
-     34, 54,173, 56,138, 44, 45,128, 20, 40, 54,217, 45,132, 20, 43,
-     36, 22,230, 15, 13, 10,  7,173, 56,130, 44, 27, 13, 36, 22,235,
-     15, 25, 16,  7,173, 56, 14, 64,  7,  0,  0,  0,  0, 44, 27, 22,
-     54,217, 45,132, 20, 25, 36, 22,240, 15, 24, 15,  7,173, 56,133,
-     44, 41,173, 56,134, 44, 27, 21, 54,217, 45,128, 20, 24, 36, 22,
-    245, 15, 13, 13, 12, 14, 65,  1,133,  0,  0,  0, 22, 34, 16, 57,
-     11,  8,174, 45,128, 25,131, 20, 19,  8,181, 45,128, 16,154,125,
-     25,131, 20, 31,  7,170, 56,174, 44, 34,170, 56,181, 44, 27, 39,
-     54,214, 45,214, 37,128, 20, 57, 54,156, 56, 14, 64,  1,  0,  0,
-      0,  0, 44, 45,170, 56,174, 44, 22, 44, 16, 29,  7,  9,181, 20,
-     13,  7,214, 33,129, 27, 19, 54,174, 45,139, 20, 29, 10, 14, 65,
-     65, 96,  0,  0,  0, 22, 54, 16,  9,  9, 54,214, 45,132, 22, 64,
-     16,  7,  7,  9,174, 22, 74, 16, 27,  9,  7,214, 34,131, 27, 18,
-     54,173, 56,131, 44, 45,128, 20, 24, 54,217, 45,132, 20, 27, 36,
-     22, 84, 16, 33, 15,  7,214, 33,129, 42,214, 31,196, 16,155,125,
-     37,128, 27, 24, 54,173, 56,131, 44, 45,128, 20, 30, 54,217, 45,
-    128, 20, 33, 36, 22, 94, 16, 27,  9,  7,196, 34,138, 27, 18, 54,
-    173, 56,139, 44, 45,128, 20, 24, 54,217, 45,132, 20, 27, 36, 22,
-    104, 16, 27,  9,  7,196, 33,128, 27, 18, 54,173, 56,139, 44, 45,
-    128, 20, 24, 54,217, 45,128, 20, 27, 36, 22,114, 16, 21, 12, 54,
-    173, 56,135, 44, 45,128, 20, 18, 54,217, 45,129, 20, 21, 36, 22,
-     48, 17, 31, 28,  7,173, 56,128, 44, 41,173, 56,129, 44, 41,173,
-     56,138, 44, 41,196, 34,138, 41,214, 34,131, 27, 31, 16,156,125,
-     36, 22, 50, 17, 38, 11,  8,174, 45,128, 25,131, 20, 28,  7,173,
-     56,130, 44, 42,169, 56,174, 44, 30,173, 56,130, 44, 27, 38, 12,
-     14, 65, 69,  0,  0,  0,  0, 22, 52, 17, 42, 32,  7,173, 56, 14,
-     64,  7,  0,  0,  0,  0, 44, 42,169, 56,174, 44, 30,173, 56, 14,
-     64,  7,  0,  0,  0,  0, 44, 27, 42, 12, 14, 65, 69,  0,  0,  0,
-      0, 22, 54, 17, 56, 30,  7,173, 56,133, 44, 42,169, 56,174, 44,
-     30,173, 56,133, 44, 42,169, 56,174, 44, 30,173, 56,134, 44, 27,
-     40, 12, 14, 65, 69,  0,  0,  0,  0, 20, 46, 54,174, 16,157,125,
-     45,139, 20, 56, 10, 14, 65, 68, 16,  0,  0,  0, 22, 55, 17, 18,
-     18,  7,173, 56,133, 44, 27, 14, 65, 68, 16,  0,  0,  0, 22, 56,
-     17, 30, 20,  7,173, 56,134, 44, 42,169, 56,174, 44, 30,173, 56,
-    134, 44, 27, 30, 12, 14, 65, 69,  0,  0,  0,  0, 22, 58, 17,  7,
-      7,  9,174, 22, 60, 17, 46, 10,  7,173, 56,131, 44, 27, 18,  8,
-    174, 45,128, 25,131, 20, 36,  7,170, 56,174, 44, 30,156, 56, 14,
-     64,  1,  0,  0,  0,  0, 44, 27, 46, 12, 14, 65, 69,  0,  0,  0,
-      0, 22, 61, 17, 17, 10,  7,173, 56,131, 44, 27, 14, 16,158,125,
-      9,174, 20, 17, 36, 22, 64, 17, 22, 22,  7,173, 56,139, 44, 42,
-    196, 34,129, 27, 14, 65, 71,  0,  0,  0,  0, 22, 68, 17, 38, 22,
-      7,173, 56,139, 44, 42,169, 56,128, 44, 37,128, 30,169, 56,129,
-     44, 27, 28, 54,174, 45,128, 20, 38, 10, 14, 65, 69,  0,  0,  0,
-      0, 22, 69, 17, 26, 10,  7,173, 56,139, 44, 27, 16, 54,174, 45,
-    131, 20, 26, 12, 14, 65, 69,  0,  0,  0,  0, 22,108, 17,  6,  6,
-     36, 22,148, 17, 42, 11, 54,183, 45,183, 37,128, 20, 21, 12, 14,
-     65,129,  0,  0,  0,  0, 20, 30, 54,169, 56,174, 44, 16,159,125,
-     45,149, 20, 39, 54,170, 56,174, 44, 45,150, 20, 42, 36, 22, 92,
-     18, 35, 11,  8,174, 45,132, 25,138, 20, 35,  7,148, 56,174, 44,
-     37,128, 34,148, 56,174, 37,128, 44, 27, 14, 65, 71, 80,  0,  0,
-      0, 22,102, 18, 51,  9,  7,174, 34,128, 27, 19, 12, 14, 65, 69,
-      0,  0,  0,  0, 20, 25, 54,174, 45,129, 20, 35, 12, 14, 65, 69,
-      0,  0,  0,  0, 20, 41, 54,174, 45,139, 20, 51, 10, 14, 65, 71,
-     80,  0,  0,  0, 22,112, 18, 57,  9,  7,174, 34,129, 27, 15, 54,
-    174, 45,138, 20, 25, 12, 14, 65, 69,  0,  0,  0,  0, 16,160,125,
-     20, 31, 54,174, 45,131, 20, 41, 12, 14, 65, 69,  0,  0,  0,  0,
-     20, 47, 54,174, 45,139, 20, 57, 10, 14, 65, 71, 80,  0,  0,  0,
-     22,122, 18, 41,  9,  7,174, 34,138, 27, 15, 54,174, 45,128, 20,
-     25, 12, 14, 65, 69,  0,  0,  0,  0, 20, 31, 54,174, 45,131, 20,
-     41, 12, 14, 65, 69,  0,  0,  0,  0, 22,142, 18, 10,  7,  9,174,
-     20, 10, 36, 22,136, 19, 33, 11,  8,174, 45,128, 25,135, 20, 33,
-      7,168, 56,174, 44, 37,171, 56,174, 44, 30,132, 27, 14, 65, 80,
-    112,  0,  0,  0, 22,196, 19,  7,  7,  9,174, 22,206, 16,161,125,
-     19, 23, 23,  7,168, 56,174, 44, 34,171, 56,174, 44, 27, 14, 65,
-      1,112,  0,  0,  0, 22,216, 19, 23, 23,  7,168, 56,174, 44, 33,
-    171, 56,174, 44, 27, 14, 65, 81, 48,  0,  0,  0, 22,226, 19, 62,
-      7, 12,142, 20, 23, 54,155, 46, 15,  9, 77, 89, 32, 80, 79, 84,
-     44, 32, 36, 20, 44, 54,155, 55, 66, 58,155, 44, 37,128, 44, 46,
-     61, 58,203, 39,129, 37,201, 44, 20, 48, 12,140, 20, 54, 54,229,
-     45,182, 20, 62, 54,199, 45,199, 37,203, 22,227, 19, 94,  7,  7,
-    250, 27, 19, 54,154, 45, 14, 64, 22,  0,  0,  0,  0, 16,162,125,
-     20, 37, 54,155, 46, 15, 11, 45, 73, 32, 75, 69, 69, 80, 32, 77,
-     89, 32, 20, 84, 54,155, 55, 66, 58,155, 44, 37,128, 44, 46,146,
-     55, 14, 65,  9,  3,  0,  0,  0, 37,207, 36,133, 38, 14, 64,  7,
-      0,  0,  0,  0, 60, 14, 65,  9,  3,  0,  0,  0, 37,207, 36,133,
-     44, 20, 88, 12,140, 20, 94, 54,250, 45,182, 22,228, 19, 38, 38,
-      7,203, 32, 14, 64, 64,  0,  0,  0,  0, 41, 72, 58,182, 44, 36,
-     14, 65,  2,  0,  0,  0,  0, 33,203, 27, 14, 65, 81,  5,  0,  0,
-      0, 22,229, 19, 78, 13, 12, 14, 65,153,153,  0,  0, 16,163,125,
-      0, 20, 17, 12,142, 20, 31, 54,180, 45, 80, 58, 72, 58,132, 44,
-     36,137, 44, 20, 64, 54,155, 46,146, 55,180, 36, 14, 64, 48,  0,
-      0,  0,  0, 37,128, 60, 43,180, 37,128, 44, 36, 14, 64, 48,  0,
-      0,  0,  0, 44, 20, 68, 12,140, 20, 78, 12, 14, 65,153,153,  0,
-      0,  0, 22,241, 19, 47, 15, 54,200, 45,200, 37,203, 37,201, 38,
-    204, 20, 25, 12, 14, 65,152,  0,  0,  0,  0, 20, 35, 12, 14, 65,
-    149,  0,  0,  0,  0, 20, 41, 54,201, 45,182, 20, 47, 54,204, 45,
-    182, 22,246, 19,  6,  6, 36, 22, 10, 20, 56,  7, 12, 16,164,125,
-    142, 20, 25, 54,155, 46, 15, 11, 89, 79, 85, 82, 32, 80, 79, 84,
-     44, 32, 36, 20, 46, 54,155, 55, 66, 58,155, 44, 37,128, 44, 46,
-     61, 58,203, 39,129, 37,204, 44, 20, 50, 12,140, 20, 56, 54,250,
-     45,182, 22, 11, 20, 54,  7,  7,229, 27, 19, 54,154, 45, 14, 64,
-     24,  0,  0,  0,  0, 20, 44, 54,155, 46, 15, 18, 45, 75, 69, 69,
-     80, 32, 89, 79, 85, 82, 32, 67, 76, 79, 84, 72, 69, 83, 20, 48,
-     12,140, 20, 54, 54,229, 45,182, 22, 12, 20, 38, 38,  7,203, 32,
-     14, 64, 64,  0,  0,  0,  0, 41, 72, 58,182, 44, 36, 16,165,125,
-     14, 65,  2,  0,  0,  0,  0, 33,203, 27, 14, 65, 81, 64,  0,  0,
-      0, 22, 13, 20, 80, 13, 12, 14, 65,153,153,  0,  0,  0, 20, 17,
-     12,142, 20, 33, 54,180, 45,137, 37, 80, 58, 72, 58,132, 44, 36,
-    137, 44, 20, 66, 54,155, 46,146, 55,180, 36, 14, 64, 48,  0,  0,
-      0,  0, 37,128, 60, 43,180, 37,128, 44, 36, 14, 64, 48,  0,  0,
-      0,  0, 44, 20, 70, 12,140, 20, 80, 12, 14, 65,153,153,  0,  0,
-      0, 22, 20, 20, 60, 15, 54,202, 45,202, 37,203, 37,204, 38,201,
-     20, 21, 54,201, 45,182, 20, 27, 54,204, 45,182, 20, 16,166,125,
-     37, 12, 14, 65,134,  0,  0,  0,  0, 20, 47, 12, 14, 65,133,  0,
-      0,  0,  0, 20, 57, 12, 14, 65,152,  0,  0,  0,  0, 20, 60, 36,
-     22, 70, 20, 51,  9, 54,154, 45,135, 20, 34, 54,155, 46, 15, 18,
-     87, 69, 32, 84, 73, 69, 68, 46, 46, 46, 78, 69, 87, 32, 68, 69,
-     65, 76, 20, 38, 12,140, 20, 48, 54,199, 45,199, 37,203, 39,129,
-     20, 51, 36, 22, 56, 24, 14,  7, 12,142, 20, 14, 54,230, 45, 40,
-    230, 22, 71, 24, 11, 11, 54,213, 45,213, 37,128, 22, 76, 24, 43,
-      7,  7,230, 27, 17, 12, 14, 65, 99,  0,  0,  0,  0, 16,167,125,
-     20, 23,  7,224, 34,132, 27, 31, 54,209, 45,209, 37,221, 20, 37,
-     54,221, 45,210, 20, 43, 54,193, 45,132, 22, 78, 24, 25,  9,  7,
-    197, 34,128, 27, 15, 54,216, 45,132, 20, 25, 10, 14, 65, 98, 85,
-      0,  0,  0, 22, 79, 24, 10,  7,  7,224, 27, 10, 36, 22, 81, 24,
-     55,  9,  7,213, 34,128, 27, 19, 12, 14, 65,100,  0,  0,  0,  0,
-     20, 29, 12, 14, 65,144,  0,  0,  0,  0, 20, 35,  7,217, 32,129,
-     27, 43, 54,209, 45,209, 37,221, 20, 49, 54,221, 45,193, 20, 55,
-     54,210, 45,132, 22, 82, 24, 55,  9,  7,213, 34,129, 16,168,125,
-     27, 19, 12, 14, 65,101, 80,  0,  0,  0, 20, 29, 12, 14, 65,144,
-      0,  0,  0,  0, 20, 35,  7,217, 32,129, 27, 43, 54,209, 45,209,
-     37,221, 20, 49, 54,221, 45,193, 20, 55, 54,210, 45,132, 22, 83,
-     24, 12,  9,  7,217, 34,129, 27, 12, 36, 22, 84, 24, 25,  9,  7,
-    197, 34,128, 27, 15, 54,216, 45,132, 20, 25, 10, 14, 65, 98, 85,
-      0,  0,  0, 22, 86, 24, 45,  9,  7,230, 34,132, 27, 19, 12, 14,
-     65, 99,  0,  0,  0,  0, 20, 25,  7,224, 34,132, 27, 33, 54,209,
-     45,209, 37,221, 20, 39, 54,221, 45,210, 20, 45, 54, 16,169,125,
-    193, 45,132, 22, 96, 24, 14, 11,  7,224, 41,217, 34,129, 27, 14,
-     36, 22, 98, 24, 22,  9,  7,198, 42,219, 27, 19, 12, 14, 65,144,
-      0,  0,  0,  0, 20, 22, 36, 22,101, 24, 25,  9,  7,197, 34,128,
-     27, 15, 54,216, 45,132, 20, 25, 10, 14, 65, 98, 85,  0,  0,  0,
-     22,102, 24, 39, 11, 54,216, 45,216, 37,128, 20, 17,  7,216, 30,
-    129, 27, 23, 54,198, 45,182, 20, 29, 54,219, 45,182, 20, 39, 10,
-     14, 65, 98, 32,  0,  0,  0, 22,103, 24, 45,  9, 54,216, 45,182,
-     20, 19, 12, 14, 65,144, 32,  0,  0,  0, 20, 25,  7, 16,170,125,
-    230, 34,182, 27, 35, 12, 14, 65,146, 16,  0,  0,  0, 20, 45, 10,
-     14, 65, 98, 85,  0,  0,  0, 22,104, 24, 35,  9, 54,183, 45,182,
-     20, 15, 54,154, 45,138, 20, 31, 54,155, 46, 15,  9, 76, 65, 83,
-     84, 32, 66, 69, 84, 58, 20, 35, 12,140, 22,106, 24, 20, 20,  7,
-     82, 58,182, 44, 34,137, 27, 14, 65, 98, 83,  0,  0,  0, 22,107,
-     24, 41, 15, 54,154, 45, 14, 64, 20,  0,  0,  0,  0, 20, 26, 54,
-    155, 46, 15,  4, 67, 65, 76, 76, 20, 30,  7,183, 27, 41, 54,155,
-     46, 15,  4, 68, 82, 79, 80, 22,108, 24, 24, 10, 54, 16,171,125,
-    183, 45, 40,183, 20, 14, 12,140, 20, 24, 12, 14, 65,153,144,  0,
-      0,  0, 22,109, 24, 22, 22,  7, 84, 58,182, 44, 41,154, 34,182,
-     27, 14, 65, 98, 80,  0,  0,  0, 22,110, 24, 33, 13, 12, 14, 66,
-      1,  0,  0,  0,  0, 20, 24,  7,155, 52, 15,  4, 68, 82, 79, 80,
-     27, 30, 54,224, 45,128, 20, 33, 36, 22,111, 24, 69, 13, 54,209,
-     45,209, 37,210, 37,193, 20, 19, 54,210, 45,132, 20, 25, 54,221,
-     45,132, 20, 37,  7,154, 34, 14, 64, 20,  0,  0,  0,  0, 27, 45,
-     54,202, 45,202, 38,193, 20, 53, 54,204, 45,204, 37, 16,172,125,
-    193, 20, 63, 12, 14, 65,133,  0,  0,  0,  0, 20, 69, 54,193, 45,
-    132, 22,112, 24, 45, 17,  8,174, 45,128, 25, 14, 64, 80,  0,  0,
-      0,  0, 20, 21,  9,174, 20, 45,  7, 84, 58,132, 44, 34,132, 41,
-     82, 58,132, 44, 30,137, 27, 14, 65, 98, 86,  0,  0,  0, 22,114,
-     24, 12,  9,  7,213, 34,129, 27, 12, 36, 22,115, 24, 39,  7, 12,
-    142, 20, 13, 54,231, 45,128, 20, 19, 54,154, 45,129, 20, 27, 54,
-    155, 46, 15,  1,116, 20, 31, 12,140, 20, 39, 54,232, 45,231, 38,
-    128, 22,116, 24, 22, 12,  7, 84, 58,132, 44, 34,132, 16,173,125,
-     27, 22, 10, 14, 65, 98,128,  0,  0,  0, 22,117, 24, 42, 18,  7,
-     82, 58,132, 44, 34, 14, 64,  7,  0,  0,  0,  0, 27, 26, 54,231,
-     45,231, 37,128, 20, 32, 54,233, 45,128, 20, 42, 10, 14, 65, 98,
-    112,  0,  0,  0, 22,118, 24, 42, 18,  7, 82, 58,132, 44, 34, 14,
-     64, 17,  0,  0,  0,  0, 27, 26, 54,231, 45,231, 38,128, 20, 32,
-     54,233, 45,132, 20, 42, 10, 14, 65, 98,112,  0,  0,  0, 22,119,
-     24, 13, 13, 10, 14, 65, 98, 96,  0,  0,  0, 22,126, 24, 21, 15,
-      7,231, 34, 14, 64,  7,  0,  0,  0,  0, 27, 21, 54, 16,174,125,
-    231, 45,128, 22,127, 24, 15,  9,  7,231, 34,132, 27, 15, 54,231,
-     45,139, 22,128, 24, 65, 55, 30,231, 23, 14, 65,115, 80,  0,  0,
-      0, 18, 14, 65,115, 80,  0,  0,  0, 18, 14, 65,115, 80,  0,  0,
-      0, 18, 14, 65,115, 80,  0,  0,  0, 18, 14, 65,115, 80,  0,  0,
-      0, 18, 14, 65,115, 96,  0,  0,  0, 20, 65, 10, 14, 65, 98, 96,
-      0,  0,  0, 22,136, 24, 19,  9,  7,231, 34,139, 27, 19, 10, 14,
-     65, 98,144,  0,  0,  0, 22,140, 24, 65, 18,  7,161, 56,231, 44,
-     34, 14, 64,153,  0,  0,  0,  0, 27, 27, 54,149, 45, 16,175,125,
-    166, 56,231, 44, 20, 36, 54,150, 45,167, 56,231, 44, 20, 42, 54,
-    151, 45,231, 20, 46, 12,223, 20, 55, 54,161, 56,231, 44, 45,132,
-     20, 65, 10, 14, 65, 98, 96,  0,  0,  0, 22,141, 24, 50, 18, 54,
-    161, 56,231, 44, 45, 14, 64,153,  0,  0,  0,  0, 20, 24, 54,151,
-     45,231, 20, 30, 54,145, 46,152, 20, 34, 12,153, 20, 40, 54,151,
-     45,128, 20, 50, 10, 14, 65, 98, 96,  0,  0,  0, 22,146, 24, 66,
-      7, 12,142, 20, 15,  8,174, 45,128, 25,131, 20, 30,  7,161, 56,
-    174, 44, 34, 14, 64,153,  0,  0,  0,  0, 27, 40, 12, 16,176,125,
-     14, 65,129,  0,  0,  0,  0, 20, 49, 54,166, 56,174, 44, 45,149,
-     20, 58, 54,167, 56,174, 44, 45,150, 20, 66, 54,222, 45,222, 37,
-    128, 22,151, 24, 31,  7,  9,174, 20, 15,  8,174, 45,128, 25,131,
-     20, 24, 54,161, 56,174, 44, 45,132, 20, 28,  9,174, 20, 31, 36,
-     22,156, 24, 66, 13, 12, 14, 65,144, 32,  0,  0,  0, 20, 19, 54,
-    154, 45,138, 20, 32, 54,155, 46, 15,  6, 87, 65, 71, 69, 82, 63,
-     20, 36, 12,140, 20, 42, 54,219, 45,132, 20, 48, 54,224, 45,132,
-     20, 54, 54,218, 45,132, 20, 60, 54,197, 45,132, 20, 16,177,125,
-     66, 54,231, 45,128, 22,163, 24, 22, 12,  7, 84, 58,132, 44, 34,
-    132, 27, 22, 10, 14, 65, 99, 41,  0,  0,  0, 22,164, 24, 48, 15,
-     31, 14, 64,119,  0,  0,  0,  0, 18,132, 20, 30,  7, 82, 58,132,
-     44, 34, 14, 64, 20,  0,  0,  0,  0, 27, 38, 54,231, 45,231, 37,
-    128, 20, 48, 10, 14, 65, 99, 21,  0,  0,  0, 22,166, 24, 30, 12,
-      7, 82, 58,132, 44, 34,136, 27, 20, 54,231, 45,231, 38,128, 20,
-     30, 10, 14, 65, 99, 21,  0,  0,  0, 22,167, 24, 13, 13, 10, 14,
-     65, 99,  7,  0,  0,  0, 22,171, 24, 39,  9, 54,219, 16,178,125,
-     45,182, 20, 15, 54,218, 45,182, 20, 21, 54,197, 45,182, 20, 27,
-     54,224, 45,182, 20, 33,  7,231, 34,138, 27, 39, 54,231, 45,128,
-     22,173, 24, 15,  9,  7,231, 32,128, 27, 15, 54,231, 45,130, 22,
-    174, 24, 51, 31, 30,231, 24, 14, 65,113,  0,  0,  0,  0, 18, 14,
-     65,113, 80,  0,  0,  0, 18, 14, 65,114,  0,  0,  0,  0, 20, 41,
-     12, 14, 65,153,144,  0,  0,  0, 20, 51, 10, 14, 65, 99,  7,  0,
-      0,  0, 22,185, 24, 26, 13, 12, 14, 66,  1,  0,  0,  0,  0, 20,
-     23,  7,224, 34,128, 41,219, 34,128, 27, 26, 36, 22, 16,179,125,
-    188, 24, 44,  9,  7,197, 34,128, 27, 17, 54,202, 45,202, 38,193,
-     20, 25, 54,204, 45,204, 37,193, 20, 35, 12, 14, 65,133,  0,  0,
-      0,  0, 20, 41, 54,194, 45,182, 20, 44, 36, 22,191, 24, 27, 13,
-     12, 14, 65,144, 32,  0,  0,  0, 20, 27,  7,218, 34,128, 27, 14,
-     65, 99, 55,  0,  0,  0, 22,192, 24, 36,  9, 54,154, 45,138, 20,
-     22, 54,155, 46, 15,  6, 87, 65, 71, 69, 82, 63, 20, 26, 12,140,
-     20, 36, 10, 14, 65, 99,  7,  0,  0,  0, 22,193, 24, 20, 20,  7,
-     84, 58,132, 44, 34,132, 27, 14, 65, 99, 55,  0,  0, 16,180,125,
-      0, 22,196, 24, 33, 17, 54,155, 46, 15,  7, 65, 77, 79, 85, 78,
-     84, 63, 20, 23, 54,154, 45,131, 20, 27, 12,140, 20, 33, 54,174,
-     45,131, 22,198, 24, 44, 18,  7, 82, 58,132, 44, 34, 14, 64, 20,
-      0,  0,  0,  0, 27, 26, 54,174, 45,174, 37,131, 20, 38,  7,174,
-     33, 14, 64, 37,  0,  0,  0,  0, 27, 44, 54,174, 45,131, 22,201,
-     24, 38, 12,  7, 82, 58,132, 44, 34,136, 27, 20, 54,174, 45,174,
-     38,131, 20, 26,  7,174, 32,131, 27, 38, 54,174, 45, 14, 64, 37,
-      0,  0,  0,  0, 22,202, 24, 90, 11,  8,181, 45,128, 16,181,125,
-     25,135, 20, 15,  9,181, 20, 21,  7,174, 33,134, 27, 32, 54,183,
-     45, 80, 58,174, 39,135, 44, 20, 42, 54,184, 45,174, 38,183, 36,
-    135, 20, 58, 31,176, 37,136, 18, 14, 64, 22,  0,  0,  0,  0, 37,
-    183, 20, 80, 31,176, 37, 14, 64, 20,  0,  0,  0,  0, 18, 14, 64,
-     22,  0,  0,  0,  0, 37,184, 20, 90, 10, 14, 65, 99, 72,  0,  0,
-      0, 22,203, 24, 33, 19, 31,176, 37,136, 18,174, 37, 14, 64, 22,
-      0,  0,  0,  0, 20, 33, 31,176, 37, 14, 64, 20,  0,  0,  0,  0,
-     18,132, 22,204, 24, 20, 20,  7, 84, 58,132, 44, 33, 16,182,125,
-    132, 27, 14, 65, 99, 66,  0,  0,  0, 22,206, 24, 51, 13, 12, 14,
-     66,  1,  0,  0,  0,  0, 20, 21, 54,210, 45,210, 37,174, 20, 31,
-     54,202, 45,202, 38,210, 38,193, 20, 41, 54,204, 45,204, 37,210,
-     37,193, 20, 51, 10, 14, 65,133,  0,  0,  0,  0, 22,  0, 25, 27,
-     13, 12, 14, 65,  1,153,  0,  0,  0, 20, 27,  7,234, 33,138, 27,
-     14, 65,137,  0,  0,  0,  0, 22,  2, 25, 18,  9,  7,217, 34,130,
-     27, 15, 54,217, 45,129, 20, 18, 36, 22,  4, 25, 29, 13,  7,217,
-     34,129, 42,218, 34,132, 27, 19, 54,217, 45,130, 20, 16,183,125,
-     29, 10, 14, 65,146, 32,  0,  0,  0, 22, 10, 25, 12,  9,  7,217,
-     34,129, 27, 12, 36, 22, 15, 25, 30, 30,  7,217, 34,128, 42, 72,
-     58,132, 44, 33, 14, 63, 37,  0,  0,  0,  0, 27, 14, 65,  1, 96,
-      0,  0,  0, 22, 20, 25, 17, 17,  7,217, 34,132, 27, 14, 65,  1,
-     96,  0,  0,  0, 22, 25, 25, 15, 15,  7,218, 27, 14, 65,146, 16,
-      0,  0,  0, 22, 30, 25, 13, 13, 10, 14, 65,146, 32,  0,  0,  0,
-     22,150, 25, 46, 13, 12, 14, 65,  1,153,  0,  0,  0, 20, 21,  8,
-    174, 45,128, 25,135, 20, 28,  7,173, 56,174, 44, 27, 16,184,125,
-     34, 54,235, 45,174, 20, 46, 54,174, 45, 14, 64, 17,  0,  0,  0,
-      0, 22,151, 25, 25,  7,  9,174, 20, 25,  7,234, 34,129, 41,234,
-     34,139, 27, 14, 65,131,  0,  0,  0,  0, 22,153, 25, 27, 27,  7,
-    234, 34,130, 41,234, 34, 14, 64,  7,  0,  0,  0,  0, 27, 14, 65,
-    136,  0,  0,  0,  0, 22,160, 25, 23, 23,  7,235, 32, 14, 64,  7,
-      0,  0,  0,  0, 27, 14, 65,  1,101,  0,  0,  0, 22,170, 25, 24,
-     24,  7,173, 56, 14, 64,  7,  0,  0,  0,  0, 44, 27, 14, 65,  1,
-     96,  0,  0,  0, 22,175, 25, 31, 31,  7,173, 56,133, 16,185,125,
-     44, 42, 72, 58,132, 44, 33, 14, 63, 32,  0,  0,  0,  0, 27, 14,
-     65,  1, 96,  0,  0,  0, 22,195, 25, 31, 31,  7,173, 56,134, 44,
-     42, 72, 58,132, 44, 33, 14, 63, 80,  0,  0,  0,  0, 27, 14, 65,
-      1, 96,  0,  0,  0, 22,200, 25, 25, 25,  7, 43,235, 34,133, 41,
-    235, 34,134, 44, 42,218, 27, 14, 65,146, 16,  0,  0,  0, 22,220,
-     25, 21, 12,  7,173, 56,135, 44, 42,218, 27, 18, 54,217, 45,129,
-     20, 21, 36, 22,230, 25, 13, 13, 10, 14, 65,146, 32,  0,  0,  0,
-     22, 88, 27, 22, 11, 54,199, 45,199, 38,209, 20, 19, 16,186,125,
-     54,203, 45,209, 37,209, 20, 22, 36, 22,188, 27, 36, 14, 54,155,
-     46, 15,  4, 66, 69, 84, 32, 20, 20, 54,218, 45,128, 20, 24,  7,
-    194, 27, 36, 54,155, 46, 15,  5, 82, 65, 73, 83, 69, 22,208, 27,
-     13, 13, 10, 14, 65,115,  0,  0,  0,  0, 22,238, 27, 49, 15, 54,
-    155, 46, 15,  5, 83, 84, 65, 89, 32, 20, 21, 54,219, 45,128, 20,
-     25,  7,194, 27, 37, 54,155, 46, 15,  5, 67, 65, 76, 76, 32, 20,
-     43, 54,197, 45,128, 20, 49, 54,219, 45,132, 22,248, 27, 13, 13,
-     10, 14, 65,115,  0,  0,  0,  0, 22, 32, 28, 21, 15, 16,187,125,
-     54,155, 46, 15,  5, 68, 82, 79, 80, 32, 20, 21, 54,224, 45,128,
-     22,132, 28, 19, 15, 54,154, 45, 14, 64, 17,  0,  0,  0,  0, 20,
-     19, 10,140, 22,182, 28, 96, 15,  7,232, 34, 14, 64,153,  0,  0,
-      0,  0, 27, 27, 54,154, 45, 14, 64, 20,  0,  0,  0,  0, 20, 42,
-     54,155, 46, 15,  8, 32, 32, 32, 32, 32, 32, 32, 32, 20, 46, 12,
-    140, 20, 68, 31,176, 37,130, 37, 43,231, 38,128, 44, 36,133, 18,
-     14, 64,132,  0,  0,  0,  0, 20, 76, 54,232, 45,231, 38,128, 20,
-     86, 12, 14, 65,153,144,  0,  0,  0, 20, 96, 10, 14, 16,188,125,
-     65, 98, 96,  0,  0,  0, 22,187, 28, 65, 15, 31,176, 37,130, 37,
-    232, 36,133, 18,132, 20, 37, 31,176, 37,130, 37, 43,231, 38,128,
-     44, 36,133, 18, 14, 64,132,  0,  0,  0,  0, 20, 45, 54,232, 45,
-    231, 38,128, 20, 55, 12, 14, 65,153,144,  0,  0,  0, 20, 65, 10,
-     14, 65, 98, 96,  0,  0,  0, 22,192, 28, 78, 15, 31,176, 37,130,
-     37,232, 36,133, 18,132, 20, 27, 54,154, 45, 14, 64, 20,  0,  0,
-      0,  0, 20, 42, 54,155, 46, 15,  8, 70, 73, 78, 73, 83, 72, 69,
-     68, 20, 46, 12,140, 20, 58, 54,232, 45, 14, 64,153, 16,189,125,
-      0,  0,  0,  0, 20, 68, 12, 14, 65,153,144,  0,  0,  0, 20, 78,
-     10, 14, 65, 98, 96,  0,  0,  0, 22,164, 31, 42, 25, 54,149, 45,
-     80, 58, 14, 64, 82,  0,  0,  0,  0, 36, 72, 58,132, 44, 37,128,
-     44, 20, 42,  7,165, 56,149, 44, 34,132, 27, 14, 65,129,  0,  0,
-      0,  0, 22,169, 31, 18, 12, 54,165, 56,149, 44, 45,132, 20, 18,
-     54,150, 45,128, 22,174, 31, 12,  9,  7,149, 29,136, 27, 12, 36,
-     22,194, 31, 29, 11, 54,149, 45,149, 38,136, 20, 19, 54,150, 45,
-    150, 37,128, 20, 29, 10, 14, 65,129, 16,  0,  0,  0, 16,190,125,
-     22,108, 32, 19, 19,  7,219, 42,235, 32,134, 27, 14, 65,  1,101,
-      0,  0,  0, 22,113, 32, 19, 19,  7,219, 42,235, 32,135, 27, 14,
-     65,  1, 96,  0,  0,  0, 22,115, 32, 15, 15,  7,219, 27, 14, 65,
-    146, 32,  0,  0,  0, 22,117, 32, 16, 16,  7, 40,218, 27, 14, 65,
-    131,133,  0,  0,  0, 22,118, 32, 29, 29,  7,204, 38,201, 32, 14,
-     64, 32,  0,  0,  0,  0, 42,235, 32,134, 27, 14, 65,  1,101,  0,
-      0,  0, 22,128, 32, 36, 36,  7,204, 38,201, 32, 14, 64, 32,  0,
-      0,  0,  0, 42,235, 34,134, 42,173, 56,134, 44, 33, 16,191,125,
-    134, 27, 14, 65,  1, 96,  0,  0,  0, 22,138, 32, 42, 42,  7,204,
-     38,201, 32, 14, 64, 32,  0,  0,  0,  0, 42,235, 34,134, 42, 72,
-     58,132, 44, 33, 14, 63, 32,  0,  0,  0,  0, 27, 14, 65,146, 16,
-      0,  0,  0, 22,148, 32, 23, 23,  7,204, 38,201, 33,137, 42,235,
-     32,133, 27, 14, 65,  1,101,  0,  0,  0, 22,153, 32, 36, 36,  7,
-    204, 38,201, 33,137, 42,235, 34,133, 42, 72, 58,132, 44, 33, 14,
-     63, 80,  0,  0,  0,  0, 27, 14, 65,  1, 96,  0,  0,  0, 22,158,
-     32, 23, 23,  7,204, 38,201, 33,137, 42,235, 34,133, 16,192,125,
-     27, 14, 65,146, 16,  0,  0,  0, 22,168, 32, 43, 43,  7,204, 38,
-    201, 33,137, 42,235, 34,134, 42,173, 56,134, 44, 33,135, 42, 72,
-     58,132, 44, 33, 14, 63,112,  0,  0,  0,  0, 27, 14, 65,  1, 96,
-      0,  0,  0, 22,173, 32, 30, 30,  7,204, 38,201, 33,137, 42,235,
-     34,134, 42,173, 56,134, 44, 33,135, 27, 14, 65,146, 16,  0,  0,
-      0, 22,178, 32, 36, 36,  7,204, 38,201, 33,137, 42,235, 34,134,
-     42, 72, 58,132, 44, 33, 14, 63, 80,  0,  0,  0,  0, 27, 14, 65,
-    146, 16,  0,  0,  0, 22,188, 32, 21, 21,  7,210, 32, 16,193,125,
-    137, 42,217, 34,128, 27, 14, 65,146, 16,  0,  0,  0, 22,190, 32,
-     12,  9, 54,217, 45,129, 20, 12, 36, 22,193, 32, 17, 17,  7,235,
-     32,134, 27, 14, 65,  1,101,  0,  0,  0, 22,194, 32, 30, 30,  7,
-    235, 34,134, 42, 72, 58,132, 44, 33, 14, 63,112,  0,  0,  0,  0,
-     27, 14, 65,146, 32,  0,  0,  0, 22,196, 32, 17, 17,  7,235, 34,
-    134, 27, 14, 65,  1, 96,  0,  0,  0, 22,198, 32, 13, 13, 10, 14,
-     65,146, 32,  0,  0,  0, 22, 52, 33, 41,  9,  7,202, 32,132, 27,
-     17, 54,202, 45,202, 37,141, 20, 25, 54,211, 45,211, 16,194,125,
-     37,128, 20, 31, 54,229, 45,128, 20, 41, 12, 14, 65,133, 16,  0,
-      0,  0, 22, 57, 33, 39, 11, 31,176, 37,128, 18,132, 20, 19, 31,
-    176, 37,129, 18,132, 20, 26, 54,154, 45, 54,128, 20, 35, 54,155,
-     46, 61, 58,202, 44, 20, 39, 10,140, 22, 62, 33, 85,  9, 54,154,
-     45,138, 20, 42, 54,155, 46, 15, 26, 89, 79, 85, 39, 76, 76, 32,
-     72, 65, 86, 69, 32, 84, 79, 32, 79, 70, 70, 69, 82, 32, 89, 79,
-     85, 82, 32, 20, 67, 54,155, 55, 66, 58,155, 44, 37,128, 44, 46,
-    147, 55,211, 36,139, 38,131, 60,211, 36,139, 44, 20, 16,195,125,
-     71, 12,140, 20, 81, 12, 14, 65,153,153,  0,  0,  0, 20, 85, 10,
-    142, 22,152, 33, 54, 11,  7,202, 31,141, 42,211, 27, 19, 54,202,
-     45,202, 38,141, 20, 27, 54,211, 45,211, 38,128, 20, 35,  7,202,
-     31,141, 42,211, 27, 43, 54,202, 45,202, 38,141, 20, 51, 54,211,
-     45,211, 38,128, 20, 54, 36, 22,162, 33,  6,  6, 36, 22, 96, 34,
-     48, 32,  7,222, 34,128, 42,204, 38,201, 33,137, 42,235, 33,133,
-     42, 72, 58,132, 44, 33, 14, 63, 21,  0,  0,  0,  0, 27, 38, 54,
-    217, 45,129, 20, 48, 10, 14, 65,136,128,  0,  0,  0, 16,196,125,
-     22,106, 34, 54, 38,  7,222, 34,129, 42,204, 38,201, 33,137, 42,
-    235, 33, 14, 64,  7,  0,  0,  0,  0, 42, 72, 58,132, 44, 33, 14,
-     63, 21,  0,  0,  0,  0, 27, 44, 54,217, 45,129, 20, 54, 10, 14,
-     65,136,128,  0,  0,  0, 22,116, 34, 44, 28,  7,222, 34,130, 42,
-    235, 34,135, 42,218, 42, 72, 58,132, 44, 33, 14, 63,  5,  0,  0,
-      0,  0, 27, 34, 54,217, 45,129, 20, 44, 10, 14, 65,136,128,  0,
-      0,  0, 22,126, 34, 55, 39,  7,222, 34,130, 42,235, 34,134, 42,
-    173, 56,134, 44, 32,135, 42, 72, 58,132, 44, 33, 14, 16,197,125,
-     63, 64,  0,  0,  0,  0, 42,202, 38,200, 33,135, 27, 45, 54,217,
-     45,129, 20, 55, 10, 14, 65,136,128,  0,  0,  0, 22,136, 34, 17,
-     17,  7,235, 32,134, 27, 14, 65,  1,101,  0,  0,  0, 22,146, 34,
-     24, 24,  7,235, 34,134, 42,173, 56,134, 44, 33,135, 27, 14, 65,
-      1,101,  0,  0,  0, 22,156, 34, 30, 24,  7,235, 34,135, 42,218,
-     42, 72, 58,182, 44, 33, 14, 63, 80,  0,  0,  0,  0, 27, 30, 54,
-    217, 45,129, 22,166, 34, 19, 19,  7,235, 34,135, 42,218, 27, 14,
-     65,146, 16,  0,  0,  0, 22,171, 34, 21, 21,  7,235, 16,198,125,
-     34,135, 42,218, 34,132, 27, 14, 65,146, 32,  0,  0,  0, 22,176,
-     34, 13, 13, 10, 14, 65,  1, 96,  0,  0,  0, 22,196, 34, 36, 11,
-      8,174, 45,128, 25,135, 20, 18,  7,173, 56,174, 44, 27, 24, 54,
-    235, 45,174, 20, 36, 54,174, 45, 14, 64, 17,  0,  0,  0,  0, 22,
-    201, 34, 25,  7,  9,174, 20, 25,  7,235, 34,131, 41,235, 34,139,
-     27, 14, 65,137,144,  0,  0,  0, 22,206, 34, 21, 21,  7,217, 34,
-    129, 41,217, 34,130, 27, 14, 65,100,  2,  0,  0,  0, 22,216, 34,
-     17, 17,  7,217, 34,182, 27, 14, 65,  1,101,  0,  0, 16,199,125,
-      0, 22,236, 34, 13, 13, 10, 14, 65,131,  0,  0,  0,  0, 22, 30,
-     35, 30, 30,  7, 72, 58,132, 44, 33, 14, 63, 32,  0,  0,  0,  0,
-     42,219, 34,128, 27, 14, 65,  1,101,  0,  0,  0, 22, 32, 35, 28,
-     28,  7, 72, 58,132, 44, 33, 14, 63, 48,  0,  0,  0,  0, 42,218,
-     27, 14, 65,  1, 96,  0,  0,  0, 22, 34, 35, 15, 15,  7,218, 27,
-     14, 65,146, 16,  0,  0,  0, 22, 36, 35, 26, 26,  7, 72, 58,132,
-     44, 32, 14, 63, 80,  0,  0,  0,  0, 27, 14, 65,  1, 96,  0,  0,
-      0, 22, 37, 35, 13, 13, 10, 14, 65,146, 32,  0,  0, 16,200,125,
-      0, 22, 40, 35, 18, 11,  8,180, 45,128, 25,137, 20, 15,  9,180,
-     20, 18, 36, 22, 45, 35, 23, 11,  8,174, 45,128, 25,135, 20, 20,
-      7, 84, 58,132, 44, 34,132, 27, 23, 36, 22, 46, 35, 10,  7,  9,
-    174, 20, 10, 36, 22, 47, 35, 55, 10, 54,154, 45, 54,128, 20, 51,
-     54,155, 46, 15, 34, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 20, 55, 10,140, 22, 50, 35, 52,  9,
-     54,154, 45,138, 20, 48, 54,155, 46, 15, 32, 32, 32, 16,201,125,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 20, 52,
-     10,140, 22, 55, 35, 36, 15, 54,154, 45, 14, 64, 32,  0,  0,  0,
-      0, 20, 32, 54,155, 46, 15, 10, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 20, 36, 10,140, 22, 60, 35, 33,  9, 54,154, 45,138, 20,
-     29, 54,155, 46, 15, 13, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 20, 33, 10,140, 22,250, 35, 75, 11, 54,200, 45,200,
-     38,210, 20, 19, 54,201, 45,201, 37,210, 20, 29, 12, 16,202,125,
-     14, 65,149,  0,  0,  0,  0, 20, 39, 12, 14, 65,144, 21,  0,  0,
-      0, 20, 51, 54,154, 45, 14, 64, 32,  0,  0,  0,  0, 20, 65, 54,
-    155, 46, 15,  7, 73, 32, 67, 65, 76, 76, 32, 20, 71, 54,197, 45,
-    128, 20, 75, 10,140, 22,  4, 36, 49, 13, 12, 14, 65,144, 21,  0,
-      0,  0, 20, 25, 54,154, 45, 14, 64, 32,  0,  0,  0,  0, 20, 39,
-     54,155, 46, 15,  7, 73, 32, 83, 84, 65, 89, 32, 20, 45, 54,198,
-     45,128, 20, 49, 10,140, 22, 24, 36, 35, 16, 54,160, 46, 15,  6,
-     73, 32, 66, 69, 84, 32, 20, 20,  7,218, 27, 35, 54, 16,203,125,
-    160, 46, 15,  8, 73, 32, 82, 65, 73, 83, 69, 32, 22, 29, 36, 82,
-     13, 54,200, 45,200, 38,210, 38,193, 20, 23, 54,201, 45,201, 37,
-    210, 37,193, 20, 33, 12, 14, 65,149,  0,  0,  0,  0, 20, 43, 12,
-     14, 65,144, 21,  0,  0,  0, 20, 55, 54,154, 45, 14, 64, 32,  0,
-      0,  0,  0, 20, 61, 54,155, 46,160, 20, 78, 54,155, 55, 66, 58,
-    155, 44, 37,128, 44, 46, 61, 58,193, 44, 20, 82, 10,140, 22, 34,
-     36, 43, 13, 12, 14, 65,144, 21,  0,  0,  0, 20, 25, 54,154, 45,
-     14, 64, 32,  0,  0,  0,  0, 20, 39, 54,155, 46, 15, 16,204,125,
-      7, 73, 32, 68, 82, 79, 80, 32, 20, 43, 10,140, 22, 84, 36, 48,
-     12,  7, 84, 58,132, 44, 34,132, 27, 22, 54,209, 45,209, 37,210,
-     37,193, 20, 28, 54,210, 45,132, 20, 34, 54,193, 45,132, 20, 38,
-     12,142, 20, 48, 10, 14, 65, 98, 83,  0,  0,  0, 22, 94, 36, 26,
-     12,  7, 82, 58,132, 44, 32,137, 27, 16, 12,142, 20, 26, 10, 14,
-     65, 98, 82,  0,  0,  0, 22,104, 36, 13, 13, 10, 14, 65,147,  0,
-      0,  0,  0, 22,184, 36, 25, 19,  7,199, 33, 14, 65,  2,153,  0,
-      0,  0, 42,207, 30,128, 27, 25, 54,207, 45,128, 22, 16,205,125,
-    189, 36, 25, 19,  7,199, 32, 14, 65,  3,  0,  0,  0,  0, 42,207,
-     30,129, 27, 25, 54,207, 45,129, 22,194, 36, 25, 19,  7,199, 32,
-     14, 65,  2,  0,  0,  0,  0, 42,207, 30,130, 27, 25, 54,207, 45,
-    130, 22,204, 36, 19, 13,  7,199, 32,141, 42,207, 30,138, 27, 19,
-     54,207, 45,138, 22,224, 36, 19, 13,  7,199, 32,182, 42,207, 30,
-    131, 27, 19, 54,207, 45,131, 22,229, 36, 20, 14,  7,199, 32, 54,
-    141, 42,207, 30,139, 27, 20, 54,207, 45,139, 22,234, 36, 17, 17,
-      7,207, 34,236, 27, 14, 65,148,101,  0,  0,  0, 22, 16,206,125,
-    239, 36, 17, 17,  7,207, 33,236, 27, 14, 65,148, 96,  0,  0,  0,
-     22,241, 36, 95,  9, 54,154, 45,138, 20, 13, 12,142, 20, 34, 54,
-    155, 46, 15, 14, 73, 32, 87, 79, 78, 32, 66, 65, 67, 75, 32, 77,
-     89, 32, 20, 81, 54,155, 55, 66, 58,155, 44, 37,128, 44, 46,146,
-     55, 14, 65,  9,  3,  0,  0,  0, 37,207, 36,133, 38, 14, 64,  7,
-      0,  0,  0,  0, 60, 14, 65,  9,  3,  0,  0,  0, 37,207, 36,133,
-     44, 20, 85, 12,140, 20, 95, 12, 14, 65,153,153,  0,  0,  0, 22,
-    244, 36, 89, 21, 54,206, 55, 14, 64,  7,  0,  0,  0, 16,207,125,
-      0, 44, 46, 61, 58,207, 44, 20, 33, 31, 14, 65,  5, 89,  0,  0,
-      0, 18,182, 20, 43, 12, 14, 66,  3, 32, 16,  0,  0, 20, 55, 31,
-     14, 65,  5, 89,  0,  0,  0, 18,205, 20, 73, 31, 14, 66,  5, 66,
-    134,  0,  0, 18, 14, 65,  1,146,  0,  0,  0, 20, 79,  7,207, 33,
-    236, 27, 89, 12, 14, 64, 65,  0,  0,  0,  0, 22,246, 36, 23,  9,
-     54,236, 45,207, 20, 23,  7,207, 34,237, 27, 14, 65,148,153,  0,
-      0,  0, 22,249, 36, 42,  7, 12,142, 20, 13, 54,154, 45,138, 20,
-     38, 54,155, 46, 15, 18, 83, 72, 65, 76, 76, 32, 87, 16,208,125,
-     69, 32, 67, 79, 78, 84, 73, 78, 85, 69, 63, 20, 42, 12,140, 22,
-    254, 36, 72, 13, 12, 14, 65,144,  5,  0,  0,  0, 20, 33, 31,176,
-     37, 14, 64, 48,  0,  0,  0,  0, 18, 14, 64,132,  0,  0,  0,  0,
-     20, 43, 12, 14, 65,144,  5,  0,  0,  0, 20, 57, 31,176, 37, 14,
-     64, 48,  0,  0,  0,  0, 18,132, 20, 72,  7, 84, 58,132, 44, 27,
-     14, 65,148,112,  0,  0,  0, 22,  8, 37, 16, 13, 12, 14, 66,  2,
-     80,  0,  0,  0, 20, 16, 36, 22, 27, 37, 92, 13, 12, 14, 65,144,
-      7,  0,  0,  0, 20, 19, 54,207, 45,128, 20, 25, 54, 16,209,125,
-    236, 45,128, 20, 31, 54,154, 45,132, 20, 65, 54,155, 46, 15, 27,
-     32, 80, 82, 69, 84, 84, 89, 32, 76, 85, 67, 75, 89, 33, 33, 33,
-     32, 84, 82, 89, 32, 65, 71, 65, 73, 78, 63, 20, 69, 12,140, 20,
-     79, 12, 14, 65,148,112,  0,  0,  0, 20, 82, 39, 20, 92, 10, 14,
-     65,  2, 22,  0,  0,  0, 22, 28, 37, 25,  9,  7,200, 32,132, 27,
-     19, 12, 14, 65,150,  0,  0,  0,  0, 20, 25, 54,250, 45,128, 22,
-     33, 37, 59, 17, 31,176, 37, 14, 64, 57,  0,  0,  0,  0, 18,132,
-     20, 31, 31,176, 37, 14, 64, 56,  0,  0,  0,  0, 18, 16,210,125,
-    132, 20, 43, 54,154, 45, 14, 64, 54,  0,  0,  0,  0, 20, 52, 54,
-    155, 46, 61, 58,200, 44, 20, 56, 12,140, 20, 59, 36, 22,128, 37,
-     97,  7, 12,142, 20, 13, 54,154, 45,138, 20, 42, 54,155, 46, 15,
-     22, 73, 39, 76, 76, 32, 72, 65, 86, 69, 32, 84, 79, 32, 79, 70,
-     70, 69, 82, 32, 77, 89, 32, 20, 50, 54,238, 45,238, 37,128, 20,
-     97, 54,155, 55, 66, 58,155, 44, 37,128, 44, 46,146, 55, 14, 65,
-      9,  3,  0,  0,  0, 37,238, 36,133, 38, 14, 64,  7,  0,  0,  0,
-      0, 60, 14, 65,  9,  3,  0,  0,  0, 37,238, 36,133, 16,211,125,
-     44, 22,148, 37, 29,  7, 12,140, 20, 15, 54,200, 45,200, 37,141,
-     20, 25, 12, 14, 65,153,153,  0,  0,  0, 20, 29, 10,142, 22,228,
-     37, 63, 11, 54,200, 45,200, 38,141, 20, 21,  7,238, 42,200, 38,
-    141, 31,132, 27, 29, 54,200, 45,200, 38,141, 20, 37, 54,238, 45,
-    238, 38,128, 20, 47,  7,238, 42,200, 38,141, 31,132, 27, 55, 54,
-    200, 45,200, 38,141, 20, 63, 54,238, 45,238, 38,128, 22,233, 37,
-      6,  6, 36, 22, 72, 38, 49, 13, 12, 14, 66,  1, 32,  0,  0,  0,
-     20, 23, 12, 14, 65,153,153,  0,  0,  0, 20, 31,  7, 16,212,125,
-    200, 31,141, 42,238, 27, 39, 54,238, 45,238, 38,128, 20, 49, 12,
-     14, 65,151,  0,  0,  0,  0, 22, 73, 38, 11,  8,  7, 40,211, 27,
-     11, 36, 22, 77, 38, 86,  7, 12,142, 20, 13, 54,154, 45,138, 20,
-     35,  7,200, 33, 14, 65,  4,  0,  0,  0,  0, 42,199, 33, 14, 65,
-      5,  0,  0,  0,  0, 27, 62, 54,155, 46, 15, 20, 89, 79, 85, 32,
-     76, 79, 83, 84, 32, 89, 79, 85, 82, 32, 85, 78, 68, 73, 69, 83,
-     20, 66, 12,140, 20, 76, 12, 14, 64, 71,  0,  0,  0,  0, 20, 86,
-     10, 14, 65,152,112,  0,  0,  0, 22, 92, 38, 83, 25, 16,213,125,
-      7,200, 33, 14, 65,  3,  0,  0,  0,  0, 42,199, 33, 14, 65,  5,
-      0,  0,  0,  0, 27, 31, 54,239, 45,130, 20, 37,  7,239, 33,240,
-     27, 63, 54,155, 46, 15, 19, 89, 79, 85, 32, 76, 79, 83, 84, 32,
-     89, 79, 85, 82, 32, 80, 65, 78, 84, 83, 20, 67, 12,140, 20, 73,
-     54,240, 45,130, 20, 83, 10, 14, 64, 71,  0,  0,  0,  0, 22, 97,
-     38, 87, 25,  7,200, 32, 14, 65,  3,  1,  0,  0,  0, 42,199, 33,
-     14, 65,  5,  0,  0,  0,  0, 27, 31, 54,239, 45,129, 20, 37,  7,
-    239, 32,240, 27, 67, 54,155, 46, 15, 23, 89, 79, 85, 16,214,125,
-     32, 87, 79, 78, 32, 66, 65, 67, 75, 32, 89, 79, 85, 82, 32, 80,
-     65, 78, 84, 83, 20, 71, 12,140, 20, 77, 54,240, 45,129, 20, 87,
-     10, 14, 65,153,153,  0,  0,  0, 22,102, 38, 81, 25,  7,200, 33,
-     14, 65,  2,  0,  0,  0,  0, 42,199, 33, 14, 65,  5,  0,  0,  0,
-      0, 27, 31, 54,239, 45,128, 20, 37,  7,239, 33,240, 27, 61, 54,
-    155, 46, 15, 17, 89, 79, 85, 32, 76, 79, 83, 84, 32, 89, 79, 85,
-     82, 32, 84, 79, 80, 20, 65, 12,140, 20, 71, 54,240, 45,128, 20,
-     81, 10, 14, 64, 71,  0,  0,  0,  0, 22,107, 38, 85, 16,215,125,
-     25,  7,200, 32, 14, 65,  2,  1,  0,  0,  0, 42,199, 32, 14, 65,
-      5,  1,  0,  0,  0, 27, 31, 54,239, 45,132, 20, 37,  7,239, 32,
-    240, 27, 65, 54,155, 46, 15, 21, 89, 79, 85, 32, 87, 79, 78, 32,
-     66, 65, 67, 75, 32, 89, 79, 85, 82, 32, 84, 79, 80, 20, 69, 12,
-    140, 20, 75, 54,240, 45,132, 20, 85, 10, 14, 65,153,153,  0,  0,
-      0, 22,132, 38,  6,  6, 36, 22,142, 38, 81, 13, 12, 14, 65,153,
-    153,  0,  0,  0, 20, 19, 54,154, 45,132, 20, 54, 54,155, 46, 15,
-     28, 32, 84, 72, 65, 84, 39, 83, 32, 65, 76, 76, 32, 16,216,125,
-     73, 32, 67, 65, 82, 69, 32, 84, 79, 32, 83, 69, 69, 46, 46, 46,
-     20, 58, 12,140, 20, 68, 12, 14, 65,153,153,  0,  0,  0, 20, 71,
-     39, 20, 81, 10, 14, 65,  2,  0,  0,  0,  0, 22,  6, 39, 20, 20,
-      7, 82, 58,182, 44, 30,137, 27, 14, 65,153,144,  0,  0,  0, 22,
-      7, 39,  6,  6, 36, 22, 15, 39, 18, 11,  8,174, 45,128, 25,141,
-     20, 15,  9,174, 20, 18, 36, 22, 16, 39, 41, 14,  8,241, 45,139,
-     25,132, 26, 54,128, 20, 24, 50,132, 18,132, 18,129, 18,241, 20,
-     28,  9,241, 20, 38, 50,132, 18,132, 18,132, 18,132, 16,217,125,
-     20, 41, 36, 22,248, 42, 75, 15, 31, 14, 66,  5, 55, 96,  0,  0,
-     18,128, 20, 39,  8,241, 45,141, 37, 14, 65,  1, 85,  0,  0,  0,
-     36, 72, 58,182, 44, 25,182, 26, 54,135, 20, 51, 31, 14, 66,  5,
-     55, 96,  0,  0, 18,241, 20, 63, 31, 14, 66,  5, 55, 97,  0,  0,
-     18,137, 20, 75, 31, 14, 66,  5, 55, 97,  0,  0, 18,182, 22,  2,
-     43, 61, 21, 31, 14, 66,  5, 55,104,  0,  0, 18, 14, 64,100,  0,
-      0,  0,  0, 20, 25,  9,241, 20, 39,  8,241, 45,128, 25, 14, 64,
-     32,  0,  0,  0,  0, 20, 43,  9,241, 20, 61, 31, 14, 16,218,125,
-     66,  5, 55,104,  0,  0, 18, 14, 64,100,  0,  0,  0,  0, 22,  3,
-     43, 90, 17,  8,241, 45,128, 25, 14, 64, 48,  0,  0,  0,  0, 20,
-     29, 31, 14, 66,  5, 55, 96,  0,  0, 18,132, 20, 41, 31, 14, 66,
-      5, 55, 97,  0,  0, 18,133, 20, 53, 31, 14, 66,  5, 55, 97,  0,
-      0, 18,129, 20, 71, 31, 14, 66,  5, 55,104,  0,  0, 18, 14, 64,
-    100,  0,  0,  0,  0, 20, 75,  9,241, 20, 87, 31, 14, 66,  5, 55,
-     97,  0,  0, 18,182, 20, 90, 36, 22,224, 46, 49, 14,  8,241, 45,
-    133, 25,132, 26, 54,128, 20, 29, 50,132, 18, 72, 58, 16,219,125,
-    132, 44, 36,138, 18,133, 18,130, 20, 49,  8,242, 45,138, 25,132,
-     26, 43, 54,129, 36, 72, 58,132, 44, 38,128, 44, 22,234, 46, 76,
-     19, 50,128, 18,138, 18,135, 18, 14, 64, 20,  0,  0,  0,  0, 20,
-     35, 50,130, 18,243, 18,133, 18, 14, 64, 18,  0,  0,  0,  0, 20,
-     45, 50,128, 18,132, 18,132, 18,132, 20, 55, 50,130, 18,132, 18,
-    132, 18,132, 20, 59,  9,242, 20, 63,  9,241, 20, 73, 50,132, 18,
-    132, 18,132, 18,132, 20, 76, 36, 22,192, 93, 59, 59, 20,189, 59,
-    133, 44, 18,185, 59, 14, 64, 38,  0,  0,  0,  0, 44, 16,220,125,
-     18,187, 59,133, 44, 18,152, 59, 14, 64, 36,  0,  0,  0,  0, 44,
-     18,188, 59, 14, 65,  2, 36,  0,  0,  0, 44, 18,186, 59, 14, 64,
-     38,  0,  0,  0,  0, 44, 22,193, 93, 74, 18, 54,189, 46, 15,  8,
-    133,134,  7,  8,  1,  2,131,132, 20, 32,  8,174, 45,128, 25, 14,
-     64, 38,  0,  0,  0,  0, 20, 48, 54,185, 55,174, 60,174, 44, 46,
-     62, 58,174, 37,137, 44, 20, 70, 54,186, 55,174, 60,174, 44, 46,
-     62, 58,174, 37, 14, 65,  1, 67,  0,  0,  0, 44, 20, 74,  9,174,
-     22,194, 93, 49, 18, 54,187, 46, 15,  8,180,181, 54, 16,221,125,
-     55, 48, 49,178,179, 20, 49, 54,152, 46, 15, 24,  9,  0,  0,  0,
-      0,  0,  0,  0,  9,  0, 56, 57, 58, 59, 60, 61,  9,  0, 56, 57,
-     58, 59, 60, 61, 22,196, 93, 80, 80, 54,188, 46, 15, 70,  0,  0,
-      0,  0,  0,  0,  9,  0,  0,  0, 96, 96,  0,  0,  0,  0, 96, 96,
-      0,  0,  9,  0,  0,  0,  0,  0,  0,  0,  0,  0, 96, 96,  0,  0,
-      9,  0,  0,  0, 96, 96,  0,  0, 96, 96,  0,  0, 96, 96,  9,  0,
-      0,  0,  0,  0,  0,  0, 96, 96,  0,  0, 96, 96,  9,  0,  0,  0,
-     96, 96,  0,  0, 22,198, 93, 88, 88, 54,188, 55, 66, 16,222,125,
-     58,188, 44, 37,128, 44, 46, 15, 70, 96, 96,  0,  0, 96, 96,  9,
-      0, 96, 96,  0,  0, 96, 96, 96, 96,  0,  0, 96, 96,  9,  0, 96,
-     96, 96, 96, 96, 96, 96, 96,  0,  0, 96, 96,  9,  0, 96, 96,  0,
-      0, 96, 96, 96, 96,  0,  0, 96, 96,  9,  0, 96, 96, 96, 96, 96,
-     96, 96, 96,  0,  0, 96, 96,  9,  0, 96, 96, 96, 96, 96, 96, 22,
-    200, 93,102,102, 54,188, 55, 66, 58,188, 44, 37,128, 44, 46, 15,
-     84, 10, 11, 12, 13, 14, 15,  9,  0, 42, 43, 44, 45, 46, 47, 82,
-     83, 84, 85, 86, 87,  9,  0,114,115,116,117,118,119, 16,223,125,
-     88, 89, 90, 91, 92, 93,  9,  0,120,121,122,123,124,125,204,205,
-    206,207,208,209,  9,  0,236,237,238,239,240,241,192,193,194,195,
-    196,197,  9,  0,224,225,226,227,228,229,198,199,200,201,202,203,
-      9,  0,230,231,232,233,234,235, 22,201, 93, 69, 69, 54,178, 45,
-     67, 58, 15, 56,162, 24,162, 10,121, 24,121, 10,102, 24,102, 10,
-     85, 24, 85, 10, 91, 24,102, 10, 91, 24, 85, 10, 91, 24, 85, 10,
-     91, 24,102, 10,121, 12,162, 12,136, 12,121, 20,121, 20,  0, 40,
-    243, 40,  0, 40,243, 40,  0, 20,243, 40,  0, 40, 44, 16,224,125,
-     22,202, 93, 93, 75, 54,192, 45, 67, 58, 15, 62,104,104,133,204,
-    104,133,203,104,133,206,104,133,205,104,104,133,207,104,104,170,
-    104,104,133,208,164,207,136,177,205,145,203,136,192,255,208,247,
-     24,165,203,101,208,133,203,144,  2,230,204, 24,165,205,101,207,
-    133,205,144,  2,230,206,202,208,219, 96, 44, 20, 81, 54,223, 45,
-    141, 20, 93, 54,153, 45, 14, 65,  1, 80,  0,  0,  0, 22,212, 93,
-     50, 47, 54,244, 45, 67, 58, 15, 34,104,104,133,204,104,133,203,
-    104,133,205,230,205,104,170,232,104,104,160,  0,145, 16,225,125,
-    203,200,208,  2,230,204,202,208,246,198,205,208,242, 96, 44, 20,
-     50, 36, 22,168, 97, 29, 26, 54,180, 45, 63, 58,244, 60,176, 37,
-    140, 60, 14, 65,  1, 32,  0,  0,  0, 60,132, 44, 20, 29, 36, 22,
-    156, 99, 27, 14, 17, 28, 14, 64,  1,  0,  0,  0,  0, 20, 17, 39,
-     20, 27, 10, 14, 65,  2, 22,  0,  0,  0, 22,144,101, 76, 15, 54,
-    206, 46, 15,  5, 68, 58, 67, 79, 77, 20, 27, 54,206, 55,139, 44,
-     46, 61, 58,208, 44, 20, 36, 54,227, 45, 67, 58,146, 44, 20, 48,
-     54,228, 45, 14, 65, 16,  0,  0,  0,  0, 20, 58, 12, 16,226,125,
-     14, 66,  3, 32, 16,  0,  0, 20, 64, 54,227, 45,245, 20, 76, 54,
-    228, 45, 14, 65, 86,  0,  0,  0,  0, 22,154,101, 58, 13, 12, 14,
-     66,  3, 33,  0,  0,  0, 20, 24, 54,206, 46, 15,  4, 68, 58, 79,
-     80, 20, 36, 54,206, 55,131, 44, 46, 61, 58,208, 44, 20, 48, 54,
-    206, 55,139, 44, 46, 15,  2, 46, 49, 20, 58, 12, 14, 66,  3, 32,
-     16,  0,  0, 22,164,101,103, 37, 54,237, 45, 64, 58,146, 55, 14,
-     65,  9,  1,  0,  0,  0, 60, 14, 65,  9,  1,  0,  0,  0, 44, 44,
-     37, 14, 64,  1,  0,  0,  0,  0, 20, 63, 54,234, 45, 16,227,125,
-     64, 58,146, 55, 14, 65,  9,  2,  0,  0,  0, 60, 14, 65,  9,  2,
-      0,  0,  0, 44, 44, 20, 75, 31, 14, 65,  5, 89,  0,  0,  0, 18,
-    205, 20, 93, 31, 14, 66,  5, 66,134,  0,  0, 18, 14, 65,  1,146,
-      0,  0,  0, 20,103, 10, 14, 65,  2, 34,  0,  0,  0, 22, 48,117,
-     96, 27, 20,246, 59, 14, 64, 20,  0,  0,  0,  0, 44, 18,206, 59,
-     14, 64, 24,  0,  0,  0,  0, 44, 20, 31, 43,133, 20, 46, 54,205,
-     45, 70, 58, 14, 65,  5, 89,  0,  0,  0, 44, 20, 66, 23, 28, 14,
-     64,  2,  0,  0,  0,  0, 18,138, 18,132, 18, 15,  2, 16,228,125,
-     75, 58, 20, 78, 31, 14, 64,130,  0,  0,  0,  0, 18,182, 20, 96,
-     31, 14, 66,  5, 66,134,  0,  0, 18, 14, 64,100,  0,  0,  0,  0,
-     22, 53,117, 54, 42, 54,226, 45, 67, 58, 15, 29,104,168,104,133,
-    209,104,133,208,136,240,  8,104,145,208,136,104,145,208, 96,177,
-    208,133,212,200,177,208,133,213, 96, 44, 20, 54, 31, 14, 65,  7,
-     17,  0,  0,  0, 18,182, 22, 54,117, 98, 38, 54,176, 45, 14, 65,
-      2, 86,  0,  0,  0, 36, 43, 70, 58, 14, 65,  1,  6,  0,  0,  0,
-     44, 38,138, 44, 38, 14, 65,  1, 96,  0,  0,  0, 20, 16,229,125,
-     57, 54,191, 45, 63, 58,226, 60, 14, 65,  6, 96,  0,  0,  0, 60,
-    176, 44, 20, 69, 31, 14, 65,  5, 89,  0,  0,  0, 18,182, 20, 86,
-     54,247, 45, 63, 58,226, 60, 14, 65,  5, 96,  0,  0,  0, 44, 20,
-     98, 31, 14, 65,  7, 82,  0,  0,  0, 18,128, 22, 58,117,121,  9,
-     54,227, 45,247, 20, 21, 54,228, 45, 14, 65,  1, 96,  0,  0,  0,
-     20, 39, 54,206, 46, 15, 11, 68, 58, 68, 76, 73, 83, 84, 46, 66,
-     73, 78, 20, 49, 12, 14, 65, 57,  0,  0,  0,  0, 20, 67, 31, 14,
-     65,  7,  8,  0,  0,  0, 18, 14, 64, 72,  0,  0,  0, 16,230,125,
-      0, 20, 85, 31, 14, 65,  7,  9,  0,  0,  0, 18, 14, 64, 80,  0,
-      0,  0,  0, 20,103, 31, 14, 65,  7, 16,  0,  0,  0, 18, 14, 64,
-     84,  0,  0,  0,  0, 20,121, 31, 14, 65,  7, 18,  0,  0,  0, 18,
-     14, 64, 82,  0,  0,  0,  0, 22, 68,117,104, 27,  8,174, 45,247,
-     37, 14, 65,  1, 84,  0,  0,  0, 25,247, 37, 14, 65,  1, 88,  0,
-      0,  0, 20, 33, 31,174, 18,139, 20, 37,  9,174, 20, 57, 31,247,
-     37, 14, 65,  1, 89,  0,  0,  0, 18, 14, 64,101,  0,  0,  0,  0,
-     20, 60, 40, 20,104, 40, 15, 39,112,114,111,103,114, 16,231,125,
-     97,109, 32, 98,121, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32,210,207,199,197,210,160,200,193,210,206,201,
-    211,200, 22, 78,117, 65, 39, 40, 15, 31, 32, 32, 32, 32, 32, 32,
-    196,197,206,206,201,211,160,218,193,206,196,197,210, 32,103,114,
-     97,112,104,105, 99,115, 32, 98,121, 20, 65, 40, 15, 20, 32, 32,
-     32, 32, 32, 32,196,207,213,199,160,205,195,198,193,210,204,193,
-    206,196, 21, 22, 72,122,112, 20, 54,245, 45, 63, 58,226, 60, 14,
-     64,136,  0,  0,  0,  0, 44, 20, 37, 54,248, 45, 70, 16,248,125,
-      2,129, 89,153,153, 85, 85, 89, 89,153, 85,  0,  0,  0,  0,  0,
-      0,  0,  0, 85, 85, 85, 85, 85, 85, 85, 85, 85,170,170,  0, 61,
-      0,  0,  0,  0,  0,  0, 90,176,  1,165, 86, 85,102,101,102, 85,
-    102,101,102,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85,
-     85, 85, 89, 85,170,  8, 12,253,  0,  0,  0,  0,  0,  0, 90,176,
-     10,  5, 85, 89, 89, 89, 85, 85, 89, 85,149,  0,  0,  0,  0,  0,
-      0,  0,  0, 85, 85, 85, 85, 85, 85, 85, 85, 86,160,  8,207,253,
-      0,  0,  0,  0,  0,  0, 90,176, 10,133, 85, 86, 85,  4,233,125,
-    102,102, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85,
-     85, 85, 85, 85, 85,101, 86,  0,  3, 15,253,  0,  0,  0,  0,  0,
-      0,105,176,  5,  5, 89, 85,153, 85, 85, 89, 89, 85, 89,  0,  0,
-      0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 85, 85, 85, 89,  0,
-      0,207,253,  0,  0,  0,  0,  0,  0,105,176, 36,137,102,101,102,
-    102,102, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85,
-     85, 85, 85, 85, 85,149,105, 48, 15,255,253,  0,  0,  0,  0,  0,
-      0,104,112, 38,193, 89, 89, 85,153,149, 89, 85, 85,  4,234,125,
-     85,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 85, 86,
-     85,101,  0, 51, 63,253,  0,  0,  0,  0,  0,  0,104,112, 38, 60,
-    101, 85,102, 86, 86,101,101,101, 85,  0,  0,  0,  0,  0,  0,  0,
-      0, 85, 85, 85, 85, 85, 85, 86, 85, 90, 76,207,255,253,  0,  0,
-      0,  0,  0,  0,104,112, 54, 15, 85,149, 85, 89,149,153, 85, 89,
-     89,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 85, 86,
-     85, 86, 67,243,255,253,  0,  0,  0,  0,  0,  0,168, 96, 12, 63,
-     37,101, 86, 85,101, 85, 86, 86, 85,  0,  0,  0,  0,  4,235,125,
-      0,  0,  0,  0, 85, 85, 85, 85, 85, 85,106, 86,149, 64, 63,255,
-    253,  0,  0,  0,  0,  0,  0,162,160, 15, 63,213,149, 85, 89,149,
-     89, 85,149, 85,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85,
-     85, 85,105, 86,150,131,243,255,253,  0,  0,  0,  0,  0,  0,162,
-    104,  3,207,197,101,102,101, 85,101, 86,102, 85,  0,  0,  0,  0,
-      0,  0,  0,  0, 85, 85, 85, 85, 85, 85,102, 90,169,160, 63,255,
-    253,  0,  0,  0,  0,  0,  0,161,104,  0,243,197, 85, 89, 89,149,
-     85,149, 85, 85,  0,  0,  0,  0,  0,  0,  0,  0, 85,  4,236,125,
-     85, 85, 85, 85, 85,165,106,165,163,255,255,253,  0,  0,  0,  0,
-      0,  0,161,104,  0,252,245,101, 85, 85,101,101,150, 85, 85,  0,
-      0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 85,149,170,165,
-     64,207,255,253,  0,  0,  0,  0,  0,  0,161,104,  0, 60, 57,149,
-     85,149,153,149, 85, 85,149,  0,  0,  0,  0,  0,  0,  0,  0, 85,
-     85, 85, 85, 85, 85,149,170,165, 96,255,255,253,  0,  0,  0,  0,
-      0,  0,162,104,  0, 15, 57, 85,101, 86,101, 85, 85, 85,101,  0,
-      0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 86,  4,237,125,
-    150,170,169, 99, 51,255,253,  0,  0,  0,  0,  0,  0,137, 32,  0,
-     12,249,149, 85, 85,153,153,149,149, 89,  0,  0,  0,  0,  0,  0,
-      0,  0, 85, 85, 85, 85, 85,150,150,170,169, 96,255,255,253,  0,
-      0,  0,  0,  0,  0,133,128,  0,  0, 50, 85,101,101,101, 86, 85,
-    101, 85,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85,154,
-     90,170,170, 99,195,255,253,  0,  0,  0,  0,  0,  0,165,128,  0,
-     15, 62,149, 85,149, 85,149,153, 85, 85,  0,  0,  0,  0,  0,  0,
-      0,  0, 85, 85, 85, 85, 85, 90,154,170,170, 64, 63,  4,238,125,
-    207,253,  0,  0,  0,  0,  0,  0,169,128, 48, 51, 62, 86, 85, 85,
-     85, 85, 85,101, 85,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85,
-     85, 85,150,154,170,169, 79,192,255,253,  0,  0,  0,  0,  0,  0,
-    149,128,  0, 32,254,149, 85, 85,149, 85,153,149, 89,  0,  0,  0,
-      0,  0,  0,  0,  0, 85, 85, 85, 85, 85,150,106,170,148, 63,  3,
-     63,253,  0,  0,  0,  0,  0,  0,150,128,  0, 76,254, 85, 85,101,
-     85,102, 85,102, 85,  0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85,
-     85, 86, 86,106,170, 95,252,  0,243,253,  0,  0,  0,  4,239,125,
-      0,  0,  0,150,  0, 16,  0,255,149,153, 85, 85,149,153,153,127,
-      0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 86, 85,106,165,
-     63,255,  0, 95,253,  0,  0,  0,  0,  0,  0,150,  2, 37, 48,255,
-    150, 85, 85, 85, 85, 85, 15,255,  0,  0,  0,  0,  0,  0,  0,  0,
-     85, 85, 85, 85, 86, 85,106,152,255,255, 10,155,253,  0,  0,  0,
-      0,  0,  0,150,  0,  8, 63,207, 85,149, 85, 89,149,152, 23,255,
-      0,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 90, 85,170, 99,
-    255,252, 37,167,253,  0,  0,  0,  0,  0,  0,150,  0,  4,240,125,
-      0,  3,207,149, 85, 85, 86,102, 84,150,252,  0,  0,  0,  0,  0,
-      0,  0,  0,149, 85, 85, 85, 89, 85,170,143,255,252, 21, 38,253,
-      0,  0,  0,  0,  0,  0,150,  0,  0, 60,147,149, 85, 85, 85,149,
-    146, 90,191,  0,  0,  0,  0,  0,  0,  0,  0,133, 85, 85, 85, 89,
-     85,170,143,255,255, 25,106, 61,  0,  0,  0,  0,  0,  0,148,  0,
-      0, 49, 83,149,102, 85, 85,101, 97,106,188,  0,  0,  0,  0,  0,
-      0,  0,  0,169, 85, 85, 85, 89, 86,169,191,255,252, 41, 73,189,
-      0,  0,  0,  0,  0,  0, 84,  0,  0,  9, 67,153, 85,  4,241,125,
-     89, 85,149,161,106,188,  0,  0,  0,  0,  0,  0,  0,  0,162, 85,
-     85, 85, 89, 86,165,143,255,243, 32, 96,125,  0,  0,  0,  0,  0,
-      0, 86,  0,  0, 21,191,149, 86, 85, 86,101, 69,  2,172,  0,  0,
-      0,  0,  0,  0,  0,  0,170, 85, 85, 85, 89, 90,165,131,255,252,
-     12,108,125,  0,  0,  0,  0,  0,  0, 86,  0,  0,150,255,153, 85,
-    149, 85, 85,152,  0,175,  0,  0,  0,  0,  0,  0,  0,  0,170, 85,
-     85, 85, 89, 90,149,131, 15,240,205, 88, 29,  0,  0,  0,  0,  0,
-      0, 86,128,  0, 88, 63, 21, 85,101,101, 86, 72,  0,  4,242,125,
-     47,  0,  0,  0,  0,  0,  0,  0,  0,170, 21, 85, 85, 90, 90,170,
-    136,195,252, 13, 91, 29,  0,  0,  0,  0,  0,  0, 86,  0,  1, 96,
-    239, 37, 85, 85,153,148,  0,  0, 43,  0,  0,  0,  0,  0,  0,  0,
-      0,170,149, 85, 85,106,154,170, 10,192, 51,  1, 84, 13,  0,  0,
-      0,  0,  0,  0, 74, 32,198,131,188, 37, 85, 86,127,240, 32,  0,
-     43,  0,  0,  0,  0,  0,  0,  0,  0, 42,149, 85, 85, 89,106, 32,
-      2,192, 60,192, 84, 13,  0,  0,  0,  0,  0,  0,118,  0,195, 10,
-    140, 41,101,152,204,254,128,  0, 11,  0,  0,  0,  0,  4,243,125,
-      0,  0,  0,  0, 10,149, 85, 86,102,106,104,  2,194, 15,  0,200,
-    205,  0,  0,  0,  0,  0,  0,202,160, 48,  8, 63, 42,150, 80, 32,
-     58,128,  0, 10,  0,  0,  0,  0,  0,  0,  0,  0,138,165, 85, 86,
-    102,106,154,130,194,  3,240, 52, 61,  0,  0,  0,  0,  0,  0,198,
-      8,  0,  0,255, 42,149,146,  0, 42, 32,  0, 10,  0,  0,  0,  0,
-      0,  0,  0,  0,162,165, 85, 86,102,106,150,  0, 50, 15,204,  4,
-     61,  0,  0,  0,  0,  0,  0,198,160,  0,  3,255, 42, 86, 80,162,
-    168,128,  0,  2,  0,  0,  0,  0,  0,  0,  0,  0, 32,  4,244,125,
-    169, 85, 86,165,170,  5,  0, 10,  0,255,195, 61,  0,  0,  0,  0,
-      0,  0,246,128,  0,  3,240, 25, 85, 72, 42,104,136,  0,  2,  0,
-      0,  0,  0,  0,  0,  0,  0, 40, 41, 85, 86,149,170,  5,128, 42,
-      3, 63, 15,253,  0,  0,  0,  0,  0,  0,246,168,  0,  3,192, 22,
-    101, 64,170,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 10,
-    169, 85, 86,149,170,  1, 64, 10,  0,255,255,253,  0,  0,  0,  0,
-      0,  0,253,128,  0,  0,192, 22, 85, 10,170,168, 32,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  2,129, 85, 86,149,170,  4,245,125,
-    129, 64,  8,  0,207,255,253,  0,  0,  0,  0,  0,  0,253,160,  0,
-      0,  0,150,166, 26,106,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  2,160, 85, 86, 86,170, 51, 64,  8,  0, 51,255,253,  0,
-      0,  0,  0,  0,  0,189,168,  0,  0,  0,150,153, 74,170,170,128,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,168, 21, 86,150,160,
-    188,224,  0,  0, 12,255,253,  0,  0,  0,  0,  0,  0,189,162, 32,
-     32,  2,102,165, 90, 42,170,128,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,170, 21, 86,150,160, 44,208,  0,  0,243,  4,246,125,
-    255,253,  0,  0,  0,  0,  0,  0,189,106,128,  0,  9, 90,153, 88,
-    170,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 42, 69,
-    101,102,140,255, 48,  0,  0, 12,207,253,  0,  0,  0,  0,  0,  0,
-    125,106, 34,  0, 33,102,165, 66,168, 42,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0, 12, 42, 69, 89, 86, 63,207, 56,  0,  0,  3,
-    255,253,  0,  0,  0,  0,  0,  0,112,106, 34, 62,128,213,101, 42,
-    160,170,128,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 10,145,
-     86, 90, 15,243,196,  0, 12,204, 63,253,  0,  0,  0,  4,247,125,
-      0,  0,  0,127, 90,255,234,  3,251, 84,170,130,138,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  2,161, 86, 86, 63,252, 48,
-      0,  0,  0,255,253,  0,  0,  0,  0,  0,  0,111, 85, 90,168,  0,
-    232, 10,170,  2,138,130,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  2,161, 85,150, 35,255,204,  0,204,195,207,253,  0,  0,  0,
-      0,  0,  0, 99, 85,106,160, 12,206, 42,170, 10, 34,162,  0, 40,
-      0,  0,  0,  0,  0,  0,  0,  0,  0, 12,169, 86,102,175,255, 49,
-      0,  0, 12,255,253,  0,  0,  0,  0,  0,  0, 83, 21,  4,252,125,
-     58, 14, 65,  1,  6,  0,  0,  0, 44, 38,138, 20, 51, 54,227, 45,
-    248, 36, 14, 65,  2, 86,  0,  0,  0, 20, 63, 54,228, 45, 14, 65,
-     16, 36,  0,  0,  0, 20, 80, 54,206, 46, 15, 10, 68, 58, 67, 65,
-     82, 68, 46, 83, 69, 84, 20, 90, 12, 14, 65, 57,  0,  0,  0,  0,
-     20,102, 54,174, 45, 14, 64, 71,  0,  0,  0,  0, 20,112, 12, 14,
-     66,  3, 34,  0,  0,  0, 22, 73,122,109,109, 54,249, 45, 67, 58,
-     15, 96, 72,152, 72,165,206, 72,165,207, 72,173, 48,  2,133,206,
-    173, 49,  2,133,207,160,  5,173, 31,208,201,  7,240, 16,249,125,
-     25,201,  6,208, 10,169,  0,145,206,160,101,145,206,208, 11,165,
-     89,145,206,160,101,173, 64,  6,145,206,173,  0,  6,141, 10,212,
-    141,  9,212,173,  1,  6,141, 22,208,173,  2,  6,141, 23,208,173,
-      3,  6,141, 24,208,173,  4,  6,141, 26,208,104,133,207,104,133,
-    206,104,168,104, 64, 44, 22, 74,122,100, 21, 31, 14, 65, 21, 54,
-      0,  0,  0, 18, 14, 65,  2, 36,  0,  0,  0, 20, 29,  8,174, 45,
-    128, 25,131, 20, 48, 54,144, 56,174, 44, 45,176, 37,140, 37, 43,
-    174, 38,128, 44, 36,133, 20, 52,  9,174, 20, 75, 31, 16,250,125,
-     14, 65, 22,  0,  0,  0,  0, 18, 70, 58,247, 37, 14, 65,  1,  1,
-      0,  0,  0, 44, 20, 94, 54,191, 45, 63, 58,226, 60, 14, 65,  5,
-     18,  0,  0,  0, 60,249, 44, 20,100, 54,151, 45,128, 22, 12,123,
-     45, 20, 54,146, 55, 14, 65, 16,  0,  0,  0,  0, 44, 46, 15,  1,
-     32, 20, 45, 54,147, 46, 15, 18, 84, 79, 80, 32, 32, 32, 80, 65,
-     78, 84, 83, 32, 85, 78, 68, 73, 69, 83, 22,  0,125, 77,  9, 54,
-    227, 45,245, 20, 21, 54,228, 45, 14, 65, 86,  0,  0,  0,  0, 20,
-     27, 54,207, 45,128, 20, 33, 54,236, 45,207, 20, 48, 18,182,125,
-     32, 32, 32, 32, 32, 32,177, 45, 83, 85, 90, 73, 32, 32, 32, 32,
-    180, 45, 79, 84, 72, 69, 82, 32, 32, 32,178, 45, 77, 69, 76, 73,
-     83, 83, 65, 32, 32, 32, 32,  2,155, 76, 73, 83, 65, 32, 32, 32,
-     32,  2,155,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 64,  0, 41,
-    170,128,  0,163,184,136, 42, 10,160,138,160,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0, 42, 86,154,143,255,255, 48,240,204, 63,253,
-      0,  0,  0,  0,  0,  0, 88, 21,170,128,  2, 44, 32, 32,168, 10,
-    170,138,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  2,169,102,
-    163,255, 60, 15,  3,  3,255,253,  0,  0,  0,  0,  0,  0, 88,  5,
-    170,  0,  2,128,  8,162,128, 34,170,170,170,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0, 10,170,153,143,255,252,204,204, 51, 63,253,
-      0,  0,  0,  0,  0,  0, 92,  5,170,  0, 10, 46, 34,  4,253,125,
-     34,  0, 34,170,170,170,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      2,170,165,140,255,255,240,240,207,255,253,  0,  0,  0,  0,  0,
-      0, 94, 13,106,160,136,128,138,170,  0,  8,170,170,175,  0,  0,
-      0,  0,  0,  0,  0,  0,128,  0,  0, 10,169,163,255,255, 63, 51,
-    252,255,253,  0,  0,  0,  0,  0,  0, 27, 13,106,  2, 32,  2, 42,
-    128,  0, 32,170,171,255,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  2,169,136,207,255,243,207,207,255, 49,  0,  0,  0,  0,  0,
-      0, 27,  3, 90,176,128,136,170,128,  0,  0, 42,191,  4,254,125,
-    255,  0,  0,  0,  0,  0,  0,  0,  0,168,  0,  0,  2,169,162,255,
-    255,255,255,255,255,205,  0,  0,  0,  0,  0,  0, 23,  3,218,186,
-     34,170,170, 32,  0, 34,171,255,255,  0,  0,  0,  0,  0,  0,  0,
-      0,192,  0,  0,  0,170,162,143,255,255, 60,255,252,193,  0,  0,
-      0,  0,  0,  0, 23,240,246,250,170,170,170,  0,  0, 40, 63,255,
-    255,  0,  0,  0,  0,  0,  0,  0,  0,252,  0,  0,  0,170, 72,  3,
-    255,255,255,255,243,205,  0,  0,  0,  0,  0,  0,  6,176,255,234,
-    234,170, 34,  0,  0,  0,255,255,255,  0,  0,  0,  0,  4,255,125,
-      0,  0,  0,  0,255,  0,  0, 32,170, 72, 15,255,255,255,255,252,
-      1,  0,  0,  0,  0,  0,  0,  6,140,255,235,138,168,136,  0,  0,
-      3,255,255,255,  0,  0,  0,  0,  0,  0,  0,  0,255,192,  0, 10,
-    170,146,  3, 63,255,255,255,204,205,  0,  0,  0,  0,  0,  0,128,
-    175,255,111,170,162, 40,162,  0, 15,255,255,207,  0,  0,  0,  0,
-      0,  0,  0,  0,255, 48,  0,  0,170,166,  0,255,255,255,255, 48,
-      1,  0,  0,  0,  0,  0,  0,128,163,255,254,170,170, 32, 42,  0,
-     63,255,255,255,  0,  0,  0,  0,  0,  0,  0,  0,255,  5,  0,125,
-    192,  0,  0,  0, 41,131, 51,255,255,252,192,  9,  0,  0,  0,  0,
-      0,  0,144,216, 61, 86,168, 34,  0,168,  0, 63, 51,207, 60,  0,
-      0,  0,  0,  0,  0,  0,  0,255,204,  0,  0,  0,  2, 64,207,255,
-    255,255, 48,  1,  0,  0,  0,  0,  0,  0,144,202,149,170,144,136,
-    162,128,  0,192, 63,192,207,  0,  0,  0,  0,  0,  0,  0,  0,255,
-    243,192,  0,  0,  0, 16,  0,255,255,243,  0,  9,  0,  0,  0,  0,
-      0,  0,148,240, 21,169, 66,168,170,  0,  3,255,243,240, 51,  0,
-      0,  0,  0,  0,  0,  0,  0,255,243, 48,  0,  0,  0,  5,  1,125,
-     10, 12, 63,255,252,  0,137,  0,  0,  0,  0,  0,  0,166, 60,  5,
-    105,  2, 40,168,  0,  3,255,255,243, 15,  0,  0,  0,  0,  0,  0,
-      0,  0,255,252,  0,  2,  0,  0,  0,128,207,252,204, 22, 41,  0,
-      0,  0,  0,  0,  0,165,191,193,101, 34, 40, 32,  0, 15,252,255,
-    255,195,  0,  0,  0,  0,  0,  0,  0,  0, 63,255, 12,  0, 48,  0,
-      0, 32,  3,255,  0,  4,169,  0,  0,  0,  0,  0,  0,169,143,240,
-     84,  2, 10,  0,  0, 15,255,255,255,240,  0,  0,  0,  0,  0,  0,
-      0,  0,255,255, 48,  0,140,  0,  0,  0, 63,255,240,  5,  2,125,
-    165,169,  0,  0,  0,  0,  0,  0,105,139,240, 84, 42, 40,  0,  0,
-     15,240, 63,255,240,  0,  0,  0,  0,  0,  0,  0,  0,255,255,243,
-    192, 32,  0,  0,  0, 15,204,  2,149, 85,  0,  0,  0,  0,  0,  0,
-    105,136,252, 80,168,160,  0,  0, 15,243,195, 63,240,  0,  0,  0,
-      0,  0,  0,  0,  0,255,255,252,  0, 15,  0,  0,  0, 60,240,202,
-    149, 85,  0,  0,  0,  0,  0,  0,101,128,254,112,170, 32,  0,  0,
-     15,255, 15,207,195,  0,  0,  0,  0,  0,  0,  0,  0,255,255,255,
-    255,  8,  0,  0,  3,207,252, 41, 85, 85,  0,  0,  0,  5,  3,125,
-      0,  0,  0, 81,128, 63, 66,168,  0,  0,  0, 63,252,255,240, 15,
-      0,  0,  0,  0,  0,  0,  0,  0,255,255,255,255,254,252,  0, 15,
-     63,240,165, 85, 85,  0,  0,  0,  0,  0,  0, 81,128, 63,194,162,
-    128,  0,  0, 63,204,240,252, 63,  0,  0,  0,  0,  0,  0,  0,  0,
-    255,255,255,255,252,  3, 12,204, 15,242,149, 85, 85,  0,  0,  0,
-      0,  0,  0, 82,128,191,  2,170,  0,  0,  0, 63,207,195, 63, 63,
-      0,  0,  0,  0,  0,  0,  0,  0,255,255,243, 51,255,207, 51, 63,
-    255,202, 85, 85, 85,  0,  0,  0,  0,  0,  0, 66,128,  5,  4,125,
-    188, 42,136,  0,  0,  0,179,207,240,240, 15,  0,  0,  0,  0,  0,
-      0,  0,  0,255,255,252,  0, 15,255, 12,192, 63,  9, 85, 85, 85,
-      0,  0,  0,  0,  0,  0,  2,130,190,170,138,  0,  0,  0,179,195,
-    252, 15,192,  0,  0,  0,  0,  0,  0,  0,  0,255,255,207, 51,192,
-    255,  0, 15, 63,165, 85, 85, 85,  0,  0,  0,  0,  0,  0, 10,  2,
-    250,170,136,  8,  0,  0,140,  3,255, 51,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,255,255,240,  3, 48, 47,192, 48,255,149, 85, 85, 85,
-      0,  0,  0,  0,  0,  0, 10, 15,234,168,160,  0,  0,  5,  5,125,
-      0,143,195,255, 48,252,  0,  0,  0,  0,  0,  0,  0,  0,255,255,
-      3,192,192,  3,252,  3,252, 85, 85, 85, 85,  0,  0,  0,  0,  0,
-      0,  8,  6,106,162, 40,  0,  0,  0, 12,207,255,255,252,  0,  0,
-      0,  0,  0,  0,  0,  0,255,255, 48, 15,  2,  8, 63,  3, 60, 85,
-     85, 85, 85,  0,  0,  0,  0,  0,  0, 42, 21,106,136,160,  0,  0,
-      2, 15,192,255,192,204,  0,  0,  0,  0,  0,  0,  0,  0,207,255,
-      0,240,194,128, 15,204,253, 85, 85, 85, 85,  0,  0,  0,  0,  0,
-      0,168, 26,170, 34, 32,  2,140,  0, 15, 60,255,252,  5,  6,125,
-    207,  0,  0,  0,  0,  0,  0,  0,  0,255,255, 12,  0, 51,  2,  3,
-    255, 61, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,152, 86,170,138,
-    136,  2,143,  2, 15,207,255,204,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,255,255,192, 51, 50,  0,  0, 63,241, 85, 85, 85, 85,  0,  0,
-      0,  0,  0,  0,144, 86,162, 34, 40,  0,143,  0,  3, 48,255, 12,
-    252,  0,  0,  0,  0,  0,  0,  0,  0,255,255, 48,  0, 60,224,  0,
-     63,241, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,145, 90,136,136,
-    162,  0,163,194,  3, 60,255,204,  3,  0,  0,  0,  0,  5,  7,125,
-      0,  0,  0,  0,255,255,  3, 51,  0,128,  0, 63,241, 85, 85, 85,
-     85,  0,  0,  0,  0,  0,  0, 81, 90,162, 32,  0,  0, 96,202,  3,
-     63,255, 12, 15,  0,  0,  0,  0,  0,  0,  0,  0,255,255,  0, 12,
-     15, 56,  0,  3,245, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0, 65,
-    106,136,128,  0,  0, 40,  2,  3, 60,255,  0, 15,  0,  0,  0,  0,
-      0,  0,  0,  0,255,255, 48,192,  3,  2,  0,  0,245, 85, 85, 85,
-     85,  0,  0,  0,  0,  0,  0, 69,170, 32,  0,  0,  0, 24, 10,  8,
-    207,255,  3,  0,  0,  0,  0,  0,  0,  0,  0,  0,255,  5,  8,125,
-    255,  0,  0, 12,  8,128,  0,253, 85, 85, 85, 85,  0,  0,  0,  0,
-      0,  0,  6,168,128,  0,  0,128, 26,  2, 35,207,243,252, 48,  0,
-      0,  0,  0,  0,  0,  0,  0,255,255,255,  0,  0,200,128,  0, 57,
-     85, 85, 85, 85,  0,  0,  0,  0,  0,  0, 22,162, 32,  3,195,168,
-      6, 10, 15,207,252,252,192,  0,  0,  0,  0,  0,  0,  0,  0,255,
-    255, 12,  0, 12, 50, 32,  0, 14, 85, 85, 85, 85,  0,  0,  0,  0,
-      0,  0, 26,168,128,131,252, 56, 10,170, 32,192, 48,192, 48,  0,
-      0,  0,  0,  0,  0,  0,  0,255,255,240,  0,  0,204,  5,  9,125,
-     40,  0,198,149, 85, 85, 85,  0,  0,  0,  0,  0,  0, 90,162, 32,
-      0, 15,206,  6,170,128, 48,252,207,240,  0,  0,  0,  0,  0,  0,
-      0,  0,255,255,  0,  0,  0,  0,130,128,  5,213, 85, 85, 85,  0,
-      0,  0,  0,  0,  0, 90,168,  0,  0, 12,255,134,170,136, 63,204,
-    255,195,  0,  0,  0,  0,  0,  0,  0,  0,255,254,195,  0,  0,  0,
-     32, 32,  5,165, 85, 85, 85,  0,  0,  0,  0,  0,  0, 90,162, 34,
-      0,  3, 63,233,170,160,  0,207,  3,192,  0,  0,  0,  0,  0,  0,
-      0,  0,255,254, 12, 12,  0,  0,  2,136,  5,101, 85,  5, 10,125,
-     85, 85,  0,  0,  0,  0,  0,  0,106,168,  0,  0,  0,255,249,154,
-    130,131, 63,243, 15,  0,  0,  0,  0,  0,  0,  0,  0,255,254,  0,
-      0,  0,  0,  0, 34,  1,101, 85, 85, 85,  0,  0,  0,  0,  0,  0,
-    106,160, 32,  0,  0, 63,252,106,160, 12,207, 63,  3,  0,  0,  0,
-      0,  0,  0,  0,  0,255,254,252, 48,  0,  0,  8,136,137,101, 85,
-     85, 85,  0,  0,  0,  0,  0,  0,106,168,128,  0,  0,207,240, 90,
-    130,  0,  0, 51,243,  0,  0,  0,  0,  0,  0,  0,  0,255,254,  0,
-      0,  0,  0,  0,  8,137, 89, 85, 85, 85,  0,  0,  0,  5, 11,125,
-      0,  0,  0,106,168,  0,  0,  3, 63,252, 22,168,184,  3,207,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,255,254,  0,  0,  0,  0,  0, 34,
-     41, 89, 85, 85, 85,  0,  0,  0,  0,  0,  0,106,168,  0,  8,  0,
-    207,252, 22,162,176,195, 12,192,  0,  0,  0,  0,  0,  0,  0,  0,
-    255,254, 51,  0,  0,  0,  0,  0,170, 89, 85, 85, 85,  0,  0,  0,
-      0,  0,  0,106,168,  0,  0,  0, 51,255,  5,170,136,  3, 12, 48,
-      0,  0,  0,  0,  0,  0,  0,  0,255,254,  0, 48,  2,  0,  0,  0,
-    138, 89, 85, 85, 85,  0,  0,  0,  0,  0,  0,106,168,  5, 12,125,
-      0,136,  0,204,255,  1,170,160, 63, 48,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,255,254,  0,  0, 10,  0, 48,  0, 42, 89, 85, 85, 85,
-      0,  0,  0,  0,  0,  0,106,160,  2, 34,  0, 51, 63,192,170,162,
-      0,252,  0,  0,  0,  0,  0,  0,  0,  0,  0,255,254,128,  0,  8,
-      0,  0,  0, 10, 89, 85, 85, 85,  0,  0,  0,  0,  0,  0,106,168,
-      8,136,  0,207,255,  0, 42,136,  3,255,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,255,250,128,  0, 32,  0,  0,  0, 10,153, 85, 85, 85,
-      0,  0,  0,  0,  0,  0,106,168, 34, 34,  3, 51,255,  6,173,125,
-     65,128, 45, 11,122,101,100,103,102, 97, 96, 99, 98,109,108,111,
-    110,105,104,107,106, 21, 20, 23, 22, 17, 16, 19, 18, 29, 28, 31,
-     30, 25, 24, 27, 26,  5,  4,  7, 57,248, 85,115,206,193, 12, 15,
-    194,197,  4,199,198,249,248,251,250,241,252, 63,254, 61, 48,243,
-     50,245,244,247,246,233,232,235,234,237,236,239,238,225,224,227,
-     33,208,125, 59, 41,214,231,212,214,225,227,224,226,237,223,236,
-    237,233,235,232,234,197,196,244,197,194,243,192,241,254,255,255,
-    253,250,251,248,249,198,199,199,249,  8,167, 39,254, 21, 14,125,
-     49, 48,255,254,245,244, 55,250,229, 36, 43, 42,225,236,239,226,
-    225,236, 47, 46, 41, 36, 43, 38, 89, 88, 91,218, 93, 92, 95, 94,
-     81, 80, 83,145,124,204,107,153,133,183,183,181,129,179,179,177,
-    189,191,143,142,186,187,139,186,134,180,132,134,129,131,128,129,
-    142,191,140,221,138,139,136,137,150,151,151,169, 68,255,243,162,
-    161,160,163,174,169,164,171,106, 85,148, 87,150, 93, 92, 83, 94,
-     81, 92, 83,146,149, 84,155,150,137,136,139, 46, 77,140,143,142,
-    129,128,131, 65,172, 23,155, 74,118,116, 68, 69,113, 21, 15,125,
-    112,115,114, 77,124,127, 78, 73,120, 72,122,102,100, 87, 86, 98,
-     99, 80, 81, 94, 95, 92,  4, 90, 91, 88, 89, 38, 39, 39, 42,244,
-     64, 67, 30, 29,208, 31, 30, 21, 20, 27, 22,  5,  4,  7,  6,  1,
-      0, 15, 14,205,  0, 15,194,197,200,199,198,245,248, 59, 92,253,
-    252,255,254,241,240,243,  2,220, 73,231,  9, 21, 23, 20, 21, 33,
-     32, 35, 34, 45, 44, 44, 46, 41, 24, 27, 25,229,215,231,229,225,
-    208,224,225,238,239,239,180,106,235,232,233,246,247,247,251,228,
-    179, 87,206,193,204,  3, 14,197,200,203,202,245,244, 21, 16,125,
-    247,246,253, 48,255,254, 49, 48, 63, 50, 57, 56,247, 54, 37, 40,
-    235,128,109, 44, 47, 46, 33, 32, 35,211,204,155,130,218,149,167,
-    148,149,161,160,163,146,157,172,156,174,153,168,155,169,181,183,
-    183,181,130,131,128,177,142,188,188,232, 57,187,184,185,134,135,
-    135,139,148,211,233,178,125,188,179,126,117,184,183,182,105,168,
-    171,102,161,160,175,110, 97,108,175, 98,101,104,107,102,153,148,
-    154, 48,221, 92,159,158,145,144,147,163,108,  1, 49, 42,117, 71,
-     71,118, 65, 67, 64, 66,125, 79, 76,125, 74, 72, 75, 21, 17,125,
-     74,118, 71,116,117, 66, 67, 67, 66,126, 79, 78, 24,202, 75, 72,
-     73, 86, 87, 87,145,148, 58,  9,226,173,108, 99,174,101,104,171,
-    106,213, 20, 23, 22, 17, 28, 19, 30,221, 28, 19,222, 25,212,215,
-    214,197,200,194, 96,141,204,207,206,193,192,195,249, 52, 94,145,
-    154,  5,  7,  7, 54,  1, 51,  0, 50, 13, 60, 60, 62, 57, 11, 59,
-     58, 22, 39, 36, 21, 18, 19, 35, 33, 29, 31, 26, 72,154, 27, 24,
-     25,230,231,231, 34,236,133,117, 66,221,208,211, 30,217, 24,219,
-    218,201,  8, 11,202,193,204,207,  2,  1,  0,  3,  2, 21, 18,125,
-      5,196,  7,  6, 57, 56, 50,144,125, 60, 63, 62, 49, 48, 51, 10,
-    196,173, 82, 90,213,228,231,214,209, 35,227,226,222,236,239,237,
-    234,232,235,234,166,151,164,165,146,147,160,145,173,175,170,248,
-     26,171,168,169,182,183,183,114,188,213,234,238, 77,140, 79, 66,
-     73,136,139, 74,185,120,123,186,177,176,115,114,177,112,115,114,
-    185,116,119,118,101,104, 98,192, 45,108,111,110, 97, 96, 99, 89,
-    148,253,241,198, 85,100, 84,102, 81, 80, 83, 98,109,108, 92, 94,
-     89, 91, 91,106,118, 71,116, 69,113, 67,112, 66,126, 21, 19,125,
-    124,122, 36,250,123,120,121, 70, 71, 71,170,  4, 37, 42,222,189,
-    124,127,178,181,184,187,118,165,104,167,102,161,160, 99,174, 97,
-    108,111, 98,165,104,103,166,217,216,210,124,157,220,223,222,209,
-    208,211,206,204, 77, 78,125,  5, 52, 55, 54,  2,  0, 51,  2, 14,
-     60, 15, 62, 10, 11, 11, 57, 53,  7, 52,  5,  1, 48, 51, 49, 14,
-     15, 14,100, 10, 11,  8,  9, 22, 23, 23,214,244,117,121, 73,237,
-     44,239, 46,233,228, 43, 42, 25,212,215,214,209,208,211,222,209,
-     16,211,210, 21, 20, 23, 22,  9,200, 10,156, 13, 12, 21, 20,125,
-     15, 14,  1,  0,  3, 50, 28,173,173,161,246,244,247,246,241,240,
-    195,242,254,252,204,205,249,251,203,250,230,215,212,213,209,208,
-    208,209,222,220,222,116,218,219,216,217,166,167,167, 86, 68,197,
-    230, 57, 93,156,159, 94,153, 84, 91,150,133,136, 71,138,129,140,
-     67,130, 77, 64,131,130, 73, 68, 71, 70,121,120,122, 44,189,188,
-    127,126,113,112,115,125,108,237,162, 17,165,164,151,166,146,160,
-    144,162,  7,172,156,174,153,168,171,169,101, 84,100, 85, 81, 96,
-     96, 97, 93,111,110,196, 26,107,104,105,118,119,119, 21, 21,125,
-    133, 20,  5, 22,232,141,128, 79, 78,137,132,135, 96,223,216,123,
-    122,125,188,115,114,189,176,179,126,121,180,183,182,105,168,170,
-     28, 45,172,175,174,161,160,163,173, 62, 24, 14,192,214, 20, 23,
-     22, 17, 16, 73,184,183,182,172, 45, 41, 27, 24, 42, 53,  7, 52,
-      5, 49, 48, 51,  1, 62, 63, 58,117, 89, 59, 56, 57,  6,  7,  7,
-    245,100,109, 89,168, 61,252, 63, 50,249,245,121,144,128,142,143,
-    234,225, 44, 35, 46, 45,224,239, 34, 37, 36, 43,234, 25, 24, 18,
-     47,133, 28, 31, 30, 17, 16, 19, 29,140,141,141, 64, 21, 22,125,
-      5,196,199,197,242,193,  0,107,148, 86,101,206,201,203,203,202,
-    246,199,247,197,194,243,243,242,205,207,232, 87,140,203,200,201,
-    214,215,215, 37,180,181,138, 36, 45,236,239,238, 41, 47,228,  0,
-     12,242,253, 22,157,144, 83, 82,145, 80,159,146, 89,152,151, 86,
-     69, 72, 82, 47,244, 76, 79, 78, 65, 64, 67, 79,220,221,239,140,
-    117,135,183,182,129,132,140, 91,235, 25,213, 62,185,184,187,185,
-    166,164,167,165,162,147,144,145,158,159,248,  7,220,155,152,153,
-    102,103,103, 87,  4,  5, 15, 68,145, 92, 83, 94,153, 21, 23,125,
-    172,100,179, 47, 30,237,230,141, 76,131, 78, 77, 76,143, 66, 69,
-    136, 71,134,181,185, 40,215,  4,188,191,190,177,176,179,125, 44,
-     45, 59,144,165,103,103,101, 81,112, 52,155,196, 58,249,198,105,
-    107,104,106, 37, 36, 39, 22, 34, 35, 32, 34, 30, 45, 72,191,108,
-     43, 40, 41, 54, 55, 55,  5, 84, 85,192,168,193, 12,207, 14,  9,
-    197, 94,240, 96, 81, 82,156, 61, 48, 63, 50, 61,240, 51, 62, 53,
-    248, 59,246, 41,225,120,135, 84,236,239,238,225,224,227, 45,252,
-    125, 38, 64,149,212,231,230,210,205,134,168,119,134, 21, 24,125,
-    133,116,217,232,235,217,197,247,244,198,242,195,240,242,254,249,
-    176,111,188,187,248,249,198,199,199,245,164,164,198, 72,141,252,
-    255, 50, 56,173,174,132,143, 78,113, 76, 97, 32,239,238,225, 32,
-    239,238,233,232, 39,230, 85, 81, 73, 55,100,220, 95, 94, 81, 80,
-     83,129,236, 11, 77,115,245,132,132,172, 36,245,214,252,231,230,
-     37,212, 10,139,136,185,181,135,135,182,129,131,176,130,142,169,
-    193, 31,204,203,136,137,150,151,151,133,244, 54,252,123,209,156,
-     98, 55,  2,125,254,244, 48, 62,253,204,241, 80, 83, 21, 25,125,
-     94, 81,144, 95, 82,149,152,151, 86,137, 81,185,215,148, 12,143,
-    142,129,128,131,209,188, 45, 22, 32, 10,183,114,  3, 30,165, 38,
-     45,231,234,214,232,209,120, 75, 73,102, 84,103,102, 81, 99, 96,
-     81,109, 59, 17,239,158, 27, 88, 89, 38, 39, 39,133, 76, 69, 70,
-    184, 98,220,216, 75,102,109, 78, 69,159,162,157,172,169,192,207,
-     14,  1,204,207,  2,  5,200,199,198,246, 73,202,187,228,124,255,
-    254,241,240,243,173,204,109,109,144, 90, 39, 34,209,220,245,118,
-    117,187,134,117,132,131, 27, 24, 42,214,215,231,213, 21, 26,125,
-    226,227,208,225,220, 43, 34, 83, 14,139,232,233,246,247,247,101,
-     20,149,149,103,129,204,210,177,244, 21,158,157, 95, 94, 97, 92,
-    155,112,255,254, 61,252, 63, 50,249, 56, 59, 58,232, 52, 22,107,
-     52,188, 47, 46, 33, 32, 35, 77, 20,189,189,127,214,164,130,105,
-    110,197,198,199,116, 54,249, 55, 15, 56,152,169,182,183,132,181,
-    177,179,176,178,186,252,134, 14, 94,219,184,185,134,135,132, 30,
-    100,229,230, 39,254,188,224, 65, 68,205,238,239, 64, 14,194,192,
-      7, 10,163,162, 97, 96,175,174,165,168,167,102,136, 21, 27,125,
-    168, 94,214,132,138,249,158,145,144,147,246,172, 13, 14, 15,134,
-    183,  8,121,190, 21, 22, 23,167,213, 37, 24,239,226,203, 73, 70,
-    119,119, 69,114, 67, 89,113, 10,128,118,254,174, 18,209,208,207,
-    215, 84,142,156, 53, 54, 55,174,160,112,145,150,189, 62, 63,243,
-     77,189,131,184,138,187, 18,209,208,211, 30, 21, 20,189,153, 58,
-      4, 46,134,  4,234,169,168,167,166,165,230,254,125,126, 93,  6,
-    196, 56, 73,206,229,102,103, 68,150,150,151, 83, 82,145, 58, 37,
-     39, 23, 37, 34, 17,182, 77, 45, 40, 10,173, 44, 66, 21, 28,125,
-    129,128,127,126,113, 62,238,  5,134,142,210, 16,210, 33, 38,141,
-    142,143,191,158,109,108,168,101,105, 98,205,204,207,  2,  9,254,
-    158,  9,234,  9, 34, 59, 48, 90, 89,104,103, 86, 85,214,198,143,
-    174,142,214, 20,240, 27,158,181,182,183,151,118, 69,180,188,113,
-    129, 64,149,167,164,150,162, 70,227,157,226, 99, 74,153,239, 62,
-     49, 48, 47,238, 45,163,190,247,232, 87, 13,188,240,123,118, 93,
-    222,223,236,225,222,220, 39, 26, 38, 24, 61,188,127,190,120,238,
-    123, 69,120,121,122,115,251, 10,  9,  8,  4, 58,  5, 21, 29,125,
-    132,166,  2, 20,252,251, 85,168,129,142,  5,  6,  7,  4,  6, 10,
-    244,255,241,242, 48,239,119,119,118, 68, 22,128,189, 50, 51,184,
-     57, 47,226, 45,220, 19,222, 29, 76,113,127,142, 39,192, 35,128,
-     41,166,175, 46, 47, 60,242, 50,207,  4,201,201,  7,  7,204,163,
-     98, 60, 50,164,181,202,233,232,203,187,137,186,184,180,134,133,
-     40, 25, 39,238, 67,158,123,248, 89,118,247, 86,127, 84, 85, 90,
-     91, 80,109, 97, 96,159,158,151, 19,100,102,188,205,194, 75,200,
-     75,147, 94, 81, 92, 67, 66, 65, 32, 97,223,246,119, 21, 30,125,
-    219,193,242, 81,118,221,244,223, 12,177,142,143, 72,134,134,183,
-    119,118,117,139,188,129, 84, 39, 56, 27, 26,144,104,106, 90, 91,
-     84, 85, 86,195,137, 55, 30,157,140,129,130, 11,174, 15, 44, 13,
-     20,149,170,171,172,174,109,160, 79,142,177,115,180,133,108, 21,
-     26,155,152,184,127,142,141,140,255,242,241,155,193,111,198,197,
-     72,193,104, 75,238,103,100,101, 96,209,210, 19, 20, 21, 37, 20,
-    219, 38, 37,219,211, 46, 38,127,104,105,106,224,212, 37, 38, 43,
-     36, 37, 37,183,233, 71,238,229,222,211,208,243,214, 21, 31,125,
-     95, 92, 93,  8,249,202, 59,240,  1,205,  3,  0, 61,193,  3,251,
-    245,242,  7,  8, 43, 42, 59,195, 62, 61, 15, 32, 17, 34, 77, 25,
-    127,182,159,152,147,176, 27, 20,183,180,176,223, 33, 34,227, 43,
-     26, 41, 40,215,214,214,235, 47,222, 30, 47, 48, 49, 50, 51, 52,
-     53,250, 55, 56, 53,245, 32, 49, 87, 60, 31, 66,107,194, 67,100,
-    239,237,184,183,137, 69, 71,191,113, 65,179, 80, 93, 82, 83,107,
-    153,106, 87, 88, 89, 90, 91, 92, 93,110, 95, 96, 98, 98,120,103,
-     63,214,231,224,195,234,107,108, 71,209,144, 64,129, 21, 32,125,
-    114,115,135, 74,117,139,184,137, 70,123, 64,177,114,127,128,129,
-    130,131,132,133,134,135,136,137, 74,156,143, 87, 52,173, 58, 59,
-    178,147,182, 62,105,104, 88, 89,166,152,172,158,110, 95, 80,161,
-     98,160,164,170,105,167,168,169,170,171,172,173,174,175,176,177,
-    178,164, 68, 67, 76, 29, 18, 19,186,187,148,130, 65, 64,  0, 61,
-    193,195,199, 54, 58,200,199, 10, 53,  7, 12,242,  1,207,208,209,
-    210,211,212,213,214,215,216,217,218,221,108, 34, 52, 53, 74,195,
-    226,227,228, 26, 25, 24, 40,213,229,235,227, 29,209, 21, 33,125,
-     16, 15, 14, 13, 51, 11,202,197, 55,248,249,250,251,252,253,254,
-    255,  0,  1,  2,  5,136,250,237,141,160,129, 10, 11, 15,242,241,
-    240,239, 45, 17, 19,215,214,214, 23, 24,217, 22,212, 16, 33, 45,
-    223, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42,171,131,210, 65,
-    133,146, 25,144, 51, 59,202,201,248,199, 58, 58, 59,252, 50,206,
-    192,127, 77,125,128, 75,133,118,183, 72,105, 74, 75, 76, 77, 78,
-     79, 80, 81, 82,211,247,170,168,253,242,121,112, 91, 99,162,161,
-    160,159,161, 97,163,155,106,154,152, 87, 86,170, 84, 21, 34,125,
-    163,110, 94, 95,112,121,242,115,116,117,118,119,120,121,122,235,
-    164, 64, 40,215,162,129, 42,131,187,182, 73,187,119, 74, 74,123,
-    176,142,114, 79,144,145,157, 92, 84,169,153,171,152,185,186,155,
-    156,157,158,159,160,161,162, 51,110, 48, 12, 55, 32, 11, 42,171,
-    108,146,110, 96, 79, 65, 66,176,184, 69,181,136,119,134,117,123,
-    188, 77,113, 64,192, 73,202, 75,196,197,198,199,200,201,202, 95,
-     60,216,103,141,120,123,210,208, 43, 38, 38,228, 39, 37, 22,212,
-    220, 34,222, 32, 47, 46, 34,236, 24, 21,233, 40,232, 21, 35,125,
-    203,202,235,236,237,238,239,240,241,242, 85,200,240,159,245,208,
-     81,250,248,  3,  2, 13,240,255,253,254,195,  4, 58, 58,  8, 55,
-    197,  5,251,243, 61,  1,  0,208,185,154,155,148, 21, 22, 23, 24,
-     25, 26,190,163,220,123, 61,  8,  1, 34, 44,216,218,217,228,212,
-    214,234,216,239, 45, 17,239, 48, 50, 61,207,203,  6, 58, 52,248,
-     27, 24, 27, 28, 61, 62, 63, 64, 65, 66,234,203,181, 18, 69, 66,
-     73, 74, 68,179,178,177,191,172,174,173,175,155,149, 89,152,171,
-    166,149,167,160,109, 94,172,144,203,234,235,100,229, 21, 36,125,
-    102,103,104,105,106,  2,231,157, 58, 69, 88,113,114,124,132, 74,
-    137,135,180,182,137,135,115,142,190,176, 67,126,189,124,180,134,
-     70, 71,120, 35, 40,169,172,141,142,143,144,145,146,250, 28,105,
-    198, 63, 56,153,154,148,111, 94,161,111,160, 93, 94, 95,107, 86,
-     86,167,168,105,169,171, 92, 82,157,159, 76,155, 26, 59, 60,181,
-    182,183,184,185,186,222, 60, 67,206, 21,224,193,194,204, 59,202,
-      9,  4,247,  6, 54,244, 15, 14, 50,240, 32,221,221,208, 40,218,
-     22,219,228,243,112,113,222,221,222,223,224,225,226, 21, 37,125,
-    178,100,218,164, 79,232,233,234,212, 16, 18, 30,224,255, 62, 14,
-     51,  4,250,  9,200,  4,  6, 53,  8,  3, 50, 62, 51, 63, 43,170,
-    171,140,  5,  6,  7,  8,  9, 10, 90,140, 50,204,173,144, 17, 18,
-     44,216,229,234, 40,215,234,229,216,224, 30,226, 32,220,222,237,
-    208,219,234,229, 20, 43, 35,128,  9, 12, 45, 46, 47, 48, 49, 50,
-     97,180,138, 52,157, 56, 57, 58,  4,243,254,  1,  0,131,177,177,
-    191,184,181, 70,184,184,181, 69,184,176,114, 78, 79,147,155,248,
-    249,220,213,214, 95, 80, 89,218, 25,220,225,116,215, 21, 38,125,
-     96, 97, 98,208,171,149,150,104,155,153,105,151, 83,145,110,108,
-    179,141,141,124,132,137,118,184,184,163,208,217,222, 95, 94, 95,
-    128,163,160,129,  6, 59, 44, 13,136,137,138, 56, 79,113,129, 79,
-     99, 98,157,108,164,106,149,155,152,150,102, 88, 92,146, 82,159,
-    160,155,  8, 41, 12, 37,174, 39, 32, 41,162,161,174, 87,  4, 39,
-    184,177,178, 63,183, 74,133,183,184,122,121, 71,127, 66,177,127,
-    255, 14,254,252, 52,250, 54,200, 55,255, 96, 97,238,237,238,237,
-    242,211,240,217,219, 63,126,119,216,217,218, 84, 31, 21, 39,125,
-     34,238, 35, 28,238, 17, 31, 24, 26, 41, 20, 23, 21, 21, 20, 19,
-    238, 18, 16, 15, 55, 88, 89, 94, 93,126,127,240,241,242,243,250,
-    151, 92,215,  0,  1,  2, 15,203,250,249,251,247, 54,250, 59,240,
-      2,  1,252,239,225,237,236,235,230,233,215,228,212,176,177,182,
-    191, 60, 29,  2,  3, 32,  9, 49, 79,174,135, 40, 41, 40, 36,236,
-    210,238,227, 15,254,193, 48,203, 53, 53,244,199,202,197,196,195,
-    206,206,  0,128,128, 40,233,238,239,236,205,192,193,194,227, 86,
-    231,108,111, 82,221, 82, 92,104,170,170,152,103,150, 21, 40,125,
-    165, 84,163, 97, 94, 95,159,158,157,156,155,170,170,152,151,105,
-      0,193,198,199,196, 69,218,219, 80,235, 34,223,252,255,122,246,
-    120,116,179,130,178,127,191, 65, 65,124,123,122,137, 71,119,133,
-    181, 72,112,130, 77,143,111,161,200, 57, 62, 63, 30, 63, 48, 17,
-     18, 11,202, 63,188,183,160, 46,162,160,148, 90,170, 91,168,101,
-    165, 87,160,146, 97,108,176,178,142, 76,116, 74,118,183,135,121,
-    172, 17, 22, 31, 20,149, 98,107,224, 82,158, 77, 78,101,200,106,
-      8,200,240, 50,  2,204,208, 45,237, 47, 20, 42, 25, 21, 41,125,
-     36, 40, 37, 38, 36,220,237,225, 32, 44, 33,244, 73, 78, 79,108,
-     77, 66, 65, 98,186,182, 79,206,239,240,145, 56,240,203, 10,250,
-    248,203,  6, 58, 11,  0,242,241, 12,240,254,254,252,244,250,  6,
-      4,247,245,143,161,166,167,164,165, 58, 59,184, 82,126,157,150,
-     23, 24, 49, 24, 24, 32,226, 30, 16, 44, 30,222, 32,216, 21, 25,
-    232,216, 22,214,212,208,210,209, 44,207,193,183,153,158,159,156,
-    173,146,147,146,126,150, 29, 62, 63, 64, 89, 72, 75,139,186, 69,
-     71,184,118,181,136,179,114,142, 64,144,174,173,172, 21, 42,125,
-    168,170,101,168,151,154,115,  1,246, 55,248,249, 10,203,200,101,
-    204,229,102,103,232,115,104, 72,163,158,146, 95,143,126,142,131,
-     72, 74,133,183,120, 70,137,132,140,190, 65,128,124, 65,163,217,
-     46, 44, 44, 45, 18, 35, 16,157, 46,173,141, 76, 56,151,152,156,
-     91,105,106, 87,155,154,105,100,156, 98, 93, 99,160,161, 97, 92,
-    103, 89,105, 88, 91, 89, 32,253,  6,  7,196,  5, 26, 23, 20,169,
-     28, 53, 53, 75,128,179, 16,155,124,141,126,143,195, 49,193, 60,
-    251,198,  9, 59, 55,249,202,203,195, 62, 49, 48, 47, 21, 43,125,
-     29,208,134,126, 79,124,126,114, 64, 64,129,126,253,222,208, 46,
-    231, 72, 99,212, 25, 41, 23, 23, 21,229, 20,227, 29,238,224, 15,
-    206,253, 15,244,201, 54,247,  7, 57,248,110, 86, 91,152,153,106,
-    103,103, 89,172,  5,  6, 11,247,143,160,131, 51,193,241,204,208,
-    225,210,236, 43,230,233, 36,232,214,213,228, 35,221, 17,224, 28,
-    209,232,182,189,191,191,190,177,124,127,113,142, 15, 46, 44, 15,
-    216,152,147, 52,250, 53,247,248,198,198, 55,  3,242,193, 63, 64,
-    126, 77,188,120, 70,185,187, 75,181, 64, 46, 42, 43, 21, 44,125,
-     43, 26,  5,  4,  7, 57,252, 85, 86, 87,167,160,192,217,223, 98,
-    173, 80,144, 98,157, 83,104,170,153, 88,167,170,106,107,144,157,
-    110,144, 79,129,122,214, 33,224, 35, 34, 45, 32, 31, 17,220, 93,
-    126,127,191,125,232, 35,136, 74,185,132, 68,138,118,180,127,141,
-    114,176, 95, 94,109,147,152,154,154, 88,167, 90, 56,  2,201,200,
-    203,201, 54, 52,247,201, 12, 37,166,167,103, 89,240, 41,172,173,
-    157, 92,124,178, 78, 76, 71, 74,182, 72,119,118, 69,116,124,130,
-     78, 64, 15,205,200,102,145,144,159,146,157, 80,108, 21, 45,125,
-    161,100,205,206,204,239, 45,196,123,108,214, 25,215,212,233,230,
-     36, 19, 34, 17,223,227,222, 29,236,235,229,230,231,235,217,234,
-    178,185,187, 72,133, 90,219,250,153, 92,245,254,247, 55,  5,236,
-     89, 76, 62,242, 63, 12,  2, 50,252,203,250,202,248,248,  9, 54,
-     52, 51,205,205,240,236,209, 48,134, 66, 76,188,183,144, 57, 24,
-    113,180, 29, 30, 31, 19,222, 39,137,172, 38, 42, 23, 27, 42, 38,
-     43, 19,210, 18,223,207,205, 50, 51, 11,202,201,244,199,249, 48,
-     94,105, 87,150, 31, 64,193,194, 41,236, 69,206, 71, 21, 46,125,
-    132,182, 75,225,236,114,126, 79, 83, 97,157,147, 84, 86,106,171,
-    167,165,165,155, 92, 81,161,172,111,157,160,246, 50,205,230,103,
-    104,105,106,  1,204,111, 76,111, 67, 78,178,217,214,117,138,119,
-    187, 69, 69,136,128,125,126, 67,127,125,125, 76,120,181,186,136,
-     75,121,136,158,230, 45,142,143,144,145,146,249, 60,157, 30,151,
-     87,102,154,177, 20,158, 97,159, 83,157,157, 80, 91,106, 90,103,
-    168,170, 85,148, 83,158,161,144, 64,129,146,229, 28,181,182,183,
-    184,185,186,209, 20,159,156,188,243, 62, 50,233,102, 21, 47,125,
-    229,  5,199,200,246,202,200, 51,  2, 49,  0, 19, 33,210,236, 40,
-    229,213, 43,215, 23,219,177,124,221,222,223,224,225,226,137, 76,
-    237,110,231, 36, 22,214,225, 70,110, 33,223,195,242, 13, 51,248,
-    202, 10,248,  4,  6,245,251,252,  2,  1,  0,255,194,  7,105,  4,
-      5,  6,  7,  8,  9, 10, 97,172, 47, 44, 15, 35, 34,237, 17,190,
-    158, 22, 20, 43,233, 37,228,220, 29, 18,208,208,222, 29,223, 36,
-     37, 37,216,219,233, 60,131, 44, 45, 46, 47, 48, 49, 50,105,156,
-    189,190,183, 52,245,245,203, 22,151, 62, 15, 67,189, 21, 48,125,
-    125,188,139,186, 70, 71, 75,182, 69,180,115,130,113,191, 99,173,
-     58, 83, 84, 85, 86, 87, 88, 89, 90,  1,254,127,124, 95, 83, 82,
-    157,156, 98,  3,230,107,168,150,105,148,172, 82,161,108,140,113,
-    114, 79,123,181,118, 72,139,135,250,123,124,125,126,127,128,129,
-    130,217, 44, 13, 14,  7,136, 73, 69,116,125, 23, 38,143,144,157,
-    110,156,107, 90,153,104,103,150,102,155,156,158,109, 83,159, 81,
-    162,163,164,165,166,167,168,169,170,253, 14,143,140,143,179,190,
-     77, 76, 75,183, 28,183,184,185,122,187,179,125,190, 21, 49,125,
-    179,255, 14, 62, 60, 55, 53,198,200,  7,  9,202,203,204,205,206,
-    207,208,209,210,133,118, 93, 94, 95,216, 37,213, 36, 35, 34, 32,
-     83,224,225,221, 44, 36,230, 25,231,232,233,234,235, 35, 46, 46,
-     32, 15,241,242,243,244,245,246,247,248,249,250,173, 86,223,220,
-    221,  0,  2,206,252,203,250,249,247,  8,  9,  9,196,252,253,241,
-    240,224,238, 45,227, 20, 26,230,215, 36, 25, 26, 27, 28, 29, 30,
-     31, 32, 33, 34,117,142,173,174,175,168, 25, 25,212,223, 17,209,
-    208,248, 49, 50, 60,251, 53, 53,  8,200,197,197, 55, 21, 50,125,
-      3,205, 50, 63,124, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 30,
-    230,239,108,109,112, 82, 82,108,171,170,170,171,166,249, 89, 91,
-     96,109, 94, 80,144, 97, 98, 83,100,165,165,164,152,105,106,107,
-    108,109,110,111,112,113,114, 38,222,221,254,255,248,121,122,116,
-    131,142,129,128,127,107,  2,143,132,134,137,183,116,118,122,184,
-     76,141,142,143,160,145,146,147,148,149,150,151,152,153,154,206,
-    246, 55,188,189,128,161,162,163, 91, 90, 85,104,103,167, 32,171,
-    144,146, 97,147, 79,142, 66,128,183,138,122,119,120, 21, 51,125,
-    185,186,187,188,189,190,191, 64,195,194,150,158,109, 78, 79, 64,
-    201,202,203,195, 50, 49, 48,239, 30,122,211,212, 25, 41,235, 23,
-    230, 38,219,223, 45,209,223,192,225,226,227,228,237,230,207,234,
-    233,202,190,186, 71, 68,205,210,241,242,243,244, 10,  9,  8,  7,
-      6,192,115,252,254, 61,255,192,  1,  2, 12,196,  5,198, 55,128,
-      9, 10, 11, 14,143, 38,143,144,153, 18, 70, 66,191,188,191,144,
-    153, 26, 27, 28, 18,225,208,223,222, 28,161,164, 37, 38, 39, 43,
-    214, 22,219, 19, 29, 33,227,144,177, 50,179, 52,189, 21, 52,125,
-    180,151, 48,187, 18,110,106,151,148,157, 98, 97, 66, 67, 68, 69,
-    121,184,119,182,185,227,206,109, 78, 79, 80,174, 98,163,100,106,
-    102, 85,242,214,152,243,214,255,124, 87,226, 67, 66, 54, 49,207,
-    204,207,224,201,106,107,108,109,109,160,140,142,142, 89,214,125,
-    244,119,120,185, 69,139,176,125,126,125, 42,129,125, 41,172, 47,
-    164, 37,  0,  1, 32,222,217, 39, 36,173,178,177,146,147,148,149,
-    165,164,171,170,101,101, 54, 55, 52, 31,  0, 33,162,163,164,149,
-    166,165,  0,169,165, 65,  6,135,132,135, 58, 19, 58, 21, 53,125,
-    230,225, 31, 28, 29, 48, 49,186,187,188,189,190,191, 12, 13, 61,
-     60, 46,111,108,120, 55, 54, 53,203,204,205,206,205, 80,225, 30,
-     45,124,119,124, 93,112,115,112,142,137,183,116,117, 66,201,224,
-    227,228,229,230,231,219,218,217, 20, 19, 18, 17, 16, 15, 14, 13,
-     12, 11,245,246,244,  7,250,201,196,  6, 93, 84, 85,170,171,168,
-     86, 81, 95,172,173,160,171,138,  3, 12, 13, 14, 15, 16, 29,222,
-    220,235,234,233,232,231,230,229,228,227,225, 30,224,208, 33, 34,
-    171,232,207, 47,142,130,179,140,114,121,119,132,133, 21, 54,125,
-    154, 27, 18, 19, 52, 53, 54, 55, 56, 10,  9,  8,  3,194,193,192,
-    115,126,189,188,187,186,185,184,136, 75,104,233,108, 76, 24,213,
-    246,251, 59,  5,  1,  3,252,253,242,209,218,219, 92, 93, 94, 95,
-     96, 97,110,175,168,169,169,152,148,150,149,148,147,146,145,147,
-    112,249,250,211,252,117, 47, 45, 18, 31,220, 46, 41, 43,212,213,
-     42, 43,  0,131,132,133,134,135,136,137,185,184,191,190,189,188,
-    163,162,161,160,148,149,150,151,154,185, 56,153,190,189,139, 10,
-    197, 52,247,245,  1,243, 12, 13,  2,  3,  0,163, 44, 21, 55,125,
-    173,174,175,176,177,178,179,180,181,122,123,116,117,118,187,188,
-    189, 54, 55, 72, 73,106,203,110,111, 96, 94,146,175,144,174,150,
-    168,100,101,122,123,122,243,212,213,214,215,216,217,218,219,220,
-    222,237,236,208,225,226,227,228,229,196,197,202,195, 64,193, 70,
-     71, 71,186,165,164,167,150,162,144,156, 93, 82, 83, 80, 83,252,
-    253,254,255,  0,  1,  2,  3,  4,  5,  6,  7,  8,  9, 10, 11,  4,
-    133,134,135,152,187, 56, 51,130, 67, 64,  1,190,191,140, 66, 89,
-     72,116,181,138,139,136,129,  4,  5, 38, 39, 40, 41, 21, 56,125,
-     42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 54, 23, 20, 21, 26,179,
-     58, 25,166, 91, 88, 41, 38,231,231, 42, 17, 16, 28,237,226,227,
-    224,225,228,205,206, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89,
-    150,151,212,213,214,215,232,203, 64, 67,242, 51, 60,113,206,207,
-    207, 49, 57, 56, 56,197,218,219,216,217,220,119,116,119,120,121,
-    122,123,124,125,126,127,128,129,128,161,166,167,164,165,170,163,
-    168,161, 22,235,232, 41,246, 55,  7,246, 61,192,195, 61, 50, 51,
-     48, 49, 54, 55,158,159, 40,169, 34,163,164,165,166, 21, 57,125,
-    167,168,169, 34, 35, 36, 37, 38, 39, 58, 57,144,153, 46, 31, 28,
-    226,237,236,239,221,218,216,235,213,106,107,104,105,110,103,230,
-    231,202,201,234,203,236,237,204,236,242,243,240,241,246,247,244,
-    245,242,217,240,249, 69, 75,116, 69,117,136,183,134, 77,176,115,
-    189, 66, 67, 64, 65, 70, 71, 68, 79,120,241,242,251,252,117,126,
-    127,112,113,114,115,116,117, 84, 85,168,137, 40, 41,174, 96, 95,
-    173,146, 96, 95, 52, 49, 51, 55, 43,194,243,192,241,254,255,255,
-    253,250,251,248,249,198,199,199,249,  8,167, 39,254, 20,  0,105,
-     58, 37, 36, 39, 38, 33, 32, 35, 34, 45, 44, 47, 46, 41, 40, 43,
-     42,213,212,215,214,209,208,211,210,221,220,223,222,217,216,219,
-    218,197,196,199,198,193,192,195,253, 52,153,191,  2,  5,200,203,
-      6, 57, 56, 59, 58, 61, 60, 63, 62, 61, 48,243, 50, 53, 52, 55,
-     54, 41, 40, 43, 42, 45, 44, 47, 46, 33, 32, 35, 34, 37, 36, 39,
-    229,108,193,135,149,146,163,144,162,174,175,172,174,170,171,168,
-    169,181,183,180,181,178,176,176,177,142,191,188,189,186,187,187,
-    185,134,135,132,133,130,131,131,189, 68,235,107,178, 33,160,125,
-    238,233,232,235,234,149,148,151,150,145,144,147,146,157,156,159,
-    158,153,152,155,154,133,132,135,134,129,128,131,130,141,140,143,
-    142,137,136,139,138,181,180,183,182,177,176,179,178,189,188,191,
-    190,185,184,187,186,165,164,167,166,161,160,163,162,173,172,175,
-    174,169,168,171,170, 85, 84, 87, 86, 81, 80, 83, 93,162,163,139,
-     94, 89, 88, 91, 90, 69, 68, 71, 70, 65, 64, 67, 66, 77, 76, 79,
-     78, 73, 72, 75, 74,117,116,119,118,113,112,115,114,125,124,127,
-    126,121,120,123, 69,154, 49, 51,102, 97, 96, 99, 98, 25, 60,125,
-    109,108,111,110,105,104,107,106, 21, 20, 23, 22, 17, 16, 19, 18,
-     29, 28, 31, 30, 25, 24, 27, 26,  5,  4,  7,  6,  1,  0,  3,253,
-    242, 89,151, 14,  9,  8, 11, 10, 53, 52, 55, 54, 49, 48, 51, 50,
-     61, 60, 63, 62, 57, 56, 59, 58, 37, 36, 39, 38, 33, 32, 35, 34,
-     45, 44, 47, 46, 41, 36, 43,213,136,130,179,214,209,208,211,210,
-    221,220,223,222,217,216,219,218,197,196,199,198,193,192,195,194,
-    205,204,207,206,201,200,203,202,245,244,247,246,241,240,240,  7,
-    160,165,103,254,249,248,251,250,229,228,231,230,225, 25, 61,125,
-    224,227,226,237,236,239,238,233,232,235,234,149,148,151,150,145,
-    144,147,146,157,156,159,158,153,168,152,207,208,210,227,134,129,
-    128,131,130,141,140,143,142,137,136,139,138,181,180,183,182,177,
-    176,179,178,189,188,191,190,185,184,187,186,165,164,167,166,161,
-    160,175, 55,248, 53, 55,174,169,168,171,170, 85, 84, 87, 86, 81,
-     80, 83, 82, 93, 92, 95, 94, 89, 88, 91, 90, 69, 68, 71, 70, 65,
-     64, 67, 66, 77, 76, 79, 78, 73,136,119, 44, 35, 18, 31,118,113,
-    112,115,114,125,124,127,126,121,120,123,122,101,100, 25, 62,125,
-    103,102, 97, 96, 99, 98,109,108,111,110,105,104,107,106, 21, 20,
-     23, 22, 18, 16, 35,139,136,133,187, 30, 25, 24, 27, 26,  5,  4,
-      7,  6,  1,  0,  3,  2, 13, 12, 15, 14,  9,  8, 11, 10, 53, 52,
-     55, 54, 49, 48, 51, 50, 61, 60, 63, 62, 58, 56, 52, 28,115, 66,
-    191, 38, 33, 32, 35, 34, 45, 44, 47, 46, 41, 40, 43, 42,213,212,
-    215,214,209,208,211,210,221,220,223,222,217,216,219,218,197,196,
-    199,198,194,192,192,235, 84, 86,167,206,201,200,203,202,245,244,
-    247,246,241,240,243,242,253,252,255,254,249,248,251, 25, 63,125,
-    250,229,228,231,230,225,224,227,226,237,236,239,238,214,235, 43,
-    192,243,242, 51,150,145,144,147,146,157,156,159,158,153,152,155,
-    154,133,132,135,134,129,128,131,130,141,140,165,142,137,136,139,
-    138,181,180,183,182,141,179,112,104, 39, 22,215,190,185,184,187,
-    186,165,164,167,166,161,160,163,162,173,172,175,174,169,168,171,
-    170, 85, 86,253,246, 81, 80, 83, 82, 93, 92, 95, 94,106, 87,167,
-    160, 35, 46,223, 70, 65, 64, 67, 66, 77, 76, 79, 78, 73, 72, 75,
-     74,117,116,119,118,113,112,115,114,125,131,149,150, 25, 64,125,
-    121,120,123,122,101,100,103,102,145, 95,147,152,196,202,199,110,
-    105,104,107,106, 21, 20, 23, 22, 17, 16, 19, 18, 29, 28, 31, 30,
-     25, 24, 27, 26, 15,174,249,172,129,  0,  3,  2, 13, 12, 15, 14,
-    201,247,251, 16,147,157,159, 54, 49, 48, 51, 50, 61, 60, 63, 62,
-     57, 56, 59, 58, 37, 36, 39, 38, 33, 32, 41,136,135,134,133,132,
-    137, 40, 43, 42,213,212,215,214, 17, 47, 35,232,119,182,119,222,
-    217,216,219,218,197,196,199,198,193,192,195,194,205,204,207,206,
-    201,200,158,160, 95, 94, 93, 92, 81,240,243,242,253, 25, 65,125,
-    252,255,253, 58,  7,  7,192, 79, 78, 79,230,225,224,227,226,237,
-    236,239,238,233,232,235,234,149,148,151,150,145,154, 10,199,203,
-     54, 53, 52, 49,152,155,154,133,132,135, 69, 66,127,127,184, 39,
-     38, 39,142,137,136,139,138,181,180,183,182,177,176,179,178,189,
-    188,191,190,185, 66, 17,208,  0,206, 13, 12, 11,160,163,162,173,
-    172,175, 97,166, 87, 84,144,207,254,255, 86, 81, 80, 83, 82, 93,
-     92, 95, 94, 89, 88, 91, 90, 69, 68, 71, 70, 66,234,233,232,228,
-     26,229,228,227,200, 75, 74,117,116,119,121,190,143, 25, 66,125,
-    140,103, 39,214,215,126,121,120,123,122,101,100,103,102, 97, 96,
-     99, 98,109,108,111,110,107,194,193,192,191,129,189,188,187,144,
-     19, 18, 29, 28, 31,221,214,231,231,  3, 83,110,175,  6,  1,  0,
-      3,  2, 13, 12, 15, 14,  9,  8, 11, 10, 53, 52, 55, 54, 63,154,
-    153,152,151,153, 85,148,147,152, 59, 58, 37, 36, 39,229, 30,223,
-    226, 72,120,122,135, 46, 41, 40, 43, 42,213,212,215,214,209,208,
-    211,210,221,220,223,222,243,114,113,112,111,109,157,108,107,104,
-    195,194,205,204,204,205,246, 55,193, 99,160,161, 95, 25, 67,125,
-    246,241,240,243,242,253,252,255,254,249,248,251,250,229,228,231,
-    230,203, 74, 73, 72, 71, 70,122, 68, 67, 64,235,234,149,148,148,
-    150,174, 96,249, 59,200,154, 55, 74,153,152,155,154,133,132,135,
-    134,129,128,131,130,141,140,143,140, 35, 34, 34, 32, 31, 30, 34,
-    236, 27, 24,179,178,189,188,188,190,134,117, 17, 47,250,105, 15,
-    143,225,160,163,162,173,172,175,174,169,168,171,170, 85, 84, 87,
-     84,248,250,246,248,247,246,245, 11,243,242, 91, 90, 69, 68, 72,
-     70,190,118,233, 23, 61,189,231,100, 29, 72, 75, 74, 25, 68,125,
-    117,116,119,118,113,112,115,114,125,124,127,116,208,210,238,208,
-    207,206,205,195, 11,202,163, 98,109,108, 99,110,150,178,194, 63,
-     85,103,127, 60,184, 16, 19, 18, 29, 28, 31, 30, 25, 24, 27, 26,
-      5,  4,  7, 12,168,170,150,168,167,166,165,164, 95,162,219, 10,
-     53, 52, 59, 54,206,234,150,103,113,  3,103, 20,147,104, 59, 58,
-     37, 36, 39, 38, 33, 32, 35, 34, 45, 44, 47,  4,128, 66,190,128,
-    127,126,125,124,119,122,111,210,221,220,211,221, 37, 50,126,143,
-    185,216, 31,236,107, 85,195,194,205,204,207,206,201, 25, 69,125,
-    200,203,202,245,244,247, 92, 84,154, 86,152, 87, 86, 85, 84, 83,
-     82, 76,250,229,228,235,229, 17, 58,118,183,152,217,247,196, 67,
-     66,171,234,149,148,151,150,145,144,147,146,157,156,159, 52, 60,
-    194, 50,240, 47, 46, 45, 44, 43, 42, 44,130,141,140,131,129,121,
-     93,222,223,236,141,175,172, 27, 26, 25, 50,189,233,234,232, 19,
-     18,187,186,165,164,169, 12,  8,122, 10,200,  7,  6,  5,  4,  3,
-      2,  0,170, 85, 84, 91, 89,145,134,  6,  7,197, 81, 23, 68,243,
-    242,254, 12,239,238,237,236,235,234,233,232,205, 76, 25, 70,125,
-    177,228,224,146,226, 16,223,222,221,220,219,218,216, 50,125,124,
-    112,113,134,165,238, 47, 61,106,239,112,203,197, 54,200,199,198,
-    197,196,195,194,193,192,176,189,109,188,184,202,185, 72,183,182,
-    181,180,179,178,176,218,  5,  4, 56,201,254, 95,150, 87,105, 13,
-    167, 24,172, 94,161,160,159,158,157,156,155,154,153,152,148,101,
-    106,148,144,226,145,108,143,142,141,140,138,222,136,226, 45, 44,
-     35, 17, 92,127,190, 79,140,213,115,195, 71,122,121,120,119,118,
-    117,116,115,114,113,112,111, 94,173,172,107,182,105, 25, 71,125,
-    148,103,102,101,100,118, 55, 97, 10,245,247,196,201,204,167, 86,
-    167,164, 97, 91,235, 83, 82, 81, 80, 79, 78, 77, 76, 75, 74, 73,
-     72, 71,122, 69,120, 67,158, 65,124, 63, 62, 61, 60, 36, 47,121,
-     98,157,159,172,161, 86, 79, 50,207,220,229,219,147,235, 42, 41,
-     40, 39, 38, 37, 36, 35, 34, 33, 32, 31, 34, 18, 80, 27,198, 25,
-     36, 23, 22, 21, 20,236,239, 65, 74,165,167,148,153, 98,245,202,
-    247,248,253, 83,187,195,  2,  1,  0,255,254,253,252,251,250,249,
-    248,247,249, 10,184,243,206,241,255,239,238,237,236, 25, 72,125,
-     20, 37,185,190, 77, 79,191,177, 25, 29, 46, 31, 32, 33, 11, 99,
-     43,218,217,216,215,214,213,212,211,210,209,208,207,253, 50,131,
-    203,253,201,199,199,198,197,196, 60, 61, 21,214, 21, 23,215,233,
-     65,197, 70, 71, 72,118, 99, 11, 67,178,177,176,175,174,173,172,
-    171,170,169,168,167,166, 88,167, 99,149,161,175,159,158,157,156,
-    100,101,110, 78, 61, 63,255,193,173, 45,110,111,112, 78,123, 51,
-    119,138,137,136,135,134,133,132,131,130,142, 64,127,126, 73,124,
-     75, 77,121,123,183,118,117,116,140,142,140,142,197, 25, 73,125,
-    199,  7, 57, 36,245,150,151,155,101, 83,219,156, 98, 97, 96, 95,
-     94, 93, 92, 91, 90, 89,103,151, 86, 97,107,163, 95,145, 83,143,
-     78, 77, 76,116,181,180,183,237,239,236, 17,188,221,190,191,195,
-     50,203,131,196, 58, 57, 56, 55, 54, 53, 52, 51, 50, 49, 48, 19,
-     46, 33,209,219, 39,233, 40,231, 38, 37, 36, 28,221,222,255,245,
-    183,116, 67,104,  5,230,231,232, 37, 35,171,236,210, 17, 19,240,
-     14, 13, 12, 11, 10,  9,  8,  4,250, 10,209,211, 15,241,  0, 15,
-    254,253,252,244,  5,  6,  7, 29, 95,156,167, 44,213, 25, 74,125,
-     14, 15, 19, 34, 27, 83, 20, 42,233, 23,231,230,229,228,227,226,
-    225,224,223,221, 34, 11,139,213,169,216,231,214,213,212,220, 45,
-     46,165,117, 84, 84,188,244, 13, 54, 55, 52, 57, 51,123, 60,  2,
-    193,192,191,190,189,188,187,186,185,184,183,182,138, 65,228,189,
-    193,176,159,174,173,172,168, 85, 86, 85, 93,  0, 12, 84,156,103,
-     94, 95,108, 97,107, 35,100,106,153,152,151,150,149,148,147,146,
-    145,144,143,142,141,124,202,137,245,136,135,134,133,132,128,125,
-    126, 93,  1,215,212,128,116,129,134,135,139,137,139, 25, 75,125,
-    203,140,130,113,112,111,109,146,147,107,106,105,151,155,102,101,
-    148, 98, 97, 61, 96, 95, 94, 93, 92, 88,165,166,165,  9,255,252,
-    168, 92,173,174,175,176,177,179,243,180,182, 73, 72, 68,186, 74,
-    187,188,189,190,188, 60,254, 61, 15,250, 57,102, 56, 55, 54, 53,
-     52, 51,205,206,205,113,132, 68,243,232,213,214,215,216,217,219,
-    155,220,222, 33, 32,224,226, 29, 19,228,230, 25, 24, 23, 42, 21,
-    235,210, 18,198, 16, 15, 14, 13, 12, 11,245,246,251, 81,175,172,
-     91,240,253,254,255,  0,  1, 11, 67,  4,  6,249,247, 25, 76,125,
-      8, 54,245,244,252,242,241,240,239,238,238, 19, 40, 42, 62, 40,
-    231,230,229,228,227, 29, 30, 31, 10,119,180,163, 40, 37, 38, 39,
-     40, 41, 35,107, 44, 45,210, 47,207,206,205,204,203,202,201,200,
-    199,198,197,203,195,130,246,  0,191,190,189,188,187,133, 70, 71,
-     74,224, 44,235, 76, 77, 78, 79, 80, 81, 91, 19, 84, 85,169,168,
-    167,166,165,164,163,162,161,160,159,158,157,159,151, 90,172, 88,
-    151,150,149,148,147,157,110,111,122,219,231,243,116,117,118,119,
-    120,121, 83, 59,124,125, 65,128,127,126,125,124,123, 25, 77,125,
-    122,121,120,119,118,117,119,140, 66, 76,128,111,110,109,108,107,
-    105,150,151,154, 51, 63, 27,156,157,158,159,160,161,139,227,164,
-    165,153, 88, 87, 86, 85, 84, 83, 82, 81, 80, 79, 78, 77, 79,188,
-    186, 68, 56, 71, 70, 69, 68, 67, 66,190,191,192,203,107, 99,196,
-    197,198,199,200,201, 99,139,204,205,193, 48, 47, 46, 45, 44, 40,
-    213,217, 40, 39, 38, 37, 36,254, 82, 44, 80, 31, 30, 29, 28, 27,
-     26, 38,231,232,235, 67, 99,236,237,238,239,240,241, 91,179,244,
-    245,249,  8,  7,249,250,251,255,  2, 14,252,240, 14, 25, 78,125,
-    253,255, 14,198,250,132,247,246,245,244,243,242,206, 15, 16, 19,
-    187,177, 20, 21, 22, 23, 24, 25,179, 91, 28, 29, 29,224, 32, 34,
-    221,220,219,218,217,219, 39,217, 37,219, 39,206,210, 12,207,206,
-    205,204,203,202,198, 55, 56, 57,144,153,188, 61, 62, 63, 64, 65,
-    235,  3, 68, 69,101,183, 75,182,181,180,179,178,177,176,175,174,
-    173,172,155,154,169,116,167,166,165,164,163,162,162, 95, 96, 97,
-    200, 43,100,101,102,103,104,107,195, 43,108,109, 68, 92,143,142,
-    141,140,139,138,137,136,135,134,133,132,176,114,129, 25, 79,125,
-     95,127,126,125,124,123,122,122,135,136,169, 32,195,140,141,142,
-    143,144,147, 59,211,148,149,131,168,103,102,101,100, 99, 98, 97,
-     96, 95, 94, 93, 92,100,138, 89,143, 87, 86, 85, 84, 83, 82, 82,
-    175,176,187, 24, 33,180,181,182,183,184,179, 51,251,188,189,155,
-    176, 63, 62, 61, 60, 59, 58, 57, 56, 55, 54, 53, 52, 60,206, 49,
-    199, 47, 46, 45, 44, 43, 42, 41,215,216,217,112,125,220,221,222,
-    223,224,203,107,163,228,229,195,168, 23, 22, 21, 20, 19, 18, 17,
-     16, 15, 14, 13, 12,  4,253,  9, 61,199,  6,  5,  4, 25, 80,125,
-      3,  2,  1,255,  0,  1,  2, 42,132,  5,  6,  7,  8,163,  3, 75,
-     12, 13,104, 80,239,238,237,236,235,234,233,232,231,230,229,228,
-    224, 47,225,213, 31,222,221,220,219,218,217,215, 40, 41, 42, 41,
-    108, 45, 46, 47, 48,153, 51,115, 52, 53,144,100,199,198,197,196,
-    195,194,193,192,191,190,189,188,184,191,185,141,119,182,181,180,
-    179,178,177,191, 80, 81, 82, 83, 68, 85, 86, 87, 88,217, 83, 27,
-     92, 93, 56,252,159,158,157,156,155,154,153,152,151,150,149,148,
-    144,159,145,165,127,142,141,140,139,138,137,139, 72, 25, 81,125,
-    121,122,123,118,125,126,127,130,129, 11,227,132,133, 19, 47,119,
-    118,117,116,115,114,113,112,111,110,109,108,104,153,105, 85,151,
-    102,101,100, 99, 98, 97, 96,160,163,162,163,164, 37,166,167,170,
-    191,131,235,172,173, 59, 55,143, 78, 77, 76, 75, 74, 73, 72, 71,
-     70, 69, 68, 67,177, 65, 77, 67, 62, 61, 60, 59, 58, 57, 56, 56,
-    201,250,203,204,237,206,207,208,213,123,179,212,215, 76,179, 39,
-     38, 37, 36, 35, 34, 33, 32, 31, 30, 29, 28, 27,233, 25, 21,107,
-     22, 21, 20, 19, 18, 17, 16,  0,241,126,243,244,245, 25, 82,125,
-    246,247,248, 92, 83,179,252,251,105, 99, 15,254,241,252,251,250,
-    249,248,247,246,245,244,243,  5,241,253,179,238,237,236,235,234,
-    233,232,228,217, 58, 27, 28, 29, 30, 31, 34,180,119, 67, 36, 35,
-    179,187, 39,214,217,212,211,210,209,208,207,206,205,204,203, 61,
-    137,197,155,198,197,196,195,194,193,192,191, 65, 77, 67, 68, 69,
-     70, 71,130,220, 31,  3, 76, 75, 23,235, 83,174,162,172,171,170,
-    169,168,167,166,165,167, 96, 94, 97,173,227,158,157,156,155,154,
-    153,152,151,169, 98,107,108,109,110,111, 89, 36, 39, 25, 83,125,
-     19,116,127, 44,195,123,134,134,132,131,130,129,128,127,126,125,
-    124, 68,142, 41,119, 11,118,117,116,115,114,113,112,111, 93,144,
-    111,148,149,150,151, 62,204, 15,243,156,148,197,235,160,158, 94,
-    156, 91, 90, 89, 88, 87, 86, 85, 84, 83,162, 97, 83,191, 78, 77,
-     76, 75, 74, 73, 72, 71, 73,186,184,176,125,190,189, 86, 87, 87,
-    161,196,204,144,115,200,246, 54,244, 51, 50, 49, 48, 47, 46, 45,
-     44, 43, 22, 25, 43,231, 38, 37, 36, 35, 34, 33, 32, 31, 30, 34,
-    108,215,229,230,237,189, 67,191,131,236,244,136, 59, 25, 84,125,
-    240,222, 13,252, 11, 10,  9,  8,  7,  6,  5,  4,  3, 61,205, 15,
-     63,254,253,252,251,250,249,248,247,245, 10, 11,  0,205, 14,  6,
-    133, 68, 71,121, 20,124,123,199, 24, 18,229, 20,227,226,225,224,
-    223,222,221,220,219,231,157,215,215,214,213,212,211,210,209,208,
-    207,206,242, 51, 52, 58, 54,145,157, 96,111, 83,188, 84, 84,239,
-     64, 75,189,128,187,186,185,184,183,182,181,180,179,130,133,188,
-    175,174,173,172,171,170,169,168,167,166,106,123, 92,109, 94,202,
-      9, 52, 55,  9, 68,192, 60,183,104,107,149,168,147, 25, 85,125,
-    146,145,144,143,142,141,140,139,186,121,136,135,134,133,132,131,
-    130,129,128,127,126,126,131,132,133,134,210,209,208,223,225, 12,
-     40, 41,223,144,147, 45, 80,107,106,105,104,103,102,101,100, 99,
-    110, 17, 96, 95, 94, 93, 92, 91, 90, 89, 88, 87, 86, 84,163,172,
-    173,174,250,233,216,231,217, 21, 32, 13,247,184,185,  5,123, 67,
-     66, 65, 64, 63, 62,  1, 60, 59, 54, 37, 56, 55, 54, 53, 52, 51,
-     50, 49, 48, 47, 46, 45, 19,212,217,215,130,129,188,143,177, 70,
-     72,165,159,224,225, 77, 19, 27, 26, 25, 24, 23, 22, 25, 86,125,
-    213, 20, 19, 30, 21, 16, 15, 14, 13, 12, 11, 10,  9,  8,  7,  6,
-      5,  9,252,254,255,154,102,100, 87,105, 30, 83,107, 71,  8,  9,
-     33,251,243,242,241,240,239,238, 45,236,235,229,174,232,231,230,
-    229,228,227,226,225,224,223,222,221,220, 36, 37, 39, 78,130,124,
-    127, 65, 54,118,131, 47, 48, 49, 25,195, 11,202,201,200,199,198,
-      5,196,195,205,134,192,191,190,189,188,187,186,185,184,183,182,
-    181,180,140,125, 79, 21,197,  4,  7, 57, 77,  3, 11, 87, 88, 89,
-    113,167, 99,162,161,160,159,157,157,156,155,151,222, 25, 87,125,
-    152,151,150,149,148,147,146,145,144,143,142,141,140,139, 73,119,
-     34, 45, 44, 47, 19, 21, 27,203,127,128,129,169,127,187,122,121,
-    119,139,117,117,116,115,127, 61,176,111,110,109,108,107,106,105,
-    104,103,102,101,100, 96,103,107,202,245,244,247,193,  1,204,210,
-    167,168,169,128, 87,147, 82, 81, 96, 76, 66, 77, 76, 75, 69, 57,
-    136, 71, 70, 69, 68, 67, 66, 65, 64, 63, 62, 61, 60, 59, 59,115,
-    146,157,156,159,161, 89,163, 26,207,208,209,248, 44,219, 42, 42,
-    232, 39,214, 37, 36, 35, 46,209,224, 31, 30, 29, 28, 25, 88,125,
-     27, 26, 25, 24, 23, 22, 21, 20, 19, 18, 67,186,165,164,167,177,
-     97,155, 34,247,248,249,208,  4,243,  2, 13,  0,255,254,253,252,
-    251,249,202,248,247,246,245,244,243,242,241,240,239,238,237,236,
-    231,234,255, 66, 77, 76, 79,113,138,134,206, 31, 32, 33,  8,156,
-     43,213,137,216,215,214,213,212,211,209,226,208,207,206,205,204,
-    203,202,201,200,199,198,197,196,204,194,196,106, 21, 20, 23, 41,
-     18,146, 22, 71, 72, 73, 96,244, 76, 71,241,176,175,174,173,172,
-    171,169,106,168,167,102,165,164,163,162,161,160,159, 25, 89,125,
-    158,157,160,103,154,153,242, 61, 60, 63,  1, 58,134, 46,111,112,
-    113, 88,220,116, 94,137,136,135,134,133,132,131,129, 64,128,124,
-    190,125,124,123,122,121,120,119,118,117,180,143,114,113, 90,197,
-    196,199,198,254, 40,214,151,152,153, 48, 51,156, 50, 97, 96, 95,
-     94, 93, 92, 91, 89,148, 88, 88,150, 85, 84, 83, 82, 81, 80, 79,
-     78, 78, 76,183, 74, 73, 82,237,236,239,238,209, 16,190,191,192,
-    193,104,107,198,122, 57, 56, 55, 54, 53, 52, 51, 49,253, 48, 32,
-    238, 45, 44, 43, 42, 41, 40, 39, 38, 41, 39,223, 34, 25, 90,125,
-     33, 42,181,180,183,182,137,136,230,231,232,233, 64, 81, 70, 82,
-     17, 16, 15, 14, 13, 12, 11,  9,205,  8,  8,  6,  5,  4,  3,  2,
-      1,  0,255,254,205,255, 11,250,249,242, 93, 92, 95, 93,102,120,
-     14, 15, 16, 17,184,237,190,234,233,232,231,230,229,228,227,225,
-    226, 32,224,222,221,220,219,218,217,216,215,214, 21,215, 35,210,
-    210,218,101,100,103,101,174,129, 54, 55, 56, 57,144,197,151,194,
-    193,192,191,190,189,188,187,186,121,120,136,182,181,180,179,178,
-    177,176,175,173,109,175, 91,170,170,174, 13, 12, 15, 25, 91,125,
-     13,138,137, 94, 95, 96, 99,237,157,203,154,153,152,151,150,149,
-    148,147,146, 97, 96,179,142,141,140,139,138,137,136,135,137,133,
-    132,115,130,142,130,213,212,215,229,111,213,134,135,136,139, 53,
-    116,115,114,113,112,111,110,109,108,107,106,149,168,155,102,101,
-    100, 99, 98, 97, 96, 95,110, 93, 92,171, 90, 86, 90,253,252,255,
-    194, 23,229,174,175,176,179,141, 76, 75, 74, 73, 72, 71, 70, 69,
-     68, 67, 66,189,128,195, 62, 61, 60, 59, 58, 57, 56, 55,246, 53,
-     52,207, 50, 12, 50,133,132,135,186,185,181,214,215, 25, 92,125,
-    216,209, 37, 36, 35, 34, 33, 32, 31, 30, 29, 28, 27, 26,229,216,
-    231, 22, 21, 20, 19, 18, 17, 16, 12,206, 13, 12, 55, 10, 52, 10,
-    173,172,175,149,145,125,254,255,  0,138,253,252,251,250,249,248,
-    247,246,245,244,243,242, 13,179, 31,238,237,236,235,234,233,232,
-    235,230,229,228,223,226, 28,226,117,116,119, 77,145,  5, 38, 39,
-     42, 22,213,212,211,210,209,208,207,206,205,204,203,202, 53,187,
-     55,198,197,196,195,194,193,192,179,190,189,188,135,185, 76,184,
-     29, 28, 31, 16,250,205, 78, 79, 88,238,173,172,171, 25, 93,125,
-    170,169,168,167,166,165,164,163,162, 81,147,111,158,157,156,155,
-    154,153,152,167,150,149,148,156,145,100,144, 37, 36, 39, 40,162,
-    221,118,119, 83,185,133,132,131,130,129,128,127,126,125,124,123,
-    122,185, 75,183,118,117,116,115,114,113,112, 95,110,109,108,100,
-    105,188, 40,205,204,207,253,198, 29,158,157,139, 94, 93, 92, 91,
-     90, 89, 88, 87, 86, 85, 84, 83, 81, 81, 79,143, 78, 77, 76, 75,
-     74, 73, 72,135, 70, 69, 68, 76, 65,148,  0,213,148,151,172,174,
-    109,198,229,103, 54, 53, 52, 51, 50, 49, 48, 47, 46, 25, 94,125,
-     45, 44, 43, 41, 21, 55,231, 38, 37, 36, 35, 34, 33, 35, 31, 30,
-     29, 28, 20, 25,204, 88,253,188,191,150, 70, 79,206,101, 79, 14,
-     13, 12, 11, 10,  9,  8,  7,  6,  5,  4,  3,  1,254, 15,255,254,
-    253,252,251,250,201,251,247,246,245,244,240,241, 36,176,  5, 68,
-     71, 69,190,189,158,188,231,230,229,228,227,226,225,224,223,222,
-    221,220,219,217, 38, 23,215,214,213,212,211,210,237,220,207,206,
-    205,204,200,201, 60,136, 61,108,111, 97,150,151,148,144,191,190,
-    189,188,187,186,185,184,183,182,181,180,179,177, 78, 25, 95,125,
-    255,175,174,173,172,171,170,150,148,167,166,165,164,160,161, 92,
-    224,101, 52, 55,  9,206,207,204,152,151,150,149,148,147,146,145,
-    144,143,142,141,140,139,137,118, 68,135,134,133,132,131,130,142,
-    112,127,126,125,124,123,121,132, 56,141,220,223,209, 38, 39, 37,
-    112,111,110,109,108,107,106,105,104,103,102,101,100, 99, 97,158,
-     92, 95, 94, 93, 92, 91, 90, 86,168, 87, 86, 85, 84, 83, 82,172,
-      0,113,228,231,233, 30, 26,121,132, 71, 70, 69, 68, 67, 66, 65,
-     64, 63, 62, 61, 60, 59, 57, 54,  4, 55, 54, 53, 52, 25, 96,125,
-     51, 50, 62,240, 47, 46, 45, 44, 43, 42,212,120, 25,140,143,142,
-    118, 34, 33, 32, 31, 30, 29, 28, 27, 26, 25, 24, 23, 22, 21, 20,
-     19, 30, 17, 44, 15, 14, 13, 12, 11, 10,  6,200,  7,  6,  5,  4,
-      3,  2,252, 80,193, 84, 87, 86, 91,250,249,248,247,246,245,244,
-    243,242,241,240,239,238,237,236,235,230, 25,212,231,230,229,228,
-    227,226,226, 32,223,222,221,220,219,218, 36,136,232,124,127, 84,
-    211,210,209,208,207,206,205,204,203,202,201,200,199,198,197,196,
-    195,205, 61, 48,191,190,189,188,187,186,186,184,183, 25, 97,125,
-    182,181,180,179,178, 76,224,160,  4,  7, 44,171,170,169,168,167,
-    166,165,164,163,162,161,160,159,158,157,156,155,149, 69,232,151,
-    150,149,148,147,146,146,144,143,142,141,140,139,138,180,216,136,
-     44, 47,  4,131,130,129,128,127,126,125,124,123,122,121,120,119,
-    118,117,116,115,125, 45,  0,111,110,109,108,107,106,106,104,103,
-    102,101,100, 99, 98, 92, 48, 80,244,247,220, 91, 90, 89, 88, 87,
-     86, 85, 84, 83, 82, 81, 80, 79, 78, 77, 76,123, 71, 22, 56, 71,
-     70, 69, 68, 67, 66, 78, 64, 63, 62, 61, 60, 59, 58, 25, 98,125,
-      4,104, 56,156,159,180, 51, 50, 49, 48, 47, 46, 45, 44, 43, 42,
-     41, 40, 39, 38, 37, 36, 19, 46, 96,224, 31, 30, 29, 28, 27, 26,
-     21, 24, 23, 22, 21, 20, 19, 18, 44, 64,  0,164,167,140, 11, 10,
-      9,  8,  7,  6,  5,  4,  3,  2,  1,  0,255,254,253,252,203,202,
-    248, 56,247,246,245,244,243,242,253,240,239,238,237,236,235,234,
-    212,184,232, 76, 79,100,227,226,225,224,223,222,221,220,219,218,
-    217,216,215,214,213,212,227,226,220, 16,207,206,205,204,203,202,
-    197,200,199,198,197,196,195,194,244,144,188, 20, 23, 25, 99,125,
-     60,187,186,185,184,183,182,181,180,179,178,177,176,175,174,173,
-    172,155,153,100,168,167,166,165,164,163,162,145,160,159,158,157,
-    156,155,154,172,216,148, 60, 63, 20,147,146,145,144,143,142,141,
-    140,139,138,137,136,135,134,133,132,179,189, 76,128,127,126,125,
-    124,123,122, 73,120,119,118,117,116,115,114,132, 48,108,196,199,
-    236,107,106,105,104,103,102,101,100, 99, 98, 97, 96, 95, 94, 93,
-     92,107,101,148, 88, 87, 86, 85, 84, 83, 82,161, 80, 79, 78, 77,
-     76, 75, 74,188,  8, 68,236,239,196, 67, 66, 65, 64, 25,100,125,
-     63, 62, 61, 60, 59, 58, 57, 56, 55, 54, 53, 52,195, 13,252, 48,
-     47, 46, 45, 44, 43, 41,233, 40, 39, 38, 37, 36, 35, 34,212, 96,
-     28,180,183,156, 27, 26, 25, 24, 23, 22, 21, 20, 19, 18, 17, 16,
-     15, 14, 13, 12,203, 57,196,  8,  7,  6,  5,  4,  3, 61,193,  0,
-    255,254,253,252,251,250, 12,184,244, 92, 95,116,243,242,241,240,
-    239,238,237,236,235,234,233,232,231,230,229,228, 35,210, 20,224,
-    223,222,221,220,219, 37,217,216,215,214,213,212,211,210,  4,144,
-    204,100,103, 76,203,202,201,200,199,198,197,196,195, 25,101,125,
-    194,193,192,191,190,189,191,123,138,140,184,183,182,181,180,179,
-     69,177,176,175,174,173,172,171,170,124,168,164, 12, 15, 36,163,
-    162,161,160,159,158,157,156,155,154,153,152,151,150,149,151, 83,
-    162,101,144,143,142,141,140,136, 93,137,136,135,134,133, 68,131,
-    130, 85,128,125,212,215,252,123,122,121,120,119,118,117,116,115,
-    114,113,112,111,110,109, 99,171, 85,109,104,103,102,101,100, 92,
-     62, 97, 96, 95, 94,157,147,103,166,241,153,  6, 15, 63,212, 83,
-     82, 81, 80, 79, 78, 77, 76, 75, 74, 73, 72, 71, 70, 25,102,125,
-     69, 75,131,143,117, 64, 63, 62,  2,195,198,102, 57, 56, 55, 54,
-    202,248,  3,254,169,241, 62,119,119,172, 40,213,214, 40, 39, 38,
-     37, 36, 35, 34, 33, 32, 31, 30, 29, 19,219,223, 45, 24, 23, 21,
-    234,235,230, 78, 17, 16, 15, 14,193,195, 55,246,173,201, 86, 95,
-     95,132,252,253,  1,  0,255,254,253,252,251,250,249,248,247,246,
-    245, 11, 51, 55,229,240,239,209, 18, 19, 62,154,233,232,231,230,
-     41, 36,211, 46,121,177,206,135,183, 99, 36,218,217,216,215,214,
-    213,212,211,210,209,208,207,206,205, 51,203, 30, 29, 25,103,125,
-    200,199,249, 58, 57,150, 50,193,192,191,190,113,124,139,186,121,
-    184,181, 28, 31, 11, 79,178,177,176,175,174,173,172,171,170,169,
-    168,167,166,170, 91,163,126,177,160,159, 97, 98,105,204, 90,153,
-    152,151,150, 85, 84,163,145, 97,144,133, 36, 39, 51,119,138,137,
-    136,135,134,133,132,131,130,129,128,127,126,130,131,123,166, 73,
-    120,120,137,136, 33, 44,114,113,112,111,110,173,172,107,105,153,
-    104,109,204,207, 52, 49, 51, 55,187,113,112,115,114,125,124,127,
-    126,121,120,123, 69,154, 49, 51,102, 97, 96, 99, 98, 24,  0,105,
-      2,195,  2,  1,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  1,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-     66, 39,  0,  4,  0, 68, 79, 83, 32, 32, 32, 32, 32, 83, 89, 83,
-     66, 45,  0,130,  0, 79, 80, 80, 32, 32, 32, 32, 32, 32, 32, 32,
-     66, 45,  0, 85,  0, 84, 73, 84, 76, 69, 50, 32, 32, 32, 32, 32,
-     66,  9,  0,131,  0, 67, 65, 82, 68, 32, 32, 32, 32, 83, 69, 84,
-     66,142,  0, 43,  0, 83, 80, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     66, 45,  0, 13,  1, 79, 80, 49, 32, 32, 32, 32, 32, 51, 32, 32,
-     66, 45,  0, 59,  1, 79, 80, 50, 32, 32, 32, 32, 32, 49, 32, 32,
-     66, 45,  0,114,  1, 79, 80, 49, 32, 32, 32, 32, 32, 53, 32, 32,
-     66, 45,  0, 58,  1, 79, 80, 49, 32, 32, 32, 32, 32, 52, 32, 32,
-     66, 45,  0,206,  1, 79, 80, 49, 32, 32, 32, 32, 32, 50, 32, 32,
-     66, 45,  0,113,  1, 79, 80, 50, 32, 32, 32, 32, 32, 50, 32, 32,
-     66, 45,  0, 36,  2, 79, 80, 50, 32, 32, 32, 32, 32, 51, 32, 32,
-     66, 45,  0, 88,  2, 79, 80, 49, 32, 32, 32, 32, 32, 49, 32, 32,
-     66,  2,  0,134,  2, 68, 76, 73, 83, 84, 32, 32, 32, 66, 73, 78,
-     66, 45,  0, 81,  2, 79, 80, 50, 32, 32, 32, 32, 32, 52, 32, 32,
-     66,  2,  0,205,  2, 65, 85, 84, 79, 82, 85, 78, 32, 83, 89, 83,
-     66,  1,  0,251,  0, 79, 80, 78, 32, 32, 32, 32, 32, 32, 32, 32,
-     67,  0,  0,188,  2, 83, 80, 77, 32, 32, 32, 32, 32, 32, 32, 32,
-     66,  8,  0,189,  2, 67, 79, 77, 49, 32, 32, 32, 32, 32, 32, 32,
-     66,  8,  0,186,  2, 67, 79, 77, 50, 32, 32, 32, 32, 32, 32, 32,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-     35, 34, 45, 44, 47, 46, 41, 40, 43, 42,213,212,215,214,209,208,
-    211,210,221,220,223,222,217,216,219,218,197,196,199,198,193,192,
-    195,194,205,204,207,206,201,200,203,202,245,244,247,246,241,240,
-    243,242,253,252,255,254,249,248,251,250,229,228,231,230,225,224,
-    227,226,237,236,239,238,233,232,235,234,149,148,152,105,110, 68,
-    147,146,157,156,159,158,153,152,155,154,133,132,135,134,129,128,
-    131,130,141,140,143,142,137,136,139,138,181,180,183,182,177,176,
-    179,178,189,188,128, 65,236,236,187,186,165,164,167, 41,159,125,
-     75,204,205,206,207,208,132,135,134,129,128,131,130,141,140,143,
-    142,137,136,139,138,181,180,183,182,177,176,179,178,189,188,191,
-    190,185,184,187,186,165,164,167,153, 88,245,211,110, 97,172,175,
-     98,101,100,103,102,153,152,155,154,145,156, 95,158,145,144,147,
-    146,149,148,151,150,137,136,139,138,141,140,143,142,129,128,131,
-     65,176, 29, 91, 73,118, 71,116, 70, 66, 67, 64, 66, 78, 79, 76,
-     77, 73, 75, 72, 73, 86, 84, 84, 85, 98, 83, 80, 81, 94, 95, 95,
-     93, 90, 91, 88, 89, 38, 39, 39, 25,232, 71,199, 30, 29,115,125,
-    209,208, 31,222, 21, 20,215,218,  5,196,203,202,  1, 12, 15,  2,
-    193,192,195,194,201,196,199,198,249,248,251,122,253,252,255,254,
-    241,240,243, 49,220,108,203, 57, 37, 23, 23, 21, 18, 19, 16, 17,
-     29, 31, 47, 46, 26, 27, 43, 25,230,215,228,230,225,227,224,225,
-    238,223,236,189,234,235,232,233,246,247,247,201, 36,159,147,194,
-    193,192,195,206,201,196,203, 10,249, 52,247, 54,253,252,243,254,
-     49,252, 51, 50, 53,244, 55, 54, 41, 40, 43,142,237, 44, 47, 46,
-     33, 32, 35,225, 12,183, 59,234,150,148,164,165,145, 29,116,125,
-    144,147,146,173,156,159,174,169,152,168,154,134,132,183,182,178,
-    131,176,177,190,191,188,228,186,187,184,185,134,135,135,138, 84,
-    224,227,190,189,112,115,190,181,180,187,182,165,164,167,166,161,
-    160,175,174,109, 96,175, 98,101,104,103,102,149,152, 91, 60,157,
-    156,159,158,145,144,147, 98,188, 41,135,105,117,119,116,117, 65,
-     64, 67, 66, 77, 76, 76, 78, 73,120,123,121, 69,119, 71, 69, 65,
-    112, 64, 65, 78, 79, 79, 20,202, 75, 72, 73, 86, 87, 87, 91, 68,
-     19,247,110, 97, 96,163,174,101,104,107,106, 21, 20, 29,117,125,
-     23, 22, 29,208, 31, 30,209,208,223,210,217,212, 23,214,197,200,
-     11, 96,141,204,207,206,193,192,195, 51, 44,123, 98, 58, 53,  7,
-     52, 53,  1,  0,  3, 50, 61, 12, 60, 14, 57,  8, 59,  9, 21, 23,
-     23, 21, 34, 35, 32, 17, 46, 28, 28, 72,153, 27, 24, 25,230,231,
-    231,235,244,179,137,210, 29,208,211, 30, 21,216,215,214,  9,200,
-    203,  6,193,192,207, 14,  1, 12,207,  2,  5,  4, 11,  6, 57, 52,
-     58,144,125,252, 63, 62, 49, 48, 51,  3,204,161,145,138,213,231,
-    231,214,225,227,224,226,221,239,236,221,234,232,235, 29,118,125,
-    234,150,167,148,149,162,163,163,162,158,175,174,248, 42,171,168,
-    169,182,183,183,113,116,218,233,  2, 77,140,131, 78,133,136, 75,
-    138,117,180,187,118,177,188,179,126,125,188,179,126,185,116,119,
-    118,101,104, 98,192, 45,108,111,110, 97, 96, 99, 89,148,254, 49,
-     58,101,103,103, 86, 97, 83, 96, 82,109, 95, 92, 94, 89,107, 91,
-    106,118, 71, 68,117,114,115,112, 65,125,127,122, 40,250,123,120,
-    121, 70, 71, 71,130, 76, 37,213,226,125,112,115,190,121,184,123,
-    186,105,168,171,106, 97,108,111,174,161,160,163,162, 29,119,125,
-    165,100,167,166,217,216,210,112,157,220,223,222,209,208,211,234,
-     36, 77,178,186, 53,  4,  7, 54, 49,195,  3,  2, 62, 15, 15, 61,
-     10,  8, 11, 10,  6, 55,  4,  5, 50, 51,  0, 49, 13, 15, 10, 88,
-    186, 11,  8,  9, 22, 23, 23,210, 28,117, 74, 78,237, 44,239,226,
-    233, 40,235,234,217, 24, 27,218,209,208, 19, 30,209, 16, 19, 18,
-    217, 20, 23, 22,  5,  8,  2,160, 77, 12, 15, 14,  1,  0,  3, 57,
-    244,157,145,166,245,196,244,198,241,243,243,194,205,207,252,254,
-    249,251,251,202,214,231,212,229,209,227,208,226,222, 29,120,125,
-    220,218,132, 90,219,216,217,166,167,167, 74,228,197,202, 62, 93,
-    156,159, 82, 85, 88, 91,150, 69,136, 71,134, 65, 64,131, 78,129,
-    140,143,130, 69,136,135, 70,121,120,114,220, 61,124,127,126,113,
-    112,115,110,108,237,238,221,165,148,151,150,162,163,147,162,174,
-    156,175,158,170,171,171,153, 85,103, 84,101, 97, 80, 83, 81,110,
-    111,110,  4,106,107,104,105,118,119,119,182,148, 21, 25, 41,141,
-     76,143, 78,137,132, 75, 74,185,120,119,118,113,112,115,126,113,
-    176,115,114,181,180,183,182,169,104,170, 60,173,172, 29,121,125,
-    175,174,161,160,163,146,188, 13, 13,  1, 22, 36, 23, 22, 17, 16,
-     35, 17, 30, 28, 44, 45, 25, 27, 43, 26,  6, 55, 52, 53, 49, 48,
-     48, 49, 62, 60, 62,148, 58, 59, 56, 57,  6,  7,  7,246,228,101,
-     70,153,253, 60, 63,254, 57,244,251, 54,233, 40,231, 42,225, 44,
-    227, 34,237,224, 35, 34,233,228,231,230, 25, 24, 26, 76,221,220,
-     31, 30, 17, 16, 19, 29, 12,141,194,113,197,199,247,198,242,192,
-    240,194,205,204,252,206,249,200,203,201,197,244,196,245,241,192,
-    192,193,253,207,206,100,186,203,200,201,214,215,215, 29,122,125,
-     37,180,165,182, 72, 45, 32,239,238, 41, 36, 39,230, 87,152,155,
-    154, 93, 92,147,146, 93, 80, 83,158,153, 84, 87, 86,137, 72, 74,
-    252,205, 76, 79, 78, 65, 64, 67, 77,222,248,238, 32,118,180,183,
-    182,177,128,128,130,187,236,140,141,137,187,184,138,149,167,148,
-    165,145,144,147,161,158,159,154,213,249,155,152,153,102,103,103,
-    149,  4, 13, 57,200, 93,156, 83, 82,153,148,155, 91, 16, 18,231,
-    138,141, 76, 79, 78, 77,128,143, 66, 69, 68, 75,138,185,184,178,
-    143, 37,188,191,190,177,176,179,189, 44, 45, 45,224, 29,123,125,
-    165,100,100,101, 82, 80, 83, 52,196,198,199,110,105,107,107,106,
-     22, 39, 23, 37, 34, 19, 19, 18, 45, 47,  8,183,108, 43, 40, 41,
-     54, 55, 55,197, 84, 85,106,196,205, 12, 15, 14,201,200, 14,127,
-     95,158,157,182, 61, 60,255,242, 49,240, 63, 50,249, 56, 55,246,
-    229,232,242,143, 84,236,239,238,225,224,227,239,124,125, 79, 44,
-     21,231,215,230,225,211,196, 47,  7,118,117,126,217,219,235,217,
-    198,196,199,197,194,243,240,241,254,255,152,103,188,251,248,249,
-    198,199,199,247,164,165,175,228, 49,252,243,254, 57, 29,124,125,
-     52,228, 15,179, 78, 77, 78, 45,236, 35,238,237,236, 47,226,229,
-     40,231, 38, 85, 89,200, 55,228, 92, 95, 94, 81, 80, 83,157,204,
-    205,219,112, 69,135,135,133,177,131,252,127,248, 38, 37, 36,137,
-    139,136,138,133,132,135,182,130,131,128,130,190,141,232, 31,204,
-    139,136,137,150,151,151,165,244,245, 96,  8, 97,172,111,162,169,
-    101,212, 87, 35,254,253,252, 93, 80, 95, 82, 93,144, 83, 94, 85,
-    152, 91,150, 73,129, 24,231, 52,140,143,142,129,128,131, 77,156,
-     29, 70, 32, 53,116, 71, 69, 66,101,140,143, 43,214, 29,125,125,
-    213,219,249, 72, 75,121,101, 87, 84,102, 82, 99, 80, 82, 94, 89,
-     16,207, 28, 27, 88, 89, 38, 39, 39, 21, 68, 68, 38,168,109, 28,
-     31,210,216, 79,228,237,220,162,173,172,129,192, 15, 14,  1,192,
-     15, 14,  9,  8,199,  6,245,241,233,151,196,124,255,254,241,240,
-    243, 33, 76,171,237,211, 85, 36, 36, 12,132, 95,220,221, 91,134,
-    133,132, 74, 43, 40, 25,213,231,231,214,225,227,224,226,238,201,
-    161,127,172,171,232,233,246,247,247,229,148, 86,156, 27,177,204,
-      2, 87, 98, 55, 60,181,108, 94, 93,111, 81,240,243, 29,126,125,
-    254,241, 48,255,242, 53, 56, 55,246, 41,241, 25,119, 52,172, 47,
-     46, 33, 32, 35,113, 28,141,182,128,234,151,146,227,254,111,236,
-    101,199, 54, 53, 56, 57,152,171,169,134,180,135,134,177,131,176,
-    177,141,219,241, 15,126,251,184,185,134,135,135, 37,236,229,230,
-     24,194,188,120,235,198, 71, 68, 77,240, 14, 13, 12,193, 96,111,
-    174,161,108,111,162,165,100,103,102,150, 41,170,219,132, 28,159,
-    158,145,144, 83,205,172, 13, 13,240, 58, 71, 66,177,190,189,188,
-     55, 23,230,229,232,237,123,120, 74,118,119, 71,117, 29,127,125,
-     66, 67, 64, 65,124,139,130,243,174, 43, 72, 73, 86, 87, 87,197,
-    180, 53, 53,199, 33,108,114, 17,150,151,182,157,111,130,189, 72,
-    117, 16, 31, 30,221, 28,223,210, 25,212,215,218,  8,212,246,139,
-    212, 92,207,206,193,166,167,173,244, 93, 93,159,118,  4, 34,201,
-    206,199,238,231,104,150, 84, 73, 77, 56, 56,  9, 22, 23, 36, 21,
-     17, 19, 16, 18, 26, 92, 38,174,254,123, 24, 25,255,126,127,126,
-      4,133,134, 71,158,220,128, 17, 38,167,142,140, 35,162,106,187,
-     21,192,195,194,  1,  0,207,206,197,196,  7,  6, 40, 29,128,125,
-      8,254,118, 36, 42, 89, 88, 87, 86, 87, 86, 12,173,174,175, 38,
-    215,168,217, 30,149,148,151,139,182,184,153, 28,232,235,233,166,
-    151,151,165,146,163,160,145,234, 96,150, 30, 78,242, 49, 48, 47,
-     46, 47,110,124,213,214,215, 78, 64,147,113,118, 85,222,223, 31,
-     29,106, 75, 71, 26, 51,178,113,112,115,190,181,180,119, 57,154,
-    164,142, 38,164, 74,  9,  8,  7,  6,  7, 70, 94,221,222,253,102,
-    100, 84,169,170,167,134,  4,203,198, 40, 41, 38,242,241, 90, 69,
-     71,119, 69, 66,115,112, 45, 77, 72,106,205, 76, 34, 29,129,125,
-    225,224,223,222,223,158, 78,165, 38, 46,114,176,112,129,166, 45,
-     14,175,195,  9,186,187,188,189,201,194,109,108,111,162,169,164,
-    167,169, 10,233,194,219,208,186,185,136,135,182,183, 54, 38,111,
-     78,110, 54, 52, 56,251,188,119, 86, 84, 86,171,120,121,126,127,
-    190,160, 53,  7,  4, 54,  2,  3,  0, 61, 66,195,234, 57, 79,158,
-    145,144,143, 78,143,  3, 30, 87, 72,247,173, 44,208,215,212,253,
-    244,127,124,  9, 42,  3, 12, 14,134, 56, 93,220, 31,222, 25, 20,
-     29, 37, 24, 25, 26, 19,155,106,105,104,100, 90,103, 29,130,125,
-    228,198, 98,116,156, 91,247,  8, 33, 36, 45,134,168,167,139,136,
-    137,142,175, 98,175, 69,215,215,214,225,211,217, 29,146,147, 24,
-    153,143, 66,141,124,243, 62,255,172,145,159,110,199, 32, 99, 96,
-    249, 68,199,206,207, 24, 89, 90, 91, 92, 94, 41, 39,231, 76, 67,
-    130, 73, 70, 34, 85,106, 73, 72,107, 27, 41, 26, 24, 20, 38, 39,
-    136,185,135, 78,227, 62,219, 88, 57,214,245,246,251,218,219,216,
-    217,222,221, 49,  0,255,228, 87,102, 82,106,250, 45,162, 43,168,
-     40, 63, 62, 49, 60, 35, 34, 35, 64,  1,191,150, 23, 29,131,125,
-    187,161,146, 49, 20,191,150, 39,168,169,138,171, 47, 30,217,216,
-    215,208,179,190,117,210,230,135,152,187,186, 59,184,202,250,251,
-    244,245,247, 99, 41,151,190, 61,108, 97,110,233,230,197, 70, 69,
-    106,107,106,107, 99,111,177,176,175,175,  7,  6, 43,165,116,245,
-    250,123,120,125,115,110,109,108, 95, 82, 83, 59, 97,207,102,101,
-    232, 97,200,235,204,237,110,231,248,249,242,249,247,253,201,136,
-    135,134, 47, 46,131,177,244,215,  8,  9, 10,  8, 72, 73, 74, 75,
-     68, 69, 71,215,137, 39,142,133,190,179,176,177, 52, 29,132,125,
-    158,150,157,186,187,184,155,179, 98, 97, 96, 95, 94, 84,204, 90,
-    151,140,135,168,139,136,136,143,158,174,175,176,177,179,237,185,
-    223, 22, 63, 56, 51, 16,145,182,189,190,191, 72, 73, 74, 75,123,
-     58, 57, 56, 55, 54,  6, 52, 64,  5,102, 39,208, 89, 82, 91, 84,
-    213,214,215,216,217,219,192,209,183,220,255,226,203, 98, 99,198,
-     71,236,229,234,203,200,203,239,  2, 17, 16, 15, 14, 13,195,215,
-     71,220,215,248,249,250,216,252,253,254,255,  0,  1,  3, 24,  7,
-     95,182,135,128,163,136,137, 12, 45,134, 15,152,153, 29,133,125,
-    154,155,167,170,233,232,231,230,229, 27, 36,213,145,151, 32, 33,
-     42, 35,164, 37, 38, 39, 40, 41, 43, 60, 47,247,148, 13,154,155,
-     18,145,156, 22, 54, 23, 26, 27, 24, 27, 62,194,193,192,191,190,
-    189,161, 68,118,170,135,104, 73, 74, 75, 76, 77, 78, 79, 80, 81,
-     83, 68,164,163,172,253,242,243, 90,123,118,221, 86,215,232,233,
-    234,235,100,218,153,152,151,150,149,148,236,110,238,231,112,113,
-    114,115,116,117,118,119,120,121,123,125,204,130,148,149, 42,163,
-    130,139, 39,137,136,165,170,171,168,169,142,162,113, 29,134,125,
-    112,111,110,109,108,107,165,150,151,186,153,154,155,156,157,158,
-    159,160,161,163,165, 40, 90, 77, 45,  0, 33,162,137, 36,174,162,
-     39, 56, 57, 58,179,188,138, 73, 72, 71, 70, 69, 68,  3,189,190,
-     63, 64, 65,194,195,196,197,198,199,200,201,203, 75, 99, 50,161,
-    101,114,249,112, 93,236, 42,233,245,250,251,250,249,220,242, 33,
-     32, 31, 18, 29, 28, 26, 21,198,229, 74,201,232,235,236,237,238,
-    239,240,241,243,115, 87, 10,  8, 93, 82,217,208, 64,119,254, 49,
-    119,136,137,130,  3,  4,142,249,248,247,197,197,244, 29,135,125,
-    243,242, 49, 37,184,153,146, 19, 20, 21, 22, 23, 24, 25, 27,139,
-    196, 32, 72,183,  2, 33,128, 17,  8, 26,217,  5, 10,  9, 10, 41,
-     44, 34,209,208,207, 61,205,204,203,202,202, 53, 26, 25, 26, 59,
-     60, 61, 62, 63, 64, 65, 67,211,142,208,236,215,192,235,194,192,
-    135,114,177,135,208, 81, 82, 83, 84, 90,169,168,164, 89,165,164,
-    163,162,161,147,232,233,106,235,100,101,102,103,104,105,107,255,
-    156,120,199, 45,216,219, 64,156, 71,134,137,149,122,121,122,123,
-    124, 66,129,128,124,129,129,124,123,122,121,125, 42, 29,136,125,
-    171,170,139,140,141,142,143,144,145,147, 53,168,144,255,149,176,
-     17, 17, 16,163, 98, 97, 87, 32,161,162,163,164,154, 89, 88,100,
-    170,166, 84, 83, 82, 81, 81, 26, 25, 58, 59, 52,181,182,183,184,
-    185,187, 30,  3,124,219,157,232,239,224,240,248, 58, 57, 53,200,
-    201,202,203,204, 54, 49, 48, 16, 18, 46, 44, 43, 42, 41, 39,114,
-    251,248,251,252,221,222,223,224,225,227, 74,107, 21,178,229,226,
-     33, 98, 36, 19, 18, 17, 23,240,241,242,243,244,202,  9,  8,  8,
-    202,  6,  4,  3,  2,  1,  3,234,171,138,139,  4,133, 29,137,125,
-      6,  7,  8,  9, 11, 98,135,253, 90, 37, 58, 34, 49, 47,235,234,
-    233,229, 24, 25, 26, 27, 28,226,225,224,208,210,221,220,219,218,
-    217,219, 50,131,136,  9, 12, 15, 46, 47, 48, 49, 51, 90,188,201,
-    102,159,152,177,134,196,195,194,193,199,192, 65, 66, 67,139,186,
-    185,184,136,134,181,180,179,178,177,176, 86,251,250,219,220, 85,
-     86, 87, 88, 89, 91, 62,220,163, 46,245, 66,143, 78,156,134, 90,
-    153,153,104,105,105,167,147,146,145,144,128, 78,141,188,139,138,
-    137,136,178,211,208,209,126, 93, 94, 95,128,129,131, 29,138,125,
-    210,  4,186,196, 47,136,  5, 53,132,140, 50,113,115,144,145,109,
-    163, 91,106,105,104,152, 86,101,100, 99, 98, 97, 96,105, 11, 10,
-     11, 44,173, 38,167,160,169,171,250, 44,146,108, 13, 50,147,125,
-     79,180,182, 73, 73,152,185,182, 72, 67, 66, 65, 64,  0,254, 61,
-     60, 59, 58, 57, 56, 10, 99,108,233,236,239,238,205,208,209,211,
-    129, 84,106,212,125,216, 85, 21, 39,244,222, 33, 35,224,225, 18,
-     28, 27, 26, 25, 24, 24,214, 21, 20, 19, 18, 17, 16, 13,153, 91,
-     89,124,117,118,255,240,249,123,185,124, 65,212,119, 29,139,125,
-      0, 46,241,243, 28,  5,249,249,  8,  9, 57,  4,243,242,241,240,
-     32, 30,237,236,235,234,233,232,231,115,176,185,190, 63, 62, 63,
-     32,  3,  3, 33,166,155,140,173, 40,162, 41,219, 78, 45,209,211,
-    184, 57, 14,204,203,202,201,200,248, 54,197,196,195,194,193,192,
-    188, 43,232,202,236,197, 78,199,192,201, 67, 65, 78,183,228,199,
-     88,115,173,163, 28, 87,169,168,120, 85,169,164,163,162,161,160,
-    144,109,157,156,155,154,153,152,152, 67,192, 13, 78, 77, 78, 77,
-     82,115, 83,121,123,159,222,215,120,242,197,139, 30, 29,140,125,
-    125,129,128,  0,129,130,124,123,122,121,120,184,137, 69,116,115,
-    114,113,112,108, 75, 58, 57, 61, 13, 30, 31,144,145,147,147,154,
-    247, 60,183,162,143,157, 83,188,173, 89, 88,168,169,154, 84, 83,
-     82, 81, 80, 76,177,177, 76, 75, 74, 73, 72, 72,227, 16,209, 22,
-     31,156,189,226,227,195,233,209,175, 78,103,200, 65,117, 55,204,
-    206, 49, 48, 80,237,221, 44, 43, 42, 41, 40, 36,219, 89, 36, 35,
-     34, 33, 32, 31,247, 74, 73,126, 79, 79,109, 96, 97, 99, 67,246,
-     71,204,207,242,210,205, 15,244,254,  9,  8,152,203, 29,141,125,
-    202,  4,  3,  2,  1,  0,240,  3, 66,252,251,250,249,248,247,111,
-    160, 33,174,167,100, 37,122,187, 51,139, 66,191,156,159, 26,150,
-    149,228, 28,178,225,224,160, 42, 33,220,219,218,217,216,219, 43,
-     42,212,211,210,209,208,205, 36,155,170,174,159,190,175,144,177,
-    179,171,106,159, 28, 23, 64,239,177,188, 76,186,185,184, 42, 73,
-    121,180,179,178,177,179,175,147, 81,175,171,170,169,168,169,  8,
-    240, 61,118,255, 52,117,194, 11, 67,242, 62,237,238,197,106,225,
-    229,148,147,146,145,144,232,125,190,140,139,138,137, 29,142,125,
-    136,139,123,121,132,131,130,129,128,127, 36,234, 26, 46, 44, 12,
-     29, 33, 17,  3,218,214, 47,174,143,176, 51,109,108,107,106,105,
-    104,248,153,170,100, 99, 98, 97, 96, 80, 97,161, 95, 91, 90, 89,
-     88, 87,248,240,201,198,207,200,137,150,155,215,242,222, 61, 54,
-    183, 58, 17, 49, 68, 67, 66, 65, 64, 72,193,241, 60, 59, 58, 57,
-     56, 55,249,249, 52, 51, 50, 49, 48, 45,128,132, 89, 77,127,124,
-     78, 66,115, 67,158,118,253,222,223,194, 67, 13, 28, 27, 26, 25,
-     27,138, 41,233, 20, 19, 18, 17, 16, 60, 49,205, 15, 29,143,125,
-     11, 10,  9,  8,  7,173,172,153, 94,151, 88, 89, 98,103,167,  5,
-    172,141,  6,  7,130,162,198,180,243,242,241,242,152,157, 17, 44,
-    235,234,233,232,215, 38,229,228,227,226,225,224,221,247,119,169,
-    140,140,140,143,176,129,179, 61,142, 13, 45,236,154, 23, 16,252,
-    203,202,201,201, 90, 57, 58,  4,195,194,193,195,124,114,189,188,
-    187,186,185,184,181,156, 31, 41,102,103, 36, 37,250,247,247, 73,
-    252,221,213,171, 98,254,214,164,163,162,161,162,232,105, 97, 92,
-    155,154,153,155,164, 90,149,148,147,146,145,144,141, 29,144,125,
-     95, 23, 42,252,239,252,222,242,224,227, 33,222, 95,126,112, 78,
-     39,173,124,123,122,121,123,234,133, 74,116,115,114,113,112, 99,
-    174,109,108,107,106,105,104,101,116,243,253,182,187,248,249,202,
-    199,199,249, 12, 45, 38,171, 87, 13, 34, 84, 83, 82, 81, 83, 56,
-     49,113,127, 71, 74, 73, 72,116,118, 69, 72, 67, 66, 65, 64, 55,
-     41, 87,154, 93, 95, 95, 94, 81, 92,159,161,110,239,238,204,239,
-    116,225, 16,235, 42, 41, 41,186,249, 26,215, 19, 34, 33, 35, 44,
-     30, 29, 31, 27, 26, 25, 24, 31, 76,188,189,138,139, 29,145,125,
-    136,186,165,164,167,153,124,125,126,123,  5,172,114, 68,195,  2,
-      1, 14,136,  1,  1, 48,183,250,249,248,251,201,245,244,243,242,
-    241,240,237, 79,183, 70,129,140,143, 66, 77, 64,127,113, 62, 63,
-     28, 60, 31,116, 24,207, 27,218,217,213,138, 41, 42, 39,227,162,
-    209,227, 48, 13, 14,255,203,202,201,200,197,111,111,110, 90, 88,
-    107,105,218,219,235, 41,204,205,206,143,199,156, 66,132,179,178,
-    177,183,216,209,210, 83,231,106,170,164,107,153,105,100,163,162,
-    161,160,181,187, 11, 54, 49, 48, 44, 62,206,195,207, 29,146,125,
-      1, 78, 79, 76, 92, 67, 76,216, 83,135, 74,137,129, 26,249,120,
-    116, 64,125,113,188,128,130,126,124,123,122,121,120,117, 91,227,
-    238,217,217,232,213, 58,148, 59,251, 28, 29, 30,151, 84, 86,240,
-     21,147, 98, 97,103, 40, 33,162,168,164,133,106, 84, 91,105,166,
-    144, 83, 82, 81, 80, 77,100,231,230,226,236, 28, 23,185,248,191,
-    209,158,159,156,191,243,242, 24, 96,251, 58, 57,  1,162,107,201,
-    203,204,253,206,192, 16, 17,209, 44, 43, 42, 41, 40, 39,164,143,
-    142,180,119,126,223,224, 97,227,139,108,109,110,231, 29,147,125,
-     36, 37, 47,195,192,222,209, 54,106,105,242,240,200,205,246,247,
-    248,249,250,248,  3,  2,  1,  0,253,216,167, 85,174,165,  6,  7,
-      8,  9, 11,105, 46, 47, 44, 47, 35, 34, 39,112, 36,230,233,241,
-     62, 57, 26, 25,208, 29, 30, 31, 32, 33, 34, 45,219,218,217,216,
-    214,252,115,113,134,141, 46, 47, 48, 49, 19, 91,188,189,190, 55,
-    180,245,246, 99,191,  1, 49, 38,218,201, 66,195, 68, 69, 70, 71,
-     72, 73, 74, 68,179,178,177,176,173, 69,  7,121,252, 85, 86, 87,
-     88, 89, 83, 57,126,127,124,127, 67, 82, 81, 54,231, 29,148,125,
-    239,153, 49,  2,233,106,107,108,109,110,111,112,113,114,115,123,
-    138,137,136,135, 44, 47, 17,220,125,126,127,128,129,131,235, 12,
-     13, 14,  7, 68,  6,118, 94,196,190,127, 22, 57,137,146,147,148,
-    149,150,151,152,153,154,155,147, 98, 97, 96, 83,231,247,137,  4,
-    165,166,167,168,169,171,201,142,143,140,143,179,130, 77, 66,224,
-    183,120,226,220,185,186,187,188,189,190,191,192,193,194,205,  8,
-    250, 57, 56, 63,220,108, 97,204,205,206,207,208,209,211,187, 92,
-     93, 94, 95,212, 85, 21, 39,137,136,206,138,136,249, 29,149,125,
-    226,235,108,229,230,231,232,233,234,235, 44, 18, 17, 16, 12,164,
-    164, 91,244,245,246,247,248,249,251,145,222,223,220,255,  0, 34,
-     49, 60,241, 80, 83, 82, 96,  9, 42, 41, 44, 13, 14, 15, 16, 27,
-     50,209,232,234,233,232,230,204, 64,185, 28, 29, 30, 31, 32, 33,
-     35,123,172,173,174,167, 40,233,166,231,211,248,123,122,170,177,
-     50,155,188,181,182, 55, 56, 57, 58, 51,188,  2,193,192,179,151,
-     40,227, 68, 69, 70, 71, 72, 73, 75, 29,110,111,108,109,112, 83,
-     97, 96,107,168,  3, 50,194, 27, 16,121,126, 85,124, 29,150,125,
-     93, 64, 67, 64,109,164,150,153,152,149,240,  0,235,108,109,110,
-    111,112,113,115, 37,252,253,254,255,120,245,114,183,179,130,171,
-     42, 42,209,139,171, 12,  5,142,  7,  8,128,154, 11,188,190,113,
-    112,109,196,184, 19,148,149,150,151,152,153,155,205, 62,191,188,
-    189,160,161,162,163,151,154, 91,242,241, 11, 42,  1,142,239,174,
-    143,144,211,180,157,180,122, 73, 72, 71,231, 24,187,188,189,190,
-    191,192,193,195,150, 76, 77, 78, 79, 72,201,202,203,204,  2, 49,
-     26,138,185,216,117,146,128,182,142,216, 89,218, 67, 29,151,125,
-    212, 34, 33, 32, 25,117,104,227,228,229,230,231,232,233,235,190,
-     78, 79,204,205,208,241,242,243,246,198,  9, 10,162, 95, 92, 81,
-    102,107,239,219,100, 33, 36, 35, 40,202,249,248,245, 80,130, 11,
-     12, 13, 14, 15, 16, 17, 19, 70,188,189,158,159,152, 25, 26, 27,
-     16,209,209,224,118,120, 72,137,189,112,114,130, 48,161,162, 42,
-    160,221,209,208,205, 91,152, 51, 52, 53, 54, 55, 56, 57, 59,110,
-     86, 23, 28, 29, 96, 65, 66, 67, 68, 70,117,184,189,239,239, 30,
-     25, 24, 23, 22,210, 55, 48,113, 20,118,169,168,173, 29,152,125,
-    243,242, 91, 92, 93, 94, 95, 96, 97, 99, 54, 14,237,238,239,224,
-    105,106,107,108,109,162,144,143, 36, 36,230,225, 32, 35, 49, 45,
-     48, 42,107,127, 78,113,128,117,235, 40,131,132,133,134,135,136,
-    137,139,222,230, 39,172,173,178,145,146,147,148,149,150,168,103,
-    100,207,205,202,196,251, 57,133,244,196,133,231,134,153, 88, 90,
-      3,  8,234,172,173,174,175,176,177,179,230,238, 29, 62, 63, 48,
-     57, 50,187,188,189,190,112, 63, 62, 23,149, 81,144,163, 98,157,
-    156,147, 90, 68,222,113, 51,112, 81,210, 83,212,213, 29,153,125,
-    214,215,216,217,219,142,138,127,252,253,194,195,226,227,228,229,
-    230,228,215, 22, 31,190,121,184,139,186,165,164,167,145,150, 25,
-    201,  8, 82,118, 56, 83,118, 93,254,255,  0,  1,  3, 86, 81,141,
-    142,143,128,137,130, 11, 12, 13, 14,  3, 28,238,237, 70, 65, 64,
-     67, 66, 77, 67, 79,142, 12,150, 33,238,138, 33,221,137, 12,143,
-      4, 39, 40, 41, 43,126,121,143,132, 13, 18, 17, 18, 51, 52, 53,
-      5,  4, 11, 10,197,238,105,104,107,106, 21, 20, 23, 22, 17, 86,
-    249,185,224, 73, 69,161,230,103,100,103, 80, 81, 83, 29,154,125,
-      6,  1,255,252,223,208,209, 90,211, 92, 93, 94, 95,172,173,157,
-    158, 49, 48, 51, 50, 61, 60, 63, 62, 61, 71,145,159,240, 65,190,
-    141,220,215,220,253,208,211,211, 46, 41, 31, 92, 93,162,161,128,
-    131,164,133,134,135,187,186,185,116,121,216,219,240,111,108,199,
-    198,194,  2,106,151,103,154,169,164,102, 61, 52, 53, 10, 11, 11,
-    246,241,255, 12, 47, 32, 41, 42,163,172,173,174,175,176,189,126,
-    124, 75, 74, 73, 72, 71, 70, 69, 71,188,189,190,191, 48,193,194,
-     75,  8, 47,207,110, 98, 83,111,158,153,151,108,237, 29,155,125,
-    242,243,242,243,212,213,214,215,216,234,233,232,227, 34, 33, 32,
-    211,210,209,220,228,229,230,231, 40,235,200, 73,204,236,184,117,
-     86, 91,155,166,161,161,124,127,112,121,122,123,244,253,254,255,
-      0,  1, 14,207,200,201,202,203,196,197,198,199,204, 13, 14, 15,
-     16,153,154,179,156, 21, 79, 77,114,127,191,126, 73, 75, 60, 61,
-      2,  1, 32, 35, 36, 37, 38, 39, 40, 41, 25, 24, 31, 30, 29, 28,
-      3,  2,  1,  0, 52, 53, 54, 55, 58, 25,152, 57, 30, 29, 43,170,
-     37,212, 23, 22, 17, 16,204,207,192,193,202, 67,196, 29,156,125,
-     77, 78, 79, 80, 81, 82, 83, 84, 85,154,155,148,149,150, 91, 92,
-     93,214,215,232,233,202,107,206,207,192,254, 50, 15, 48, 14, 57,
-     56,204,205, 82, 83, 82, 83,116,119,118,119,120,121,122,123,124,
-    126, 77, 76,176,129,130,131,132,133,164,165,170,163, 32,161, 38,
-     39, 39,218,197,196,199,245,193,192,254, 61, 48, 17, 18, 19,156,
-    157,150, 31,160,161,162,163,164,165,166,167,168,169,170,171,164,
-     37, 38, 39, 56, 27,152,147, 34,227,224,161, 30, 31, 44,225, 42,
-    216,212, 21,226,227,224,193,228,229,198,197,202,233, 29,157,125,
-    202,203,204,205,206,207,208,209,210,211,214,247,244,245,250, 83,
-    218,249, 70,187,184,201,134, 71, 71,138, 65,176,188, 77, 66, 97,
-     98,107,236,109,110,231,112,241,242,243,244,245,246,247,248,249,
-     54, 55,116,117,118,119,136,171, 32, 35,146, 83, 92, 17,174,175,
-    175, 81, 89, 88, 88,173,186, 51, 48, 49, 20, 23, 20, 23, 24, 27,
-     56, 27, 28, 29, 30, 31, 32, 33, 32,  1,  6,  7,  4,  5, 10,  3,
-      8,  1,182, 75, 72,137, 86,151,167, 86,157, 96, 99,157,178,177,
-    178,179,180,189, 62, 63,200, 73,194, 67, 68, 69, 70, 29,158,125,
-     71, 72, 73,194,195,196,197,198,199,218,217,112,121,206,255,252,
-      2, 13, 12, 15, 61, 58, 56, 11, 53, 74, 75, 72, 65, 70, 71, 70,
-     71,106,105, 74,107, 76, 77,108, 76, 82, 83, 80, 81, 86, 87, 84,
-     85, 82,121, 80, 89,229,235,212,229, 21,232,215,230, 45,208, 19,
-    237, 34, 35, 34,  3,  4,  5, 14,143, 24,145,146,155,156, 21, 30,
-     31, 16, 17, 18, 19, 20, 21, 52, 53,  8, 41,136,137, 14,192,255,
-     13, 50,192,255, 52, 49, 51, 55,203, 98, 83, 80, 81, 94, 95, 95,
-     93, 90, 91, 88, 89, 38, 39, 39, 25,232, 71,199, 30, 28,  0,105,
-    166,161,160,163,162,173,172,175,174,169,168,171,170, 85, 84, 87,
-     86, 81, 80, 83, 82, 93, 92, 95, 94, 89, 88, 91, 90, 69, 68,184,
-    185, 20,216, 67, 66, 77, 76, 79, 78, 73, 72, 75, 74,117,116,119,
-    118,113,112,115,114,125,124,127,126,121,120,123,122,101,100,103,
-    102, 97, 96, 99, 98, 97,108,144, 51, 63, 12,107,106, 21, 20, 23,
-     22, 17, 16, 19, 18, 29, 28, 31, 30, 25, 24, 27, 26,  5,  4,  7,
-      6,  1,  0,  3,  2, 13, 12, 15, 14,  9,  8, 11, 10, 53, 55,194,
-    107,104,168, 51, 50, 61, 60, 63, 62, 57, 56, 59, 58, 41,204,125,
-    117,116,187,122,169,168,107,102,161, 96,111,110,173,160,163,174,
-    101,100,103,102,149,152,155,154,157,156,159, 30,145,144,147,146,
-    149,148,151, 85,160, 16,183, 69, 65,115,115,113,126,127,124,125,
-    121,123, 75, 74, 70, 71,119, 69, 66,115, 64, 66, 77, 79, 76, 77,
-     74,123, 72, 25, 86, 87, 84, 85, 82, 83, 83,109,136, 51, 63,110,
-    101,100,103,106, 21, 24, 23,214, 29,208, 19,210, 17, 16, 31, 18,
-    213, 24,215,214,201,  8,203,202,205,204,207,106,  1,192,195,194,
-    197,196,199,  5,208,107,231, 54, 50, 48,  0,  1, 61, 33,161,125,
-     60, 63, 62,  9, 56, 59, 10, 21, 36, 20, 38, 34, 32, 19, 18, 30,
-     47, 28, 29, 26, 27, 24, 64,230,231,228,229,226,227,227,238, 56,
-    140,143,210,217, 20, 23,218,201,200,199,202,193,192,195,194,205,
-    204,195,194,  9,  4,203,  6, 57, 52, 59, 58, 49, 60,255,152, 49,
-     48, 51, 50, 53, 52, 55,198,  0,149, 59,213,209,211,208,209,237,
-    236,239,238,233,232,232,234,149,164,167,165,161,147,163,161,173,
-    156,172,173,170,171,171,240, 54,183,180,181,178,179,179,191,168,
-    255, 27,130,133,132, 71, 74,185,180,183,182,177,176, 33,162,125,
-    179,178,177,124,179,178,117,116,123,118,101,104,171,106, 97,108,
-    175,196, 33, 96, 99, 98,101,100,103,151,112, 39, 62,102, 81, 99,
-     80, 81,109,108,111, 94, 89,104, 88,106, 69,116, 71,117,113,115,
-    115,113, 78, 79, 76,125, 74,120,120, 44,197, 71, 68, 69, 66, 67,
-     67, 79, 88, 31, 37,126,185,116,119,186,169,100,107,106,173,108,
-    111,162,109,108, 99,162,165,168,107,166,217,216,215,218,221,208,
-    222,116,145, 16,211,210,213,212,215, 39, 48, 93,109,118, 49,  3,
-      3, 50, 13, 15, 12, 14, 57, 11,  8, 57, 54, 52, 55, 33,163,125,
-     54, 50,  3, 48, 49, 14, 15, 15, 14, 58, 11, 10, 92,150, 23, 20,
-     21, 18, 19, 19, 21,216,118, 69,174,233, 40, 39,234,217,212, 23,
-    214, 17,208,223, 18,221,208,223, 18, 25,216,215, 26,197,  8, 11,
-     10,  1, 12,  6,164, 65,  0,  3,  2,  5,  4,  7,253,200,162,109,
-    102,193,195,195,242,205,255,204,254,201,251,248,250,229,215,231,
-    214,210,227,224,209,222,223,220,237,217,219,222,140, 38,167,164,
-    165,162,163,163,166,160,201, 57, 14,153,148,151, 90,133, 68,135,
-     70,141, 76, 79,142,141,128,131, 66, 69, 68, 71, 70, 33,164,125,
-    121,184,123,122,125,124,118,212, 49,112,115,114,117,116,119,142,
-    152,241, 14,  6,145,160,163,146,157,111,175,174,154,171,171,153,
-     86, 84, 87, 86, 98, 83, 96, 97, 94, 95,108, 93,105,107,110, 60,
-    198,119,116,117,114,115,115,118,112, 25, 38, 34,137, 72,139,134,
-    181,116,183,182,125,188,191,126,125,124,191,178,117,180,183,182,
-    101,168,171,170,161,172,166,  4,225,160,163,162,165,164,167, 93,
-     40, 65, 77,122, 17, 32, 16, 34, 29, 31, 31, 46, 41, 43, 24, 26,
-      5,  7,  7, 54, 50,  3, 48,  1, 61, 15, 60, 14, 58, 33,165,125,
-     56, 62, 96,134,  7,  4,  5,  2,  3,  3, 46, 72,105,102,146,249,
-     56, 59,246,233,228,231, 42,225, 44,227, 34,237,236, 47,226, 37,
-     40, 43, 38, 25,212,219, 26, 29, 28, 22,184, 81, 16, 19, 18, 21,
-     20, 23,202, 16,145,146,161,193,240,243,242,206,207,255,206,202,
-    248,203,250,246,247,247,197,241,195,240,193,205,252,255,253,202,
-    203,202,160,214,215,212,213,210,211,211,210, 56,185,181,133, 41,
-    232, 43,234, 85, 88,151,150, 93,156,147,146,157,156,159,146,149,
-     84,151,150, 73, 72, 75, 74, 77,140, 78,216, 65, 64, 33,166,125,
-     67, 66, 69, 68, 71,182, 96,209,209,221,178,128,179,178,189,188,
-    143,189,186,184,136,137,165,167,151,166,162,147,144,145,157,156,
-    156,157,154,152,154, 48,102,103,100,101, 98, 99, 99, 82,136,  9,
-     42,245,153, 88, 91,154, 69,136,135, 74,141, 76,131, 78,141, 64,
-    143, 78,137,132, 71, 70,181,184,187,186,189,188,190,232,113,112,
-    179,178,181,180,183,121,176, 49,126,205, 97, 99, 83, 98, 94,108,
-     92,110,105,104, 88,106, 37, 20, 23, 21, 33, 16, 32, 17, 29, 44,
-     44, 45, 25, 43, 42,128, 70, 55, 52, 53, 50, 51, 51, 33,167,125,
-      1, 88, 73, 90,164,201,196, 11, 10,245,248,251, 28,155, 60, 63,
-     62,241,240, 63, 62,249,244,247, 58, 37,232,235,234, 45,236,238,
-     88, 97,224,227,226,229,228,231, 41,130,164,178,124, 18,208,211,
-    210,221,236,237,116,115,114,232,233,245,199,196,246,241,195,240,
-    193,253,252,255,205,250,251,254,177,165,199,196,197,194,195,195,
-    241,168,161,149,100,249, 56,247,246, 37, 40, 61, 76, 75, 74, 67,
-     46, 33,224,227,226,233, 36, 43,230,153,152,151, 86, 93, 92, 86,
-    107,201, 80, 83, 82, 85, 84, 87,153,208,209,209, 28, 33,168,125,
-     65,128,128,129,190,188,241, 36, 35, 34, 35,138,181,183,183,182,
-    178,131,179,129,142,191,191,190,137,139,172, 19,208,151,148,149,
-    146,147,147,161,248,249,198,104,105,168,171,170,149,149,162,252,
-    251,250,249,210, 81, 80,147,158, 85,148, 91, 86,133, 68, 75,138,
-    129,140,150,235, 56,128,131,130,133,132,135, 75, 32, 33, 19,112,
-    177, 67,115, 66, 77,123,168,212,211,210,209,218,101,103, 87,101,
-     98, 96, 99, 97,110, 95, 92, 93, 90, 91, 60,195, 96, 39, 36, 37,
-     34, 35, 35, 19, 72, 73, 67,  8,213, 24, 23, 26,197, 33,169,125,
-    195,216,236,171,170,169,170,193,  0,207,  2,  9,  8,203,  6, 57,
-    244, 59,250,241,253,108,147, 72,240,243,242,245,244,247, 57,112,
-    113,103,204,225, 35, 35, 33, 29, 43, 80,196,131,130,129,128,213,
-    215,212,214,225,224,227,210,238,239,236,238,218,233,140,123,176,
-    247,244,245,242,243,243,193,152,153, 12,100,  5,200, 11,198,245,
-     57,160, 12, 91, 90, 89, 88,241,252,243,254,249, 52,247,250,233,
-     36,231, 42,237, 37,188, 67,152, 32, 35, 34, 37, 36, 39,233, 64,
-    193,154,252,209,144,163,161,174,137,202,100, 51, 50, 33,170,125,
-     49, 48,  5,180,183,133,129,179,176,130,190,143,188,190,186,189,
-    244, 43,192,199,132,133,130,131,131,177,232,232,138,  4,201,184,
-    187,118,100,243,114, 92, 11, 10,  9,  8, 45,108,163,162,165,100,
-    171,170, 85, 84,155, 90,145,149,141,243,168, 16,147,146,149,148,
-    151, 69, 48,215,145,175, 49, 64, 64,104,232, 51,154, 48,227,226,
-    225,224,214,119,116, 69,113, 67, 67,114, 77, 79, 76, 78, 74,109,
-      5,219, 16, 23, 84, 85, 82, 83, 83, 65, 56,250, 48,183, 21,104,
-    166,243,190,235,226,104,187,186,185,184,189, 28, 31, 33,171,125,
-     18, 21,212, 27, 22,201,196,203, 10,205, 21,253,147,216, 64,195,
-    194,197,196,199,149,192, 81,106, 92, 78, 51, 54, 71, 82,195, 74,
-    104,147,146,145,144,133, 36, 23, 21, 34, 16, 35, 34, 29, 47, 28,
-     29, 41,127, 85,171, 34,167,228,229,226,227,227, 65,128,137,138,
-    116,166,216, 28,143,186, 59, 18,144,107,106,105,104,109, 12,  3,
-    194,197,  8, 11,198,249, 56, 59, 58, 50,141, 14,127, 40,176, 51,
-     50, 53, 52, 55,105, 16,177,177, 76,158,227,230, 21, 18, 17, 18,
-    184, 67, 66, 65, 64, 49,167,164,150,146,147,163,145, 33,172,125,
-    174,175,172,173,152,111,102, 23, 82,215,180,181,178,179,179, 33,
-     88,217,217, 43,197,136,150,245, 74, 75, 98,224, 27, 26, 25, 24,
-     25,188,179,178,121,184,123,118,165,104,107,102,172,112, 82, 47,
-    120,240, 99, 98,101,161,171,  9,168,  1,  1,195, 18, 96, 70,173,
-    162,171,130, 11,243,242,241,240,225, 68, 68,117,114,115, 64,113,
-    125,127,124,126,126, 56, 66,202,162, 39, 68, 69, 91,218,219,218,
-    168, 41, 42,235, 58,120, 36,181,154, 27, 50, 51,203,202,201,200,
-    201,108,111,110,165,164,107,106, 25, 24,219,218,204, 33,173,125,
-    236, 26,146,200,198,223, 28,179,178,179,178,240, 81, 82, 83,194,
-     51, 76, 61,242,121,120, 91,175,162,161,160,128, 52, 55, 53,  2,
-     51, 51,  1, 62, 15, 12, 61, 78,196, 50,186,242, 78, 13,140,139,
-    138,139,202,208,121,122,123,234,228, 55,213, 42,  9,130,131,119,
-    122,121,120, 35,118, 95,222, 21, 20, 23,218,201,200, 11, 69,254,
-    192,234, 66,200, 38,101,100, 99, 98, 99, 34,  2,129,130,161,194,
-    192,240, 13,  6, 11, 42,171, 80, 82, 81, 81, 26, 78, 77,230,225,
-    227,211,225,238,223,220,129,233,236,206,105,144,254, 33,174,125,
-     61, 60, 59, 58, 55,122,162, 73,202,194,150, 84,148,101, 90,209,
-    242, 81, 43, 42, 41, 61, 80, 81, 37, 46,137,136,139, 70,117,120,
-    123,117,174, 77,102,127,124, 22, 21, 36, 35, 18, 19,146,154,211,
-    242,210,146,144,156, 95, 16,219,250,249, 76,  2,  1, 93, 34, 35,
-    226,252, 81, 99, 96, 82,110,111,108, 81, 38,167,142, 93, 51,226,
-    237,236,235, 42,235,103,114, 59, 36,155,201, 72,180,179,136,161,
-    168, 33,151, 26,216,167,160,162, 42,148,249,120,187,122,165,168,
-    161,153,188,189,190,183, 55,198,197,196,192,254,195, 33,175,125,
-     64, 26,190,168, 64,191, 19,236,197,200,193,106, 73,252,130,180,
-    109,114, 83,158, 83,161, 51, 51, 50, 13, 63, 37,241,118,119,252,
-    125, 83,158, 81,160, 87,154, 91,  8, 61, 51,194,107,132,199,196,
-     93,248,123,114,113,199, 74,158,255,240,242,133,139, 67,232,231,
-     38, 21, 26,126,  9, 14, 45, 44, 15,119, 69,118,116,112, 66, 67,
-    236,197,251, 50,159, 90,191, 60, 93,186,153,154,145, 32, 98, 60,
-    189,130,129,109, 92, 91, 64,243,194,254,198, 86,129,  6,143, 12,
-    140,131,130,141,128,180,181,183,228,173, 19, 58,187, 33,176,125,
-     31,  5, 54,149,200, 99, 74,249,119, 58,110, 79,195,242, 53, 52,
-     51, 52, 87, 90,137,109,218,123,124, 95, 94,223, 84, 38, 26,219,
-    220,221,223,135,245, 75, 98,225,200,197,202, 77, 74,105,234,193,
-     96, 19,206,207,223,211, 13, 12, 11, 11,163,162,158,  5,216, 89,
-     94,223,220,217,  0,  1,  2,  3,  4,  5,  7, 95, 13,163, 10,  9,
-    140,  5,172,143,176,145, 18,185,235,237,150,157,155,145,165,228,
-    227,226, 75, 74,217,237,168,139,172,173,174,172,228, 41, 42, 43,
-     44, 45, 47,115, 53,155, 50, 57, 26, 23, 20, 21,155, 33,177,125,
-    242, 58,148,195,199, 28, 63,111,190,189,188,187,186,176, 40,181,
-    249, 64,107, 76,111, 78, 79, 80, 81, 82, 83, 84, 85, 87,  9, 85,
-     51,250,211,220,215,244,117,106,157, 96,220,155,173,238,239,215,
-    150,149,148,147,146,162,144,140,209,122,155,116,253,118,119,120,
-    121,122,123,124,125,127,100,141,235,128,163,134,175,  6,  7,170,
-     38, 64,116,115,175,172,175,147,126,109,108,107,106,105,167,167,
-    245,144,187,156,157,158,159,160,161,162,163,164,165,167,188,171,
-    243, 26, 43, 36,  7, 44, 45,178, 27, 57, 76, 75, 61, 33,178,125,
-     62, 63, 11,  6, 69, 68, 67, 66, 65,191,252, 25,193, 75,196,197,
-    206,199,200,201,202,203,204,205,207,216,211, 11,104,241,126,127,
-    246,117,112,243,101, 36, 34,255,252,255,226, 30, 29, 28, 27, 26,
-     25,  5,232,241,234, 43,204,237,238,239,240,241,242,243,244,245,
-    247,224,  8, 15,  0, 81, 86, 87,254,223, 42,171,253,252,250,141,
-    142,143,  8,182,245,244,243,242,241,240,144, 23, 18,155, 20, 21,
-     22, 23, 24, 25, 26, 27, 28, 29, 31, 25,144,222,200,201,142,  7,
-     38, 47,139,  6,213,212,214, 15, 12, 13, 50, 30,205, 33,179,125,
-    204,203,202,201,200,199,  8, 58, 59, 30, 61, 62, 63, 64, 65, 66,
-     67, 68, 69, 71, 65,196,182,161,193,228,197, 70,109,216,126,173,
-    172,172,221,222, 87, 80,102,165,164,163,162,161,160,223, 96, 98,
-    227,228,229,102,103,104,105,106,107,108,109,111,239,223,142, 29,
-    217,214, 93,212,249, 64,134,133,132,134, 95, 94, 93,128,174,125,
-    124,123,118,121,120,118,121,202,137, 46,173,140,143,144,145,146,
-    147,148,149,151, 23, 59,102,100, 49, 54,189,180, 36, 43,158, 93,
-     92, 92, 45, 38,167,168, 34, 85, 84, 83, 97, 97, 80, 33,180,125,
-     79, 77,162,153, 28, 61, 54,183,184,185,186,187,188,189,191, 47,
-     24,252,148,107,230,197,100,245,228, 54, 53, 52, 46,237,238,205,
-    208,222, 45, 44, 43,217, 41, 40, 39, 38,202,217,254,253,254,223,
-    224,225,226,227,228,229,231,119, 34,124, 64,123,100, 79,102,103,
-    251, 14, 13, 12, 20,245,246,247,248,246,  5,  4,  0,253,  1,  0,
-    255,254, 22,  3,140,141, 14,143,  8,  9, 10, 11, 12, 13, 15,155,
-    224,  4,187, 81,188,191, 36,247, 43,234,229,228,254, 29, 30, 31,
-     32, 30,221,220,216, 37, 37,216,215,214, 46, 33,142, 33,181,125,
-     15, 14, 47, 48, 49, 50, 51, 52, 53, 55,145,  4, 60, 83, 57, 20,
-    181,181,183,115,190,189,188,132, 69, 70, 71, 72,118,181,180,128,
-     78, 66,176,175,174,151, 81,254,253,222,223,216, 89, 90, 91, 92,
-     93, 95,250,223,160,  7, 65, 76, 75, 68, 87,103,150,149,148,108,
-    109,110,111,112,138,141,140,180,182,138,136,135,134,191, 59,214,
-     95, 92, 95,160,129,130,131,132,133,135, 46,  7,121,222,137,134,
-     69,  6, 79,175,110,109,108,148,149,150,151,152,166,101,100,108,
-    174, 98, 96, 95, 94,103,227,142, 15, 46, 47,168, 41, 33,182,125,
-    170,171,172,173,175,198, 59, 65,230,153,156,134,153,183, 71, 70,
-     69, 68,188,189,190,191,192, 62, 61, 60, 52, 54, 57, 56, 55, 54,
-     15,155,214,103,108,237,240,209,210,211,212,213,215,190, 80, 37,
-    138,115,126, 85, 81,223, 31, 30, 29, 28,100,229,230,231, 39, 22,
-     21, 20, 44, 34, 17, 16, 15, 14, 51,163,242, 95, 94,127,112,249,
-    250,251,252,253,255,154,128,255,114,169, 44,235, 58,  5,247,246,
-    245,244, 12, 13, 13,195,239,238,237,236,228, 42,233,216,231,230,
-    219,143, 22,183,180,181, 34, 33, 34, 35, 36, 37, 39, 33,183,125,
-    118,168, 22,104,131,172,161,146, 45,207,206,205,204, 52, 53,201,
-      7,247,198,197,196, 60,242,193,192,191,190,179,230, 77,239,238,
-    239,192, 65,202, 75, 68, 77, 79, 30,208,110,144,241,212,119,166,
-     93,167,166,165,164,124, 93, 82,172,159,158,157,156,164, 90,153,
-    152,151,150,155,194, 46,199,200, 77, 80, 83, 82,113,116,117,119,
-     37,248,198,120,209,124,241,142,116,127,126,125,124,132,133,118,
-    120,119,118,117,116,124,178,113,112,111,110, 99, 57,197,253, 63,
-     61, 16, 25, 26,147,148,157, 31,221, 32, 29,136, 43, 33,184,125,
-    166,138, 86,172, 87, 86, 85, 84,172,173,157,160, 79, 78, 77, 76,
-    132,186, 73, 72, 71, 70, 75,209, 40,215, 20, 29, 98,227,226,227,
-    196,231,231,197, 74,119, 96, 65,204, 70, 62,192, 47, 46, 45, 32,
-     92,221,234, 40, 39, 38, 37, 36, 28,210, 33, 32, 31, 30, 19,137,
-     65,207, 76,110, 64,105,226,107,100,109,231,229,242, 11, 88,123,
-    254,215,  6,248,  7,  6,  5,  4,220,241, 13,  0,255,254,253,252,
-    244,  9,249,248,247,246,250,109,149,103,164,105, 50, 49, 50, 49,
-     54, 23, 55, 29, 23,243,178,187, 28,150,222, 16,223, 33,185,125,
-    222,221,220,164, 37, 38,216,215,214,213,212, 28, 45,225,208,207,
-    206,194, 86,158,111,158,157,145,161,178,179, 52, 53, 55, 55, 70,
-     43,224,107, 70,107,134, 72,183,182,181,184, 76, 77,126,176,175,
-    174,173,172,168, 85, 85,168,167,166,166, 61, 10,199,244, 53,202,
-    195, 64, 97, 70, 71,103, 77,125,  3,226,203,108,229,238, 96,143,
-    142,141,140,244, 73,121,136,135,134,133,132,128,127,253,128,127,
-    126,126,234,226, 47, 46, 45, 18, 35, 35,  1,  4,  5,  7, 39,138,
-     59,176,179,150,182,150,152,103,102,101,104,252,175, 33,186,125,
-    174, 96, 95, 94, 93, 92, 84,167,230, 88, 87, 86, 86,193, 58,203,
-      4,133, 18, 27,216,153,222, 31,151, 47,238, 19, 48, 51,190, 50,
-     62, 48, 63, 62, 61, 60, 68,206,197, 56, 55, 54, 53, 52, 63,207,
-    206, 48, 47, 46, 46,185, 77, 67,127, 78, 66,115, 82, 67,116, 85,
-     87, 79,182, 67,192,203,228, 75, 22,104, 23, 22, 21, 24,142,237,
-    221, 16, 15, 14, 13, 15, 11, 55,245, 11,  7,  6,  6,146,153,168,
-     84,153, 42,163,104, 41,166,111, 39,150, 82,129,130,169, 12,133,
-    142,128,239,238,237,220,140, 25,218,232,231,230,229, 33,187,125,
-    228,239, 31, 29,224,223,222,222, 73, 66, 64,142,190,130,128,160,
-    177,133,181,167,126,106,147, 18, 51, 54,151, 52,184,199,198,197,
-    200, 92, 61, 14,192,191,190,189,188,180,133, 69,187,183,182,182,
-     45,234, 20, 36, 45, 58, 51, 52,117,114,127, 51, 22, 50,209,218,
-     91, 94,245,212, 96,159,158,157,172,236,101, 85,152,151,150,149,
-    148,147, 93, 93,144,143,142,141, 21, 46,236, 28,253,225,211,208,
-    226,230,215,231, 58, 42,161,130,131,134, 39,100,184,119,118,117,
-    119,238, 77,141,112,111,110,109,108, 88, 85,169,107, 33,188,125,
-    103,102,101,242,201,248,196,253,  2,203,  4,  5,198,195,  3,161,
-      0, 41,170,171, 38,  6,108,144, 79, 78, 77,124, 60, 57,181,136,
-     71, 70, 69, 68,115,130, 65, 64, 63, 62, 61,170, 18,144,144, 77,
-     96, 96, 96, 99, 84,101, 87,217,114,241,209, 16,126,243,252,216,
-     39, 38, 37, 36,190,221,222,224, 31, 30, 29, 31,216,214, 25, 24,
-     23, 22, 21,140, 25,184,187, 77,218,219,152,153, 94, 83, 83,237,
-     80,121,121,  7,198, 90, 84,192,255,254,253,204,140, 13,  5, 56,
-    247,246,245,247,192, 62,241,240,239,238,237,116,105, 33,189,125,
-     64, 67,190,144,131,144,178,150,132,135, 69,130,  1, 34, 44,234,
-    131, 12, 24,215,214,213, 23, 78, 33,238,208,207,206,205,204,199,
-     10,201,200,199,198,197, 92,227,104,107, 89,106,103, 36, 37, 46,
-     35, 35, 29,224,193, 74, 71,179,233,228,112,175,174,173,159,220,
-    213,149,155,171,166,165,164,144,146,161,172,159,158,157, 10,179,
-     60, 51, 13,241,243,243,242,245,248, 59, 53,210, 83,114,112, 75,
-    208,220,116, 71,134,133, 69, 30, 93,190,115, 79,126,125,127, 72,
-    122,121,123,119,118,117,224, 83,216,219,217,246,247, 33,190,125,
-    244,198,193,192,195,253, 16, 17, 18, 23, 97,200, 54,160,159, 94,
-     94, 82, 44,165,165,148, 27, 86, 85, 84, 95,109, 81, 80, 79, 78,
-     77,216,201,224,227,225, 45, 32, 35,238,233,228,219,213, 98,227,
-    192,224,251,144,172, 43,247, 54, 53,249,110,205,206,195, 31, 94,
-     45, 31,212,233,234, 27, 39, 38, 37,188, 41,136,139,137, 70,132,
-    183,181,126,127, 79,141, 96, 97, 98, 35, 99, 56,182, 32, 15, 14,
-     14, 11,124,117,118,247, 75,198,  6,  8,207, 61,205,192,255,254,
-    253,106,210, 92, 83, 82, 93, 92, 64, 82,170,167,171, 33,191,125,
-    101,178, 51, 48, 32, 39, 40, 76, 55,235, 38,217, 45,126,157, 28,
-     16, 28, 33, 45,224, 36, 38,218,216,215,214,213, 66,121,184,123,
-    122,101,101, 84,105,158, 48,159, 93,176,177,178, 59,240,242,104,
-    177, 79,190,190,187,204,197, 70, 76, 72,105,134,184,191,141, 66,
-    116,175,174,173, 57, 62, 48,  3,  2, 14,  0,240,251, 93, 28, 91,
-     53, 66, 67, 64, 99, 87, 86,176,196, 87,150,153,109,  6,207,109,
-    111,112, 65,114,124,180,181,117,136,135,134,133, 29,234, 40, 43,
-     41, 40, 43, 34,131,132,  5,135,237,  0,  1,  2,139, 33,192,125,
-     64, 65, 75,167,188,162,158, 74, 14, 13,150,148,164,161,154,155,
-    156,157,158,156, 95, 94, 93,202,  1, 48,243,253,  2,  9,170,171,
-    172,173,175,197,146,147,144,147,135,134,131,212,136, 74, 73, 93,
-    154,157,190,189, 12,193,194,195,196,197,198,201, 55, 54, 53,173,
-    149,148, 91,165,122,113,210,211,212,213,247,191, 80, 81, 82,219,
-     80, 17, 18,135, 99,221,238,250,126,109,230,103,232,233,234,235,
-    236,237,238,224, 15, 14, 13,149,110,147,163, 93, 80,249,250,251,
-    252,253,247,149, 34, 35, 32, 35, 39, 54, 53, 82,139, 33,193,125,
-    131,245, 93,102,141, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 23,
-    230,229,114,138,184, 75,181,128, 33, 34, 35, 36, 37, 39, 79,160,
-    161,162,171,224,162,210,250,120,  2,195,170,157, 45, 54, 55, 56,
-     57, 58, 59, 60, 61, 62, 63, 79,190,189, 42, 46, 16, 28,237,232,
-     73, 74, 75, 76, 77, 79, 37,114,115,112,115, 87,102,169,166, 12,
-     91,148, 14, 56, 93, 94, 95, 96, 97, 98, 99,100,101,102,105,164,
-     86,149,  1,197, 56,  4,197,112,113,114,115,116,117,119, 31,240,
-    241,242,243,112,241,177,131,213,212,146,214,236,157, 33,194,125,
-    134,143,  0,137,138,139,140,141,142,143, 80,110,109,249, 49,195,
-     60, 63,152,153,154,155,156,157,159,245,130,131,128,163,164,134,
-    149,152, 93,252,255,254,196,173,142,141,144,177,178,179,180,191,
-    150,117, 68, 70, 69,221, 41,247, 20, 29,192,193,194,195,196,197,
-    199,159, 64, 65, 66, 75,204, 13, 66,  3, 47,  4,135,134, 78, 85,
-    214,127, 80, 89, 90,219,220,221,222,215, 96,222, 31,137,176,207,
-     76, 71,232,233,234,235,236,237,239,185,210,211,208,209,212,247,
-    197,196,199,  4,175,158,102,191,180,221, 34,  9, 32, 33,195,125,
-      1, 36, 39, 36,  9,200,250,247, 98, 92, 39,164,143, 16, 17, 18,
-     19, 20, 21, 23, 65,144,145,146,147, 28,145, 22,211,239,222,247,
-    118,142,117, 47, 15,160,169, 34,171,172, 36, 62,175,  0,  2,207,
-    150,180,159,156,183, 56, 57, 58, 59, 52, 61, 63,105,226, 99, 96,
-     97, 68, 69, 70, 71,123,118,183, 30, 21,239,206,229,114, 19, 82,
-    115,116, 55, 80,121, 88,150,167,253, 94,247,252, 95, 96, 97, 98,
-     99, 78,229,239, 50,224,225,226,227,236,109,110,111,112,190,141,
-    166, 46, 29,124,209, 62, 44, 26, 34,124,253,126,231, 33,196,125,
-    136,126,127,213,134, 47, 12,135,136,137,138,139,132,173,143,218,
-     50, 51,176,177,180,149,150,151,154,170,101,102,198, 59, 56, 53,
-     58, 55,179,135,192,133,128,135,132,102, 87,255,165,244, 38,175,
-    176,177,178,247,244,181,179,226, 16, 17, 50, 51, 60,189,190,191,
-    204, 13, 13, 60,146,156,172,109, 81,156,158,110,212, 69, 70,206,
-     92, 33, 47,131,221,191,124,215,216,217,218,217,118,221,139,138,
-    138,203,192,193,196,229,230,231,232,234,217, 20, 25, 75, 75,186,
-    165,164,171,170,118,147,148,213,184,218,  7,187,213, 33,197,125,
-     87, 86,255,  0,  1,  2,  6,174,175,175, 82, 98,129,130,131,132,
-     13, 14, 15, 16, 17,222,236,235, 64, 64,130,141, 76, 79, 93, 73,
-     84, 78, 15, 35, 18, 47, 99,141, 79,140, 39, 56,121,106,107,117,
-    139,139,122, 90,155, 16, 17, 22, 53, 54, 55, 56, 57, 58,  4,195,
-    192,107,105, 22, 24, 39,229, 97, 16, 32, 97, 11,106,119, 11,238,
-    231,236, 14, 80, 68,200,214,254,195,  3,  2,  2,241,210,211,212,
-    221,214, 95, 96, 97, 98,172,155,154,179, 49,253, 60, 15,206, 57,
-     56, 55,254,248, 98,207,115,212,245,118,247,120,241, 33,198,125,
-    248,219,116,255, 87, 42,214, 35,160,161,166,167,134,135,136,137,
-    138,136,179,114,123,218,  5,196,247,198,193,192,195,245,250,117,
-    167,153, 54, 18, 92, 55, 42,  3,128,171, 38,135,135,242,253, 33,
-     34, 35, 36, 45, 38,175,176,177,178,191,184, 74, 73,226,237,236,
-    239,238,233,231,235, 42,208, 74,255,201,110,197, 57,109,224, 99,
-    232,105, 68, 69,103,154,133,115,120,241,246,245,246,215,216,217,
-    233,232,239,238, 33, 10,181,180,183,182,177,176,179,178,189,250,
-     94,225, 68,237,225,  5, 90,219,216,219,126, 87,127, 33,199,125,
-    162,173, 83, 80,115,116,117,254,119,  0,  1,  2,  3,200,201,249,
-    250, 93, 92, 95, 94, 89, 88, 91, 90, 65, 59,234, 19,148, 37,218,
-    233,176,187,176,145,180,183,183, 74,117, 67,  0,  1,  6,  5, 36,
-     39,  8, 41, 42, 43, 31, 30, 29,208,197,100,103, 76,203,200, 99,
-     98,110,174,210, 59,195, 62, 13,  0,186,225,232,233,238,239,239,
-     18, 29, 19,224,195,196,205,206, 71, 80, 81, 82, 83, 84, 89,154,
-    152,167,166,165,164,163,162,161,163, 96, 97, 98, 99,148,101,102,
-    239,164,131, 99,194,198,247,203, 58, 37, 43,208, 81, 33,200,125,
-     86, 87, 86, 87,120,121,122,123,124, 78, 77, 76,191,126,125,124,
-    183,182,181,184,136,137,138,139, 76,143,172, 45,176,144,196,  9,
-     50, 63,255,194,205,205, 16, 19, 20, 29, 30, 31,168,161,162,163,
-    164,165,170,107,100,101,102,103, 96, 97, 98, 99,112,177,178,179,
-    180, 61, 62, 23, 48,185,227,225,214,219, 27,218,149,151,224,225,
-    230,229,196,199,200,201,202,203,204,205,253,252,227,226,225,224,
-    231,230,229,228,216,217,218,219,222,253,124,221,194,193,247,118,
-    129,112,179,178,189,188, 96, 99,100,101,110,231,120, 33,201,125,
-    241,242,243,244,245,246,247,248,249, 54, 55, 48, 49, 50,255,  0,
-      1,138,139,140,141,174, 15,162,163,172,146, 86,107, 87,106, 69,
-     68,176,177, 54, 55, 54, 55, 24, 27, 26, 27, 28, 29, 30, 31, 32,
-     34, 17, 16, 20, 37, 38, 39, 40, 41,  8,  9, 14,  7,132,  5,154,
-    155,155,102, 97, 96, 99, 81,109,108, 82,145,148,181,182,183, 64,
-     65, 74,195, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 88,
-    217,218,219,220,255,124,119,206, 15, 12, 77,250,251,203,  5,246,
-      4,  8,201, 70, 71, 68,101, 72, 73,106,105,110, 77, 33,202,125,
-    110,111,112,113,114,115,116,117,118,119,122, 91, 88, 89, 94,247,
-    126, 93, 26,231,228,149,226, 35, 35,238, 45,220,208, 33, 38,  5,
-      6, 15,144, 17, 18,155, 20,149,150,151,152,153,154,155,156,157,
-     82, 83, 40, 41, 42, 43, 44, 15,132,135, 62,255,240,189, 10, 11,
-     11,245,229,228,228, 17, 30,151,148,149,184,187,184,187,188,191,
-    156,191,192,193,194,195,196,197,196,229,234,235,232,233,238,231,
-    236,229, 74,183,180,117,178,115, 67,178,113,140,143,113, 86, 85,
-     86, 87,104, 97,226,227,108,237,102,231,232,233,234, 33,203,125,
-    235,236,237,102,103,120,121,122,123,126,125,212,221, 98, 83, 80,
-    174,169,168,171,153,102,100, 87,105, 46, 47, 44, 37, 42, 43, 42,
-     43, 14, 13, 46, 15, 48, 49, 16, 48, 54, 55, 52, 53, 58, 59, 56,
-     57, 54, 29, 52, 61,185,183,136,185,177, 76,115, 66,129,124,191,
-     65,134,135,134,167,184,185,178, 51,188, 53, 54, 63, 48,185,178,
-    179,180,181,182,183,200,201,232,233,236,205,108,109,226, 44, 19,
-    225,214, 36, 27, 52, 49, 51, 55,111,142,191,188,189,186,187,187,
-    185,134,135,132,133,130,131,131,189, 68,235,107,178, 32,  0,105,
-     37, 36, 39, 38, 33, 32, 35, 34, 45, 44, 47, 46, 41, 40, 43, 42,
-    213,212,215,214,209,208,211,210,237,223,138,139,143,188,219,218,
-    197,196,199,198,193,192,195,194,205,204,207,206,201,200,203,202,
-    245,244,247,246,241,240,243,242,253,252,255,254,249,248,251,250,
-    229,232,114,179,120,120,227,226,237,236,239,238,233,232,235,234,
-    149,148,151,150,145,144,147,146,157,156,159,158,153,152,155,154,
-    133,132,135,134,129,128,131,130, 77,176,233,216,239,224,139,138,
-    181,180,183,182,177,176,179,178,189,188,191,190,185, 41,205,125,
-    184,187,186,165,164,167,166,161,160,163,162,173,172,175,174,169,
-    168,171,169, 85,100,206,195,200,244, 83, 82, 93, 92, 95, 94, 89,
-     88, 91, 90, 69, 68, 71, 70, 65, 64, 67, 66, 77, 76, 79, 78, 73,
-     72, 75, 74,117,116,119,118,113,112,115,113,125,115, 89, 40, 31,
-    224,123,122,101,100,103,102, 97, 96, 99, 98,109,108,111,110,105,
-    104,107,106, 21, 20, 23, 22, 17, 16, 19, 18, 29, 28, 31, 30, 25,
-     24, 27, 25,  5,  7, 46,159,155,104,  3,  2, 13, 12, 15, 14,  9,
-      8, 11, 10, 53, 52, 55, 54, 49, 48, 51, 50, 61, 60, 41,251,125,
-    103,102, 97, 96, 99, 98,109,108,111,110,105,104,107,106, 21, 20,
-     23, 22, 17, 16, 19, 18, 29, 28, 31, 30, 25, 24, 27, 26,  5,  4,
-      7,  6,  1,  0,  3,  2, 13, 12, 48,247, 92,120,199,198, 53, 52,
-    251,250,253,252,255,254,241,240,243,254,245, 52,247,246,233,232,
-    235,234,237,236,239,238,225,224,227,226,229,228,231,230, 25, 24,
-    216, 47,132,192,208,209,238,223,239,237,234,235,235,233,246,247,
-    244,246,242,243,240,241,253,255,252,205,250,251,248,249,198,196,
-    196,197,194,195,192,193,206,204,240,  7,174, 44,247, 37,207,125,
-     54, 41,228, 39,234,237, 44, 35,226, 45, 32, 35,238,229,228,235,
-     38, 89, 88, 91, 86, 93, 92, 95, 94, 81, 80,211, 82, 85, 84, 87,
-     86, 73, 72,136, 99,213,112,128,130,190,188,188,189,186,187,184,
-    186,134,180,183,133,130,176,128,129,190,143,143,142,138,139,136,
-    137,166,151,196,149,146,147,144,145,158,156,160, 75,246,248,171,
-    166, 89, 88, 87, 86, 93, 80,147, 94,157, 92,159, 82, 85, 88, 87,
-    150, 69,136,139,138, 77,140,143,142,129,128, 39, 66,133,132,135,
-    134,185,184,120,147, 46,160,115,113,125, 79, 76,126, 37,208,125,
-    121,120,123, 74,101,100, 87, 86, 97, 83, 99, 97,109, 92, 95, 93,
-    106, 91, 88, 89, 38, 39,125, 37, 34, 35, 32, 33, 46, 44, 35,251,
-     73, 72, 23, 26,201,200,  7, 10, 13,  0, 15,  2, 13, 12, 15, 14,
-      9,  4,  7,202,249, 52,251,250,241,252,255,242,241, 48, 85,242,
-    245,244,247,246,233,232, 27,195, 80,252, 16, 18, 30, 31, 28, 46,
-     41, 40, 43, 42,213,215,215,214,225,224,224,226,222,236,236,238,
-    217,235,232,233,246,244,173,117,242,243,240,241,254,252,242,235,
-    186, 92,199,198,249, 56, 55,250,241,240,243,242,253, 37,209,125,
-    252,255,242, 57,244,247, 54, 41, 36, 43, 38, 45,236, 47, 34, 33,
-    224,137, 98, 37, 36, 39, 38, 89, 88,170,179,226,249,163,146,174,
-    159,156,174,169,168,155,154,181,135,183,134,177,128,176,178,190,
-    188,188,141,138,139,184,137,133,135,209,  6,130,131,128,129,142,
-    140,130,155,218,226,187,122,169,168,103,106,161,172,175,110,161,
-    160,111,174,169,164,103,102,149, 84,155,154,157,144,159,158,157,
-    145, 57,210, 85,148,151,150,137,136,186,115, 24, 42, 51,114, 78,
-     76,127, 78, 74, 75, 75,122,118,119, 68,117,113,112, 37,210,125,
-    115,113, 78,127,124, 77, 74, 72, 75,121, 86, 85,  1,213, 82, 83,
-     80, 81, 94, 92,152,155, 51,  2,235,170, 21, 24,215, 26, 17,208,
-     19,210, 29, 16,223, 30, 21, 24,215,218,  5,  8,199,  6,205,204,
-    207,194,193,201,105,130,197,196,199,198,249,248,192, 11,103,170,
-    163,  2, 14, 12, 63, 14, 58, 11, 59, 10, 38, 39, 39, 38, 18, 32,
-     19, 17, 46, 47, 28, 29, 26, 27, 40, 26,230,225,177,101,226,227,
-    224,225,238,236, 43,227,140,126, 75,218,201,200,  7,198,  1,192,
-      3,206,  1,  0,195,206,197,196,  7,  6, 57, 56, 59, 37,211,125,
-     58,253, 60, 63, 62, 49, 57,153,114, 53, 52, 55, 54, 41, 40, 19,
-    219,180, 73, 67,210,237,236,223,222, 42,232,235,217,150,148,164,
-    149,145,144,147,161,158,175,172,157,154,171,152,170,182,177,225,
-      5,178,179,176,177,190,188,123,179,220,225,231, 74,181,116,123,
-    118,177,112,115,190,113,112,179,190,185,120,119,182,105,104,107,
-    166,109,108,111, 98, 97,105,201, 34,101,100,103,102,153,152,160,
-    107,  4, 10, 63, 82,109, 95,111, 94, 90, 88,107,106,118, 71, 71,
-     70, 66, 64,115,113, 78,127, 76,126, 74,123, 75,121, 37,212,125,
-     69, 65, 29,197, 66, 67, 64, 65, 78, 76,163, 11, 44, 33,215,186,
-    101,100,171,170,161,160,111,162, 97,172,111,174,169,104,167,102,
-     21, 20, 27,218, 17, 28,223,222,209,217,117,146,213,212,215,214,
-    201,200,215,211, 84, 85,100,  2, 61, 60, 63, 13, 10, 56, 11,  9,
-      5, 52,  7, 53, 50, 48,  0, 50, 14, 63, 12, 14, 57, 56, 56,  9,
-     22, 21,125, 21, 18, 19, 16, 17, 30, 28,223,251,124,114, 64,234,
-    213, 20,215, 22, 29,208,211, 30,209,220,223,222,217,216,215,214,
-      9,200,203, 10, 13, 12, 15, 14,193,  1,149,  2,  5, 37,213,125,
-      4,  7,  6, 57, 56, 11, 35,148,150,152,241,205,252,255,254,249,
-    200,248,249,229,215,212,230,226,208,227,225,222,223,220,222,217,
-    219,216,217,165,165, 13,165,162,163,160,161,174,172, 95, 75,204,
-    237, 48, 90,133,132, 71,134, 77, 64,143, 78,129, 76,131, 78,133,
-     72,139, 74,121,184,187,118,125,124,127,126,113,113, 37,178,181,
-    116,119,118,105,104,100,115,244,185,  8,162,174,156,175,157,169,
-    155,171,  0, 85,103, 87,102, 81, 80, 80, 98, 93,111, 92, 94,105,
-    107,104, 90,118,117,221,  5,114,115,112,113,126,124, 37,214,125,
-    140, 27, 12, 29,225,138,185,116,119,182,189,188, 89,216,209,112,
-    115,178,181,120,123,186,169,168,103,102,173,172,175,110,161,161,
-     21, 34,165,164,167,166,217,216,212, 65, 97,117,185,209, 29, 28,
-     31, 30, 41, 66,177,176,175,183, 52, 54,  2,  3, 51, 50, 14, 63,
-     12, 62, 57, 56,  8, 57,  6,  1, 76,102,  2,  3,  0,  1, 14, 12,
-    252,107,100, 82,161, 58,229, 40, 43,230,236, 98,137,135,135,132,
-    227,226, 37, 36, 39, 42, 25, 20,219,218,221,208, 19, 30, 17, 25,
-     38,138, 21, 20, 23, 22,  9,  8,  4,147,148,150, 89, 37,215,125,
-      2,205,207,204,253,248,  8, 98,147,111, 94,119,246,242,240,243,
-    241,206,252,204,205,250,248,251,202,214,243, 78,147,210,211,208,
-    209,222,220, 44,187,188,129, 45, 42,149,148,151, 86, 86,148,185,
-     11,251,198, 63,146,149, 84, 91,150, 73,132,139, 70,129,140, 79,
-     66, 65, 89, 38,251, 69, 68, 71, 70,121,120,118,227,228,212,181,
-    114,142,188,143,142,141,143,146,236, 48,194, 15,166,162,144,160,
-    161,173,172,172,173,154,155,152,153,102,  3,254, 35, 98, 99, 96,
-     97,110,108, 94, 11, 12,  4, 77,150, 69, 72, 71,134, 37,216,125,
-    181, 80,106, 40, 23,214,229,130, 69,136, 71, 74,117,180,123,122,
-    177,124,191,178,176, 35,222, 11,181,180,183,182,169,168,100, 51,
-     52, 32,137,162,110,108,108, 94,121, 27, 98,195, 67,130, 77, 22,
-     18, 19, 19, 34, 45, 44, 31, 45, 42, 43, 43, 25, 52, 83,166,115,
-     50, 51, 48, 49, 62, 60, 12, 91, 92,203,161,198, 53,244, 59, 54,
-    252,252,249,103,104, 89,169,178, 57, 52, 59, 58,233, 40, 39, 42,
-    225, 32,239, 46,232,115,142, 91,229,228,231,230, 25, 24,212,  3,
-    132,221,185,146,221,236,236,237,198, 27,209,112,159, 37,217,125,
-    158, 97,102,241,240,192,194,254,255,207,253,202,251,251,249,192,
-    139, 86,131,130,195,192,193,206,204,252,171,173,205, 65,138,229,
-    228, 43, 39,182,223,217,136,119,121,134, 78, 41,228,231,230, 89,
-    148,151,150,145, 92,159, 82, 88, 66, 62,107,213, 84, 87, 86, 73,
-     72,152,243, 18, 86,106,242,141,143,165, 43,246,135,185,224,239,
-     17,237,221,178,179,128,178,142,140,191,142,138,139,139,137,176,
-    218,  6,211,210,147,144,145,158,156,140,251, 63,247,114,214,101,
-    153,206,253,174,167, 45, 55,  7,249,  5,246, 89, 88, 37,218,125,
-     87, 86,137, 68, 75,138,129,140, 79,142, 88,178,222,155,  5,132,
-    135,134,185,184,232,131, 20, 45, 25, 13,190,121, 10, 17,134,  7,
-    133,224,243,241, 50,204, 97, 80, 80, 97, 93,108,111, 94,106, 91,
-     88,106, 66,106,150,225, 98, 35, 32, 33, 46, 44,140, 67, 76, 77,
-    177,101,197,195, 82,121,254,255,253,152,168,153,106,164,201,196,
-      7,  6,245,244, 59, 58,241,252,255,241, 64,193,178,235,117,244,
-    247,246,233,232,180,211,116,118,137, 93, 46, 41,216,209,212,215,
-     85,188,124,129,130,188, 98,227,211,209,222,236,220, 37,219,125,
-    237,234,235,232,219, 50, 57, 74, 17,146,243,240,241,254,252,108,
-     27,156,158,110,134,245,233,136,  9, 14, 45,  5, 88, 87,169,170,
-    148, 89,244,247, 58,229, 36, 43,230, 33, 44, 35,239, 61, 29, 98,
-     59,181, 36, 39, 38,154,104, 52,107,196,198,  6,209,173,137, 96,
-     97,110, 69, 69, 51, 44,209,210,208, 33,131,176,177,190,143,188,
-    190,186,187,187,189,197,189, 55, 97,226,131,128, 77, 66, 64, 23,
-    107,236,237, 46,249,165,251, 88, 89,222,245,253,  7,  8,249, 58,
-    248,  1,168,171,102,153, 84, 87, 90, 81,172,159,143, 37,220,125,
-    161, 85,223,139,134,167,164,165,186,184,239,179, 20, 21, 22,129,
-    190,  3,112,177, 60, 29, 29,224, 32, 33, 17, 35, 27,240,112, 65,
-    126,124, 76,125, 74,120, 72, 13,153,109,231,177, 30,159,156,157,
-    146,144,135,147, 60, 61, 62,169,217, 11,232,233,204, 69, 69,184,
-    136, 73,138,139, 79,176, 27,214,201,200,  7, 10, 13,252,192, 61,
-     13, 37,143, 11,246,247,244,245,202,200,223,193, 68, 69,100,  1,
-    205, 51,192,197,204,109,110,144,112, 65,130,179,183,138, 35, 34,
-     46, 28, 44, 45, 26, 43, 24, 42,209,241, 84,211, 46, 37,221,125,
-     47, 44, 45, 34, 32, 55,225, 12,141,135,213,  9,203, 56, 25,148,
-    149,149,148,152,149,154,155,156, 98,107,202,245,244, 59, 54, 61,
-    192, 12, 13,  0, 41, 50, 63,  6,  7,  4,  5, 26, 24,207,217,150,
-    181,151,209, 29,211, 18, 83,188,189,181, 79,252,253,240,249,196,
-    234, 57,146,174,175,159,173,169,103,100,101,122, 81,128,249,126,
-    127,124,125,114,112,170,177,254,227, 94, 10,133, 75, 78, 75,228,
-    239,229, 27, 36,213,234, 99,108,237, 17, 58,165,100,167,106,174,
-     95, 92, 93, 82,113,112, 81, 86, 87, 84, 85,170,168, 37,222,125,
-    125, 89,251,239,  5,252, 94,163,136,139, 12, 45,  5,252, 44, 34,
-     50, 27, 20, 21, 41,234,126,124,127,126,182,183,180,181,138,131,
-      8,137,142,143,140,141,130,128, 69,126,118,133, 46,199,154,155,
-      0,179, 54, 53, 29,196, 56, 53, 58,153, 60, 49, 14,  0, 21,216,
-     23, 25,238,239,236,237,226,227,224,225,230,231,228,229,250,248,
-     49,  6, 62,245, 90,153,114,243,144,121, 94, 93,118, 95, 96, 97,
-    168,201,228,101, 89,152, 61, 60, 60,193,198,199,196,197,218,219,
-    216,217,222,223,220,221,210,208, 41,110,214,253,126, 37,223,125,
-    220, 56,  9,168,139, 38, 15, 41,119, 74,118,128,  9,  3,129,190,
-    112,197,196,248, 57, 62, 63, 60, 61, 50, 51, 48, 49, 54, 55, 52,
-     53, 10,  8,250,182, 14, 37,164,139,136,133,  0,  9, 36, 37, 49,
-     95,112,  2,184,177,183,118,185, 72,173,236, 16, 17, 22, 23, 20,
-     21,106,107,104,105,110,111,108,109, 98, 96,146,206,102,205,204,
-     79,216,115, 82,115, 94,255,137,219,216,121,216,211, 28, 46, 29,
-    220, 58, 72, 72, 73, 78, 79, 76, 77, 66, 67, 64, 65, 70, 71, 68,
-     69, 90, 88,174,246, 94,245,252,217,218,219,216, 91, 37,224,125,
-    246, 84,130,207,128,  9,  0, 12,248, 54,250,  7, 18,172,160,161,
-    166,167,164,165,186,187,184,185,190,191,188,189,178,176, 68, 22,
-    118,189,150,159,170,139,  8, 41, 46,130,230,231,  8,  3, 34, 36,
-    211, 34, 33,208, 90,164,152,153,158,159,156,157,146,147,144,145,
-    150,151,148,149,234,232, 89, 78, 46, 71,102, 69, 98,201,202,105,
-    230, 17, 78,115, 88,115,250,160,168, 90,170, 87, 50,207,240,241,
-    246,247,244,245,202,203,200,201,206,207,204,205,194,192,113,104,
-     54,221,238,231,218,243,240,115,221,137, 73,199,122, 37,225,125,
-    211,250,136,131,126,130,190,234, 23, 40, 41, 46, 47, 44, 45, 34,
-     35, 32, 33, 38, 39, 36, 37, 58, 56,133,144, 78, 47,180, 61, 50,
-    185, 56, 49, 55,109, 97,127,160,171,138, 83,167, 85,102, 86,  2,
-     51,  0,  1,  6,  7,  4,  5, 26, 27, 24, 25, 30, 31, 28, 29, 18,
-     16,173, 75, 74, 71, 20, 21,106,193,226,233,107, 58, 57, 15,200,
-     73, 72,200, 63, 49,193,194,122,139,120,121,126,127,124,125,114,
-    115,112,113,118,119,116,117, 74, 72,228, 83, 27, 15, 12, 77,202,
-    233,224, 65, 83,210, 30, 47,240,209,125,252,  4,202, 37,226,125,
-      9,  2, 82,163, 80, 81, 86, 87, 84, 85,170,171,168,169,174,175,
-    172,173,162,160, 12,135,243,230,132,167,152, 25, 56,184,235,233,
-     41,232,152, 57, 21,216,223,221, 30,217,137,123,136,137,142,143,
-    140,141,130,131,128,129,134,135,132,133,154,152,178,156,203, 90,
-    156,149, 16,155,176,132,195,194,241,192, 67, 65,141,131, 75,181,
-    185,177,237, 35,224,225,230,231,228,229,250,251,248,249,254,255,
-    252,253,242,240,218,248,163,163,244,245, 64, 75,216,156,155,154,
-    153,152,139,106,149,148, 99,145,145,105,213, 27,216, 37,227,125,
-    217,222,223,220,209,210,211,208,209,214,215,212,213, 42, 40, 18,
-     91,185,211, 46,165,136, 43,177,116,191, 66,178,112, 83, 81, 98,
-    175,151,105, 86, 77, 61, 51, 48, 49, 54, 55, 52, 58, 10, 11,  8,
-      9, 14, 15, 12, 13,  2,  0, 58, 97, 57,  7, 62, 39, 18, 57, 57,
-    115,139,117,121, 72, 72, 69, 69,183, 76,190,129,165,101,107,104,
-    105,110,111,108, 98, 98, 99, 96, 97,102,103,100,101,122,120, 70,
-     35,193,124,148,127,114,235,213,228, 47, 45,237,224, 28, 29,221,
-    227, 27,229, 25,253,125, 67, 64, 65, 70, 71, 68, 74, 37,228,125,
-     90, 91, 88, 89, 94, 95, 92, 93, 82, 80, 92,199,249,148,252,215,
-    136,137, 14, 60,251,246,  9,247,244, 53,201, 11, 51, 49,  1,101,
-    133,187,184,185,190,191,188,182,114,179,176,177,182,183,180,181,
-    138,136,135,156,229, 64,  4, 15,  6, 41, 22,215,211,210,237,211,
-    207, 49,193,240, 52, 10,246, 93,174,147,144,145,150,151,148,158,
-     26,235,232,233,238,239,236,237,226,224,227,196,188, 25, 76, 69,
-    155, 81,162,172,171,170,166,171,103,106,166,148,156, 82,145, 53,
-    246,203,200,201,206,207,204,  6, 62,195,192,193,198, 37,229,125,
-    199,196,197,218,216, 27,248,132, 33, 92, 95, 71,121,138, 75, 67,
-    130,142,179,140,113,126,140,119, 69, 75, 45,222, 35, 32, 33, 38,
-     39, 36,239,197,251, 56, 57, 62, 63, 60, 61, 50, 48,243, 19, 96,
-    205, 54, 63, 31,162, 94,160,103,154, 86,167,104, 85, 86,100, 95,
-     93,175,  5,230, 27, 24, 25, 30, 31, 28,215,237,227, 16, 17, 22,
-     23, 20, 21,106,104,167, 67, 58,181,108,231, 56,202, 57, 52,195,
-      2, 13,240, 31, 45,237, 16, 23, 41,235,125,130,115,218,249,246,
-    119,116,191,245,183, 72, 73, 78, 79, 76, 77, 66, 64, 37,230,125,
-    187,107,211,175, 70,239, 48,254,253, 15, 11,  5,249,248, 55,  5,
-     58, 11,243,  2,195, 85, 90,  1,168,169,166, 47,172,111, 29, 92,
-     80,161,166,167,164,165,186,184, 67,147, 43,215,180,151,216, 22,
-     25, 27, 44,225, 33,208,211,222,225,223, 39,217, 27,141,114,131,
-    128,129,134,143,196,119, 53,100,103, 89,158,159,156,157,146,144,
-    104,187,131, 63,148, 63,128, 77,126, 64, 71,122,121,132,184,186,
-    182,183,188, 77,179,230, 10,251,248,249,254,255,245, 13, 89, 12,
-     15, 14,  9,  8, 11, 10, 53, 52, 32,227,216, 79,238, 37,231,125,
-    103,104, 86,154,168, 92,173, 97,156,128,114,142, 76,136,117,119,
-    222, 34,211,208,209,214,215,212, 21,129,212,215,214,209,208,211,
-    210,221,220,136,  9, 50, 39,  4,143,144,173, 81, 80,148,150, 86,
-    100,107,150,101,171, 99,158,147, 54,248, 43,  8,  9, 14, 15, 12,
-    255, 40,252,255,254,249,248,251,250,229,228,184,177, 78, 31, 62,
-    191,184,137, 70,187,140,142,190,191,  3,  2, 62,  0, 59,202,  7,
-    110,144,201, 96, 97,102,103,100,149, 96,196,135,134,129,128,131,
-    130,141,140,208,212, 54,117,126,223,224,210,226,227, 37,232,125,
-    228,213,218, 27,231, 26, 22, 23, 19, 34, 31, 70,250,241,240, 89,
-     94, 95, 92, 97, 84,236,175,174,169,168,171,170, 85, 84, 10,  5,
-    110,167, 46,  7,  8, 58,246,  4,204, 13, 50,255, 47,225, 34,239,
-     27, 26,231,178,122,177, 26,177,182,183,180,137,136, 52,119,118,
-    113,112,115,114,125,124,  0, 62, 70,165,142, 47, 48, 14,254, 51,
-    244,245,250, 55, 23,202, 57,196, 60, 62,255,154, 18,225, 64, 73,
-     70,239,236,209,224, 92, 31, 30, 25, 24, 27, 26,  5,  4,250, 73,
-    254,119,118, 85, 88,106,150, 91, 96,173,145, 95,111, 37,233,125,
-    158,109,156, 88,101, 96,194, 60,105,106,107,100, 71,196,249,219,
-     84, 39, 38, 33, 32, 35, 34, 45, 44,226, 45,214,247,246,125,128,
-    189, 66,131,132, 69,134,  7,168, 74,117,116,115,130, 72, 41,197,
-    196,210,147,148,159, 60,  1, 50,156,207,206,201,200,203,202,245,
-    244, 50,245,  6,135,142,167,168,154,106,171,164,173, 82,143, 62,
-    190, 78,191,139,122,112, 17,237,236,239,238,252,181,148, 25,106,
-    248,151,150,145,144,147,146,157,156, 91,145, 68, 69,108,207,208,
-     45,208,115,212, 21,213,245,230,230, 38, 27, 35, 18, 37,234,125,
-     40, 73,181,180,183,182,177,165,228,225, 66, 96,191,190,185,184,
-    187,186,165,164,163,169, 86,213,246,247,248, 53,240,219,252,241,
-    241,221,255,233,242,255, 11, 10,240,158, 93, 92, 95, 94,166,152,
-     14, 11,186,187, 71, 70, 65, 64, 67, 66, 77, 76, 91,113,148,157,
-     30, 31, 35, 17, 42, 43, 36,165, 42, 43, 23,213, 41,215, 28, 18,
-    232,182,101,100,103,153,158,159, 99, 63, 50,144,111,110,105,104,
-    107,106, 21, 20,  7,233,100, 69, 70, 71, 71, 75, 66, 65,204, 78,
-     76,125,111,174,145,172,107,149, 80,206, 13, 12, 48, 37,235,125,
-    241,246,247,203, 10, 42,235, 59, 54, 49, 48, 51, 50, 61, 60,108,
-    195,236,109,110,239,143,115, 82, 83,244, 85, 70,201,215,133,138,
-     71, 67,142,184,230,213,215, 40, 41, 46, 47, 44,210, 28, 32, 28,
-    238,217,216,219,218,197,196,132, 49,180,150, 85, 40,100, 25,186,
-     25,188,157,158,159,171, 82, 93,163, 91,102, 80, 62,253,195,  0,
-      1,  6,  7,  4, 57, 25,219, 23,218,225,224,227,226,237,236,160,
-     19, 60, 62, 66,128, 60, 99,104, 67,228,199,198,199, 56,202, 53,
-    244,207,  2, 20,106,134,123,120,121,126,127,124,125, 37,236,125,
-    114, 79, 64,130,137,136,139,138,181,180,184, 65,196,229,233, 41,
-    178, 75,106, 75,198,239,110,207, 12,254, 13,252,  4,245,236,146,
-    162, 83, 80, 81, 86, 87, 84, 85, 34,168, 87, 86, 81, 80, 83, 82,
-     93, 92, 80,163, 12, 14,241,240,134,179, 56,179, 62, 21, 22, 63,
-    232,217,229, 36,239,226,  4, 69,138,139,136,137,142,143,140,143,
-    162,131,127,126,121,120,123,122,101,100,104,145, 22, 10,201,  8,
-    158,147,144, 17, 22,189,158, 55,191,189, 78,124,139,186, 92, 29,
-    226,227,224,225,230,231,228,231,112,248,  7,  6,  1, 37,237,125,
-      0,  3,  2, 13, 12, 18,211,220,163,222, 93, 54,203,200, 73,236,
-     77, 76,111,107,150, 90,103,163,146,116,  5,218,219,216,217,222,
-    223,220,223,218,208, 47, 46, 41, 40, 43, 42,213,212,224,161,167,
-    123,229,183,209, 16,232, 33, 36,167,  4, 13,147,109,173, 96,148,
-    105,140,253, 50, 51, 48, 49, 54, 55, 52, 55, 40,  8,247,246,241,
-    240,243,242,253,252,226, 35, 35, 84,102, 35,149, 43,218, 57,180,
-    191, 52,181, 27, 69, 69, 72, 67,189,212,213,106,107,104,105,110,
-    111,108,111,194,108,159,158,153,152,155,169,122,120, 37,238,125,
-    176,241,235,195,229,228,230,191, 64, 65,124,247, 92,223,218,221,
-     29, 44, 27, 42,140,141, 66, 67, 64, 65, 70, 71, 68, 69,210, 84,
-    167,166,161,163,172, 93, 82, 80,178,115, 12,229,254, 51,207, 84,
-    104,105,172, 37,172,141,  7, 57,245,196,243,193,100,165,186,187,
-    184,185,190,191,188,179,146,188, 79, 78, 69,183,180,181,138,136,
-     64,  0,229, 71, 38, 20, 27,204,188, 65,138,141, 14,  7, 19, 61,
-     50, 12,203,  9, 92,157,146,147,144,145,150,151,148,155,226,212,
-     23, 22, 46,239,236,237,226,224,  2,196, 73,197, 78, 37,239,125,
-    131,156,135, 54, 53, 62,213,118,117,216,150,154, 91, 95, 97, 52,
-    245,202,203,200,201,206,207,204,207, 98,252,195, 62,198,199,196,
-    197,218,216, 16, 93, 98, 87, 86, 68, 75, 76, 40, 97,220, 93, 86,
-     95,168,190,113,127,132,133,236, 45, 34, 35, 32, 33, 38, 39, 36,
-     43,185,203, 56,198, 62, 63, 60, 61, 50, 48,242, 39,198, 21,158,
-     19,108,108,244,  5,242, 15,  4, 39,130,150, 89, 84, 99, 80,  4,
-      5, 26, 27, 24, 25, 30, 31, 28, 23,146,211, 19,237, 22, 23, 20,
-     21,106,104,160, 51,174,231,230,228,251,250,156,175, 37,240,125,
-    158,239,110,103, 96, 89,209, 44, 27, 40,124,125,114,115,112,113,
-    118,119,116, 77, 69, 71,119,181, 78, 79, 76, 77, 66, 64,129, 74,
-    132,101,110, 35,127, 13, 39,169,109, 95,118,117,120,250,114,247,
-    195,  0, 84, 85,170,171,168,169,174,175,172,167, 46, 83,159,161,
-    166,167,164,165,186,184,113,182,182, 55, 54, 20, 43,230,239, 78,
-     73,135,180,149,  0, 33, 34, 35, 36, 40,140, 77,130,131,128,129,
-    134,135,132,181,165, 88,100,153,158,159,156,157,146,144, 81,157,
-    180,181,182, 51,204,142,191, 21,221,236, 44,237,224, 37,241,125,
-     73, 74, 68,179, 76,228, 37,250,251,248,249,254,255,252, 29,205,
-     51,240,241,246,247,244,245,202,200, 12,249,198, 71,102,103, 75,
-     90, 85,190, 53,  7,  4,111,250,211,114,115, 75,184,220, 29,210,
-    211,208,209,214,215,212, 53,214, 43, 40, 41, 46, 47, 44, 45, 34,
-     32,212, 19,  4,  5, 14,143, 80, 29, 94,102,193,  3, 48, 21,152,
-     43,146,155,147,155, 52,197, 10, 11,  8,  9, 14, 15, 12,205,242,
-      3,  0,  1,  6,  7,  4,  5, 26, 24,232, 41, 22,151,148,151,186,
-    138,137,132,233,232, 20, 21,192, 67, 98,195,196,195, 37,242,125,
-    108,145, 98, 99, 96, 97,102,103,103,230,138,123,120,121,126,127,
-    124,125,114,112,140,177, 84, 85, 86,223,108,233, 46, 44, 17,128,
-    188, 69,104,106,234,235,239, 27, 68,186, 90, 91, 88, 89, 94, 95,
-     95, 94,146, 83, 80, 81, 86, 87, 84, 85,170,168, 88,105, 38, 39,
-     36,  7,  8,  9, 10, 56, 51, 88, 84,141, 58, 18, 18, 19, 20,227,
-    188, 66, 66,179,176,177,182,183,180,186, 74,139,136,137,142,143,
-    140,141,130,128, 66, 65,164,165,166,175, 48, 49, 50, 51,251,200,
-     99,157,154,153, 58, 59, 63,203,148,106, 22,235,232, 37,243,125,
-    233,238,239,236,226,226,227,224,225,230,231,228,229,250,248, 59,
-    249,246,119,116,119, 88, 89, 90, 89,111,162,139, 55, 96,235,194,
-     99,100, 99,204, 50, 61,  3,192,193,198,199,196,250,218,219,216,
-    217,222,223,220,221,210,208, 19,209,212,245,246,255,128,129,130,
-    143, 72, 74,121,221, 34, 33, 42,163,140,139, 36,218,197,196,244,
-    249, 62, 63, 60,193, 50, 51, 48, 49, 54, 55, 52, 53, 10,  8,203,
-    201,142,135,132,135,168,169,170,171,175,158, 81, 90, 26, 27, 50,
-    185,188,179, 28,226,237,236,227, 18, 22, 23,215,233, 37,244,125,
-    106,107,104,105,110,111,108,109, 98, 96,175,161, 68, 69, 70, 71,
-    208,209,210,211,212, 25, 41, 40,142,115, 88, 91, 84,219,116,138,
-    181,180,183,133,126,127,127,177, 66, 67, 64, 65, 70, 71, 68, 69,
-     90, 88,155,153, 94,215,212,213,248,249,250,251,252,253,193,  0,
-    245, 91,168,171, 36,131,172, 82, 93, 92, 95, 93,101,107,107, 89,
-    186,187,184,185,190,191,188,189,178,176,115, 65,180,149,150,151,
-    160,169, 34, 35, 36, 37,233,216,215,240,128,129,166,171,132,122,
-    101,100,103,102, 98,159,163,109,146,147,144,145,150, 37,245,125,
-    151,148,149,234,232, 43, 21,230,103,100,101,106, 73, 74, 75, 76,
-     77, 77,112,175,172,  4,249, 94,211,252,  2, 13, 12, 15, 14, 54,
-    251, 11,  5,239,163,200,201,206,207,204,205,194,192,  3, 62,228,
-    229,230,231,240,249,114,115,116,117,122,123,135,134,133,129,214,
-    215,212,234,213,212,215,213, 46, 44,211,221,136,118, 32, 33, 38,
-     39, 36, 37, 58, 56,251,198, 54, 63,180,181,184,185,154,155,156,
-    174,173,172,147, 94, 93, 92, 91, 90, 76, 13,253,252,255,193,  6,
-     56,251,199,176,190, 88, 25, 30, 31, 28, 29, 18, 16, 37,246,125,
-    211,238, 22, 23, 54, 55, 72,193, 74,195,196,197,198, 11,  4, 54,
-     53, 52, 51, 50, 49, 48, 45,132,136,121,125,128,131,151,232, 21,
-     36,113,118,119,116,117, 74, 72,139,182,134,199,196,197,200,235,
-    234,203,236,237,238,220,195,194, 13, 12, 11, 10,  9,  8,  7,  6,
-      0, 81, 89,168,171,  0,  3, 50, 61,249,174,175,172,173,162,160,
-     99, 94, 86,167,134,135,144,145, 26, 19, 20, 21, 22, 23, 20,213,
-    213,228,227,226,225,224,220, 33, 34, 35, 36, 37, 38,215, 40, 41,
-    162,231,198,135,132,133,154,152, 91,102,110,151, 20, 37,247,125,
-     21, 26, 25, 26, 59, 60, 61, 62, 63,115,114,113,124,187,186,185,
-    116,123,122,117, 75, 76, 77, 78,143, 82,115,240,115, 85, 51,204,
-    241,242, 48,  0, 14,  8,215,214,215,224,225,226,107,100,101,102,
-    103,104,101,166,167,160,161,162,163,188,189,190,179,116,117,118,
-    119,240,241,218,243,124, 20, 36, 21,230, 36,232, 22,210,167,164,
-    165,168,139,138,139,140,141,142,143,144,162,161,160,167,166,165,
-    164,171,170,169,155,156,157,158,157,128,  3,160,129,132,176, 51,
-    194, 61,252,252, 14,246, 39, 38, 39, 56, 49,186, 59, 37,248,125,
-    180,181,182,183,184,185,186,187,188,113,114,115, 12, 13,194,195,
-    196, 77, 78, 79, 64, 97,194, 97,102,107, 87,149,182,139,183,249,
-    126,119,116,245,250,249,250,219,222,221,222,223,224,225,226,227,
-    231,214,213,215,232,233,234,235,236,207,204,205,218, 91,216, 89,
-     94, 92,147,162,173,172,156,241, 86,149, 84, 87,136,137,138,  3,
-      4, 13,134,  7,  8,  9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 27,
-    156,157,158,159,178, 51, 58,141, 74, 75,  8,185,134,183,120,163,
-      1, 79,140,  5, 10, 11, 40, 11, 12, 45, 44, 45, 16, 37,249,125,
-     49, 50, 51, 52, 53, 54, 55, 56, 57, 58, 57, 30, 31, 28, 29,202,
-     65, 96,217, 34, 35, 80, 33,238,236, 35,238, 25, 23,228,229,216,
-    217,210, 83,212,213, 94,215, 88, 89, 90, 91, 92, 93, 94, 95, 96,
-    173,174,235,236,237,238,239,194, 75, 74,253, 58, 55,120,201,214,
-    212, 40, 38, 33, 35,212,221, 90, 91, 88,123,126,127,126,127,130,
-    163,130,131,132,133,134,135,136,139,168,169,174,175,172,173,186,
-    179,184,  9,242,243, 48,241, 62, 12,255, 50,201,200, 52, 21, 40,
-     41, 42, 43, 36,165,166, 47,160, 41,170,171,172,173, 37,250,125,
-    174,175,176, 57, 58, 59, 60, 61, 62, 61, 48,155,144, 33, 22, 23,
-    235,234,149,148,164,165,161,144,172,237,226,227,232,233,238,237,
-    238,205,208,241,210,243,244,215,245,245,250,251,248,249,254,255,
-    252,245,224,203,192,122,114, 79,124,114,129,188,143, 66,185,120,
-    132, 69, 90, 89,122,123,124,117,246,127,248,249,242,243,124,117,
-    118,119,136,137,138,139,140,175,172,175,128, 35, 32,161,105, 84,
-    164,149,121, 68, 52, 49, 51, 55, 50,205,250,251,248,249,198,196,
-    196,197,194,195,192,193,206,204,240,  7,174, 44,247, 36,  0,105,
-     63, 62, 57, 56, 59, 58, 37, 36, 39, 38, 33, 32, 35, 29, 46,236,
-      5, 72, 79,140, 43, 42,213,212,215,214,209,208,211,210,221,220,
-    223,222,217,216,219,218,197,196,199,198,193,234,195,194,205,204,
-    207,206,201,200,203,246,246, 55, 45,108, 91,152,243,242,253,252,
-    255,254,249,248,251,250,229,228,231,230,225,224,227,226,237,236,
-    239,238,235, 66, 75,234,149,148,151,150,145,144,147,161,146, 96,
-    101,248,243,  0,155,154,133,132,135,134,129,128,131,130,141,140,
-    143,142,137,136,139,138,181,180,183,182, 78, 90, 91, 41,252,125,
-    178,189,188,191,190,185,184,187, 74,154, 84, 93, 15,  7,  8,163,
-    162,173,172,175,174,169,168,171,170, 85, 84, 87, 86, 81, 80, 83,
-     82, 93, 92, 95, 84,243,166,241,218, 69, 68, 71, 70, 65, 64, 67,
-    130,178,188, 85,232,224,224, 75, 74,117,116,119,118,113,112,115,
-    114,125,124,127,126,121,120,123,122,101,110,205,204,203,202,201,
-    194,109,108,111,110,105,104,107,170,234,228, 45,188,123,184, 19,
-     18, 29, 28, 31, 30, 25, 24, 27, 26,  5,  4,  7,  6,  1,  0,  3,
-      2, 13, 89,101,164,163,162,161,170, 53, 52, 55, 54, 41,253,125,
-     49, 48, 48,241,194,192,  5,148,147,144, 59, 58, 37, 36, 39, 38,
-     33, 32, 35, 34, 45, 44, 47, 46, 41, 40, 43, 42,223, 77,130,128,
-    123,122,121,122,221,220,223,222,217,216, 24, 25, 58, 56,253,108,
-    107,104,195,194,205,204,207,206,201,200,203,202,245,244,247,246,
-    241,240,243,242,  7, 86,149, 91,147, 82, 81, 80,229,228,231,230,
-    225,224, 44,237, 18, 19,213,116, 67, 64,235,234,149,148,151,150,
-    145,144,147,146,157,156,159,158,153,152,155,153, 47, 46, 45, 47,
-    215, 42, 41, 40, 13,140,143,142,137,136,132, 69, 74, 41,254,125,
-     75,162,236, 27, 24,179,178,189,188,191,190,185,184,187,186,165,
-    164,167,166,161,160,163,160,  7,  6,  5,  4, 60,  2,  1,  0,213,
-     84, 87, 86, 81, 80,144,157,162,160, 70,  8, 51,240, 91, 90, 69,
-     68, 71, 70, 65, 64, 67, 66, 77, 76, 79, 78, 73, 72, 75, 68,223,
-    222,221,220,212, 26,217,216,221,124,127,126,121,120,184, 69,154,
-    165, 13, 51, 55,200, 99, 98,109,108,111,110,105,104,107,106, 21,
-     20, 23, 22, 17, 16, 19, 56,183,182,181,180,176, 66,177,176,173,
-      4,  7,  6,  1,  3,  0, 61,242,  6,166, 91, 92,160, 41,255,125,
-     11, 10, 53, 52, 55, 54, 49, 48, 51, 50, 61, 60, 63, 62, 57, 56,
-     59, 16,143,142,141,140,139,181,137,136,133, 44, 47, 46, 41, 43,
-     43, 21, 37,190,126,131,215,120,  7,210,221,220,223,222,217,216,
-    219,218,197,196,199,198,193,192,193,104,103,101,101,100, 99, 93,
-    145, 96, 93,244,247,246,241,243,243,205, 48, 86,106,161, 52, 80,
-    238,186,229,228,231,230,225,224,227,226,237,236,239,238,233,232,
-    233, 67, 63, 49, 61, 60, 59, 58,198, 56, 55,156,159,158,153,151,
-    155,101,179, 46,210,246,112, 40,166,214,141,140,143, 42,  0,125,
-    142,137,136,139,138,181,180,183,182,177,176,185, 27, 23, 41, 21,
-     20, 19, 18, 30,208, 15,100,167,166,161,172,163, 93,119,  5,250,
-    238,218,192,142,255, 85, 84, 87, 86, 81, 80, 83, 82, 93, 92, 95,
-     94, 89, 88, 81,243,239,209,237,236,235,234,233, 20,231,156, 79,
-     78, 73, 68, 75,181,175,209, 34, 58, 78, 40, 86, 39, 45,124,127,
-    126,121,120,123,122,101,100,103,102, 97, 96,121,203,  7,249,197,
-    196,195,194,193,204,191,168, 23, 22, 17, 28, 16,238,247,185, 74,
-     98,  5,192, 50, 79, 80,  4,  7,  6,  1,  0,  3,  2, 42,  1,125,
-     13, 12, 15, 14,  9,  8, 81,175, 95,145, 93,156,155,154,153,152,
-    151,139, 63, 62, 57, 52, 56,202,255,177,114, 83, 20, 56, 10,119,
-    120,108, 47, 46, 41, 40, 43, 42,213,212,215,214,209,208,185,119,
-    135,117,181,116,115,114,113,112,111,107,199,198,193,204,204, 50,
-     24,153,154,151,240,208,225,159,160,160,247,246,241,240,249,242,
-    213,252,255,254,249,245,145, 83, 63, 77,141, 76, 75, 74, 73, 72,
-     71, 71,239,238,233,228,228, 42, 67,193,194, 14,156,216,185,199,
-    200,201,203,158,153,152,178, 90, 45,132,135,134,129, 42,  2,125,
-    125, 41, 43, 87, 37,213, 36, 35, 34, 33, 32, 31, 31,247,182,177,
-    191,188, 77, 96, 41,234,230,183, 48,161,239,242, 81,242,246,161,
-    160,138, 96,  7,172,175,187, 86, 93,  1,  3,143,254, 13,252,251,
-    250,249,248,247,247,159, 94, 89,103,148,165, 26,209, 18, 34, 64,
-    232,101,215, 18, 25, 26, 27, 29, 75,238,156,223,244,117,225,142,
-    134,217,219,167,214, 41,212,211,210,209,209,155,207,167,102, 97,
-    108, 92, 23, 58,249, 10, 55,104,204,113,255, 64, 65, 66, 67, 68,
-    110,180,200,187,156, 21,137,230, 78,177,176,115,174, 42,  3,125,
-     81,172,171,170,169,191, 90,166,207, 14, 10, 59, 52, 55, 98,145,
-     98,111,172,148, 41,151,104,105,106,107,108, 70,172, 83,128,132,
-     13,113,222, 74,137,136, 91,134,185,132,131,130,129,159, 64, 62,
-     39,214,210,227,236, 29, 10,117,138,135,184,132,254,127,144,145,
-    146,147,148, 58, 84,167,104,172,230,145, 52,162, 97, 96,131, 94,
-     97, 92, 91, 90, 89,167,168,  6, 15,254,250,203,196, 57,176,141,
-    178,179,176, 28,245,135,184,185,186,187,190, 18,126, 79, 60,206,
-     62,201,108, 58, 57, 56, 11, 54, 58, 52, 51, 50, 49, 42,  4,125,
-    207,224,254,123,134,130,112,124,210,216,233,218,219,220,244,158,
-    211,224,225,226,227,230, 74, 41, 39, 23,233, 26,193,204, 18, 17,
-     16, 56, 14,  2, 12, 11, 10,  9,247,248,210, 19,174,170,104, 84,
-    250,128,  1,  2,  3, 59, 44,121,251,  8,  9, 10, 11,  6,178,241,
-     15,239, 17,226, 59, 20,234,233,232,208,230,234,228,227,226,225,
-     31, 32, 41, 11,118,114,176,140,230,104, 41, 42, 43, 19, 36, 94,
-    227, 48, 49, 50, 51, 62,202,201, 55,  7, 58,202, 19, 63,194,193,
-    192,136,190,190,124,187,186,185, 71, 75, 75, 75, 30, 42,  5,125,
-     26,216,228,255, 48, 81, 82, 80,168,156, 21,100, 88, 89, 90, 91,
-    119,162,162, 95, 95, 98,146, 67,107,154,153,152,154, 86,150, 84,
-    147,146,145,175,112,115,114, 38, 34, 35,220,119, 24,121,122,120,
-    143,116, 50, 64,128,129,130,131, 39,122,118,135,183,138,122,139,
-    179,114,113,112, 98,174,109,172,107,106,105, 87,152,153,186,142,
-    202, 11, 62, 19, 64,161,162,163,104,108,229,100,104,169,170,161,
-      3, 82, 94,175,143,190, 78,179,139, 74, 73, 72, 74,182, 69,180,
-     67, 66, 65, 79,192,193,194,214,146, 83,106,231, 16, 42,  6,125,
-    201,202,200,255,196,142,255, 16,209,210,209,107, 42, 38,219,231,
-    214, 38,219,227, 34, 33, 32, 16,110, 29, 44, 27, 26, 25, 23,232,
-    233, 96,174,137,139, 97, 47,200,241,242,255,244,252,186,251, 56,
-    249,250,115,  3,  2, 14,240, 63, 14,253,  3,251,250,249,248,248,
-    134,245,196,243,242,241,243, 16, 17, 16, 22, 77, 67, 25,215, 34,
-     25, 26, 23, 28, 20, 94, 28,224, 33, 34, 41,219,218,230, 40, 23,
-     38,213, 43,211,210,209,208,204,178,205,204,203,202,201,203, 56,
-     57, 24,186,106,107, 61,207, 68, 65, 66, 64, 68, 68, 42,  7,125,
-     54, 71,120, 73, 74,224,179,178,142,115,111, 94,173,147,171,170,
-    169,168,164,250,165,164,163,162,161,163, 96, 97, 96,194, 50, 51,
-    101,151,104,105,106,107,108,108, 18,108,140,113,115,220,139,138,
-    182, 75, 71,118,133,187,131,130,129,128,124, 33,125,124,123,122,
-    121,120,136,137,136, 42,217, 27,174,179,144,145,146,147,148,148,
-    213,151, 84,153,143,164, 99, 98, 94,163,159,110, 93, 99, 91, 90,
-     89, 88, 87,129, 85, 84, 83, 82, 81, 80,176,177,190, 26,226,227,
-     22,187,184,185,186,187,188,180,242,191,252,193, 82, 42,  8,125,
-    188, 59, 58,  6,251,247,  6, 53, 59, 51, 50, 49, 48, 47,249,237,
-     44, 43, 42, 41, 40,216,217,218,241,138, 75, 94,211,224,225,226,
-    227,228,236,149,231,235,235,191, 20, 19, 18,238, 31,207, 14, 13,
-      3, 11, 10,  9,  8,  7, 49,197,  4,  3,  2,  1,  0,192,  1,  2,
-      1,173, 99,166,  7,  8,  9, 10, 11, 12,  4,114, 15,227, 27, 65,
-    236,235,234, 22,231, 39,230,229,235,227,226,225,224,223,235, 29,
-    220,219,218,217,216,216, 41, 42, 33,134,184,174, 47, 48, 49, 50,
-     51, 52, 28, 70, 55, 55,147,125,196,195,194, 62,207, 42,  9,125,
-    191,190,189,179,187,186,185,184,183,139, 69,180,179,178,177,176,
-    172, 81, 82, 81,254,240,214, 87, 88, 89, 90, 91, 92,116, 33, 95,
-     83,136, 53,156,155,154,101,151,151,150,149,155,147,146,145,144,
-    143,131,253,140,139,138,137,136,135,121,122,123,118,212,222,127,
-    128,129,130,131,132, 44,250, 71,132,108,213,116,115,114,141,127,
-    111,110,109, 99,107,106,105,104,103,107, 21,100, 99, 98, 97, 96,
-     95, 97,162,163,166, 12, 46,167,168,169,170,171,172,  4,209,175,
-    179, 84,237, 76, 75, 74,185,119, 71,134, 69, 75, 67, 42, 10,125,
-     66, 65, 64, 63, 61, 65, 60, 59, 58, 57, 56, 55,  9,202,203,206,
-    100,108,207,208,209,210,211,212,124,169,231,216,236,165, 36, 35,
-     34,209, 31, 31, 30, 29, 19, 27, 26, 25, 24, 23, 21,201, 20, 19,
-     18, 17, 16, 15,  1,242,243,244, 95, 84,119,248,249,250,251,252,
-     84,130, 51,  3, 36,125,252,251,249, 57,199,247, 54,245,251,243,
-    242,241,240,239,238, 49,236,235,234,233,232,231,229, 26, 27, 28,
-    183, 86, 31, 32, 33, 34, 35, 38,140, 89,215, 40,195,213,212,211,
-    209,209,239,207, 14,205,195,203,202,201,200,199,198, 42, 11,125,
-     26,196,195,194,193,192,191,189, 66, 67,100,239, 14, 71, 72, 73,
-     74, 75, 78,228, 49,179, 80, 68,173,172,171,169,169, 87,167,102,
-    165,168,163,162,161,160,159,158, 74,156,155,154,153,152,151,149,
-    106,107,102,199,252,111,112,113,114,115,126,252,  9,135,120,156,
-    133,132,131,130,129,127,127,190,125,112,123,122,121,120,119,118,
-    130,116,115,114,113,112,111,110,146,147,148, 63, 48,151,152,153,
-    154,155,182, 20,225, 96,160,132,221, 92, 91, 90, 89,164, 87,150,
-     85, 88, 83, 82, 81, 80, 79, 78,120,140, 75, 74, 73, 42, 12,125,
-     72, 71, 70,186,187,188,189,151, 63,192,193,194,195,110,204,185,
-     59,200,175,149, 52, 51, 50, 49,204, 47,238, 45, 32, 43, 42, 41,
-     40, 39, 38, 16,228, 35, 34, 33, 32, 31, 30, 18,227,228,229,228,
-    167,232,233,234,235, 68,236,145, 32,240, 87,173, 12, 11, 10,  9,
-    244,  7,198,  5,  8,  3,  2,  1,  0,255,254,200, 60,251,250,249,
-    248,247,246,250, 11, 12, 13, 14, 31, 16, 17, 18, 19,148, 28,105,
-    232,216,127,181,228,227,226,225, 28,223, 46,221,211,219,218,217,
-    216,215,214,224, 36,211,210,209,208,207,206,206,  3, 42, 13,125,
-     52, 53, 54, 61, 56, 57, 58, 57, 60,180, 65,195,112,212,233,188,
-    187,186,185, 68,183, 70,181,183,179,178,177,176,175,174,144, 92,
-    171,170,169,168,167,166,165, 91, 94, 93, 94, 95,224, 97, 98, 97,
-    114, 76, 25,152,168,252,241,148,147,146,145,108,143,126,141,143,
-    139,138,137,136,135,134,136,248,131,130,129,128,127,126,125,115,
-    132,181,134,135,168,137,138,139,136, 36,241,115,110, 11,246,108,
-    107,106,105,148,103,150,101,103, 99, 98, 97, 96, 95, 94, 80, 32,
-     91, 90, 89, 88, 87, 86, 85, 91,172, 33,174,175,176, 42, 14,125,
-    177,178,179, 17, 28,201, 72, 78, 46, 33,  4, 67, 66, 65,176, 63,
-      2, 61, 63, 59, 58, 57, 56, 55, 54, 56,104, 51, 50, 49, 48, 47,
-     46, 45, 47, 20,245,214,215,216,217,218,217, 73,136,161, 32, 38,
-    116,121, 76, 27, 26, 26,232, 23, 42, 21, 20, 19, 18, 17, 16, 15,
-     14,  0, 80, 11, 10,  9,  8,  7,  6,  5,  4,252,242,254,255,  0,
-      1,  2,201,145, 80,121,248,206, 80,173,228,243,242,242,  0,239,
-    210,237,236,235,234,233,232,231,230,232,152,227,226,225,224,223,
-    222,221,220,228, 45, 38, 39, 40, 41, 42,  2,121,120, 42, 15,125,
-     81,208,250,107,133,217,203,202,202, 56,199,250,197,196,195,194,
-    193,192,191,190,178,192,187,186,185,184,183,182,181,180,128, 79,
-    178, 79, 80, 81, 82,245,  1,192, 41,168,145,  2, 46,177,163,162,
-    162, 96,159,161,157,156,155,154,153,152,151,150,150,100,147,146,
-    145,144,143,142,141,140,132,117,117,123,184,121,120,237,234,232,
-      1,128,137,215, 53,177, 59,122,122,184,119,121,117,116,115,114,
-    113,112,111,110,110,172,107,106,105,104,103,102,101,100,111, 93,
-     17,172,160,161,168,246, 14,240,217, 88,177,207,126, 42, 16,125,
-     85, 19, 82, 82,144, 79, 65, 77, 76, 75, 74, 73, 72, 71,  6, 74,
-    132, 67, 66, 65, 64, 63, 62, 61, 60, 56,197,198,203,  8,201,195,
-     94,153,152,177, 51,185,188,  2,221,123, 42, 42, 40, 39, 41,229,
-     36, 35, 34, 33, 32, 31, 94, 18, 28, 27, 26, 25, 24, 23, 22, 21,
-     20, 19, 45,238,239,255,241, 84, 86,173,160,137, 11,145,147, 42,
-    203,247,  2,  2,  0,255,241, 61,252,251,250,249,248,247,230,249,
-    244,243,242,241,240,239,238,237,236,235,229, 54, 23, 40, 25,143,
-    114, 73, 72, 97,227,133,123,242, 35,174,218,217,216, 42, 17,125,
-    215,217, 21,212,211,210,209,208,207,222,205,204,203,202,201,200,
-    199,198,197,196,195,253, 62, 63, 64, 65, 23, 26, 29, 16, 57,183,
-    237,238, 26, 75,102,178,177,176,175,173,109,172,171,170,169,168,
-    167,182,165,164,163,162,161,160,159,158,157,156,155,151,110,103,
-    104,105, 63, 50,  5, 56, 17,158,229,202, 50,115, 93,202,137,136,
-    135,133,117,132,131,130,129,128,127,110,125,124,123,122,121,120,
-    119,118,117,116,115,115, 14,143,156,144,199,202,241,192,217, 77,
-     13,226,234,155,150, 34, 97, 96, 95, 93,173, 92, 91, 42, 18,125,
-     90, 89, 88, 87, 82, 85, 84, 83, 82, 81, 80, 79, 78, 77, 76, 75,
-     74,116,183,187,184,223,221,217,232,241,101,150,172,178,195,196,
-    234, 57, 56, 55, 54,197, 52, 51, 50, 49, 48, 47, 42, 45, 44, 43,
-     42, 41, 40, 39, 38, 37, 36, 35, 34, 34,223,224,224,139, 73,177,
-    176,153,253,179, 68, 38,235,236,194, 17, 16, 15, 14,253, 12, 11,
-     10,  9,  8,  7,  2,  5,  4,  3,  2,  1,  0,255,254,253,252,251,
-    250,249,199, 56,  8, 80,158, 89, 88,114, 22, 70, 76,226,211, 20,
-     30,233,232,231,230, 25,228,227,226,225,224,223,218, 42, 19,125,
-    221,220,219,218,217,216,215,214,213,212,211,210,209,208, 12, 48,
-    103,102, 97, 96, 74, 94, 94,140,201, 59, 60, 55,193,192,191,190,
-     65,188,187,186,185,184,183,178,181,180,179,178,177,176,175,174,
-    173,172,171,170,169,171,162,172, 15, 14,  9,  8, 32,250,  9, 22,
-    157, 99,100, 99,153,152,151,150,105,148,147,146,145,144,143,142,
-    141,140,139,138,137,136,135,134,133,132,131,130,129,128,126, 52,
-    215,214,209,208,196, 18,230, 94,118,123,140,140,113,112,111,110,
-     81,108,107,106,105,104,103,102,101,100, 99, 98, 97, 42, 20,125,
-     96, 95, 94, 93, 92, 91, 90, 89, 88, 87,  4,255,254,249,248,236,
-     58,222,102, 65,179,180,180,  9, 72, 71, 70,121, 68, 67, 66, 65,
-     64, 63, 62, 61, 60, 59, 58, 57, 56, 55, 54, 53, 52, 51, 50, 49,
-     60, 47, 56,135,134,129,128,156, 65, 67,  6, 37, 20,220,221,113,
-     32, 31, 30, 33, 28, 27, 26, 25, 24, 23, 22, 21, 20, 19, 18, 17,
-     16, 15, 14, 13, 12, 11, 10,  9,  7,  7,  3,175,174,169,168,148,
-    169,215, 94,253,207,244,  5,173,248,247,246,202,244,243,242,241,
-    240,239,238,237,236, 43,234,233,232,231,230,229,228, 42, 21,125,
-    227,226,221, 28,223,222,183,118,113,112, 76,113,195, 86,213, 24,
-     44,237, 29,208,207,206,194,204,203,202,201,200,199,198,197,199,
-      3,194,193,192,191,190,189,188,187,186,121, 68,183,182,159, 30,
-     25, 24, 27, 37,237, 46,173,156,104, 86, 85,168,167,166,170,164,
-    163,162,161,160,159,158,157,147, 91,154,153,152,151,150,149,148,
-    147,145,145,108,143,142,151, 38, 33, 32, 35, 26,213,134,133,132,
-    176,177, 78,128,127,126,114,124,123,122,121,120,119,118,117,123,
-    179,114,113,112,111,110,109,108,107,102,106,148,103, 42, 22,125,
-    102,111,206,201,200,203,242,205, 94, 93, 95, 84,165,102, 88, 87,
-     86, 90, 84, 83, 82, 81, 80, 79, 78, 77, 67, 75, 74, 73, 72, 71,
-     70, 69, 68, 67,114, 66,176, 63, 62, 55,150,145,144,144,173,189,
-     54, 53, 52, 60,254,206,240, 47, 46, 34,236, 43, 42, 41, 40, 39,
-     38, 37, 27, 35, 34, 33, 32, 31, 30, 29, 28, 27,218, 26,232, 23,
-     21, 31,190,185,184,184,117, 71, 14, 13, 12, 11, 54, 54,200,  7,
-      6, 10,196,  3,  2,  1,  0,255,254,253,195,251,250,249,248,247,
-    246,245,244,240, 50,242,  0,239,237,235, 70, 65, 64, 42, 23,125,
-     64,193,207,230,229,228,227, 45, 46, 32,223,222,222, 28,219,218,
-    217,216,215,214,213,232,211,210,209,208,207,206,205,204,196,202,
-    201, 56,199,201,199,110,105,104, 88,212, 19,190,189,188,139,186,
-     70, 72,183,182,182,116,179,178,177,176,175,174,173, 80,171,170,
-    169,168,167,166,165,164,147,162,161, 80,159,145,159, 54, 49, 48,
-     15,220, 43,150,149,148,147,161,146, 96,143,142,142, 76,139,138,
-    137,136,135,134,133,120,131,130,129,128,127,126,125,124,187,122,
-    121,132,119, 75,119,222,217,216,231,226,223,110,109, 42, 24,125,
-    108,107,106,101,148,103,102,102,148, 99, 98, 97, 96, 95, 94, 93,
-    172, 91, 90, 89, 88, 87, 86, 85, 87,147, 82, 81,108, 79,115, 79,
-    230,225,224,216,218,183, 70, 69, 68, 67, 66, 65,124, 63, 62, 62,
-    204, 59, 58, 57, 56, 55, 54, 54,196, 51, 50, 49, 48, 47, 46, 45,
-     32, 43, 42, 41, 20, 39,219, 39,142,137,136,176,106,239, 30, 29,
-     28, 27, 26, 25, 36, 23, 22, 22,228, 19, 18, 17, 16, 15, 14, 14,
-    252, 11, 10,  9,  8,  7,  6,  5,  8,  3,  2,  1, 60,252, 11,253,
-     86, 81, 80, 93,179, 56,246,245,244,243,242,241,204, 42, 25,125,
-    239,238,238, 28,235,234,233,232,231,230,230, 20,227,226,225,224,
-    223,222,221,236,219,218,217,215,212, 35,213,126,121,120,117,251,
-     15,206,205,204,203,202,201,247,199,198,198, 52,195,194,193,192,
-    191,190,190,124,187,186,185,184,183,182,181,132,179,178,177,191,
-    172,123,237,  6,  1,  0, 48,  7, 91,102,165,164,163,162,161,175,
-    159,158,157,108,151,154,153,152,151,150,154, 84,147,146,145,144,
-    143,142,141, 76,139,138,137,135,132, 83,197,110, 41, 40, 17, 63,
-    143,126,125,124,123,122,121,119,119,118,117,132,127, 42, 26,125,
-    114,113,112,111,110, 98,172,107,106,105,104,103,102,102,100, 99,
-     98, 97,111, 92,139, 29,182,241,240,219,167,164, 90, 85, 84, 83,
-     82, 81, 95, 15, 78, 77,188, 71, 74, 73, 72, 71, 70, 74, 68, 67,
-     66, 65, 64, 63, 14, 62, 60, 59, 58, 57, 59, 52,227,117,222,153,
-    152,154,207,211, 46, 45, 44, 43, 42, 41, 39,103, 38, 37,212, 32,
-     34, 33, 32, 31, 30, 18, 28, 27, 26, 25, 24, 23, 42, 25, 20, 19,
-     18, 17, 19, 12,251, 77,246,161,160,174,247,244, 58,  5,  4,  3,
-      2,  1,  3, 63,254,253, 12,248,250,249,248,247,246, 42, 27,125,
-    250,244,243,242,241,240,239,209,209,236,235,234,233,235,228, 27,
-    165, 30, 73, 72,126, 31, 32,221,221,220,219,218,217,219, 23,214,
-    213, 40,211, 18,209,208,207,206,193,204,203,202,201,200,199,201,
-     53,196,195,194,193,192,188, 67,253, 70, 17, 16,  6, 71, 72, 70,
-    181,180,179,178,177,179,111,174,173,144,171,106,169,168,167,166,
-    153,164,163,162,161,160,159,145,109,156,155,154,153,152,151,107,
-    197,170, 57, 56, 14,111,127,190, 65,140,139,138,137,136,119,134,
-    133,184,131, 66,129,128,127,126, 65,124,123,122,121, 42, 28,125,
-    120,119,121,181,116,115,114,113,112,111,147, 61, 82,193,192,214,
-    151, 84,150,101,100, 99, 98, 97, 96,143, 94, 93, 96, 91,154, 89,
-     88, 87, 86,105, 84, 83, 82, 81, 80, 79, 65,141, 76, 75, 74, 73,
-     72, 71,187, 21,122,233,232,220,191,192,194,254, 60, 59, 58, 57,
-     56,231, 54, 53,  8, 51,  2, 49, 48, 47, 46, 17, 44, 43, 42, 41,
-     40, 39, 37,229, 36, 35, 34, 33, 32, 31,227, 77, 35,177,176,166,
-    231,235,217,213, 20, 19, 18, 17, 16,255, 14, 13, 48, 11, 58,  9,
-      8,  7,  6,245,  4,  3,  2,  1,  0,255,253,253,252, 42, 29,125,
-    251,250,249,248,247, 11,165,251, 89, 88,108, 15, 16, 17,237, 44,
-    235,234,233,232,219,230,229,216,227,210,225,224,223,222, 45,220,
-    219,218,217,216,215,213,213,212,211,210,209,208,207,243,157,195,
-     97, 96,118, 55, 56, 10,  5,196,195,194,193,192,139,190,189,176,
-    187,138,185,184,183,182, 69,180,179,178,177,176,175,173,173,172,
-    171,170,169,168,167,155,245,171,  9,  8, 62,223, 96, 97,109,156,
-    155,154,153,152,146,150,149,155,147,162,145,144,143,141,125,140,
-    139,138,137,136,135,137,133,132,131,130,129,128,127, 42, 30,125,
-     67, 45,115,209,208,228,  7,136,138,134,120,115,114,113,112, 98,
-    110,109, 99,107,102,105,104,103,101,165,100, 99, 98, 97, 96, 95,
-     82, 93, 92, 91, 90, 89, 88, 87,107,  5, 91,249,248,206,175,176,
-    130,125,140, 75, 74, 73, 72, 70,  6, 69, 75, 67, 78, 65, 64, 63,
-     61,253, 60, 59, 58, 57, 56, 55, 58, 53, 52, 51, 50, 49, 48, 47,
-     19,125, 35,129,128,158, 95,216,217,218,231, 35, 34, 33, 32, 28,
-     94, 29, 19, 27, 22, 25, 24, 23, 25,213, 20, 19, 18, 17, 16, 15,
-      2, 13, 12, 11, 10,  9,  8,  7, 51, 85,  7,169,168, 42, 31,125,
-    158,223,  0,  1,206, 60,251,250,249,248,244,166,245,247,243,254,
-    241,240,239,225,237,236,235,234,233,232,231,214,229,228,227,226,
-    225,224,223,235,157,223,113,112,110,167, 40, 41, 38,215,211,210,
-    209,208,207,158,205,207,203,198,201,200,199,201,197,196,195,194,
-    193,192,191,142,189,188,187,186,185,184,183, 67,245,183, 25, 24,
-     38, 69, 80, 81, 82,172,171,170,169,168,167,118,165,167,163,163,
-    161,160,159,145,157,156,155,154,153,152,151,102,149,148,147,146,
-    145,144,143,123,205,143, 33, 32, 30,253,120,121, 74, 42, 32,125,
-     72,179,130,129,128,127,174,125,127,187,123,121,120,119,122,117,
-    116,115,114,113,112,108,174,109,108,107,106,105,104,103,147, 37,
-    103,201,200,244,159, 32,161,161,108, 91, 90, 89, 88, 87,134, 85,
-     87,147, 83, 81, 80, 79, 66, 77, 76, 75, 74, 73, 72,120,134, 69,
-     68, 67, 66, 65, 64, 63,203,125, 63,145,144,172,237,202,201,198,
-    248,243, 50, 49, 48, 47, 62, 45, 44,235, 43, 41, 40, 39, 26, 37,
-     36, 35, 34, 33, 32,224, 30, 29, 28, 27, 26, 25, 24, 20,195, 85,
-     23,185,184,132,111,240,241,241,240, 59, 10,  9,  8, 42, 33,125,
-      7, 22,  5,  4,204,  2, 65,  0,255,206,253,252,251,250,249,248,
-      0,246,245,244,243,242,241,240,236, 59,237,239, 65, 64,124,181,
-     56, 25, 25, 43,239,226,225,224,223,206,221,220, 36, 42,153,216,
-    215,150,213,212,211,210,209,211, 24,206,205,204,203,202,  9,200,
-    198,147,197,199,105,104, 84, 55,202, 65, 66, 79,180,186,185,184,
-    183,162,181,180, 76, 78,241,176,175,174,173,172,171,170,169,151,
-    251,166,165,164,163, 98,110,136, 54, 55, 28,205,194,240, 12, 69,
-    200,105,105,107, 95,146,145,144,143,154,141,140,116, 42, 34,125,
-    117,201,136,135,134,133,132,131,189,126,125, 35,126,125,124,123,
-    133,181, 88,254,238,244,101, 42, 40,228,  7,152,153,146,175,167,
-     90,105,104,103,114,101,100,156,157,177, 96, 95, 94, 93, 92, 88,
-    165,166,173, 11, 86, 85, 84, 83,158,146,120,230,234,204, 29, 18,
-     16,220, 29,154,153,186,187,179, 66, 65, 64, 63, 42, 61, 60,196,
-    197,233, 56, 55, 54, 53, 52, 12,205,206,229, 95, 46, 45, 44, 43,
-    230,233,  8,174,190,132, 53,122, 72,180, 95, 96,225, 98,227, 40,
-     26, 41, 24, 23,  2, 21, 23,236,237,193, 16, 15, 14, 42, 35,125,
-     13, 12, 52,245,244, 93,247,  6,  5,  4,  3,206,193, 32,250,170,
-    253,243, 81, 80, 92,175,170,  1, 10,  7, 15,242,241,240,239,250,
-    237,239, 20, 21, 57,232,231,230,229,228, 28, 29, 20,183, 31,222,
-    221,220,219, 26, 25,248,210,134,213,218,121,120,116,141, 56, 17,
-     18, 51,200,  9,201,200,203,208,197,199, 60, 61, 17,192,191,190,
-    189,179, 68, 71,236,231,183,182,181,180,179,114,113,176,170,238,
-    173,146,  1,  0, 52, 49, 51, 55,118,138,181,180,183,182,177,176,
-    179,178,189,188,128, 65,236,236,187,186,165,164,167, 40,  0,105,
-    140,143,142,137,136,139,138,181,180,183,182,177,176,179,178,189,
-    188,191,190,185,184,187,186,165,164,167,166,161,160,163,162,173,
-    172,175,174,169,168,171,170, 85, 84, 87, 86, 81, 80, 83, 82, 93,
-     92, 95, 94, 89, 88, 91, 90, 69, 68, 71, 70, 65, 64, 67, 66, 77,
-     76, 79, 78, 73, 72, 75, 74,117,116,119,118,113,127,140,141,169,
-    124,127,126,121,120,123,122,101,100,103,102, 97, 96, 99, 98,109,
-    108,111,110,105,104,107,106, 21, 20, 23, 22, 17, 16, 19, 18, 29,
-     28, 31, 30, 25, 39,228, 79, 81,  4,  7,  6,  1,  0, 46, 37,125,
-      3,  2, 13, 12, 15, 14,  9,  8, 11, 10, 53, 52, 55, 54, 49, 48,
-     51, 50, 61, 60, 63, 62, 57, 56, 59, 58, 37, 36, 39, 38, 33,223,
-    220,119,181, 44, 47, 46, 41, 40, 43, 42,213,212,215,214,209,208,
-    211,210,221,220,223,222,217,216,219,218,197,196,199,198,193,192,
-    195,194,205,204,207,194,201, 55,150,156,145,244,247,246,241,240,
-    243,242,253,252,255,254,249,248,251,250,229,228,231,230,225,224,
-    227,226,237,236,239,238,233,232,235,234,149,148,151,150,146,101,
-    206,203,  5,156,159,158,153,152,155,154,133,132,135, 46, 38,125,
-    134,129,128,131,130,141,140,143,142,137,136,139,138,181,180,183,
-    182,177,176,179,178,189,188,191,142,186,237,238,236,193,164,167,
-    166,161,160,163,162,173,172,175,174,169,168,171,170, 85, 84, 87,
-     86, 81, 80, 83, 82, 93, 92, 95, 94, 89, 88, 91, 90, 69, 68, 71,
-     70, 77,213, 22,219,213, 76, 79, 78, 73, 72, 75, 74,117,116,119,
-    118,113,112,115,114,125,124,127,126,121,120,123,122,101,100,103,
-    102, 97, 96, 99, 98,109,108,111,174, 85, 14, 61, 12,125, 20, 23,
-     22, 17, 16, 19, 18, 29, 28, 31, 30, 25, 24, 27, 26, 46, 39,125,
-      5,  4,  7,  6,  1,  0,  3,  2, 13, 12, 15, 14,  9,  8, 11, 10,
-     53, 52, 52, 54,  1,169,166,171,153, 60, 63, 62, 57, 56, 59, 58,
-     37, 36, 39, 38, 33, 32, 35, 34, 45, 44, 47, 46, 41, 40, 43, 42,
-    213,212,215,214,209,208,211,210,221,220,220,222,214,254,141,188,
-     93,196,199,198,193,192,195,194,205,204,207,206,201,200,203,202,
-    245,244,247,246,241,240,243,242,253,252,255,254,249,248,251,250,
-    229,228,228,230,226,201,122,120,133,236,239,238,233,232,235,234,
-    149,148,151,150,145,144,147,146,157,156,159,158,153, 46, 40,125,
-    194, 27,154,133,132,135,134,129,128,131,130,141,140,176,141, 73,
-    162,237,236, 17,180,183,182,177,176,179,178,189,188,191,190,185,
-    184,187,186,165,164,167,166,164,250,  3,162,173,172,175,174,169,
-    168,171,170, 85, 84,107, 85,146,138,201,248, 53, 92, 95, 94, 89,
-     88, 91, 90, 69, 68, 71, 70, 65, 64, 67, 66, 77, 76, 79, 78, 92,
-     30, 33, 74,117,116,119,118,113,112,115,114,125,124, 76,113,133,
-    130, 29, 16,253,100,103,102, 97, 96, 99, 98,109,108,111,110,105,
-    104,107,106, 21, 20, 23, 22, 71,117,185,146, 29, 28, 46, 41,125,
-     31, 30, 25, 24, 27, 26,  5,  4,247, 57,241,250,170,164,165, 12,
-     15, 14,  9,  8, 11, 10, 53, 52, 55, 54, 49, 48, 51, 50, 61, 60,
-     63, 63, 83,173,145,154, 37, 36, 39, 38, 33, 32, 35, 34, 45, 44,
-    239,209,217, 50,141,131,125,212,215,214,209,208,211,210,221,220,
-    223,222,217,216,219,218,197,196,199,203,171,106,105,106,205,204,
-    207,206,201,200,203,202,245,244, 55,  9,  1,202, 89,152, 85,252,
-    255,254,249,248,251,250,229,228,231,230,225,224,227,226,237,236,
-    239,219, 67, 77, 65, 64,149,148,151,150,145,144,147, 46, 42,125,
-    146,157,159, 92, 97,101,162, 49, 48, 45,132,135,134,129,128,131,
-    130,141,140,143,142,137,136,139,138,181,180,183, 67, 27, 25,217,
-     24, 61,188,191,190,185,184,187,186,165,103,100, 89, 93,154,  9,
-      8,  5,172,175,174,169,168,171,170, 85, 84, 87, 86, 81, 80, 83,
-     82, 93, 92, 95,168,243,242,  1,240,229, 68, 71, 70, 65, 64, 67,
-     66, 77,131, 64,177,182,114,209,224,221,116,119,118,113,112,115,
-    114,125,124,127,126,121,120,123,122,101,100,100,176,203,202, 57,
-    200,197,108,111,110,105,104,107,106, 21, 27,216,233, 46, 43,125,
-    238,  5, 73,184,181, 28, 31, 30, 25, 24, 27, 26,  5,  4,  7,  6,
-      1,  0,  3,  2, 13, 12, 12,216,163,162, 81,160,159, 52, 55, 54,
-     49, 48, 51, 50, 61,255,240,193,197, 33,109, 80,141, 36, 39, 38,
-     33, 32, 35, 34, 45, 44, 47, 46, 41, 40, 43, 42,213,212,216,  0,
-    123,122, 69,120,119, 92,223,222,217,216,219,218,197,  7,248, 57,
-      0,170,150,148,101,204,207,206,201,200,203,202,245,244,247,246,
-    241,240,243,242,253,252,240, 36, 83, 82, 93, 80, 79, 75,231,230,
-    225,224,227,226,238,239,208, 17,227, 65,190,191, 61, 46, 44,125,
-    148,151,150,145,144,147,146,157,156,159,158,153,152,155,154,133,
-    132,129, 92, 43, 42, 37, 40, 39, 38,112, 78,137,136,139,138,182,
-    180,136, 70,219, 25,230,180, 21,104,191,190,185,184,187,186,165,
-    164,167,166,161,160,163,162,173,172,170,116,  3,  2, 14,  0,255,
-    254,168,170, 81, 80, 83, 82, 94, 92, 96,147,243,205,  4,151,237,
-     81,  7, 70, 65, 64, 67, 66, 77, 76, 79, 78, 73, 72, 75, 74,117,
-    116, 98,160,219,218,218,216,215,214,192,161,121,120,123,122,106,
-    100,152, 80,203, 53, 19,147,197, 73, 59,110,105,104, 46, 45,125,
-    107,106, 21, 20, 23, 22, 17, 16, 19, 18, 29, 28, 10,232,179,178,
-    178,176,175,161,168,249,193,  0,  3,  2,  1, 12,240,212,160, 93,
-     75,121, 93, 17, 98, 54, 49, 48, 51, 50, 61, 60, 63, 62, 57, 56,
-     59, 58, 37, 36, 48,208,139,138,138, 72,135,181, 68,211,249, 40,
-     43, 42,217,212, 40, 12,116,133,159,237,133,249,138,142,217,216,
-    219,218,197,196,199,198,193,192,195,194,205,204,208,251, 99, 98,
-     97,160, 95, 97,172,  9, 13,240,243,242,241,255,  3, 20, 92,173,
-    135,230, 61,205,178,179,225,224,227,226,237,236,239, 46, 46,125,
-    238,233,232,235,234,149,148,198,155, 59, 58, 57,248, 55, 58,201,
-     33,110,152,155,154,137,135,119, 92, 20,213,246,183,149,165,218,
-    219,201,136,139,138,181,180,183,182,177,176,179,178,189,189, 96,
-    255,211, 18, 17,224, 15, 61, 50, 25, 94,160,163,162,161,163, 95,
-    123,252,253,242,147, 77,125,  2,  3,  5, 80, 83, 82, 93, 92, 95,
-     94, 89, 88, 91, 90, 69,187,184,121, 43,234,234, 24,231,249,218,
-     37,182, 72, 75, 74,121,123,183,160, 36, 37,235,127, 53, 86, 42,
-     43, 44, 44,123,122,101,100,103,102, 97, 96, 99, 98, 46, 47,125,
-     98,147,144,145, 63,194,194, 48,191,162, 78, 65,238, 80, 19, 18,
-     18, 19,224,195,140, 77, 67, 20,141, 30, 82, 81,244, 85, 83,  2,
-     13, 12, 15, 14,  9,  8, 11, 10,202,203,200,227,  4,154,154,104,
-    151,129,170,104,198,248, 59, 58, 26,235,216,121,180,117, 71, 35,
-    133, 10,250,113,124,125,126, 42,213,212,215,214,209,208,211,221,
-     34, 35,  2,  3, 36,114,114,140,111,113,145,145,190,  0,195,194,
-    193,243,186,153, 92,173,146,203, 81,238, 98,163,164,165,166,162,
-    253,252,255,254,249,248,251,  5, 26, 17, 48,185,182, 46, 48,125,
-    138, 70,180, 71, 66,182,187,182, 40,235,233,166,171,170,193, 52,
-    197,202, 15, 57,134, 58,203,204,205,206,230,133,132,135,134,129,
-    128,128,125,114,251,210,219,220, 94, 46, 92, 31, 25,226, 35,110,
-     64,179,177,142,131,112,105, 16,237,226,219,249,129, 10,243,244,
-    245,246,216,157,172,175,174,169,168,164, 85,168,137,130,  3,  4,
-     45,  6,132,251,243, 10, 11,174,168, 91, 89,118,123,132, 19, 40,
-     21, 22, 19,177, 90, 42, 27, 28, 29, 30, 32,218,180,119,118,113,
-    112, 76,141,128,169, 42, 43, 44, 39,172,175,195,203, 46, 49,125,
-     50,  3, 20,156, 99, 97,157,147, 63, 59, 12, 61, 62, 63,105,  1,
-     78, 67, 68, 69, 70,184,136,227, 31, 30, 25, 24,228,229,250, 89,
-     82, 83, 84, 87,252,215,167,161,214, 91,116,116, 11,  9,245,203,
-    103,227,100,101,102, 88, 65, 22,146,107,108,109,108,144, 80,113,
-     39, 38, 33, 35,220,221,240,249,122,123,124,125,212,223,124,123,
-      2,131,142, 44,211,209, 29, 35, 75,203,140,141,142,176,153,225,
-     94,147,148,149,149,105,152,153,159,206,201,199, 52, 53, 32,161,
-    162,163,164,165,140,  7, 84, 87,138,168,174, 44,251, 46, 50,125,
-    249, 37, 27,  2,211,180,181,181, 75,113,250,137,187,188,189,145,
-     67,192, 65,234, 70,145,111,108,109,232,201,202,203,204,205,196,
-    111,236, 47, 82,208,214,117,131,129,142,115,218,187,220,221,221,
-     44,233,173,221,227,228,229,217, 23,232,233,104,201,206, 71, 68,
-     69,120,241,242,243,244,245,252, 95,199,  6, 90,251,252, 85,235,
-    169,150,161,142,227,  4,  5,  6,203,193, 74,201,139, 12, 15,241,
-     63, 16, 17, 18, 17, 54,191,188,189, 56, 25, 26, 27, 28, 29, 28,
-    181, 31,222,170, 35, 36,143, 51,113,190,133, 10,243, 46, 51,125,
-     44, 45, 45, 28, 57,113,  2, 51, 52, 62,201,199, 56, 57, 58, 59,
-    180, 23,148,159,192, 65, 66, 67, 68, 69, 68,237, 71,118,232, 75,
-     76,103, 11, 42, 54,222,146,107, 84, 85, 90, 87, 81, 21, 86,155,
-     92,242,162,175, 96, 97, 98, 99,108,111,204,237,232,105,106,107,
-    108,109, 76,197,127,126,154,115,120, 95, 51, 46, 46,118,186, 65,
-    124,125,114,127,137,193,129, 67, 44,186,121, 71,136,137,138,139,
-    140, 39, 36, 39,144,145,146,155,156, 29,188, 61,151, 86, 96,155,
-    156,151, 15,201,246,162, 82,167,164,165,165,167,169, 46, 52,125,
-    217,170,147,172, 18, 93, 79,176,177,178,179,180,183, 28, 21,184,
-    185,186,187,158,159, 60, 21,195, 62, 62, 67,196,199,103,145,158,
-    202, 58,203,204,205,206,207,209,173,209, 35,223, 42, 25, 55,216,
-    217,218,219,220,215,116, 87, 96,225,234,107,110,205,110,205,235,
-     26, 20,235,236,239, 79,186,102,209,206,243,244,245,246,247,249,
-    186,250, 51, 99,  2,205, 63,  0,  1,  2,  3,  4,  5,172,167,  0,
-      9,136, 41,164,133, 38,165,144,238, 45,147, 20, 25,191, 65, 78,
-    185, 22, 27, 28, 29, 30, 31, 41,109, 34, 26,219,214, 46, 53,125,
-    217, 39, 40, 41, 42, 43, 44, 47,132,133,176,185,186,153,148, 53,
-    180,157,184,  6, 53,187, 60, 61, 20,105,214,193, 78, 67, 68, 69,
-     70, 71, 65, 58, 74, 75,179,113,129,239, 80, 81, 82, 83, 84, 87,
-    252,223, 88, 83,112,249,212,223,126,245,224,110,157,163,100,101,
-    100,206, 14,201,106,107,108,109,110,111,121, 13,114,131,139,134,
-    137,119,120,121,122,123,188,125,212,223,  8,163, 40, 41,166,165,
-    132,173, 40,134,117, 99,140,141,132, 37,  5, 17,146,147,148,149,
-    150,151,177,233,154,147, 99,114, 98, 31,160,161,162, 46, 54,125,
-    163,160,175, 12, 45,160, 35,  0,  1, 36,173,142,  5, 16,178, 77,
-     65,180,181,180, 29, 29, 57,186,187,188,189,190,191,233,190,194,
-    243, 52,250, 57,199,200,201,202,199,  0,207,100,109,218,251,120,
-    113,212, 87,222,253,120,218, 37, 39, 92,221,222,213, 73, 65,226,
-    227,228,229,230,231, 65,149, 42,231,227, 18, 18,239,240,241,242,
-    240,201,253, 92, 95,218, 83, 80,115,124,253,220,213,168,  1,253,
-    252,  4,  5,  6,  5,161,129, 10, 11, 12, 13, 14, 15,185,110, 18,
-     16,164,234,233, 23, 24, 25, 26, 27,226, 31,180,181, 46, 55,125,
-     42,139,136,131, 36, 37,166,141,128, 41,213,212,132, 45, 46, 45,
-    153,147, 50, 51, 52, 53, 54, 55,145, 70, 10, 59, 51,194,194, 63,
-     64, 65, 66, 66,178, 79,236,237,226,227,226, 67, 76, 77, 68,101,
-    248, 81,109,172,148, 85, 86, 87,242,251,218, 91, 92, 93, 94, 95,
-    201, 29,174, 96, 68,154,153,231,104,105,106,107, 60, 79,196,197,
-    218,219,218,243,116,117,126,221,210,121,117,132,132,125,126,127,
-     42,201,130,131,132,133,134,133, 33,246,122,139,102,114,114, 15,
-    144,145,146,147,148, 31, 60, 61, 50, 51, 48,155,156, 46, 56,125,
-    157,188,181, 10, 33,161, 92, 90,165,166,135,  2,225,170,171,172,
-    173,174,173, 25,206, 78,179,161,138, 73,183,184,185,186,187,188,
-    181, 20, 21,106,107, 98, 67,196,197,198,109, 98,105,201, 52, 51,
-     13,206,197,122, 67,210,211,212,213,214,221, 81,166, 42,219, 57,
-    226, 34, 95,224,225,226,227,228,231, 76, 77, 66, 67, 98,235,236,
-    237,230, 69, 90, 81,242, 12, 11, 69,246,247, 82, 95,250,251,252,
-    253,254,213,137,126,253,  3, 33, 74,249,  7,  8,  9, 10, 11, 12,
-     15, 36,165,186,187,178, 19, 20, 21, 22,189,178,177, 46, 57,125,
-     26,228,227,221, 30, 31, 32,  8,162, 35, 36, 37, 38,141, 33, 86,
-    214, 43, 74,118,209, 47, 48, 49, 50, 51, 52, 53, 60,157,146,147,
-    186, 59, 60, 61, 60,149,234,235, 66,188,187,169, 70, 71, 72, 75,
-     10, 75, 76, 77, 78,231, 81, 46,157, 83,242,134,169, 87, 88, 89,
-     90, 91, 92, 93,116,245,202,203, 98, 99,103,101,102,205,194,195,
-    105,100,147,158,174,111,112,113, 98,115,116,117,118,247,113,  6,
-    133,187, 26,158,129,159,128,129,130,131,132,133,140, 45, 34, 35,
-     10,139,140,141,140,229, 58, 59,146,172,107,110,166, 46, 58,125,
-    151,152,153,144,155,156,157,156,159, 41,222, 94,147, 49, 12, 89,
-     39,168,169,169,155,108,173,172,  5, 26, 27,178,179,120,117,182,
-    221, 18, 58,138,184, 67, 65,190,189,192,193,194, 67,196,197,196,
-    209,225,182, 53, 11, 89, 84, 49, 47,208,209,222, 28,212,213,214,
-    125,114,123, 90,219,208,221,222,181, 74,225,226,239,219, 26,106,
-    231,216,233,234,203,236,237,238,235, 89,142, 14, 13,110,145, 53,
-    119,248,249,250,251,255,253,252, 85,170,169,  2, 15,199, 53,  6,
-     93,160,  9, 54,  4,243,242, 46, 15,156, 17, 18, 19, 46, 59,125,
-     20, 21, 22,178,177,102,229,237,139,131,225,255, 32, 33,209, 31,
-     27, 37, 38,141,130,139, 42, 40, 28,237, 46,117,152, 49, 62,240,
-    203,202,197,247, 24, 57, 58, 59, 60, 61, 60,170, 21, 62,189,133,
-    209,219,249,167, 72, 73, 69,119, 64,141, 78,101,250,249, 82,144,
-    151,101, 84, 13,240, 89, 90,155,163,162,160, 95,111, 97, 98, 99,
-    100,101,172,242, 61, 22,149,173, 53,201,209,159,112,113,142,188,
-    119,181,118,221,210,219,122,119, 76,177,126, 37, 32,129,190, 64,
-    123,122,121,103,128,137,138,139,140,141,167,218,197, 46, 60,125,
-    238,109, 89,206, 35,185,111,152,153,169,148,160,157,158,181, 10,
-     41,162,144,107,149,166,253,  8,169,150,104, 83, 82, 81, 80,114,
-     77,178,179,180,181, 16,226, 45,198, 69,114,231,201,117,133,192,
-    193, 14,255, 56,249,198,237, 98,105,201,199, 63,193,204,149, 80,
-    222,226,211, 43, 42, 41, 40, 36,218,214, 27,220,223, 72, 73,117,
-    158, 29,234,178, 82,197, 24,232,233,234,235,236,237,238,229, 90,
-    121,242,192,248,198,246,173,120,250,197,200,  3,  2,  1,  4,255,
-    206, 49,  3,  4, 15, 83,173, 93,118,245, 18,106,217, 46, 61,125,
-    253,243,144, 17,221, 28, 24, 25, 22, 61,178, 25, 26,212,239,209,
-     28, 69, 32,238,209, 16,219,218,216, 39, 43,217, 38,235, 44, 36,
-    187,122,101, 78,206, 90, 89,229, 56,203,248, 57,  9,  7, 12,194,
-     62, 53,234,193, 78, 79,184,138,134, 45, 72,118,181,119,179,178,
-    177,124,144,174, 82, 92, 84,243,243, 14, 13, 38,166, 50, 54,141,
-    110, 96, 64, 97, 81,160,107, 85,166, 77,202, 97,105,148,163, 93,
-    108,  5,115,142,141,128,139,138,142,116, 72, 86,186, 75,124,232,
-     23, 42,213,254,126, 38,222, 85,134,  8,104,137,137, 46, 62,125,
-    187,127, 78, 78,173, 58,177, 94, 92,107, 90,148,253,155,102,101,
-    100, 99, 98, 93, 95, 96,161, 82,163,164,240,255,254,253,214, 90,
-     14, 11,253,174,128,112,177,177,143,136,117,118,189, 18,185,186,
-     68, 67, 77,126,215,207, 62, 61, 12, 59, 58, 54,200,202,193,246,
-    203,204,152,151,166,133,174, 35, 70,111,149,214,252, 40,217,218,
-     23, 44, 46, 30,221, 72, 97,225,220, 27, 42,228,143,231, 22, 21,
-     24, 35, 18,110, 31, 50,113,253,255,245,160,175,146,173,182, 32,
-    110,135,141,254,245,242,  1,  2,255,247,  6,  6, 13, 46, 63,125,
-    130,  9, 57,244,243,241,206,103, 31,238,237,239,235,234, 26, 23,
-     43, 27, 25,216, 29,120,120,122,117,110,248,117, 73, 85, 38, 39,
-    214, 41, 42, 39,220,225, 46, 47,152, 18, 61,204,203,249, 54, 95,
-      7,198,197,196,195,194,254, 12,114, 65, 66,179, 69, 44,236, 18,
-     29, 54, 80, 16,225,129, 78, 79,236, 81, 82, 95,152, 86,150, 85,
-     82, 89, 85,164,163,161,156, 55, 95,158,157,156,155,154,214,103,
-     84,137,106, 91,109, 55,251, 58, 37, 13,107, 37, 41,133,182,119,
-     68,121,122,120, 79,178,126,125, 42,129,189,188,123, 46, 64,125,
-    121,182,239,119,118,117,116,115,114,141,188,144, 17,146,175,149,
-    192,195,194,205,229,243,253, 41,110,158,159,143, 33,162,160,152,
-    149,150,167,138, 37, 85, 84, 83, 82,110,199, 79, 78, 77, 76, 75,
-     74,182,187,183,129,186,184, 73,232,235,234,149,191,103,170,179,
-     58,198,199,199, 73,202,199,240, 62,254,207,112,209,209, 44, 43,
-     38,230,191, 39, 38, 37, 39, 35, 34,238, 31,227,227,226,227, 17,
-    176,179,178,189,171,127,133, 59, 17, 30,239,251, 17,242,240,244,
-    245,245,247,210,250,  5,  4,  3,  2, 62,167,255,254, 46, 65,125,
-    253,252,251,250,  6,  7,  4,  1,138, 11,241, 88, 91, 90, 69, 83,
-    135,125,195,230, 22, 23, 27,233, 26, 27, 28, 29, 30, 31, 32,161,
-    237,220,219,218, 26, 63,215,214,213,212,211,210,145, 47, 48,249,
-    178, 51, 13, 96, 99, 98,109,115,172,160,227,194,241, 63, 66,177,
-     66, 67,135,137,118, 71,106, 74,133,180,179,178,142, 87,175,174,
-    173,172,171,170,218, 87, 84,107,122, 91, 82,  8, 11, 10, 53, 11,
-     52,180, 59,154,170,151,104,145,106,104,108,109,110,111,112,125,
-    141,140,139,138,186,239,135,134,133,135,131,130,206, 46, 66,125,
-    127,128, 77,170,131, 66, 16,211,210,221,227,220, 96,243,114,189,
-    143, 80, 45,146,159,164, 86,153,151,154,153, 85,100, 99, 98,174,
-    135, 95, 94, 93, 92, 91, 91,230,167,168,169, 40, 43,169,120,251,
-    250,229,228,216, 14,203, 74,121,139,187,166, 58,187,188,189,190,
-    191,192,194, 61, 60, 59, 58, 54,223, 55, 54, 53, 52, 51, 51, 13,
-    207,208,209,242,243,209,112,131,130,141,140,183,118, 35, 34, 33,
-     19, 44,206, 34,227,228,233,230,231,234,233, 37, 20, 19, 18,210,
-    247, 15, 14, 13, 15, 11, 11,250,251,248,249,248,115, 46, 67,125,
-    249,152,171,170, 85, 84,111,110,251,250,250,247,  8,203,202, 11,
-     12, 14,  2, 15, 16, 17,237,236,235,234,229, 31, 39,230,229,231,
-    227,227, 30, 31, 32, 33, 34,  1, 37, 64,115,114,125,127, 64, 94,
-    211,210,209,223,  3, 48, 29,  3, 55,  5,246,247, 56, 58,197,196,
-    195,194,242, 55,127,190,189,191,187,187,186,119, 72, 73, 66,195,
-    197, 40, 27, 26,  5,  7,200,228,171,170,169,168,155,154, 91, 91,
-    111,174, 82, 95, 96,109,109,156,155,154,154,109,103,150,149,148,
-    147,147,110,111,112,113,114,123,253, 44, 35, 34, 45, 46, 68,125,
-     47,172,172,131,130,129,128,176,177,122,143, 68,121, 69,139,136,
-    137,117,116,115,114,125, 77,159,110,109,111,107,107,150,151,152,
-    153,154,185,181,196,203,202,245,199, 73,240, 91, 90, 89,104, 87,
-    170,214,104, 80, 94,162,172,176,178,125, 76, 75, 74, 73,189,183,
-     70, 69, 71, 67, 67,141,191,192,193,194,195,110,156,147,146,157,
-    160,113,136, 51, 50, 49, 48, 28, 45,206,239, 39,234, 22,231,216,
-    233, 37, 36, 35, 34, 45, 29,239, 30, 29, 31, 27, 27,230,215,234,
-    233,234,235,102,180,187,186,165,152,159,188, 11, 10, 46, 69,125,
-      9,  8,  7, 10,  0,136, 51, 14,205,243,  0, 14, 61,252,251,250,
-    249,  5,135,246,245,247,243,243, 14, 15, 26, 17, 34, 19, 62, 76,
-     67, 66, 77,119,119, 20,227,226,225,224,223,222,220, 28,219,218,
-    233, 20, 40, 41,213,212,211,210,221, 31,179,206,205,195,203,203,
-    182, 55, 48, 57, 58, 59, 54,100,107,106, 21, 47,247, 76,187,186,
-    185,184,183,182,185,244,179,114,177, 79,144,157,109,172,171,170,
-    169,149,219,166,165,171,163,167,222, 95, 64, 97, 98, 99,110,252,
-     51, 50, 61, 50,222, 91,147,146,145,144,143,142,140, 46, 70,125,
-    108,187,137,186,132,120,121,133,132,131,130,129,191,  3,126,125,
-    112,123,127,  6,133,168,137,138,139,142, 40,219,218,197,202, 70,
-    172,107,106,105,104,103,102,101, 20, 99, 98, 98, 95, 83,161,145,
-     92, 91, 90, 89, 87,  8, 86, 85, 88, 83, 87, 14,175, 48,177,178,
-    179,180, 16,227,226,237,223,234,184,131, 66, 65, 64, 63, 62, 60,
-    196, 59, 58, 57, 59,200,249, 53, 52, 51, 50, 49,255,240, 46, 45,
-     32, 43, 47,118,245, 88,217,218,219,220,120,139,138,181,142,162,
-    236, 27, 26, 25, 24, 23, 22, 21, 80, 19, 18, 29, 44, 46, 71,125,
-     48,242,253, 12, 11, 10,  9, 11,216,  6,  5,  8,  3,  7, 86,117,
-      0,  1,  2, 15,196, 32, 83, 82, 93,116, 10,  7,255,242,241,240,
-    239,238,237,208,235,234,233, 43, 40,217,213,228,227,226,225, 35,
-      0,222,221,208,219,223,140,141, 40, 41, 42,231, 44,  4,123,122,
-    101,101, 50, 48,203,202,201,200,199,198,197,250,195,194,194,204,
-    128, 65, 77,188,187,186,185,184, 64,118,181,136,179,183,228,231,
-     80, 81, 94, 96,152, 92,  3,  2, 13,  1, 90, 87,159,162,161,160,
-    159,158,157,143,155,154,153,164, 84,105,106,148,147, 46, 72,125,
-    146,145, 92,184, 78,141,176,139,191,220,215,120,121,186,116,188,
-     84, 43, 42,213,225,130,131,120,122,121,120,119,118,117,123,115,
-    114,113,188, 80,157, 93,108,107,106,105,107,152,166,101, 91, 99,
-     87, 52, 31,160,161,162,159, 87,172,243,242,253,233,170,171,163,
-     82, 81, 80, 79, 78, 77, 75, 75, 74, 73, 75, 72,121,186,132, 67,
-     66, 65, 64,  8,254, 61,  3, 59, 47,108,199,200,201,198, 52, 60,
-    228,155,154,133,177,210,220, 27,230, 41, 40, 39, 38, 37, 40, 99,
-     34, 33, 19, 44,225,225,208, 27, 26, 25, 23,234,230, 46, 73,125,
-     21, 43, 19,231, 70,239,240,193,194, 12,  7,252,163,162,173,185,
-    250, 55,243,  2,  1,  0,255,254,253,251, 59,250,249,251, 59,201,
-    202,  7,243, 50,241,252, 26,158,237, 19, 43, 31,182, 23, 24,217,
-     41,228, 32, 20, 75, 74,117, 67, 34, 35, 39, 25,217,216,215,214,
-    213,213,243,210,209,224,252, 49, 50, 12,203,202,201, 11, 26,186,
-    197, 59, 60, 23, 62, 63, 64, 65, 66,188,139, 76, 19, 18, 29,  9,
-     74, 72,124,114,177,176,175,174,173,175, 91,170,169,171,152, 85,
-     86, 91, 99, 98,161,111, 96,226,157, 75,100,197,102, 46, 74,125,
-    103,104,101,101,148,147, 68, 59, 58, 37, 19,114,115,116,138, 73,
-    136,135,134,133,133,179,130,129,140,131,129,130,143, 75,122,185,
-    139,130,138,118,161,142, 13,142,143,163,161,109,108,107,156,195,
-    194,205,217,154,155,175,162, 97, 96, 95, 94, 93, 92,171, 90, 89,
-     88,100,105,170,107,172,158, 82,159,146,145, 78, 57,158,181,182,
-    183,184,134,137, 68, 67,180,235,234,149,161, 66,195,196,202, 57,
-     56, 55, 54, 53, 52,195, 50, 49,  3, 32,221,225,227, 24,234, 21,
-    215,248, 81,218,241,116,221,222,223,224, 17, 29, 28, 46, 75,125,
-     20,204,179,178,189,139,106,235,239,225, 29, 16, 15, 14, 13, 13,
-    251, 10, 10,  8,251,249,250,248,255,241,206, 51,  2, 43,  2,137,
-    164,  5,  6,  8,  4, 10,197,244,240,  4, 91, 90, 69,113, 18, 19,
-     39,218, 41,232,231,230,229,228, 39,226,225, 35,236, 45, 34, 35,
-    232, 21,229, 39,170,169, 40,129,172, 45, 46, 47, 48,254,205,204,
-    196, 28, 99, 98,109,113,178, 59, 60, 61,  2,192,191,190,189,188,
-     71,186,185,184,120, 73, 74, 75, 64,142, 66,143, 88, 89,250,251,
-     84, 85, 86, 87,107,101,165,164,172, 84, 11, 10, 53, 46, 76,125,
-      1, 66, 99,100,169, 89,152,151,150,149,148,239,146,146,172,188,
-    177,114,115,119,121,118,119,122,243,216,219,124,125,126,124,128,
-    114,125,124,116,140,211,210,221,193, 10,139,140,129,114,112,111,
-    110,109,108, 87,106,105,100,152,153,154,155,156,157, 82,157,130,
-     11,  8,163,164,165,166, 84,103,150, 85, 84,172,164,251,250,229,
-    217,184,179,180,181, 73, 72, 71, 70, 69, 68,125, 66, 66,115, 51,
-    193,194,195,196,197,198,199, 64,227,162,203,204,205,206, 63,227,
-     46, 45, 44, 20,252,131,130,141,177, 80,219,220,237, 46, 77,125,
-    237, 16, 31, 30, 29, 28,164, 26, 21,216,232,233,234,235,236,237,
-    238,239,218,216, 98,243,244,245,198,251,  7,  6,  5,  4,252,244,
-    171,170, 85,107,  2,131,  4,  6,201,248,247,246,245,244,206,242,
-    241,192, 28, 17, 18, 19, 20, 21, 22, 53,146,176, 26, 27, 28, 29,
-    210, 44, 31,222,221,220, 36,128,115,114,125, 67,  0, 41, 44, 33,
-     29, 16,207,206,205,204,248,202,250,199,248, 57, 26, 59, 60, 61,
-     54,149,233, 17, 66, 67, 68, 69,122,132,183,182,181,187, 78,104,
-     27, 26,  5, 59,210, 83, 84, 86, 85,152,167,166,165, 46, 78,125,
-    164,124,161,161,159, 96, 97,224, 99,100,101,100,205,205,105,106,
-    107,108, 97,110,144,143,142,141,128,116, 80, 35, 34, 45, 19,216,
-     91,124,126, 78,140,127,126,125,124,196,250,117,139, 68,139,130,
-    171,142,135, 36, 38,192,145,146,147,148,105, 89,104,103,102,101,
-    103,156,136,203,202,245,203,170, 41,164,165,170, 87, 87, 86, 85,
-     84,160,158,146,175,176,177, 16,145, 30, 31, 28,226,184,185,186,
-    187,191,189,113, 64, 63, 62, 61, 51,198,208,147,146,157,163,232,
-    107,204,206,206,252, 47, 46, 45, 46,164,106, 26, 20, 46, 79,125,
-    216,219,240,113,121,136,139,139,224,225,226,227,228, 22,217, 24,
-     23, 22, 21, 27,238,184,187,186,165,155,122,251,252,245,202,196,
-     55,  6,  5,  6,243,238,206,207,  0,  3,168,150, 81, 80, 83, 71,
-      8,  9, 10, 11,243, 50,  1,240,239,238,225,211, 22, 64, 67, 66,
-     77, 67,176, 57, 60, 29, 30, 16,223,222,221,215, 36, 41,234,231,
-     40, 35,143,126,121,120,122, 47, 48, 49, 50, 51, 55,  6,201,200,
-    199,198,197,251, 58,104,107,106, 21, 27,194,195, 68,197, 70,139,
-    183,134,181,183,112,137, 78, 67, 80,248,  7,  6,  1, 46, 80,125,
-      0, 22, 87, 88, 89, 90,107,172,158,161,160,159,158,157,163, 77,
-     48, 51, 50, 61, 51,194,201,100,109, 98,108,143,142,141,135,123,
-    118,121,119,122,220, 47, 46, 41, 41,126,127,128,129, 65,188,139,
-    186,121,120,119,118,118,139,  5,216,219,218,197,203, 48,155,180,
-    181,150,107,164,102,101, 75, 80,172, 93,159,170,244,247,246,241,
-    245,166,167,168,169,170,107, 96, 82,145, 80, 79, 78, 77, 67,161,
-    224,227,226,237, 52, 49, 51, 55,217, 23, 22, 17, 16, 19, 18, 29,
-     28, 31, 30, 25, 39,228, 79, 81,  4,  7,  6,  1,  0, 44,  0,105,
-     53, 52, 55, 54, 49, 48, 51, 50, 61, 60, 63, 62, 57, 56, 59, 58,
-     37, 36, 39, 38, 33, 32, 35, 34, 45, 44, 47, 46, 41, 40, 43, 42,
-    213,212,215,214,209,208,211,210,221,220,223,222,217,216,219,218,
-    197,196,199,198,193,192,195,194,205,204,207,206,201,200,203,202,
-    245,244,247,246,241,240,243,242,253,252,255,254,246,  7,  4, 46,
-    229,228,231,230,225,224,227,226,237,236,239,238,233,232,235,234,
-    149,148,151,150,145,144,147,146,157,156,159,158,153,152,155,154,
-    133,132,135,134,190,127,214,214,141,140,143,142,137, 58, 82,125,
-    136,139,138,181,180,183,182,177,176,179,178,189,188,191,190,185,
-    184,187,186,165,164,167,166,161,160,163,162,173,172,175,174, 86,
-     87,254, 50, 85, 84, 87, 86, 81, 80, 83, 82, 93, 92, 95, 94, 89,
-     88, 91, 90, 69, 68, 71, 70, 65, 64, 67, 66, 77, 76, 79, 78, 73,
-     72, 75, 74,117,116,123,118,142, 45, 37, 22,125,124,127,126,121,
-    120,123,122,101,100,103,102, 97, 96, 99, 98,109,108,111,110,105,
-    104,107,106, 21, 20, 23, 22, 17, 16, 19, 18, 29, 28, 31, 29,236,
-     69, 66,130,  5,  4,  7,  6,  1,  0,  3,  2, 13, 12, 58, 83,125,
-     15, 14,  9,  8, 11, 10, 53, 52, 55, 54, 49, 48, 51, 50, 61, 60,
-     63, 62, 57, 56, 59, 58, 37, 36, 23, 37,116,117,117, 70, 45, 44,
-     47, 46, 41, 40, 43, 42,213,212,215,214,209,208,211,210,221,220,
-    223,222,217,216,219,218,197,196,199,198,193,192,195,194,205,204,
-    207,194, 92,157, 82, 82,245,244,247,246,241,240,243,242,253,252,
-    255,254,249,248,251,250,229,228,231,230,225,224,227,226,237,236,
-    239,238,233,232,235,234,149,148, 87,170,247,198,245,250,157,156,
-    159,158,153,152,155,154,133,132,135,134,129,128,131, 58, 84,125,
-    130,141,140,143,142,137,136,139,138,181,180,183,182,177,176,179,
-    178,189,191,191,142, 32, 45, 34, 30,165,164,167,166,161,160,163,
-    162,173,172,175,174,169,168,171,170, 85, 84, 87, 86, 81, 80, 83,
-     82, 93, 92, 95, 94, 89, 88, 91, 90, 69, 71, 71, 73,103, 22, 37,
-    218, 77, 76, 79, 78, 73, 72, 75, 74,117,116,119,118,113,112,115,
-    114,125,124,127,126,109,120,123,122,101,100,103,102, 97, 96, 99,
-     98,109,111,111,109, 64,241,241,  2, 21, 20, 23, 22, 17, 16, 19,
-     18, 29, 28, 31, 30, 25, 24, 27, 26,  5,  4,  7,  7, 58, 85,125,
-     89,  0,  3,  2, 13, 12, 15, 14,  9,  8, 11, 10, 53, 11, 52,246,
-     27, 86, 85,150, 61, 60, 63, 62, 57, 56, 59, 58, 37, 36, 39, 38,
-     33, 32, 35, 34, 45, 44, 47, 52,115,168, 43, 42,213,212,215,214,
-    209,208,211,210,221,224,220, 29,  3, 66,113,178,197,196,199,198,
-    193,192,195,194,205,204,207,206,201,200,203,202,245,244,247,157,
-    167,152,243,242,253,252,255,254,249,248,251,250,229,215,232, 26,
-     27,134,137,122,237,236,239,238,233,232,235,234,149,148,151,150,
-    145,144,147,146,157,156,158, 53,236, 50, 27,154,133, 58, 86,125,
-    132,135,134,129,128,131,130,141,124,176,126,115, 33, 45, 34,181,
-    180,183,182,177,176,179,178,189,188,191,190,185,184,187,186,165,
-    164,161, 12, 11, 10,  3,162,173,172,175,174,169,168,171,170, 85,
-    148,168,166, 75,246,250,250, 93, 92, 95, 94, 89, 88, 91, 90, 69,
-     68, 71, 70, 65, 64, 67, 66, 77, 76, 89,228,227,226,227, 74,117,
-    116,119,118,113,112,115,114,125,188,128,142, 67,210, 17,210,101,
-    100,103,102, 97, 96, 99, 98,109,108,111,110,105,104,107,106, 21,
-     20, 77,188,187,186,185, 18, 29, 28, 31, 30, 25, 24, 58, 87,125,
-     27, 26,  6,199,248,250, 59,170,169,170, 13, 12, 15, 14,  9,  8,
-     11, 10, 53, 52, 55, 54, 49, 48, 51, 50, 61, 60, 85,148,147,146,
-    145,186, 37, 36, 39, 38, 33, 32, 35, 34,238,239,208,210, 19,130,
-    129,130,213,212,215,214,209,208,211,210,221,220,223,222,217,216,
-    219,218,197,197,145,108,107,106,105, 98,205,204,207,206,201,200,
-    203,202, 58,251,  8,  9,203,106, 89, 90,253,252,255,254,249,248,
-    251,250,229,228,231,230,225,224,227,226,237,237,118, 68, 67, 66,
-     65, 66,149,148,151,150,145,144,147,146,146, 83, 96, 58,133,125,
-    239, 42,135,173,220,223,222,217,216,219,218,197,196,199,198,193,
-    192,195,194,205,204,207,206,201,200,203,202,245,244,247,246,241,
-    240,243,242,253,252,255,254,249,199,  2,175,149, 40, 43,230,225,
-     44, 47,238, 33, 32, 35, 34, 37, 36, 43, 38,153, 88,151,154, 93,
-    156, 95, 94, 81, 80, 83, 82, 85, 84, 87, 86, 73, 72, 75, 74, 77,
-    143,122,215,157,143,140,189,138,136,187,185,134,132,135,181,130,
-    131,131,129,142,140,191,190,138,187,184,137,166,151,148,149,145,
-    147,144,145,158,159,156,157,153,167, 82,253,129, 88, 50, 89,125,
-    155,154, 81, 80, 95, 94,145, 92, 95,158,149,148, 91, 86, 73, 68,
-     75, 70,129,128,131,142,141,128,131,130,133,  4,135,134,185,184,
-    187,186,189,127,150, 38,141,127,127, 77, 73, 75,123, 73, 85, 87,
-     87, 85, 97, 96, 80, 81,109, 92, 92,110, 90, 88, 91, 89, 38, 39,
-     36, 21, 34,115, 32, 33, 46, 47, 44, 45, 41, 23,254, 69, 85,  4,
-     11, 10, 13,  0,  3, 14, 13,204, 15,206,  9,200,  7,  6, 53, 56,
-     59, 54, 61,252,255, 62,253,240,243,242,245, 80, 55,246,233,232,
-    235,234,237, 47,198,125,253, 44, 44, 46, 26, 27, 43, 50, 90,125,
-     42,213,212,231,214,209,224,227,210,238,220,220,222,233,232,216,
-    217,246,247,244,245,242,170,240,241,254,255,252,253,249,244, 46,
-    154,165,248,247, 58,241,240,255,254,253,240,255,254,249,248,251,
-    250,233,232, 39,234,225, 44, 47, 34, 33, 32, 47, 34,229,130, 39,
-     38, 89, 88, 91, 90, 93,172,118,227, 65,175,175,173,170,171,155,
-    154,133,132,135,134,130,128,131,178,189,191,191,141,185,187,187,
-    138,134,135,132,133,129,218,  0,129,142,143,140,141,137,133,158,
-    201, 49,168,171,166,109, 96,175,162,173,172,175,174, 50, 91,125,
-    169,168,167,106, 89, 88,155,154,145,156,147,146, 81,144,159,146,
-     85, 62,215,150,137,136,139,138,141,125,102, 49, 36,124, 79,125,
-     74, 75,123,122, 69,116,119, 70,114, 64,115, 66,125, 79, 79, 77,
-     73, 75,120,121,102, 87,100, 86, 82,  6,211, 81, 94, 95, 92, 93,
-     89, 85, 78,  9, 79, 20,215, 22, 29,208,223, 18, 17, 16,211, 18,
-     21,216, 27, 26,  9,200,203,198,  1,204,207,194,205,192,195,206,
-    196,110,135,  6,249,248,251,250,253,205,  6,107, 87, 76, 15, 61,
-     57,  8, 59, 57, 38, 36, 23, 37, 34, 19, 32, 34, 45, 50, 92,125,
-     44, 44, 29, 42, 43, 24, 25,229,228,212,229,224,182, 96,225,238,
-    239,236,237,233, 47, 46,128,175, 68,  7,198,205,  0,207,194, 13,
-    204, 15,206,201,200,203,198,245,248, 55,246,253, 48,243, 62, 49,
-     48, 63, 50, 60,158,119, 54, 41, 40, 43, 42, 45, 23,222,180,119,
-    124,223,221,217,232,219,233,166,148,167,150,146,144,147,161,157,
-    156,172,157,154,171,168,169,133,135,183,181,180,230, 48,177,190,
-    191,188,189,185,124,182,223, 19, 36,183,186,189,112,179,114,189,
-    188,179,114,117,180,187,182,169,100,107,106,109,108, 50, 93,125,
-    111,174, 97, 96, 99, 98,108,206, 39,102,153,152,155,154,157,164,
-    110,  7,244,252,111, 94, 89,104,107,153, 69, 68,116, 70, 65, 67,
-     64, 66, 77, 76,124, 77,122,123, 72, 73, 70,119, 71, 69, 68, 22,
-    240, 65, 78, 79, 76, 77, 73,140, 70, 47, 12,  8,167,102,161,172,
-    163, 98,109,172, 99,162,165,100,107,106,213,212, 27,218,221,220,
-     19,222,209,208,223,210,220,126,151,214,201,200,203,202,205,247,
-     62, 87, 87, 96, 15, 62, 10, 56, 11, 10, 53,  4,  7,  6, 50, 48,
-     51, 49, 61, 12, 12, 61, 10, 59, 11, 57, 22, 36, 20, 50, 94,125,
-     22, 20, 74,144, 17, 30, 31, 28, 29, 25,244, 94,127,140,120, 23,
-    214,209, 28, 31, 18, 29,208, 31,210, 25,216, 27, 26,197,  8,203,
-    198,193,204, 15,194,193,  0,  3,  2, 12,162, 71,  6, 57, 56, 59,
-     58, 61, 32, 38,167,168,155,255,206,201,200,248,250,213,206, 76,
-    214,225,208,224,225,237,223,239,221,234,219,219,234,149,151,164,
-    165,160,202,160,161,174,175,172,173,169,104, 78,207,223,239, 71,
-    134, 65,128, 67, 78,141,169, 35,142,137,136,139,138,181,184,187,
-    122,189,188,127,126,113,112,115,178,116,226,119,118, 50, 95,125,
-    105,104,107,106,109, 92,118,199,203,199,172,174,169,168,171,170,
-    101,193, 52, 86, 98, 99, 83, 81,109, 92, 92,109,106,107,107,106,
-    118,119,116,118,112,218,112,113,126,127,124,125,121,136,158, 31,
-      0,223,183,118,113,176,115,190,231, 43,255,114,185,116,123,118,
-    165,100,167,170,109,108,163,174,161,160,163,162,164,242,103,102,
-    217,216,219,218,221,211,198, 71,  4,183, 31, 30, 41, 24, 40,  0,
-     82, 91,109,  6, 50,  0, 51,  2, 13, 15, 63, 14, 58, 11, 11, 58,
-      6,  7, 55,  5,  0,170,112,  1, 14, 15, 12, 13,  9, 50, 96,125,
-    251,110,127,112,142,231,234, 33, 32,118,119,112, 94,133,130, 37,
-     36, 39,230,213,212, 23, 26, 29,208,211, 30, 17, 16,211, 18, 20,
-    162,151, 22,  9,  8, 11, 10, 13,  3,148,178,168,102, 12,206,201,
-    205, 52, 31,138, 18, 93, 92, 66,195,195,241,254,204,207,253,202,
-    251,203,202,213,231,212,213,212,155,179,209,222,223,220,221,217,
-     43,190,183,255, 14,151, 86,145,159,108,109, 98, 54, 53, 52, 49,
-     84, 91,150,133,136,135, 74, 65,140,143,142,141, 76, 67, 66, 76,
-    113,223, 70,121,120,123,122,125,115,230,231,235, 38, 50, 97,125,
-    127,190,185,135, 65, 69, 89, 14, 13, 12, 11,160,163,161,173,172,
-    172,157,169,155,152,169, 85, 84,103,101, 70,249, 38, 97,110,111,
-    108,109,105,155, 14, 15, 44,130,135, 70, 65,127,233,237,189,166,
-    229,228,227,200, 71, 74,181,180,123,186,113,124,179,114,113,176,
-    191,178,172,209, 14,182,169,168,171,170,173,161, 54, 55,  9,106,
-    175, 93,105,194,193,192,228,190,189,188,187,144, 19, 18, 29, 31,
-     28, 30, 25, 27, 24, 41, 54, 55, 52, 53, 86,169,118, 49, 62, 63,
-     60, 61, 57,  9, 94, 95,105, 34,251, 54, 60,154,153, 50, 98,125,
-    152,168,150,149,148,147,152,247, 54,229, 40, 39, 38,225, 44, 47,
-    226, 33,224,239,227,118,137, 94,230, 25, 24, 27, 26, 29,211,134,
-    135,157, 54, 31,221,219,114,126,140,144,110,109,108,107,104,195,
-    193,206,204,255,254,249,200,248,249,198,196,244,199,166, 81,134,
-    193,206,207,204,205,201,251,174,175, 38, 78, 43,230, 39, 69,182,
-    183,184,134, 69, 68, 67, 66,231,234,153,148,151, 90,157,144,159,
-     82,157, 80,147, 91,198, 57,238, 86, 73, 72, 75, 74, 77,131, 86,
-    215,128,230,207,142,188,223,246, 96, 32,238, 29, 28, 50, 99,125,
-     27, 26,179,130,141,191,191,141,138,184,136,185,150,148,148,147,
-    222,  1,214,209,158,159,156,157,153,171,254,254, 96,238, 39, 86,
-     12,175,169,248,244, 10,245,244,243,242,219,154, 73, 72, 75,138,
-     65, 64, 67, 66,129, 64,143,139,151,233,190,  6,185,184,187,186,
-    189,111,  6,225,171,149, 21,113,134,135,145,208,207, 49, 13,204,
-    203,202,224, 97,110, 95,111, 93, 89,104, 91, 89, 22, 36, 36,  3,
-    111,177,102, 97, 46, 47, 44, 45, 41, 59, 78,140, 90,221,114,185,
-    254,235,169,168,167,169, 85,164,163,162,171, 10, 53, 50,100,125,
-     56, 59,250, 49, 60,255,242,241, 48,243, 43,199,169,238,118,233,
-    232,235,234,237,191,214, 71,112, 70, 82, 69,215,129,129,128,127,
-    126, 65,124,123,122,123,210,237,239,220,238,217,216,235,217,198,
-    247,199,145,191, 65, 52,177,254,255,252,253,249, 91,150,159,160,
-     94,128,156, 91, 91,153, 88, 87, 86, 86, 84, 83, 82, 83, 58, 41,
-    232,235, 38, 33,236,239, 34, 33, 32, 44,147, 20,101, 60,166, 89,
-     88, 91, 90, 93,  3,102,199,203, 54,224, 75, 51,  1,241, 48, 47,
-     46, 45,236, 43, 42, 41,177,190,140,140,141,185,139, 50,101,125,
-    184,185,182,135,182, 65, 76, 61,100,225,142,143,140,141,137, 27,
-    110,239,243,  1,232, 83,251, 59,117,  8,  7,  6,  5, 52,  3,  2,
-      1, 42, 89, 88,151, 86,145,156, 83,146,157,156, 82,142,168,213,
-    140,  6,137,136,139,138,141,227,190, 23, 27,217, 15,177, 31, 19,
-     60, 32,223,222,221,208,219,218,217,210,126, 79, 76, 77,122, 75,
-     75, 73, 86, 84, 80, 22,104,224,180, 49, 94, 95, 92, 93, 90,192,
-    190, 63, 64,129, 87,233,204, 70,206, 71,183,182,181,184,179,178,
-    177,176,  5,  4,203,202,  1,  0, 15,  2,  1,192,210, 50,102,125,
-    242,  0,136,220,223, 96,248,251,250,253,152,198,103,104,105,255,
-     49,196,238,205,144,143,142,141,143,139,138,137,136,173, 47, 28,
-     45, 41, 27, 40, 25,230,231,160, 42,216, 80, 12,  7,136,137,138,
-    173,234, 48, 38,143,144,145,  7,  6, 62,149,121,104,103,102,101,
-    100,147, 98, 97, 96, 93,244, 59, 58, 61,240,255,254, 50,  3,192,
-    254,208,120,244, 47,176,177,178,179,180,  8, 20,151,152,187,220,
-     46,230, 30, 86, 64, 63, 62, 61, 60, 55, 58, 57, 56, 55,156,159,
-    157,169,155,152,169,121,132,119,130,164,  3,142,215, 50,103,125,
-    216,217,218,219,220, 96,180, 95,224,232,184,118,177, 74, 28,216,
-     23, 22, 21, 20, 16, 18, 17, 16, 15,  4,167,166,161,108, 99, 93,
-    109,172,175,163,124,103,106,255,  0,  1,  2,  3,  4,120,108, 37,
-      8, 40,108,174, 89,167, 48,175,239,238,237,236,235, 42,233,232,
-    231,230, 79,125,122, 72, 68,186,117,116,119,121,164,127,134, 39,
-     40, 41, 42, 43, 44, 93, 68, 13, 14,177,231, 86, 97,111,137,221,
-     55,198,197,196,195,  2,193,192,191,190, 23, 22,209, 16,239, 18,
-     29, 35,223, 30,196,231, 78, 79, 80, 81, 82, 83, 84, 50,104,125,
-     42, 12,168,178, 90,161, 15,202,200,241,160,163,158,157,156,155,
-    106,153,152,151,150,188, 61,  9,  7,251, 58, 37,219,216, 38, 22,
-    213,118,119,120,121,122,123,124, 18, 43, 37, 40,129,106,137, 46,
-    128,209,121,119,182,117,116,115, 66,113,112,111,110, 71,  6, 13,
-     60,195,194,206, 51, 48, 50,198, 29,158,159,160,161,162,163,164,
-    198,243,205,  8,165,100,129,  6,168,251,236, 79, 90, 77, 76, 75,
-     70, 73, 72, 71, 70, 76,221,214, 40,235,234,150,107,104,105,110,
-     69,198,199,200,201,202,203,204,158,219,101, 80,209, 50,105,125,
-    113,107, 92,255,131,135,231, 38, 85, 36, 35, 33, 33, 16, 31, 30,
-     23,186,141,176,179, 66,178, 67, 64, 65, 70, 69,238,239,240,241,
-    242,243,244,173,227, 93,120,251,214,219,220, 85,247,170,  0,  2,
-     62,252,251,249,249,200,247,246,240,173, 89, 88, 84,165, 74,187,
-    184,185,190,191,182, 23, 24, 25, 26, 27, 28, 69, 27,181, 32, 35,
-    162, 43,134,165,  4,130,124, 41, 42, 36, 19,210, 17, 16,207,206,
-     23, 89, 97, 96, 92,157,146,147,144,145,150,151,148,191, 64, 65,
-     66, 67, 68, 25, 67,237, 72, 67,100,105,110, 77,108, 50,106,125,
-    229,197,  6,174, 83, 91,170,154,168,167,165,127, 14, 57, 11,244,
-    245,250,203,200,201,206,207,204,205,232,105,106,107,108, 51, 99,
-      5,208,249,242,249,222,117,125,136,135,134,133,123, 79,130,141,
-    128,127,125,166,134,209,223, 44, 45, 34, 35, 32, 33, 38, 39, 36,
-     37, 58, 59,146,147,148,142,155,253,154,185,152,177, 28,157,161,
-     96, 95, 94, 98,156,164, 90, 89, 88, 87, 85, 10,170,249,199,  4,
-      5, 26, 27, 24, 25, 30, 31, 28, 29, 18, 19, 16, 17, 22,166,189,
-    229,112, 65, 74,105, 68,202, 57, 56, 55, 57,245, 52, 50,107,125,
-     12,  2, 49, 48, 47, 45,114,210,177,127,124,125,114,115,112,113,
-    118,119,116,117, 74, 75, 72, 73, 78,242,229, 61, 82,203, 64, 84,
-     19, 18, 17, 16,  0,242, 13, 12,  4,198,  9,  8,  7,  9,122,250,
-    170, 87, 84, 85,170,171,168,169,174,175,172,173,162,163,160,161,
-    166, 26,254,249,234,187,173,236,235,234,233,231, 27,230,229,228,
-    227, 17,225,224,223,209,162, 34,114,143,140,141,130,131,128,129,
-    134,135,132,133,154,155,152,153,158, 51,134,200,210,198,197,196,
-    195,194, 52, 60,191,190,189,188,187,133,185,184,139, 50,108,125,
-    187,202, 66, 22,231,228,229,250,251,248,249,254,255,252,253,242,
-    243,240,241,246, 91,210,160,139,174,157,156,155,173, 89,152,151,
-    150,149,148,147,157, 81,144,128,179,242,122, 46,223,220,221,210,
-    211,208,209,214,215,212,213, 42, 43, 40, 41, 46,  5, 41,120,231,
-    118,117,116,114,178,113,112,111,110,109,108,107,105,153,104,100,
-    155, 26,158,246, 55, 52, 53, 10, 11,  8,  9, 14, 15, 12, 13,  2,
-      3,  0,  1,  6, 45, 13, 80, 79, 78, 77, 89, 27, 74, 73, 72, 71,
-     70, 69, 68, 67, 66,125, 64, 63,195,194,230,174,111, 50,109,125,
-    108,109, 98, 99,108, 97,102,103,100,101,122,123,120,121,126, 69,
-     14,234,143, 51,112,123, 35, 34, 33, 32, 31, 30, 29, 28, 27, 26,
-     22, 24, 23,227,234,206, 70, 71, 68, 69, 90, 91, 87, 89, 94, 95,
-     92, 93, 82, 83, 80, 81, 86,109, 52,106,255,171,162, 60,251,250,
-    249,248,247,246,245,244,243,242,242,  0,239, 27, 18,182,190,191,
-    188,189,178,179,191,177,182,183,180,181,138,139,136,137,142,177,
-    214, 50,213, 67, 41,212,211,210,209,208,207,206,205,204,203,202,
-    201,247,199,241, 58,174,150,151,148,149,234,235,231, 50,110,125,
-    233,238,239,236,237,226,227,224,225,230,235,114, 74, 45,241, 93,
-    172,171,170,169,168,167,166,165,164,163,162,161,163, 95,105,202,
-    246,206,207,204,205,194,195,203,  1,198,199,196,197,218,219,216,
-    217,222,208,201,182, 13,249,133,132,131,130,129,128,127,126,125,
-    124,123,122,121,120,139,163,136, 29, 38, 39, 36, 37, 58, 59, 51,
-    201, 62, 63, 60, 61, 50, 51, 48, 49, 54, 52, 17,111,246,162, 93,
-     92, 91, 90, 89, 88, 87, 86, 85, 84, 83, 82, 81, 80,112,145,176,
-     37, 30, 31, 28, 29, 18, 19,219,237, 22, 23, 20, 21, 50,111,125,
-    106,107,104,105,110,172, 77, 55,156,198, 53, 52, 51, 50, 49, 48,
-     47, 46, 45, 44, 43, 42, 41, 40, 40,249,216,141,118,119,116,117,
-     74, 75,130,182,142, 79, 76, 77, 66, 67, 64, 65, 70,132,102, 19,
-    160,206, 13, 12, 11, 10,  9,  8,  7,  6,  5,  4,  3,  2,  1,  0,
-    240,161,  0, 85,174,175,172,173,162,163,106, 94, 86,167,164,165,
-    186,187,184,185,190,112,150,233,104,230,229,228,227,226,225,224,
-    223,222,221,220,219,218,217,216,216,169, 40,113,134, 45, 12,  5,
-    154,155, 82, 38, 98,159,156,157,146,147,144,145,150, 50,112,125,
-    108,190,  0,  0,190,189,188,187,186,185,184,183,182,181,180,179,
-    178,177,176,162,209, 80,  9, 84,255,252,245,114,243, 50, 78,  9,
-      7,244,245,202,203,200,201,206, 52,230, 88,168,150,149,148,147,
-    146,145,144,143,142,141,140,139,138,137,136,186,249,120, 33,214,
-    215,212,213, 34, 43,218,134,209,208,236, 45, 34, 35, 32, 33, 38,
-    223, 14, 48,147,110,109,108,107,106,105,104,103,102,101,100, 99,
-     98, 97, 96, 98,161,171,249, 14, 15, 12, 13,  2, 11,240,170,249,
-    248,251,  5, 26, 27, 24, 25, 30,247, 54, 11,187, 70, 50,113,125,
-     69, 68, 67, 66, 65, 64, 63, 62, 61, 60, 59, 58, 57, 56,  2,105,
-    195,145,102,103,100,101,122,123,184,210,129,128,131,129,114,115,
-    112,113,118,223, 92,111,227, 30, 29, 28, 27, 26, 25, 24, 23, 22,
-     21, 20, 19, 18, 17, 16,  8, 49,219,171,126, 95, 92, 93, 82, 83,
-    162,123,169,168,171,169,170,171,168,169,174, 15,  4,247,  8,246,
-    245,244,243,242,241,240,239,238,237,236,235,234,233,232, 19,218,
-     19, 67, 28,183,180,181,138,139,120,147, 49,112,115,114,125,124,
-    127,129,134, 39, 33,239, 48,154,205,204,203,202,201, 50,114,125,
-    200,199,198,197,196,195,194,193,192,139,194,107, 73, 68, 71,236,
-    237,226,227,220,231, 89, 24, 27, 26,  5,  4,  4,249,254, 93, 80,
-     20,152,115,229,164,163,162,161,160,159,158,157,156,155,154,153,
-    152, 99,234,223,  9,196,109,196,197,218,219,228,219, 97, 32, 35,
-     34, 45, 44, 47, 46,214, 87,107, 48,127,131, 40,124,123,122,121,
-    120,119,118,117,116,115,114,113,112,187, 29, 39,193, 52,151,156,
-    149, 50, 51, 12, 51,137,200,203,202,245,244,247,246, 14, 13,186,
-    164, 87,105,160, 20, 83, 82, 81, 80, 79, 78, 77, 76, 50,115,125,
-     75, 74, 73, 72,147, 59, 15,239,188,189,190,183,234,107, 84,104,
-    225,144,147,146,157,156,159,158,153, 85,154,207, 47, 45,208,124,
-     43, 42, 41, 40, 39, 38, 37, 36, 35, 34, 33, 32,203, 79, 84,182,
-    177,165,230,231,226, 67,124, 65,233,184,187,186,165,164,167,166,
-    161,101,160,247,199,  6,250, 81,  3,  2,  1,  0,255,254,253,252,
-    251,250,249,248,227,231,204, 94, 89, 88, 91, 79, 24, 59,180,185,
-     45, 64, 67, 66, 77, 76, 79, 78, 73,140, 78,181, 47,222,226, 41,
-    139,218,217,216,215,214,213,212,211,210,209,208,149, 50,116,125,
-    219,228,102, 97, 96, 99, 98,120, 59, 60,145,181,104,107,106, 21,
-     20, 23, 22, 17, 20, 22, 77,203,182,182, 75,230,178,177,176,175,
-    174,173,172,171,170,169,168,253,166,  3, 14,  9,  8, 11,245,245,
-     97,102,201,206, 48, 51, 50, 61, 60, 63, 62, 57, 44, 46,109,211,
-    142,141,179,116, 74,137,136,135,134,133,132,131,130,129,128, 37,
-    212,219,214,209,208, 44, 45, 34,220,130,129, 37,216,219,218,197,
-    196,199,198,193,208,150,103,176,102,101,103,156,158, 97, 96, 95,
-     94, 93, 92, 91, 90, 89, 88,141,249,179,254,249,199, 50,117,125,
-      4,  5, 26, 36,231,249, 62,236,227,226,237,236,239,238,233,185,
-    189, 64, 10, 62, 61, 60,  4,  5, 57, 56, 55, 54,  5, 52, 51, 50,
-     49, 48,245,113,203,134,130,127,124,125,114,115,143, 79,117, 75,
-    187,138,181,180,183,182,177,241,233, 24, 26, 86, 21, 20, 19, 30,
-    209, 16, 15, 14,253, 12, 11, 10,  9,  8,222,121,163,174,150, 87,
-     84, 85,170,171,148,170,110,160,111, 97,110, 92, 95, 94, 89, 29,
-      1,240,236,190,237,236,235,234,213,232,231,229, 21,228,227,226,
-    225,224,  6, 33, 71,117,142,143,140,141,130,131,128, 50,118,125,
-    129,186,183,119,182,101,100, 91,102, 97,101,  9,200,199, 18,197,
-    196,195,194,193,192,191,177,125,188,187,186,185,184,110,  9, 47,
-     17,230,231,228,229,250,251,248,113,253,  0,  3,  2, 13, 12, 15,
-     14,  9, 13, 97,160,159,155,221,156,155,154,153,152,148,105, 85,
-    148,147,146,145,144, 90,113, 40,217,222,223,220,221,210,211,210,
-    241,214, 40, 43, 42,213,212,215,214,209,213,185,120,119,118, 32,
-     33,131,114,113,112, 80,145,109,108,107,106,105,104,176,153,192,
-     49, 54, 55, 52, 53, 10, 11, 10,131, 13,240,243,242, 50,119,125,
-    253,252,255,254,249,197,145, 80, 79, 78, 76, 25, 28,138, 73, 72,
-    184,185, 69, 68, 67, 66, 65, 64,232,192,168,105,110,111,108,109,
-     98, 99, 98,105,101,152,155,154,133,132,135,134,129,189, 41, 40,
-     39, 38, 37, 37,118,253, 33, 31,224,226, 29, 28, 27, 26, 25, 27,
-    200,232,128, 65, 70, 71, 68, 69, 90, 91, 90,123, 93,160,163,162,
-    173,172,175,174,169,149,  1,  0,255,254,253,252,238,167,  6,  7,
-      8,  6,245,244,243,242,241,243,176, 16,120,185,190,191,188,189,
-    178,179,178, 17,185, 72, 75, 74,117,116,119,118,113, 50,120,125,
-     77,217,216,215,214,213,212,211,135,166, 47, 48, 62,205,204,203,
-    202,201,203,184, 56, 80,145,150,151,148,149,234,235,232, 97,225,
-     16, 19, 18, 29, 28, 31, 30, 25, 37,177,176,175,174,173,172,171,
-    191,244, 87, 88, 86,165,164,163,162,161,163,225, 96,200,201,206,
-    207,204,205,194,195,206,225,201, 56, 59, 58, 37, 36, 39, 38, 33,
-     29,137,136,135,134,133,132,131,135,212, 95,128,142,125,124,123,
-    122,121,123,  8,136, 32, 33, 38, 39, 36, 37, 58, 59, 54, 49,  1,
-    192,195,194,206,  3, 48, 49, 54,245,161, 96, 95, 94, 50,121,125,
-     93, 92, 91, 90, 60, 15,168,150, 85, 84, 83, 82, 81, 95, 48,176,
-     24, 25, 30, 31, 28, 29, 18, 19, 18,177, 41, 20,235,233,170,107,
-    104,105,110,173,249, 56, 55, 54, 53, 52, 51, 50, 40,101,208,238,
-     45, 44, 43, 42, 41, 39, 88,220,112,113,118,119,116,117, 74, 75,
-     70,202,190, 79,179,189, 66, 67, 64, 65, 70,133,209, 16, 15, 14,
-     13, 12, 11, 10, 19, 13,120,198,  5,  4,  3,  2,  1, 15,128,  4,
-    168,169,174,175,172,173,162,163,170, 33,102,164, 88,165,186,187,
-    184,185,190,127, 41,232,231,230,229,228,227,226,249, 50,122,125,
-    225,128, 30,221,220,219,218,217,215,136, 47,128,129,134,135,132,
-    133,154,155,160,150,146,160, 96,157,146,147,144,145,150, 87, 49,
-    192,191,190,189,188,187,186,233,184,192, 70,181,180,179,178,177,
-    141, 16,247,248,249,254,255,252,253,242,243,250,125,  6,200,244,
-    245,202,203,200,201,206, 15,105,152,151,150,149,148,147,146,209,
-    144,216,126,141,140,139,138,137,181,218, 95, 16,209,214,215,212,
-    213, 42, 43, 24, 22,237,211, 44, 45, 34, 35, 32, 33, 38,215, 13,
-    112,111,110,109,108,107,107,105,104,114,154,101,100, 50,123,125,
-     99, 98, 97, 93,  8, 11,200,  9, 14, 15, 12, 13,  2,  3,224, 62,
-    198,  7,  4,  5, 26, 27, 24, 25, 30,239, 21, 72, 71, 70, 69, 68,
-     67, 70, 65, 64, 56, 66, 61, 60, 59, 58, 57, 13, 98,111,160, 97,
-    102,103,100,101,122,123,152,133,126,127,124,125,114,115,112,113,
-    118,135, 86, 32, 31, 30, 29, 28, 27, 10, 25, 31,210, 73, 21, 20,
-     19, 18, 17,230,154,167,168, 89, 94, 95, 92, 93, 82, 83,144,161,
-     86, 87, 84, 85,170,171,168,169,174, 83,166,248,247,246,245,244,
-    243,226,241,255,186,177, 45,236,235,234,233, 18,129, 50,124,125,
-    143, 76,177,182,183,180,181,138,136, 11,121,142,143,140,141,130,
-    131,128,129,134,123,132, 16,207,206,205,204,203,138,201,244,198,
-    145,181,196,195,194,193, 58, 21, 27, 23,233,238,239,236,237,226,
-    224,227, 33,230,231,228,229,250,251,248,249,254,  3,252,216,167,
-    166,165,164,162,226,161,144,159,155,193,156,155,154,154, 98, 61,
-     48, 63, 49,198,199,196,197,218,219,215, 25,222,223,220,221,210,
-    211,208,209,214, 43,212,208,127,126,125,124,126,122,121,123,119,
-    118, 66,116,115,114,126,170,197,200,199,197, 62, 63, 50,125,125,
-     60, 61, 50, 51, 63, 49, 54, 55, 52, 53, 10, 11,  8,  9, 14,240,
-     12, 12, 87, 86, 85, 84, 84, 82, 82, 80, 76, 77, 76, 28, 75, 74,
-    118,145,237, 16,239,238,214, 23, 20, 21,106,107, 87,105,110,111,
-    108,109, 98, 99, 96, 97,102,152,100,101, 47, 46, 45, 44,123, 42,
-     37, 36, 39, 38, 37, 49, 83, 33,222,201, 74,120,183,182,177,131,
-    140, 77, 66, 67,188, 65, 70, 71, 68, 69, 90, 91, 88, 89, 94,160,
-    156, 93,  7,  6,  5,  4, 67,  2, 49,  0,243,206,205, 13,132,  5,
-      6,146,162, 80, 95, 94, 89, 84,167,165,186,120, 68, 50,126,125,
-    185,190,191,188,189,178,179,176,177,182, 72,116,181,159,222,221,
-    221, 27,218, 41,216,215,214, 21,228,132, 45, 46,186,101,104,103,
-    102, 97, 96, 80,173,162,160,108,145,150,151,148,149,234,235,232,
-    233,238, 16, 16,237,231,182,181,176,179,177, 78,176,175,174,173,
-    172,110,213, 86,194, 13,  0, 15, 14,  9,  8,  8, 54,  6,  4, 52,
-    201,206,207,204,205,194,195,192,193,198, 56, 56,197,223,142,141,
-    152,139,141,118,120,135,182,133,132, 66,221,116,234,213,216,215,
-    214,209,208,211,225, 18,220,223, 33, 38, 39, 36, 37, 50,127,125,
-     58, 59, 56, 57, 62,192,192, 61, 51,102,101, 52,163,125,158,159,
-    159, 94,157, 92, 87, 15, 12,  2,253,240,255,254,249,248,251,246,
-     37,228,231,217, 30, 31, 28, 29, 18, 19, 16, 17, 22,232,235, 21,
-    106, 62, 61, 79, 59, 37,198,199,203,  6, 54, 52, 48,231,100,102,
-     69,132,135,134,129,128,131,130,141,140,143,228, 35,119,116,117,
-     74, 75, 72, 73, 78,176,179, 77, 66, 86, 21,104,227,109,238,239,
-    195,194,193,192, 11, 11, 92, 94,157,156,175,174,169,168,171,170,
-     85, 84, 86, 12,203,239,172,173,162,163,160,161,166, 50,128,125,
-     88, 91,165,186,190,238,208, 26,149, 22, 23, 24, 25,214,215,227,
-    226,200,138,112, 33, 34, 35, 36,112,115,114,125,124,106, 27,224,
-    211,132,133,154,155,152,153,158, 96, 99, 93,146,146,197,251,198,
-     61, 62, 63, 64, 65,113,112,119,186,185,135, 72, 74,181,180,188,
-     77, 78, 26,  5,  5, 82, 80,103,106,172,247,242,243,240,241,246,
-      8, 11,  5,202,203,152,160,142,109,102,103,104,105,106,103,160,
-    162,145,144,143,142,141,140,139,138,182,118, 45,121,122,123,124,
-    245,178,149,137, 40, 40, 25, 34,220,211,221, 34, 35, 50,129,125,
-     32,116, 22,173,142,143,144,145,146,160,167,166,169,104,103,102,
-    169,164, 99, 98, 97,159,160,161,162,161,134,  7,134,166,254, 51,
-     12,  1,198,251,251,249, 26, 27, 24, 78,222, 53,182,183,184,185,
-    186,187,176,113,114,115, 15, 62, 62, 60, 59, 58, 57, 55,200,201,
-    202, 67, 68,109, 70,207,137,139,184,181,114,128,131,129,114,115,
-    112,110,182, 93,222,223,224,225,226,227,215,214,213,212,219,218,
-    217,216,223,222,238,239,240,241,240,211, 86,247,212,215,237,108,
-    159,110,169,171, 91,169,170,171,168,150,110,141,134, 50,130,125,
-      7,  8,  9, 10, 11, 12, 13, 14, 15,220,221,222,223,216, 21, 22,
-     23,144,145,146,147,180, 21,180,181,134,184,120, 69,126, 64,124,
-     66,130,131,128, 62,134,141, 46, 47, 48, 49, 50, 51, 52, 53, 54,
-     52, 11, 10, 10, 59, 60, 61, 62, 63, 98, 99, 96,105,238,111,236,
-    237,225, 28, 31, 30, 25, 40, 24, 42, 58,251,248, 70,254,253, 86,
-     87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99,100,101,110,
-    239,224,225,226,193, 70, 77,248, 57, 38,103,212,213,226, 44, 51,
-     34, 18,211,208,110,214,223, 94, 95,128,129,130,131, 50,131,125,
-    132,133,134,135,136,137,138,139,140,141,140,173,178,179,176, 25,
-    148,183, 12,241,254,143,252, 61, 57,244,203,202,250, 11,  8,182,
-    206, 15, 14, 39, 40,169,170,171,172,173,174,175,176,177,178,179,
-    120,121, 62, 63, 48, 49, 50, 17,158,157, 40,233,154,215,100,101,
-     97,159,147,146,158, 99, 96, 78,166,103,102,205,210,209,210,211,
-    212,213,214,215,216,217,218,219,222,255,252,253,194,195,192,201,
-    198,207,124,129,142, 79,140, 77,121,136, 71,186,165, 91, 88, 82,
-    174, 95, 92, 93,248,249,114,243,124,253,254,255,  0, 50,132,125,
-      1,  2,  3,140,141,142,143,128,129,128,131, 46, 39,148,165,186,
-     68, 71, 70, 65,115,112,114, 77,115,176,178, 70,183,180,189,  0,
-      1, 32, 35,  4, 37,  6,  7, 42, 10,  8,  9, 14, 15, 12, 13, 18,
-     19, 24, 51, 30, 23,175,161,146,163,175, 82,105, 88,151,106,213,
-     27,232,235, 18,239,236,237,226,233,194, 75, 76, 69, 70,207,216,
-    217,218,219,220,221,222,223,242,243,242,211,118,119,244, 58, 57,
-    203,248, 10, 49, 52, 49, 51, 55,133,184,137,166,151,148,149,145,
-    147,144,145,158,159,156,157,153,167, 82,253,129, 88, 48,  0,105,
-     97,140,194, 49, 50,133,132,135,134,129,128,131,130,141,140,143,
-    142,137,136,139,138,181,177,209, 28, 27, 26, 26, 40,189,188,191,
-    190,185,184,187,186,102,107, 88, 90,184,246,201, 10,173,172,175,
-    174,169,168,171,170, 85, 84, 87, 86, 81, 80, 83, 82, 93, 90,198,
-    244,243,242,241, 48,197, 68, 71, 70, 65, 64, 67, 66,142,115,176,
-    143, 35, 29, 29,226,117,116,119,118,113,112,115,114,125,124,127,
-    126,121,120,123,122,101, 97, 13, 12,203,202,202,203,194,108,111,
-    110,105,104,107,105, 22, 43,232, 28,184, 69, 70,186, 58,136,125,
-    112,112,112, 78, 80,129, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 78,  0,144, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 54,135,125,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14,  0,194, 96,155,  0,  4,  5,  5,
-     65,  0,  6, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 78,  0,144, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14,
-     14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 14, 52,  0, 35,
-     29, 28, 31, 30, 25, 24, 27, 26,  5,  4,  7,  6,  1,  0,  3,  2,
-     13, 10,169,100,163,162,173, 80, 90,203,247, 54, 49, 48, 51, 49,
-     61,  3,207, 84,144,109, 61,146,241, 36, 39, 38, 33, 32, 35, 34,
-     45, 44, 47, 46, 41, 40, 43, 42,213,209, 77,124,123,122,122, 75,
-     70, 35, 35,222,217,216,219,217,197,251, 10,108, 84,159, 14,106,
-    216,140,207,206,201,200,203,202,245,244,247,246,241,240,243,242,
-    253,233, 90,167, 83, 82,158,156,179, 27, 56,230,225,224,227,237,
-    237, 19,217, 68,188,152, 26, 66,176,192,151,150,145, 58,137,125,
-    144,147,146,157,156,159,158,153,152,155,154,133,145,225,208, 43,
-     42, 41, 27, 40,243,112, 78,137,136,139,134,181, 75,109, 31,228,
-    240,192,218,152,233,191,190,185,184,187,186,165,164,167,166,161,
-    160,163,162,173,187,218, 55, 51,  2, 13,252, 12, 11,170,134, 81,
-     80, 83, 94, 93,163,133,251, 12, 20,100,  2, 96, 17, 23, 70, 65,
-     64, 67, 66, 77, 76, 79, 78, 73, 72, 75, 74,117,107,162, 16, 24,
-    218, 25, 27,232, 43,128,130,121,120,123,118,102,152,141,195, 52,
-     28,127,186, 68, 57, 58,110,105,104,107,106, 21, 20, 58,138,125,
-     23, 22, 17, 16, 19, 18, 29, 77,226, 71,131,178,130, 79, 99, 81,
-    248,241,  1,  0,  3, 14, 14,252,213,155, 92,125, 62, 18, 28, 97,
-     98,118, 49, 48, 51, 50, 61, 60, 63, 62, 57, 56, 59, 58, 36,251,
-     80,112, 75,134,138,180,116,185, 80,209, 41, 40, 43, 38,218, 36,
-      2,131,132,137,234,202,247,137,138,138,217,216,219,218,197,196,
-    199,198,193,192,195,194, 50, 51,251,187, 95,162,109,147,144, 97,
-    168,  9,241,240,243,254,242, 60, 41,171,172, 96,246,178,207,177,
-    178,179,181,224,227,226,237,236,239,238,233,232,235, 58,139,125,
-    229,106,107,104,203,200, 58, 10,  7, 11,197,192, 97,217,152,155,
-    149,138,123, 90, 19,212,216,141, 10,151,217,216,123,220,216,139,
-    138,181,180,183,182,177,176,179, 77, 66, 67,106,139,236, 30,221,
-    223, 48, 49,240, 89, 97,160,163,157, 98, 83,240, 59,252,204,170,
-      2,115,193,  8,  3,  4,  5, 83, 82, 93, 92, 95, 94, 89, 88, 84,
-    165,186,153,154,185, 23, 25,214, 23, 24, 26, 24,177,137, 72, 75,
-     70, 74,  1, 32,227, 20, 41,114,214,103,233, 42, 43, 44, 45, 43,
-    122,101,100,103,102, 97, 96,156,157,152,187, 48, 57, 58,140,125,
-     60,205, 62, 63, 67, 77, 66,233,209, 16, 16, 33, 34, 33, 72,187,
-     76, 65,134,190, 31,161, 82, 83, 84, 85,124,  2, 13, 12, 15, 14,
-      9, 11,244,245, 66,105, 98, 99,228, 86,102,103,104,105,170,193,
-    201, 56, 56,  9, 26,235,240,143,116,121, 66,126,  8,137,122,123,
-    124,125,124,234,213,212,215,214,209,223, 44, 47,  0,  9,138,139,
-    172,141,142,143,144,145,146, 57, 49,192,192,241,242, 15,154,167,
-    156,157,154, 54,227,145,162,163,164,165,166,162,253,252,255,254,
-    249,199,  4,  7, 48,177,178,179,180,181,182,183,184, 58,141,125,
-    185,138,145, 21,232,232, 26,106,196,194,243,196,197,198,238,136,
-    197,202,203,204,205,206,207,133,132,135,134,129,127,124,125,208,
-    217,218,219,220,221,222,223,224,237,226,201, 77,176,176,114, 66,
-    236,106,235,236,237,209,198,143, 13,242,243,244,245,244,215,249,
-    172,175,174,170, 87, 84,119,128,  1,  2,  3,  4,  5,  6,  7,  8,
-      9, 10,  1,165, 88, 88,154,186,208, 82, 19, 20, 21, 41, 30,104,
-    213, 26, 27, 28, 29, 54, 29,  2, 36,119,118,126,143,140,167, 40,
-     41, 42, 43, 44, 45, 46, 47, 48, 49, 49, 49,157, 96, 58,142,125,
-     96,162,146,137, 90, 59, 60, 62,194,246,  3,114, 66, 67, 68, 69,
-    198, 79,194, 97,207, 30,230,231,228,111, 80, 81, 82, 83, 84, 85,
-     86, 87, 88, 89, 89, 89,245,  8,  8,  9,202, 97,  2, 99,100,102,
-    149,110, 36, 86,106,107,125,109,102,205, 88,243, 80, 81,222,223,
-    220,255,120,121,122,123,124,125,126,127,128,129,130,131, 45,208,
-    208, 17, 40,  5,106,139,140,141, 66, 70,211, 82, 82,147,132,159,
-     52,191,152,153,152,185, 54, 55, 52,191,160,161,162,163,164,165,
-    166,167,168,169,170,171,  6,248,248, 57, 28,145,106, 58,143,125,
-    179,180,182,133,190,248,137,122,187,244,191,182, 31,192,193,194,
-     75,238,111,102, 71,200,201,202,203,204,205,206,207,208,209,210,
-    211,254,128,179,177, 87, 25,226,219,220,209,222,214,172,237, 34,
-    167,177,125,108,103,232,233,234,225,198, 71,100,111,240,241,242,
-    243,244,215,252, 93,248,249,250,247,214,168,167,169, 15,193, 56,
-      3,  4,  9,  6, 14, 72, 10,202, 26,  9, 95,134, 15, 16, 17, 18,
-     19,190,191,190, 23, 24, 25, 18, 19,148, 55,180,181,136, 33, 34,
-     35, 46,176,112,113, 43,217, 46, 43, 44, 46, 46, 46, 58,144,125,
-     64, 49,  6,118, 96,103,148, 55, 56, 57, 58, 57, 30,151,156, 63,
-     64, 65, 66, 97,102,199,102,237,226,201, 74, 75, 78,232, 24, 25,
-     83,161, 82, 83, 84, 85, 86, 86, 36, 90,166, 30,  9,217,126, 95,
-     96, 97, 98, 99, 78,207,238,231,104, 97,226,225, 68,229, 76,109,
-    218,217,114,115,118,208, 35,225, 88, 69,122,123,124,125,126,126,
-    195,129, 79,214,145,147, 14,135,136,137,138,139,  4, 39, 46,135,
-    144, 19,176, 59, 28,189, 30, 61,178, 51, 26,155,144, 52,200,201,
-      0,173,162,163,164,165,166,174,228,169,151,254,248, 58,145,125,
-    199,142,175,176,177,178,179,150, 31, 28, 55, 48, 49, 16, 27,188,
-     63, 20, 23, 98,233, 66,195,196,239,144, 81, 72,197,202,203,204,
-    205,206,198,163,209,209,134,129,191,118,215,216,217,218,219,214,
-    119, 86,223,234,203, 64,107,102,197,100, 69, 98,227,106,235,236,
-    239, 71,137, 80,241,242,243,244,245,246,254,132,249,  9,174,173,
-    175,254,255,  0,  1,  2,195, 36,175,166,143, 42,163,160, 41, 44,
-     15, 36, 47, 56,177, 58, 19, 20, 31,188,130,152, 25, 26, 27, 28,
-     29, 30, 54, 80, 33, 45,118,114,  3,134, 39, 40, 41, 58,146,125,
-     42, 43, 38,135,164, 39,186,155,152,187, 52, 21,156,183, 58,177,
-     56, 59, 60, 63,148,154,192, 65, 66, 67, 68, 69, 70,110, 55, 73,
-    121,158, 24, 23, 78, 79, 80, 81, 94,159, 86,255,244, 93,114,243,
-    248, 91,222, 85,124, 95,172, 73,106,227,100,101,108,206,200,105,
-    106,107,108,109,110,198, 12,177,126,166, 33, 39,118,119,120,121,
-    121, 71,116,215,214, 93, 42, 43, 10,  3,132,167,174,136,184,139,
-    136,139,140,141,140, 38, 24,145,146,147,148,149,150, 62,231,153,
-    153, 78,205,247, 30,159,160,161,162, 93,134, 15, 12, 58,147,125,
-    173,  2,  3, 10,171,172, 45,  6,159, 76,114,130, 27,180,181,180,
-     30, 26,185,186,187,188,189,190, 22,191,241,194,246,145,173, 70,
-    199,200,201,202, 61, 70,103,100,101,122,121,218,211,212,223,246,
-    212, 39,229, 22,219,220,221,222,117, 66, 97,226,227,228,229,230,
-     78,148, 37,233,206,184,183, 78,239,240,241,242,229,214, 95, 92,
-     93, 82, 81,122,251,252,245, 86,195,255,253,193, 63,  4,  5,  6,
-    173, 64,  9, 10, 11, 12, 13, 12,166,111,225, 18,249, 93,113,182,
-     23, 24, 25, 26, 27,150,183,180,181,138,139, 34, 35, 58,148,125,
-     36,  7, 38, 36,215,213, 22,232, 44, 45, 14,133,120, 49, 50, 51,
-     52, 53, 52,158, 71,197, 58, 46, 41,159, 62, 63, 64, 65, 66, 67,
-     76,239,236,237,226,233,202, 75, 76, 77,238,115,175,174,158,108,
-    148, 85, 92,253,202, 89, 90, 91, 92, 93, 84,214, 31,145, 98,134,
-    113,205,230,103,104,105,106,107,110,199,196,197,218,249,114,115,
-    116,125,214,183,135,134,137, 75, 76,125,126,213, 38,129,130,131,
-    132,133,172, 14,247,118,138,174,200,207,142,143,144,145,146,147,
-    150,191, 60, 61, 50, 57,154,155,156,157, 30,144, 95, 58,149,125,
-     94, 93,108,100,165,166,167,129, 41,170,171,172,173,  4,166,207,
-     77,178,213,225,223, 22,183,184,185,186,187,188,183, 20, 21,106,
-     65,194,195,196,199,102, 56, 55, 54, 53, 56,  0,205,206,207,210,
-    145,210,211,212,213,126,214,167, 22,218,125,137,151,222,223,224,
-    225,226,227,228,207, 76, 77, 66,233,234,232,236,237,110, 44, 15,
-     14, 13, 63,199, 53,246,247,248,233,250,251,252,253,126,246,127,
-    254,194,101,161, 45,166,  7,  8,  9, 10, 11, 12,  7,164,165,186,
-    145, 18, 19, 20, 23,182, 40,231,230, 37,232,223, 45, 58,150,125,
-     30, 31, 32, 43, 34, 35, 36, 39, 38,174, 87,213, 26,190,132,133,
-    174, 47, 48, 50,  2,243, 52, 55,156,157,146, 57, 58,247,252, 61,
-     29, 12,191,189,233,188,180, 69, 68, 71, 72, 73,202, 75, 76, 79,
-     88,102, 47,174,146,198,205,117,118, 87, 88, 85,149, 91, 92, 93,
-    244,245,194,225, 98,111,100,103,230,168,151,149,200,212,163, 97,
-    110, 95,112,113, 82,115,116,117,114,222,  7,133,132,225, 24,223,
-    254,127,128,129,130,128,132,135, 44, 45, 32,137,134, 72,188,141,
-     13,176,111,111, 18,156,103,165,150, 27,152,153,154, 58,151,125,
-    155,156,157, 59, 54,223, 94, 84, 52, 62, 37,  6,167,168, 90,150,
-    148,172,173,  4,  5, 18,177,177,131,116,181, 22,116, 71, 71,186,
-    184,112, 78,126,159,192,193,194,195,196,199, 83,146,183, 54, 12,
-     94, 86,101,102,207,208,222,238,223, 20,213,252,125,112,217, 25,
-     24,236,223,146,224, 31, 31,226,224, 27, 41,230,232,232,233,234,
-    235,236, 39,123,186,143, 14, 52,170, 83, 95,246,247,248,  5, 53,
-    248, 60,253, 84, 85,162,  1, 14, 51,200,  5, 70,248,247,247, 10,
-      8, 51, 61,206,  7, 16, 17, 18, 19, 20, 60, 67, 66, 58,152,125,
-    103,230,208, 65,171,247,150, 31, 32, 18, 45, 31, 36, 37, 12,141,
-    160, 41, 25,228, 28, 45,109, 32,207,207, 50, 48,203,246,250, 53,
-    196, 57, 58, 59, 60,155,107,170, 63,190,139, 24, 48,175, 76, 71,
-     72,133,118,183,112, 77,100,229,240, 82, 94,160, 88, 87, 54,168,
-    167,166,216,155,160,109,110, 95, 99,109,162, 99,102,243,240,242,
-     23,150, 99, 61,219, 95,110,111,112,113,114,115,116,117,124,221,
-    240,121, 73,119, 79,125, 50, 64,127,126,  9, 67, 75,134,181, 71,
-      7,186,138,139,134,216, 36,218,239,110,139,245, 64, 58,153,125,
-    107, 30, 23,152, 86,149,151,144,157,180, 53,160,161,109, 80,104,
-    167,229, 88, 87, 86, 33,107, 80, 81,174,175,176,189,114,179,189,
-     32,227,226,199, 69,211,214,108,179, 22,191,192,242,254,243, 59,
-    197,204,109, 72,197,198, 55,  3, 13,142,240, 47, 46, 80,211, 27,
-    218,229, 23,216,217,213,219,122,120,135,138,159, 29,139,137, 52,
-    213,206,199,232,218, 41,228,220, 45,196, 77,248,242, 13, 60,196,
-    247,154,244,  7,  6, 58,251,  0, 13,253,207, 32,  1, 50,  3,145,
-    108, 83, 82,119,245,175, 81,220, 13,142, 47, 16, 18, 58,154,125,
-     34,224,215,213, 52,189, 56,213,213,228,211, 31, 94,208,223,222,
-    226, 35,215, 38,230,231, 40, 41, 42, 43,121,116,119,122, 79,193,
-    151,148,100, 53, 28, 55, 56, 58,  6,  7,252,253, 52,149, 64, 65,
-    189,188,180,133, 37,184,183,182,170, 75,176,125, 65, 77, 88, 81,
-     82, 83,  1, 12, 63,  2, 39,168,207,224, 28, 93,118, 95, 96, 97,
-    174,147,151,165,100,207,232,106, 85,148,163,111, 46,108,143,142,
-    130, 80,139,117,134,181,248,121,118,122, 41, 36, 27, 42,207, 91,
-     23,248,244,133,140,165,136,137,118,120,143,141,132, 58,155,125,
-      5,144,162,109,108,104, 85,254,164,103,102,104,152, 96,145,158,
-    172,162,161,161,162,193,195,195,242,231,115,252,198,220,173,174,
-    141,176,177,190, 67,120,181,182, 31,155,182, 69, 68,112,189, 61,
-    176, 63, 62, 62,204, 59,  5,245,245,200,201,202,202,165,103,155,
-    154,175,203,137,126, 24,213,214,219,216,217,214, 23,223, 29,220,
-    213,224,238, 29, 28, 24, 39,198, 40, 23, 22, 21, 20, 28,221,238,
-    211, 16,241,194,242,174, 96,163,162,132,224,172,166, 12, 61,254,
-    255,  0,  1,  1, 48,203,  5,  4,173,  8, 54, 53,244, 58,156,125,
-    240, 61, 46, 60,239,238,237,236,231, 22, 37, 23,152, 25, 38, 26,
-     73, 72, 75, 74, 92, 72, 68,150,215, 37, 38, 39, 40, 41, 41, 23,
-     28, 29, 46, 13,188,206,205,204,203,245,174,248,199,198,197,196,
-    192, 61, 50, 48,120, 65, 65, 70, 17, 16, 19, 18, 54,236, 35, 60,
-    179, 77, 78, 79, 80, 81, 94,111,167,101, 86,247, 88, 90,165,164,
-    175,109, 78, 96,159,158,157,156,155, 85,166,100,106,105,106,110,
-     57, 56, 59, 58, 50,228, 28,164,136,133,118,119,120,121,121,123,
-    124,126,126, 85,131,126,125,124,123, 69, 22,139,119, 58,157,125,
-    118,117,116,112,141,142,131,152, 17,146,150,193,192,195,194,218,
-     12,244, 76,111,157,158,159, 96,161,162,163,164,165,166,167, 40,
-    102, 85, 84, 83,145,134,156, 79, 78, 77, 76, 71, 74,182,183,112,
-     57,186,190,233,232,235,234,138, 87, 89, 28, 59, 10,198,199,200,
-    201,202,  8,  0,253,206,237,211, 30, 45, 44, 43, 21,214,219, 39,
-     38, 37, 36, 32,209,222,211,210,193,226,230,177,176,179,178,130,
-    191, 61,180, 19, 33, 30,239,240,241,241,243,244,245,246,247,244,
-      6,  5,  4,  3, 49, 86,204,255,254,253,252,251,245, 58,158,125,
-      6,  7,196, 33, 10,206, 89, 88, 91, 90,122, 71,249,108,235, 38,
-     22,215, 40, 25, 22, 43,223, 18, 30, 29, 32,238,221,220,219, 21,
-     46, 40,215,214,213,212,211, 45, 46, 47, 48,179,178, 54, 97, 96,
-     99, 98,109, 83,135, 68,195,242,  2, 60, 64, 65, 66, 67, 68, 69,
-     70, 71, 75,182,181,180,179,189, 78,124,175,174,173,172,164,150,
-     86, 87, 88,121,122, 94,  9,  8, 11, 10, 53, 12,207,156,155,154,
-    170,171, 88,169,106,107, 96,109,110,109,112,190,141,140,139, 73,
-     84,187,135,134,133,132,188,113,114,127,128,131, 10, 58,159,125,
-    134,209,208,211,210,221,228,231,116,115,113,126,143, 80,145,146,
-    147,151,153,150,151,152,102,101,100, 99,110,158,156,159, 94, 93,
-     92,107,165,166,167,168,169,136,170,249,248,251,250,230,219,199,
-     76, 75, 74, 70,132,187,182,138,184,140,125,126,191,195, 62, 61,
-     60, 59,  9,206,203, 55, 54, 53, 52, 12, 49,254,207,208,217, 90,
-     90,129,128,131,130,142, 67,109, 36, 35, 34, 33, 28, 35,225,226,
-    208, 23,233,230,231,228,230, 21, 20, 19, 17,236,236, 63, 14, 13,
-     12,  7,245,246,247,248,249,242,114,169,168,171,170, 58,160,125,
-     86,215,213,252,251,250,249, 55, 56,197,  6,203,240,206,  2, 15,
-     16,238,237,236,235,230,212,151,231,230,229,228,224, 29, 30, 31,
-     32, 33,  0, 10,113,112,115,114, 78,194,121,212,211,210,225,208,
-     51,  1,241,207,199, 57, 53, 55, 59,246,197,196,195,194, 52, 60,
-    127,190,189,188,135,118, 70, 71, 72, 73, 74,225, 25, 24, 27, 26,
-     57,234, 17,172,171,170,169,155,164, 85,102,168, 99,157,110, 95,
-     80,158,157,156,155,150,166,231, 91,150,149,148,160,109, 94,109,
-    112,113,114,249, 33, 32, 35, 34, 17, 20, 53,132,131, 58,161,125,
-    130,129,128,115,114,113, 76,119,182,138,135,135,182,117,116,115,
-    114,140, 15,111,110,109,108,168,149,150,157,152,169,154,177,201,
-    200,203,202,206,204,173, 92, 91, 90, 89, 88, 87, 86, 85, 84, 83,
-     98,157,175,176, 78, 77, 76, 75, 70,134, 55,139, 70, 69, 68,176,
-    125,190,183,192,193,194,201,145,144,147,146,166,124,197, 52, 51,
-     50, 49, 48, 47, 34, 45, 44,235, 42,214, 23, 20,230, 37, 36, 35,
-     34, 28,255, 47, 30, 29, 16, 23,229,230,199,232,233,234,225,121,
-    184,187,186,171, 69,194, 12, 11, 10,  9,  8,  7,  6, 58,162,125,
-      5, 52,  0, 49, 13,255,  0,254,253,252,251,250,198, 39, 52,246,
-    245,244, 12, 13, 14, 47, 16, 17, 18, 17,129, 64, 67, 66, 67,205,
-     37,228,227,226,225,224,223,222,221,220,219,217,230,212, 40, 26,
-    213,212,211,210,222,131, 63,194,205,195,244,245, 54,183, 56, 57,
-     58, 59,169,104,107,106, 38, 17, 65,124,187,186,185,184,183,182,
-    181,180,179,178,178, 79, 96,174,173,172,171,170,102,119,107,166,
-    165,148, 92, 93, 94,223, 96, 97, 98, 99,193, 48, 51, 50,  7, 41,
-    101,148,147,146,145,144,143,142,141,140,139,134,181, 58,163,125,
-    183,123,118,133,132,131,130,130, 95, 76,126,125,127,180,133,132,
-    135,136,137,134, 75,169,216,219,218,237,145,158, 96,107,106,105,
-    104,103,102,101,100, 99, 98,162,175, 96,110, 93, 92, 91, 90,154,
-    143,168,102,149,152,175,173,164,175,176,177,126,179,157,224,227,
-    226,236,185,185, 68, 67, 66, 65, 64, 63, 62, 61, 60, 59, 57, 53,
-      7,200,198, 53, 52, 51, 50, 49,199,220, 46, 46, 19,212,119,254,
-    215,216,213,233, 23,213,136,139,138,184,225,238, 32, 27, 26, 25,
-     24, 23, 22, 21, 20, 19, 18, 45,211,240,241, 13, 12, 58,164,125,
-     11, 10,197, 61,251,250, 54, 55,252,221,222,255,  0,193, 13,195,
-     45, 80, 83, 82,104,  9, 10,247,243,242,241,240,239,238,237,236,
-    235,234, 37,215, 20,214,229,228,227,226,226, 29, 35, 18,221, 16,
-     20,  7,166, 39, 40, 41, 22,216, 37,120,123,122,112, 49, 50, 60,
-    203,202,201,200,199,198,197,196,195,194,194,207,128, 65,125,188,
-    187,186,185,143, 72, 69,118,139, 78,199, 78, 79, 80, 93,173,163,
-    125,  0,  3,  2, 56, 89, 85,148,111,162,161,160,159,158,157,156,
-    155,154,170,171,104,106, 89,148,147,146,158,109,112, 58,165,125,
-    114,130,115,252,221,118,119, 72, 73,133,136,117, 40, 43, 42,192,
-    129,142,140,123,122,121,120,119,118,117,116,115,114,114,188, 80,
-     81,158,108,171,106,101,157, 56, 89,154,171,150, 61,158,159, 96,
-    146, 93,159,173,240,243,242,202,169,170,168,144, 82, 81, 80, 79,
-     78, 77, 76, 75, 74,121,123,184,185,133, 68, 67, 66,130,157,104,
-    193,194,193,110,197,198,199,200,201, 53,  4,197,152,155,154,144,
-    209,209,227,235, 42, 41, 40, 39, 38, 37, 36, 35, 34, 34, 31,236,
-    237,226,220,219, 26,214,231, 64,106,201,227, 76,237, 58,166,125,
-    238,239,252,254, 13, 12,221,160,163,162,154,249,250,251,  3,194,
-      1,  0,255,254,253,252,251,250,245,  4,  8,  9,  6,196,243, 50,
-      2,  5,184, 17, 18, 49,148, 21, 22, 36, 40,230,229,228, 21, 72,
-     75, 74, 96, 33, 34, 16, 27,218,217,216,215,214,213,212,211,210,
-    209,227,240, 49,242, 51,  7,201,  6, 21, 18,153,178,177, 60, 61,
-     62, 63,127,114,189,188, 77, 16, 19, 18, 40,201, 74, 75, 67,178,
-    177,176,175,174,173,172,171,170,154,167, 84,106,106,151, 99,158,
-     94,127,200,233, 64,203,100,101,102,103,152,150,149, 58,167,125,
-    155, 69, 56, 59, 58, 18,241,114,112,120,134,137,136,135,134,133,
-    132,131,129,129,124,128,129,129,128,136,181, 74,133,162, 35, 32,
-     43,140,141,129,131,147, 94,109,111,157,192,195,194,248,153,154,
-    168, 83,162, 97, 96, 95, 94, 93, 92, 91, 90,154,107,164,169,170,
-    103,156,110,174, 45, 26, 27, 24, 51,180,181,182,183,119, 70, 69,
-     75,149,232,235,234,136, 73,194,195,196,249, 57, 56, 55, 54, 53,
-     52, 51, 50, 49,255,208,209,210,223, 23,217, 22,223,242,115,114,
-    219,220,221,222,236,220, 30, 29, 19,237,176,179,178, 58,168,125,
-    136,201,234,235, 32,210, 17, 16, 15, 14, 13, 12, 11,  9, 53, 59,
-     56,249,250,248,240,253,254,253,170,171,162,  3,  4,  5,  5,  7,
-    251,246,245,251,  5, 88, 91, 90, 88,145, 18, 19, 24,233,233,232,
-    231,230,229,228,227,226,237, 31, 32, 33, 34, 35, 36,233, 36,  5,
-    130,131, 42, 43, 44, 45,221,224, 15,206,205, 51, 61, 96, 99, 98,
-     80, 51, 58, 59, 60,194,193,192,191,190,189,188,187,185,138,180,
-     72, 73, 74, 75, 76, 77, 78,229,250,249, 82, 83, 84, 85,166,100,
-    167,166,165,155,117,  8, 11, 10,  8,235, 98, 99, 84, 58,169,125,
-     86,169,152,151,150,149,148,147,158, 81,111,112,113,114,115,116,
-    117,118, 93,210,217,122,123,124, 77,114,128,127,126,125,131,141,
-    208,211,210,226,137, 10,139,143, 66,113,112,111,110,109,108,107,
-    106, 89,155,152,153,154,155,156,157,188, 53,  9,161,162,163,164,
-    105,149,152, 87, 86, 85,171,  9,248,251,250,218,155,176,179,184,
-    134,137, 72, 71, 70, 69, 68, 67,113, 78,127,192,225,194,195,196,
-    205,108,110,152,201,202,203,204,241, 13, 48, 47, 46, 34,209,241,
-    128,131,130,178, 89,218,219,223,222, 17, 32, 31, 30, 58,170,125,
-     29, 28, 24, 26, 38,231,232,107,234,235,236,239, 68, 74,240,241,
-    242,243,248,245,  9,  8,  7,  6,  9,251, 89,168,171,170,106,163,
-     34,  3,  7, 53,245,248,247,246,245,244,243,254,  2,195, 18, 25,
-     50, 17, 30,191,191, 71, 24, 25, 26, 27,224,210,225,224, 31,222,
-    210, 33,113,112,115,114, 66, 33,160, 43, 44, 33,222,208,207,206,
-    205,204,199,  9, 54, 55, 56,155, 24,145,150,151,107, 63, 64, 65,
-     66, 64, 68,138,185,120,120,138, 30, 29, 90,235,232,218, 58,115,
-    242, 83, 87, 85,101,168,167,166,165,164,163,145,157, 58,171,125,
-     95, 98, 75,200,198, 49, 48, 50,103,104,105,106,107,159, 82,145,
-    111, 67,190,  6, 53, 98, 19,208,210, 34,241,114,115,124, 65, 77,
-    176,127,126,125,124,119,181,182,135,138, 35, 31,222,217,216,206,
-    143,144,145,146,108,171,154,105,164,168, 90,206,193,138, 59, 56,
-     58,250, 11,128,131,164,165,169, 88, 87, 86, 85, 84,144, 97,110,
-    175,186, 20,231,230,225,225,182,183,184,185,186,184,143, 66, 65,
-    140,255, 14,134,133,194,163, 96, 82,146, 73, 74,203, 76,205,  2,
-     48, 31, 46, 45, 32,232,213,218,215,113,140,143,142, 58,172,125,
-    137,157,222,223,224,225,210, 19, 39, 26, 25,212,215, 38,234,193,
-    185,184,187,186,170, 89, 80,251,244,249,245,  8,  7,  6,  5, 52,
-     63,242,254,253,165, 84, 87, 86, 80,  5,  6,  7,  8,202, 53,  4,
-     51,242, 61, 48, 47,222, 18,153, 65, 64, 67, 66, 78,187, 18, 59,
-     60, 29,226, 35,223,222,209,223, 36,230, 38, 45,125,124,127,126,
-    124, 45, 46, 47, 48, 49,242,255,203, 10,201,  8,  7,197, 26, 98,
-    105,104,107,106, 52, 49, 51, 55, 96,156,159,158,153,152,155,154,
-    133,132,135,134,190,127,214,214,141,140,143,142,137, 56,  0,105,
-    240, 42,162, 32,195,  0,  0,  0,  0,  0,  0,  0,  0,  0,255,250,
-    128,  2, 32,  0,  0,  0,  2,165, 85, 85, 85,  0,  0,  0,  0,  0,
-      0,106,168,  8,136,  0,204,255, 60, 10,170,131,207, 48,  0,  0,
-      0,  0,  0,  0,  0,  0,255,250,160,  0,128,  0,  0,  0,  0,165,
-     85, 85, 85,  0,  0,  0,  0,  0,  0,106,160, 34, 34,  0, 51, 51,
-    255,  2,170,139,  0,  3,  0,  0,  0,  0,  0,  0,  0,  0,255,250,
-    160, 34,128,  0,  0,  0,  0,165, 85, 85, 85,  0,  0,  0,  0,  0,
-      0, 90,168,136,136,128, 12,204,207,240, 42,170,  0,  6,174,125,
-     48,  0,  0,  0,  0,  0,  0,  0,  0,255,250,168,138,  0,  0,  0,
-     12,192, 37, 85, 85, 85,  0,  0,  0,  0,  0,  0, 90,162, 34, 34,
-      0, 51, 51,255,255,  6,102,128, 12,  0,  0,  0,  0,  0,  0,  0,
-      0,255,250,170,170,  0,  0,  0,204,  0, 41, 85, 85, 85,  0,  0,
-      0,  0,  0,  0, 90,168,136,136,128,  0,192,207,255,241,154,168,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,255,250,170,168,  0,  0, 12,
-     51,204,  9, 85, 85, 85,  0,  0,  0,  0,  0,  0, 86,162, 34, 34,
-     32,  3, 15,255,255,255,  2,170,  0,  0,  0,  0,  0,  6,175,125,
-      0,  0,  0,  0,255,202,170,160,  0,  0,192, 15,192, 41, 85, 85,
-     85,  0,  0,  0,  0,  0,  0, 86,162,136,136,136,  0,252, 15,255,
-    255,255,254,140,  0,  0,  0,  0,  0,  0,  0,  0,255,202,170,128,
-      0,  0,  0, 60,243,  9, 85, 85, 85,  0,  0,  0,  0,  0,  0, 86,
-    170, 34, 34, 34,  0,  3,204,255,207,255,255,240,  0,  0,  0,  0,
-      0,  0,  0,  0,255,234,170,  0,  0,  0, 12,255,240, 41, 85, 85,
-     85,  0,  0,  0,  0,  0,  0, 86,170,136,136,136,128, 48, 51,255,
-    243, 60,255,255,  0,  0,  0,  0,  0,  0,  0,  0,255,  6,176,125,
-     10,168,  0,  0, 48, 48,255,243,  9, 85, 85, 85,  0,  0,  0,  0,
-      0,  0, 85,170,162, 34, 34, 32,  3,  0, 63,255,255,252,252,  0,
-      0,  0,  0,  0,  0,  0,  0, 63, 10,160,  0,  0,192, 51,255, 60,
-      9, 85, 85, 85,  0,  0,  0,  0,  0,  0, 85,170,168,136,136,128,
-      0,  0, 15,255,243,255,255,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-     42,  0,  0,  0,  0,  0,255,207,  9, 85, 85, 85,  0,  0,  0,  0,
-      0,  0, 85,106,170, 34, 34, 32,  0,  0,  0,255,255,243,207,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,160,  0,  0,  0, 12,  6,177,125,
-     15,255,255, 41, 85, 85, 85,  0,  0,  0,  0,  0,  0, 85, 90,168,
-    136,136,136,  0,  0,  0, 15,255,255,255,  0,  0,  0,  0,  0,  0,
-      0,  0,  2,128,  0,  0, 51, 48,255,255,255,  9, 85, 85, 85,  0,
-      0,  0,  0,  0,  0, 85, 86,170,170, 34, 34,  0,  0,  0,  0,255,
-    255,255,  0,  0,  0,  0,  0,  0,  0,  0, 42,  0,  0,  0,  0, 63,
-     51,255,255,  9, 85, 85, 85,  0,  0,  0,  0,  0,  0, 85, 86,170,
-    170,168,136,128,  0,  0,  0, 15,255,207,  0,  0,  0,  0,  0,  0,
-      0,  0,168,  0,  0,  0,  0,240,255,255,240, 41, 85,  6,178,125,
-     85, 85,  0,  0,  0,  0,  0,  0, 85, 86,170,170,162, 34, 32,  0,
-      0,  0,  0, 63,255,  0,  0,  0,  0,  0,  0,  0,  0,160,  0,  0,
-     15, 12,  3,207,255,252,  9, 85, 85, 85,  0,  0,  0,  0,  0,  0,
-     85, 85,170,170,168,136,160,  0,  0,  0,  0,  3,207,  0,  0,  0,
-      0,  0,  0,  0,  0,128,  0,  0,  0,  0,207,255,255,240, 41, 85,
-     85, 85,  0,  0,  0,  0,  0,  0, 85, 85,170,170, 34, 34, 32,  0,
-      0,  0,  0, 51, 51,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0, 51, 60,255,255,240,  9, 85, 85, 85,  0,  0,  0,  6,179,125,
-      0,  0,  0, 85, 85,170,170,170,136,136,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,243,255,255,
-    240,  9, 85, 85, 85,  0,  0,  0,  0,  0,  0, 85, 85,106,170,170,
-    162, 40,  2,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,243,207, 63,255,255,  0,  9, 85, 85, 85,  0,  0,  0,
-      0,  0,  0, 85, 85, 90,170,170,168,162,128,  8,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,240, 51,255,255,255,
-    192, 41, 85, 85, 85,  0,  0,  0,  0,  0,  0, 89, 85,  6,180,125,
-     90,170,170,170, 42, 32, 32,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0, 48, 12,255,255,255,255,  0,  9, 85, 85, 85,
-      0,  0,  0,  0,  0,  0, 86, 85, 86,170,170,170,136,128,128,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,204, 51, 63,
-    255,255,255,  0,165, 85, 85, 85,  0,  0,  0,  0,  0,  0, 85, 85,
-     86,170,170,170,170,130,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0, 60,195,255,255,255,240,  2, 37, 85, 85, 85,
-      0,  0,  0,  0,  0,  0, 86,165, 86,170,170,170,170,  6,181,125,
-    170,  8,128,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 12,
-      0,255,255,255,255,243,  0, 37, 85, 85, 85,  0,  0,  0,  0,  0,
-      0,101, 90,101,170,170,170,170,168, 32,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,252,207,255,255,255,255,252,  2,149,
-     85, 85, 85,  0,  0,  0,  0,  0,  0,101, 86,101,106,170,170,170,
-    170,168,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  3,  0,
-    207,207,255,255,255,  0,  0,149, 85, 85, 85,  0,  0,  0,  0,  0,
-      0, 89, 69, 85,106,170,170,170,170,162, 32, 32,  0,  6,184,125,
-     54,206, 46, 15,  8, 68, 58, 84, 73, 84, 76, 69, 50, 20, 65, 54,
-    251, 45, 70, 58,247, 37, 14, 65,  1,  1,  0,  0,  0, 44, 20, 77,
-     31, 14, 65, 22,  0,  0,  0,  0, 18,251, 22, 10,125,119, 15, 31,
-     14, 66,  5, 66,114,  0,  0, 18,182, 20, 27, 31, 14, 65,  5, 89,
-      0,  0,  0, 18,182, 20,109, 54,174, 45, 63, 58, 67, 58, 15, 61,
-    104,169, 64,133, 16,141, 14,210,169,  1,141, 68,  2,141,  1,  3,
-    169, 82,141,  2,  3,169,  0,141,  4,  3,169,  6,141,  5,  3,104,
-    141, 11,  3,104,141, 10,  3, 32, 83,228,169, 83,141, 18,183,125,
-      2,  3, 32, 83,228,173,235,  2, 73,255,201, 32, 48,  1,104, 96,
-     44, 60, 14, 65,  7, 25,  0,  0,  0, 44, 20,119, 12, 14, 65, 57,
-      0,  0,  0,  0, 22, 20,125,102, 21, 31, 14, 65, 21, 55,  0,  0,
-      0, 18, 14, 64, 66,  0,  0,  0,  0, 20, 39, 31, 14, 65, 21, 56,
-      0,  0,  0, 18, 14, 65,  1, 24,  0,  0,  0, 20, 57, 31, 14, 65,
-     21, 57,  0,  0,  0, 18, 14, 64, 80,  0,  0,  0,  0, 20, 75, 31,
-     14, 65, 21, 64,  0,  0,  0, 18, 14, 64, 18,  0,  0,  0,  0, 20,
-     87, 31, 14, 65, 21, 54,  0,  0,  0, 18,248, 20, 99, 18,202,125,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,243, 63,255,255,255,252,
-    240, 10, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,105, 85, 85, 90,
-    170,170,170,170,170,168,128,128,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,255, 63, 15, 63,255,255,240,  0,  2, 85, 85, 85, 85,  0,  0,
-      0,  0,  0,  0, 90, 85, 85, 86,170,170,170,170,170,168,  2,  2,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  3, 51,255,255,255,255,255,
-    240, 41, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,101,169, 85, 85,
-    170,170,170,170,170,170,170,  0,  0,  0,  0,  0,  0,  6,185,125,
-      0,  0,  0,  0,240,195,255,255,255,255, 12,  0,137, 85, 85, 85,
-     85,  0,  0,  0,  0,  0,  0,102,102,101, 85,106,170,170,170,170,
-    170,162, 32, 32,  0,  0,  0,  0,  0,  0,  0,  0, 15, 63,255,255,
-    255,252,240,  0, 37, 85, 85, 85, 85,  0,  0,  0,  0,  0,  0,101,
-    169, 85,149, 90,170,170,170,170,170,170,170,160,  0,  0,  0,  0,
-      0,  0,  0,  0,204,255, 63,255,255,255,192,  2,165, 85, 85, 85,
-     85,  0,  0,  0,  0,  0,  0,  0, 85, 85, 85, 85, 85, 85, 85, 85,
-     85,106,170,  3, 49,  0,  0,  0,  0,  0,  0, 90,172,  4,  0,100,
-     73, 39, 77, 32, 79, 78, 32, 65, 32, 76, 85, 67, 75, 89, 32, 83,
-     84, 82, 69, 65, 75, 32, 78, 79, 87, 33, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 71, 73, 86, 69, 32, 85, 80, 63, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 79, 72, 72, 72,
-     46, 46, 46, 73, 32, 76, 73, 75, 69, 32, 65, 32, 77, 65, 78, 32,
-     87, 73, 84, 72, 32, 71, 85, 84, 83, 33, 72, 65, 86, 69, 32, 89,
-     79, 85, 32, 69, 86, 69, 82, 32, 72, 69, 65, 82, 68, 32, 79, 70,
-     32, 79, 68, 68, 83, 63, 32, 32, 76, 79, 79, 75, 32, 78,187,125,
-     79, 85, 84, 33, 32, 73, 39, 77, 32, 87, 65, 82, 77, 73, 78, 71,
-     32, 85, 80, 33, 32, 32, 32, 32, 32, 84, 72, 73, 83, 32, 73, 83,
-     32, 71, 79, 73, 78, 71, 32, 84, 79, 32, 66, 69, 32, 70, 85, 78,
-     33, 32, 32, 32, 32, 32, 32, 32, 84, 72, 73, 83, 32, 73, 83, 78,
-     39, 84, 32, 79, 76, 68, 32, 77, 65, 73, 68, 32, 89, 79, 85, 32,
-     75, 78, 79, 87, 46, 73, 39, 77, 32, 71, 79, 78, 78, 65, 32, 72,
-     65, 78, 71, 32, 89, 79, 85, 32, 79, 85, 84, 32, 84, 79, 32, 68,
-     82, 89, 33, 32, 32, 32, 32, 32, 32, 32, 32, 89, 79, 78,188,125,
-     85, 32, 84, 87, 69, 82, 80, 33, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 68, 73, 68, 32, 89, 79, 85, 32, 84, 72, 73, 78,
-     75, 32, 73, 32, 87, 65, 83, 32, 66, 76, 85, 70, 70, 73, 78, 71,
-     63, 32, 73, 83, 32, 73, 84, 32, 71, 69, 84, 84, 73, 78, 71, 32,
-     67, 79, 76, 68, 32, 79, 85, 84, 32, 84, 72, 69, 82, 69, 63, 32,
-     32, 32, 32, 32, 73, 32, 76, 79, 86, 69, 32, 66, 69, 73, 78, 71,
-     32, 68, 69, 65, 76, 69, 82, 46, 32, 32, 32, 32, 32, 32, 87, 72,
-     65, 84, 32, 72, 65, 86, 69, 32, 89, 79, 85, 32, 66, 78,190,125,
-     73, 39, 77, 32, 79, 78, 32, 65, 32, 76, 85, 67, 75, 89, 32, 83,
-     84, 82, 69, 65, 75, 32, 78, 79, 87, 33, 32, 32, 32, 32, 84, 79,
-     78, 73, 71, 72, 84, 39, 83, 32, 77, 89, 32, 76, 85, 67, 75, 89,
-     32, 78, 73, 71, 72, 84, 46, 32, 32, 32, 32, 32, 89, 79, 85, 32,
-     66, 69, 84, 32, 79, 78, 32, 84, 72, 65, 84, 32, 72, 65, 78, 68,
-     63, 32, 32, 32, 32, 32, 32, 32, 32, 32, 73, 32, 87, 73, 78, 46,
-     46, 46, 73, 32, 87, 73, 78, 46, 46, 46, 73, 32, 87, 73, 78, 32,
-     65, 71, 65, 73, 78, 33, 33, 33, 73, 39, 77, 32, 78, 74,191,125,
-     69, 69, 78, 32, 83, 77, 79, 75, 73, 78, 71, 63, 32, 32, 32, 78,
-     79, 87, 46, 46, 78, 79, 87, 46, 46, 71, 82, 79, 87, 78, 32, 77,
-     69, 78, 32, 68, 79, 78, 39, 84, 32, 67, 82, 89, 46, 82, 69, 65,
-     68, 32, 39, 69, 77, 32, 65, 78, 68, 32, 87, 69, 69, 80, 32, 72,
-     79, 78, 69, 89, 33, 33, 33, 32, 32, 32, 32, 32, 32, 32, 65, 82,
-     69, 32, 89, 79, 85, 32, 77, 65, 82, 75, 73, 78, 71, 32, 84, 72,
-     69, 32, 67, 65, 82, 68, 83, 63, 32, 89, 79, 85, 32, 76, 85, 67,
-     75, 89, 32, 35, 94, 42, 35, 33, 64, 38, 37, 42, 35, 78,198,125,
-     79, 84, 32, 66, 65, 68, 32, 70, 79, 82, 32, 65, 32, 66, 69, 71,
-     73, 78, 78, 69, 82, 33, 32, 32, 32, 84, 72, 73, 83, 32, 73, 83,
-     32, 71, 79, 73, 78, 71, 32, 84, 79, 32, 66, 69, 32, 70, 85, 78,
-     33, 32, 32, 32, 32, 32, 32, 83, 65, 89, 44, 32, 65, 78, 89, 32,
-     82, 69, 65, 76, 32, 80, 76, 65, 89, 69, 82, 83, 32, 65, 82, 79,
-     85, 78, 68, 63, 32, 73, 32, 79, 87, 78, 32, 84, 72, 69, 32, 67,
-     65, 82, 68, 83, 32, 84, 79, 78, 73, 71, 72, 84, 44, 32, 72, 79,
-     78, 69, 89, 73, 39, 77, 32, 84, 65, 75, 73, 78, 71, 74,192,125,
-     32, 67, 65, 78, 68, 89, 32, 70, 82, 79, 77, 32, 65, 32, 66, 65,
-     66, 89, 33, 32, 68, 73, 68, 32, 89, 79, 85, 32, 84, 72, 73, 78,
-     75, 32, 73, 32, 87, 65, 83, 32, 66, 76, 85, 70, 70, 73, 78, 71,
-     63, 32, 73, 83, 32, 73, 84, 32, 71, 69, 84, 84, 73, 78, 71, 32,
-     67, 79, 76, 68, 32, 79, 85, 84, 32, 84, 72, 69, 82, 69, 63, 32,
-     78, 79, 84, 72, 73, 78, 71, 32, 85, 80, 32, 77, 89, 32, 83, 76,
-     69, 69, 86, 69, 83, 46, 46, 46, 32, 32, 32, 32, 32, 32, 89, 79,
-     85, 32, 66, 69, 84, 32, 79, 78, 32, 84, 72, 65, 84, 74,193,125,
-     32, 72, 65, 78, 68, 63, 32, 32, 32, 32, 32, 32, 32, 32, 32, 87,
-     69, 82, 69, 32, 89, 79, 85, 32, 67, 72, 65, 83, 73, 78, 71, 32,
-     65, 32, 82, 65, 73, 78, 66, 79, 87, 63, 63, 63, 32, 82, 69, 65,
-     68, 32, 39, 69, 77, 32, 65, 78, 68, 32, 87, 69, 69, 80, 32, 72,
-     79, 78, 69, 89, 33, 32, 32, 32, 32, 32, 32, 89, 79, 85, 82, 32,
-     76, 85, 67, 75, 32, 72, 65, 83, 32, 84, 79, 32, 82, 85, 78, 32,
-     79, 85, 84, 46, 46, 46, 32, 32, 32, 89, 79, 85, 32, 76, 85, 67,
-     75, 89, 32, 42, 33, 35, 37, 38, 42, 43, 36, 35, 33, 74,194,125,
-     64, 32, 32, 32, 32, 32, 32, 32, 32, 32, 87, 73, 80, 69, 32, 84,
-     72, 65, 84, 32, 71, 82, 73, 78, 32, 79, 70, 70, 32, 89, 79, 85,
-     82, 32, 70, 65, 67, 69, 33, 32, 83, 84, 79, 80, 32, 87, 73, 78,
-     78, 73, 78, 71, 44, 32, 73, 39, 77, 32, 71, 69, 84, 84, 73, 78,
-     71, 32, 67, 79, 76, 68, 72, 69, 89, 33, 32, 69, 78, 79, 85, 71,
-     72, 32, 73, 83, 32, 69, 78, 79, 85, 71, 72, 32, 65, 76, 82, 69,
-     65, 68, 89, 33, 83, 79, 32, 89, 79, 85, 39, 86, 69, 32, 78, 69,
-     86, 69, 82, 32, 80, 76, 65, 89, 69, 68, 32, 66, 69, 74,195,125,
-     70, 79, 82, 69, 63, 76, 85, 67, 75, 89, 46, 46, 46, 76, 85, 67,
-     75, 89, 46, 46, 46, 76, 85, 67, 75, 89, 46, 46, 46, 32, 32, 32,
-     32, 32, 32, 78, 69, 88, 84, 32, 68, 69, 65, 76, 46, 46, 46, 73,
-     32, 67, 85, 84, 32, 84, 72, 69, 32, 67, 65, 82, 68, 83, 46, 32,
-     32, 66, 82, 82, 82, 46, 46, 46, 73, 32, 70, 69, 69, 76, 32, 65,
-     32, 68, 82, 65, 70, 84, 46, 32, 32, 32, 32, 32, 32, 32, 32, 89,
-     79, 85, 82, 32, 77, 79, 77, 32, 87, 69, 65, 82, 83, 32, 65, 82,
-     77, 89, 32, 66, 79, 79, 84, 83, 46, 46, 46, 32, 32, 74,196,125,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 83, 72, 73, 84, 33,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 73, 32,
-     72, 79, 80, 69, 32, 89, 79, 85, 82, 32, 71, 76, 65, 83, 83, 69,
-     83, 32, 83, 84, 69, 65, 77, 32, 85, 80, 33, 32, 80, 76, 69, 65,
-     83, 69, 33, 32, 80, 76, 69, 65, 83, 69, 33, 32, 80, 85, 83, 72,
-     32, 82, 69, 83, 69, 84, 33, 33, 33, 32, 87, 72, 79, 32, 68, 69,
-     65, 76, 84, 32, 84, 72, 69, 83, 69, 32, 67, 82, 85, 77, 77, 89,
-     32, 67, 65, 82, 68, 83, 63, 32, 65, 82, 69, 32, 89, 74,197,125,
-     79, 85, 32, 80, 69, 69, 75, 73, 78, 71, 32, 65, 84, 32, 77, 89,
-     32, 67, 65, 82, 68, 83, 63, 32, 32,  4,  6, 32, 66, 76, 79, 85,
-     83, 69, 32, 32, 74, 69, 65, 78, 83, 32, 32, 32, 84, 69, 68, 68,
-     89, 32, 32, 32, 85, 78, 68, 73, 69, 83, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 72,  0,125,
-     36, 33, 32, 32, 32, 32, 32, 32, 32, 32, 87, 73, 80, 69, 32, 84,
-     72, 65, 84, 32, 71, 82, 73, 78, 32, 79, 70, 70, 32, 89, 79, 85,
-     82, 32, 70, 65, 67, 69, 33, 32, 67, 85, 84, 32, 73, 84, 32, 79,
-     85, 84, 44, 32, 73, 39, 77, 32, 71, 69, 84, 84, 73, 78, 71, 32,
-     67, 79, 76, 68, 33, 32, 73, 32, 82, 69, 65, 76, 76, 89, 32, 72,
-     65, 84, 69, 32, 84, 72, 73, 83, 32, 71, 65, 77, 69, 33, 33, 33,
-     32, 32, 32, 32, 83, 79, 32, 89, 79, 85, 39, 86, 69, 32, 78, 69,
-     86, 69, 82, 32, 80, 76, 65, 89, 69, 68, 32, 66, 69, 78,199,125,
-     70, 79, 82, 69, 63, 76, 85, 67, 75, 89, 46, 46, 46, 76, 85, 67,
-     75, 89, 46, 46, 46, 76, 85, 67, 75, 89, 46, 46, 46, 32, 32, 32,
-     32, 32, 32, 78, 69, 88, 84, 32, 68, 69, 65, 76, 46, 46, 46, 73,
-     32, 67, 85, 84, 32, 84, 72, 69, 32, 67, 65, 82, 68, 83, 46, 32,
-     32, 32, 32, 32, 73, 39, 77, 32, 78, 79, 84, 32, 76, 73, 75, 73,
-     78, 71, 32, 84, 72, 73, 83, 46, 46, 46, 32, 32, 32, 32, 32, 84,
-     72, 69, 83, 69, 32, 67, 65, 82, 68, 83, 32, 82, 69, 65, 76, 76,
-     89, 32, 83, 84, 73, 78, 75, 33, 32, 32, 32, 32, 32, 78,200,125,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 78, 85, 84, 83, 46, 46,
-     46, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 65, 32,
-     66, 65, 68, 32, 84, 82, 65, 78, 83, 73, 83, 84, 79, 82, 32, 77,
-     65, 68, 69, 32, 77, 69, 32, 66, 69, 84, 33, 32, 73, 84, 39, 83,
-     32, 65, 32, 71, 65, 77, 69, 33, 32, 83, 84, 79, 80, 32, 68, 82,
-     79, 79, 76, 73, 78, 71, 33, 33, 33, 32, 87, 72, 79, 32, 68, 69,
-     65, 76, 84, 32, 84, 72, 69, 83, 69, 32, 67, 82, 85, 77, 77, 89,
-     32, 67, 65, 82, 68, 83, 63, 32, 73, 67, 75, 46, 46, 78,201,125,
-     46, 73, 39, 77, 32, 71, 69, 84, 84, 73, 78, 71, 32, 71, 79, 79,
-     83, 69, 66, 85, 77, 80, 83, 46, 32,  3,  1, 32, 83, 75, 73, 82,
-     84, 32, 32, 32, 66, 76, 79, 85, 83, 69, 32, 32, 85, 78, 68, 73,
-     69, 83, 32, 32, 85, 78, 68, 73, 69, 83, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32,
-     32, 32, 32, 32, 32, 32,  0,100,  0, 12,  0,  0, 64, 76,  0,125,
-     31, 14, 65, 22,  0,  0,  0,  0, 18,251, 20,102, 36, 22,100,125,
-     95, 17, 31,247, 37, 14, 65,  1, 84,  0,  0,  0, 18,138, 20, 31,
-     31,247, 37, 14, 65,  1, 85,  0,  0,  0, 18,131, 20, 45, 31,247,
-     37, 14, 65,  1, 86,  0,  0,  0, 18,131, 20, 65, 31,247, 37, 14,
-     65,  1, 87,  0,  0,  0, 18, 14, 64,101,  0,  0,  0,  0, 20, 77,
-     31, 14, 65, 21, 54,  0,  0,  0, 18,248, 20, 95, 31, 14, 65, 21,
-     64,  0,  0,  0, 18, 14, 64, 18,  0,  0,  0,  0, 22,110,125, 27,
-     24, 54,180, 45, 63, 58,244, 60,176, 60, 14, 65,  1, 18,203,125,
-     96,  0,  0,  0, 60,132, 44, 20, 27, 36, 22,200,125, 67, 64, 54,
-    174, 45, 63, 58, 67, 58, 15, 42,104,104,133,204,104,133,203,104,
-    133,205,230,205,104,170,232,104,104,133,206,160,  0,177,203, 69,
-    206,145,203,230,206,200,208,  2,230,204,202,208,240,198,205,208,
-    236, 96, 44, 60,227, 60,228, 60,174, 44, 20, 67, 36, 22, 44,126,
-     83, 67,  8,174, 45, 70, 58, 14, 65,  1, 48,  0,  0,  0, 44, 37,
-     14, 65,  2, 86,  0,  0,  0, 36, 70, 58, 14, 65,  1, 49,  0,  0,
-      0, 44, 25, 70, 58, 14, 65,  1, 50,  0,  0,  0, 44, 18,204,125,
-     37, 14, 65,  2, 86,  0,  0,  0, 36, 70, 58, 14, 65,  1, 51,  0,
-      0,  0, 44, 20, 79, 31,174, 18, 14, 65,  1, 37,  0,  0,  0, 20,
-     83,  9,174, 22, 54,126,  0, 51, 31, 70, 58, 14, 65,  1, 56,  0,
-      0,  0, 44, 37, 14, 65,  2, 86,  0,  0,  0, 36, 70, 58, 14, 65,
-      1, 57,  0,  0,  0, 44, 37, 14, 64,  2,  0,  0,  0,  0, 18, 14,
-      0,  0,  0,  0,  0,  0, 20, 60, 25, 15,  4, 68, 58, 83, 80, 20,
-     63, 22, 22,  0,128, 13, 13, 10, 14, 66,  3, 35,  0,  0,  0, 22,
-    125,125,125,125,125,125,125,125,125,125,125,125,125, 16,  0,112,
-    255,255,  0,  6,188,  6,162,  0,189, 26,  3,201, 69,240,  5,232,
-    232,232,208,244,232,142,105,  6,189, 26,  3,133,205,169,107,157,
-     26,  3,232,189, 26,  3,133,206,169,  6,157, 26,  3,160,  0,162,
-     16,177,205,153,107,  6,200,202,208,247,169, 67,141,111,  6,169,
-      6,141,112,  6,169, 65,141,106,  6, 96,172,106,  6,240,  9,185,
-    123,  6,206,106,  6,160,  1, 96,138, 72,174,105,  6,165,205,157,
-     26,  3,232,165,206,157, 26,  3,104,170,169,155,160,  1, 96,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 62,206,125,
-     76,  0,  0,  0, 34, 80, 83, 58, 68, 34, 78, 85, 82, 58, 34, 82,
-     69, 75, 79, 80, 32, 80, 73, 82, 84, 83, 34, 59, 54, 35, 63, 58,
-     54, 44, 51, 46, 83, 79, 80, 58, 34, 46, 46, 46, 71, 78, 73, 68,
-     65, 79, 76, 34, 59, 54, 35, 63, 58, 52, 44, 51, 46, 83, 79, 80,
-     58, 55, 49, 46, 82, 71,255,255,226,  2,227,  2,  0,  6,  9,185,
-    123,  6,206,106,  6,160,  1, 96,138, 72,174,105,  6,165,205,157,
-     26,  3,232,165,206,157, 26,  3,104,170,169,155,160,  1, 96,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 60,  0, 78,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-      0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26,
-     26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26, 26
-]);
-
-export const ATR_FILENAME = 'Strip Poker.atr';
-
-// Get embedded ATR as ArrayBuffer
-export function getEmbeddedATR() {
-    return EMBEDDED_ATR_DATA.buffer;
-}
-
-// Editable game text strings
-export const EDITABLE_TEXTS = [
-    { offset: 8997, length: 34, text: "!    PUSH MY TRIGGER FOR OPPONENTS", description: "Trigger message" },
-    { offset: 9259, length: 34, text: "!THAT'S AS FAR AS I GO FOR FREE!!!", description: "Free limit message" },
-    { offset: 9509, length: 39, text: "& LOAD NEW OPPONENT DISK...PRESS RETURN", description: "Load opponent prompt" },
-    { offset: 10227, length: 25, text: "WE BOTH STAYED - NEW DEAL", description: "Both stayed message" },
-    { offset: 20956, length: 18, text: "-KEEP YOUR CLOTHES", description: "Keep clothes message" },
-    { offset: 21184, length: 18, text: "WE TIED...NEW DEAL", description: "Tie message" },
-    { offset: 24793, length: 26, text: "YOU'LL HAVE TO OFFER YOUR ", description: "Player offer prompt" },
-    { offset: 26656, length: 27, text: " PRETTY LUCKY!!! TRY AGAIN?", description: "Lucky message" },
-    { offset: 26817, length: 22, text: "I'LL HAVE TO OFFER MY ", description: "Opponent offer message" },
-    { offset: 27100, length: 20, text: "YOU LOST YOUR UNDIES", description: "Lost undies" },
-    { offset: 27191, length: 19, text: "YOU LOST YOUR PANTS", description: "Lost pants" },
-    { offset: 27279, length: 21, text: "} WON BACK YOUR PANTS", description: "Won back pants" },
-    { offset: 27364, length: 17, text: "YOU LOST YOUR TOP", description: "Lost top" },
-    { offset: 27448, length: 21, text: "YOU WON BACK YOUR TOP", description: "Won back top" },
-];
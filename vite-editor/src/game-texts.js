@@ -0,0 +1,21 @@
+// Game text strings the editor can change, as byte offsets into the ATR
+// image. The disk itself is loaded from the bundle (see disk-bundle.js).
+
+export const ATR_FILENAME = 'Strip Poker.atr';
+
+export const EDITABLE_TEXTS = [
+    { offset: 8997, length: 34, text: "!    PUSH MY TRIGGER FOR OPPONENTS", description: "Trigger message" },
+    { offset: 9259, length: 34, text: "!THAT'S AS FAR AS I GO FOR FREE!!!", description: "Free limit message" },
+    { offset: 9509, length: 39, text: "& LOAD NEW OPPONENT DISK...PRESS RETURN", description: "Load opponent prompt" },
+    { offset: 10227, length: 25, text: "WE BOTH STAYED - NEW DEAL", description: "Both stayed message" },
+    { offset: 20956, length: 18, text: "-KEEP YOUR CLOTHES", description: "Keep clothes message" },
+    { offset: 21184, length: 18, text: "WE TIED...NEW DEAL", description: "Tie message" },
+    { offset: 24793, length: 26, text: "YOU'LL HAVE TO OFFER YOUR ", description: "Player offer prompt" },
+    { offset: 26656, length: 27, text: " PRETTY LUCKY!!! TRY AGAIN?", description: "Lucky message" },
+    { offset: 26817, length: 22, text: "I'LL HAVE TO OFFER MY ", description: "Opponent offer message" },
+    { offset: 27100, length: 20, text: "YOU LOST YOUR UNDIES", description: "Lost undies" },
+    { offset: 27191, length: 19, text: "YOU LOST YOUR PANTS", description: "Lost pants" },
+    { offset: 27279, length: 21, text: "} WON BACK YOUR PANTS", description: "Won back pants" },
+    { offset: 27364, length: 17, text: "YOU LOST YOUR TOP", description: "Lost top" },
+    { offset: 27448, length: 21, text: "YOU WON BACK YOUR TOP", description: "Won back top" },
+];
@@ -1,8 +1,10 @@
 import './style.css';
-import { getEmbeddedATR, ATR_FILENAME, EDITABLE_TEXTS, EMBEDDED_ATR_DATA } from './embedded-atr-binary.js';
+import { ATR_FILENAME, EDITABLE_TEXTS } from './game-texts.js';
+import { openDiskBundle } from './disk-bundle.js';
 
 // --- Global State ---
-let atrBuffer = null;
+let atrBuffer = null;     // whole ATR image, fetched from the bundle on first write
+let diskBundle = null;    // lazy disk bundle (see disk-bundle.js), null for a loaded file
 let diskFiles = [];
 let currentFile = null;
 let currentFileOriginalData = null; // Store original decrypted data to preserve trailing bytes
@@ -83,6 +85,25 @@ function getFileChain(startSector) {
     return chain;
 }
 
+// File bytes: from the ATR image once it is loaded (so edits show), else
+// from the disk bundle without fetching the whole image
+async function loadFileData(file) {
+    if (atrBuffer) return readFileData(file);
+    const fileData = await diskBundle.loadFile(file.name);
+    file.originalSize = fileData.length;
+    return fileData;
+}
+
+// The ATR image, fetched from the bundle the first time something is
+// written to the disk
+async function ensureAtrBuffer() {
+    if (!atrBuffer && diskBundle) {
+        document.getElementById('status').textContent = `Loading ${ATR_FILENAME}...`;
+        atrBuffer = new Uint8Array(await diskBundle.loadAtr());
+    }
+    return atrBuffer;
+}
+
 function readFileData(file) {
     const chain = getFileChain(file.startSector);
     let bytes = [];
@@ -169,21 +190,65 @@ function renderFileList() {
     });
 }
 
-function selectFile(file) {
+// Frame from the disk bundle: pixels were decrypted at build time, so only
+// the footer needs the cipher (seed is null for an unencrypted bitmap)
+function frameToData(frame) {
+    const bitmapSize = frame.width * frame.height / 4;
+    const out = new Uint8Array(bitmapSize + frame.footer.length);
+    for(let i=0; i<bitmapSize; i++) {
+        const p = frame.pixels.subarray(i * 4, i * 4 + 4);
+        out[i] = (p[0] << 6) | (p[1] << 4) | (p[2] << 2) | p[3];
+    }
+    for(let i=0; i<frame.footer.length; i++) {
+        const key = frame.seed === null ? 0 : (frame.seed + bitmapSize + i) & 0xFF;
+        out[bitmapSize + i] = frame.footer[i] ^ key;
+    }
+    return out;
+}
+
+async function selectFile(file) {
     document.querySelectorAll('.file-item').forEach(el => el.classList.remove('active'));
     currentFile = file;
-    const rawData = readFileData(file);
-    let seed = file.name === "OPP" ? 0 : getBestSeed(rawData);
+    let seed, decrypted;
+    if (diskBundle && file.hasFrame) {
+        const frame = await diskBundle.loadFrame(file.name);
+        seed = frame.seed;
+        decrypted = frameToData(frame);
+        file.originalSize = decrypted.length;
+        renderPixelsToCanvas(frame.pixels, frame.width, frame.height);
+    } else {
+        const rawData = await loadFileData(file);
+        seed = file.name === "OPP" ? 0 : getBestSeed(rawData);
+        decrypted = processData(rawData, seed);
+        renderImageToCanvas(decrypted);
+    }
     currentFile.seed = seed;
-    const decrypted = processData(rawData, seed);
 
     // Store original decrypted data to preserve trailing bytes
     currentFileOriginalData = new Uint8Array(decrypted);
 
-    renderImageToCanvas(decrypted);
     document.getElementById('editorControls').style.display = 'flex';
     document.getElementById('placeholder').style.display = 'none';
-    document.getElementById('status').textContent = `Editing ${file.name} (${file.originalSize} bytes, Seed: 0x${seed.toString(16).toUpperCase()})`;
+    const seedText = seed === null ? 'unencrypted' : `Seed: 0x${seed.toString(16).toUpperCase()}`;
+    document.getElementById('status').textContent = `Editing ${file.name} (${file.originalSize} bytes, ${seedText})`;
+}
+
+function renderPixelsToCanvas(pixels, width, height) {
+    const cvs = document.getElementById('editorCanvas');
+    const ctx = cvs.getContext('2d');
+    const imgData = ctx.createImageData(160, 140);
+    const n = Math.min(width, 160);
+    for(let y=0; y<Math.min(height, 140); y++) {
+        for(let x=0; x<n; x++) {
+            const color = PALETTE[pixels[y * width + x]];
+            const idx = (y * 160 + x) * 4;
+            imgData.data[idx] = color.r;
+            imgData.data[idx+1] = color.g;
+            imgData.data[idx+2] = color.b;
+            imgData.data[idx+3] = 255;
+        }
+    }
+    ctx.putImageData(imgData, 0, 0);
 }
 
 function renderImageToCanvas(data) {
@@ -863,14 +928,15 @@ document.getElementById('atrInput').addEventListener('change', (e) => {
     const reader = new FileReader();
     reader.onload = (e) => {
         atrBuffer = new Uint8Array(e.target.result);
+        diskBundle = null;
         parseDirectory();
         document.getElementById('status').textContent = `Loaded ${file.name}`;
     };
     reader.readAsArrayBuffer(file);
 });
 
-document.getElementById('saveAtrBtn').addEventListener('click', () => {
-    if(!atrBuffer) return;
+document.getElementById('saveAtrBtn').addEventListener('click', async () => {
+    if(!await ensureAtrBuffer()) return;
     const blob = new Blob([atrBuffer], {type: "application/octet-stream"});
     const url = URL.createObjectURL(blob);
     const a = document.createElement('a');
@@ -885,11 +951,12 @@ document.getElementById('clearBtn').addEventListener('click', () => {
     ctx.fillRect(0, 0, 160, 140);
 });
 
-document.getElementById('commitBtn').addEventListener('click', () => {
+document.getElementById('commitBtn').addEventListener('click', async () => {
     if(!currentFile) return;
     const rawData = canvasToBinary();
     if (!rawData) return; // Error already shown by canvasToBinary
-    const encrypted = processData(rawData, currentFile.seed);
+    if (!await ensureAtrBuffer()) return;
+    const encrypted = currentFile.seed === null ? rawData : processData(rawData, currentFile.seed);
     if(writeFileData(currentFile, encrypted)) {
         alert(`✓ Updated ${currentFile.name} in memory.\nSize: ${rawData.length} bytes\nNow click "Save ATR" to download.`);
     }
@@ -1096,20 +1163,26 @@ canvas.addEventListener('mousedown', (e) => { isDrawing = true; draw(e); });
 canvas.addEventListener('mousemove', (e) => { if(isDrawing) draw(e); });
 window.addEventListener('mouseup', () => isDrawing = false);
 
-// --- Auto-load embedded ATR on startup ---
-async function autoLoadEmbeddedATR() {
-    try {
-        console.log('Loading embedded Strip Poker.atr...');
-        document.getElementById('status').textContent = 'Loading embedded ATR...';
-
-        // Get embedded ATR data (already a Uint8Array)
-        atrBuffer = new Uint8Array(getEmbeddedATR());
+// --- Auto-load the disk bundle on startup ---
+// Only the manifest (and later the files that are opened) is fetched; the
+// ATR image itself is fetched when something is written to the disk.
+const DISK_BUNDLE_URL = './disks/strip-poker/';
 
-        console.log(`ATR buffer loaded: ${atrBuffer.length} bytes`);
-        console.log(`First 16 bytes: ${Array.from(atrBuffer.slice(0, 16)).join(',')}`);
-
-        // Use the same parseDirectory function as file loading
-        parseDirectory();
+async function autoLoadDiskBundle() {
+    try {
+        console.log(`Loading disk bundle ${DISK_BUNDLE_URL}...`);
+        document.getElementById('status').textContent = 'Loading disk...';
+
+        diskBundle = await openDiskBundle(DISK_BUNDLE_URL);
+        atrBuffer = null;
+        diskFiles = diskBundle.files.map(f => ({
+            name: f.name,
+            startSector: f.start,
+            sectorCount: f.sectors,
+            flag: f.flag,
+            hasFrame: Boolean(f.frame)
+        }));
+        renderFileList();
 
         console.log(`Parsed ${diskFiles.length} files`);
         diskFiles.forEach(f => console.log(`  - ${f.name}: sector ${f.startSector}, count ${f.sectorCount}`));
@@ -1120,7 +1193,7 @@ async function autoLoadEmbeddedATR() {
         // Show tabs and initialize text editor
         document.getElementById('tabNav').style.display = 'block';
         showTab('image');
-        initializeTextEditor();
+        await initializeTextEditor();
 
         console.log('Load complete!');
     } catch (error) {
@@ -1160,11 +1233,11 @@ document.getElementById('textTabBtn').addEventListener('click', () => showTab('t
 // --- Text Editor Functions ---
 
 // Helper function to read a complete file from disk (handles sector chains)
-function readCompleteFile(fileName) {
+async function readCompleteFile(fileName) {
     const file = diskFiles.find(f => f.name === fileName);
     if (!file) return null;
 
-    const data = readFileData(file);
+    const data = await loadFileData(file);
     return data;
 }
 
@@ -1196,11 +1269,11 @@ function writeCompleteFile(fileName, data) {
 }
 
 // Load COM file texts
-function loadCOMTexts() {
+async function loadCOMTexts() {
     const comTexts = { COM1: [], COM2: [] };
 
     for (const fileName of ['COM1', 'COM2']) {
-        const data = readCompleteFile(fileName);
+        const data = await readCompleteFile(fileName);
         if (data) {
             // Each comment is 30 chars, there are 30 comments (900 bytes total)
             for (let i = 0; i < 30; i++) {
@@ -1214,7 +1287,7 @@ function loadCOMTexts() {
     return comTexts;
 }
 
-function initializeTextEditor() {
+async function initializeTextEditor() {
     const container = document.getElementById('textEditorList');
     container.innerHTML = '';
 
@@ -1268,7 +1341,7 @@ function initializeTextEditor() {
     com1Section.innerHTML = '<h3 style="color: #4CAF50; margin: 30px 0 10px 0;">COM1 - Opponent Comments (Set 1)</h3>';
     container.appendChild(com1Section);
 
-    const comTexts = loadCOMTexts();
+    const comTexts = await loadCOMTexts();
 
     comTexts.COM1.forEach((text, index) => {
         const div = document.createElement('div');
@@ -1340,8 +1413,8 @@ function initializeTextEditor() {
     });
 }
 
-function saveTextChanges() {
-    if (!atrBuffer) {
+async function saveTextChanges() {
+    if (!await ensureAtrBuffer()) {
         alert('No ATR loaded!');
         return;
     }
@@ -1458,10 +1531,10 @@ document.addEventListener('keydown', (e) => {
     }
 });
 
-// Auto-load embedded ATR on page load
+// Auto-load the disk bundle on page load
 window.addEventListener('DOMContentLoaded', () => {
-    console.log('Page loaded, auto-loading embedded ATR...');
-    autoLoadEmbeddedATR();
+    console.log('Page loaded, auto-loading disk bundle...');
+    autoLoadDiskBundle();
 
     // Setup crop selection on original canvas
     setupCropSelection();
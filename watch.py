@@ -0,0 +1,364 @@
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from PIL import Image
+
+from convert_images import unpack_mode15, render_png
+from decrypt_images import decrypt_frame
+from extract_atr import read_header, read_directory, read_file, walk_chain
+from filetype import classify, BITMAP, ENCRYPTED_BITMAP
+from instrument import span, count, setup_logging, init_worker, worker_config
+from result_cache import source_version
+
+log = logging.getLogger(__name__)
+
+# Incremental watch mode: keep extracted files, frame PNGs and thumbnails up
+# to date while ATR images or extracted files are being edited.
+#
+#   python3 watch.py "Strip Poker.atr" extracted/ --out build/
+#
+# Dependency graph:
+#
+#   disk (ATR) -> file on the disk -> frame -> PNG + thumbnail
+#   loose file (e.g. extracted/OP1.1)  -> frame -> PNG + thumbnail
+#
+# Inputs are polled by mtime and size; a changed stat triggers a content
+# hash, and only a changed hash invalidates anything. For a changed ATR the
+# old and new images are compared sector by sector, and only files whose
+# sector chain (or directory entry) changed are read again. A file whose
+# bytes are unchanged stops the invalidation there, so saving one frame
+# re-renders one frame.
+#
+# Frame work runs in a process pool behind an asyncio semaphore (--jobs),
+# while polling carries on. Saves that arrive while a node is being rebuilt
+# are coalesced: the node runs once more with the newest bytes when the
+# current run finishes, and the outdated result is dropped.
+#
+# An input that can't be read (removed mid-save, half-written ATR) or a
+# frame whose build fails is logged and tried again on the next poll; it
+# never stops the watcher.
+#
+# State (hashes of inputs, files and what each output was built from) is
+# kept in <out>/.watch-state.json, so a restart only rebuilds what changed
+# while it was not running. Outputs:
+#   <out>/<file>_decrypted.png      encrypted frames (as decrypt_images.py)
+#   <out>/<file>.png                raw Mode 15 bitmaps (as convert_images.py)
+#   <out>/thumbs/<png name>         half size thumbnails
+# and for files on a watched ATR the same under <out>/<disk name>/, next to
+# the extracted files themselves.
+
+STATE_FILE = ".watch-state.json"
+STATE_FORMAT = 1
+THUMB_SIZE = (80, 70)
+DIR_SECTORS = range(360, 369)       # VTOC + directory
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def changed_sectors(old, new, sector_size):
+    # Sector numbers whose bytes differ between two images of one geometry,
+    # or None if the images can't be compared (size or header changed).
+    if old is None or len(old) != len(new) or old[:16] != new[:16]:
+        return None
+    a = np.frombuffer(old, dtype=np.uint8)[16:]
+    b = np.frombuffer(new, dtype=np.uint8)[16:]
+    offsets = np.nonzero(a != b)[0]
+    if sector_size > 128:
+        boot = offsets < 3 * 128
+        sectors = np.where(boot, offsets // 128 + 1, 4 + (offsets - 3 * 128) // sector_size)
+    else:
+        sectors = offsets // sector_size + 1
+    return set(np.unique(sectors).tolist())
+
+def render_outputs(data, name):
+    # Runs in a worker process: (kind, {output name: bytes}) for one file,
+    # with no outputs if it isn't a frame. Matches the output of decrypt_images.py and
+    # convert_images.py.
+    result = classify(data)
+    if result.kind == ENCRYPTED_BITMAP:
+        plain, _ = decrypt_frame(data, name, result.details["seed"])
+        png = render_png(unpack_mode15(plain), 160, len(data) // 40)
+        png_name = f"{name}_decrypted.png"
+    elif result.kind == BITMAP:
+        png = render_png(unpack_mode15(data), 160, 140)
+        png_name = f"{name}.png"
+    else:
+        return result.kind, {}
+    thumb = io.BytesIO()
+    Image.open(io.BytesIO(png)).convert("RGB").resize(THUMB_SIZE, Image.BOX).save(thumb, format="PNG")
+    return result.kind, {png_name: png, os.path.join("thumbs", png_name): thumb.getvalue()}
+
+class Pipeline:
+    def __init__(self, inputs, out_dir, jobs=None, executor=None):
+        self.inputs = inputs
+        self.out_dir = out_dir
+        self.version = source_version(__name__, "convert_images", "decrypt_images", "xor_cipher", "filetype")
+        self.jobs = jobs
+        self.own_executor = executor is None
+        self.executor = executor or self._new_executor()
+        self.limit = asyncio.Semaphore(jobs or os.cpu_count() or 1)
+        self.images = {}            # ATR path -> last image bytes
+        self.chains = {}            # ATR path -> {file name: sector chain}
+        self.running = {}           # file key -> task
+        self.pending = {}           # file key -> newest (name, data, subdir, time) to build
+        self.failed = {}            # file key -> (name, data, subdir) to retry on the next poll
+        self.errors = {}            # input path -> last error, logged once
+        self.state = self._load_state()
+
+    def _new_executor(self):
+        return ProcessPoolExecutor(self.jobs, initializer=init_worker, initargs=(worker_config(),))
+
+    # --- State ---
+
+    def _state_path(self):
+        return os.path.join(self.out_dir, STATE_FILE)
+
+    def _load_state(self):
+        try:
+            with open(self._state_path()) as f:
+                state = json.load(f)
+            if state.get("format") == STATE_FORMAT and state.get("version") == self.version:
+                return state
+            log.info("Code or state format changed, rebuilding everything")
+        except (FileNotFoundError, ValueError):
+            pass
+        return {"format": STATE_FORMAT, "version": self.version, "inputs": {}, "files": {}}
+
+    def save_state(self):
+        _write_atomic(self._state_path(), json.dumps(self.state, indent=1).encode())
+
+    # --- Inputs ---
+
+    def _expand(self):
+        paths = []
+        for path in self.inputs:
+            if os.path.isdir(path):
+                paths.extend(sorted(os.path.join(path, n) for n in os.listdir(path)
+                                    if os.path.isfile(os.path.join(path, n))
+                                    and not n.endswith((".png", ".tmp"))))
+            elif os.path.exists(path):
+                paths.append(path)
+        return paths
+
+    async def scan(self):
+        # One polling pass: returns the number of inputs whose content changed
+        # (plus removed inputs and retried frames)
+        loop = asyncio.get_running_loop()
+        seen = set()
+        changed = 0
+        for key, (name, data, subdir) in list(self.failed.items()):
+            del self.failed[key]
+            self.submit(key, name, data, subdir)
+            changed += 1
+        for path in self._expand():
+            seen.add(path)
+            try:
+                changed += await self.scan_input(loop, path)
+                self.errors.pop(path, None)
+            except (OSError, ValueError, IndexError, struct.error) as e:
+                # Not recorded in the state, so the next poll reads it again
+                message = f"{e.__class__.__name__}: {e}"
+                if self.errors.get(path) != message:
+                    log.warning(f"{path}: {message}, retrying")
+                self.errors[path] = message
+                count("input_errors")
+        for path in list(self.state["inputs"]):
+            if path not in seen:
+                self.forget_input(path)
+                changed += 1
+        for path in list(self.errors):
+            if path not in seen:
+                del self.errors[path]
+        return changed
+
+    async def scan_input(self, loop, path):
+        st = os.stat(path)
+        known = self.state["inputs"].get(path)
+        if known and known["mtime"] == st.st_mtime_ns and known["size"] == st.st_size:
+            return 0
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = await loop.run_in_executor(None, sha256, data)
+        stat = {"mtime": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+        if known and known["sha256"] == digest:
+            self.state["inputs"][path] = stat
+            return 0            # touched, not changed
+        if path.lower().endswith(".atr"):
+            self.update_disk(path, data)
+        else:
+            self.submit(path, os.path.basename(path), data)
+        self.state["inputs"][path] = stat
+        return 1
+
+    def update_disk(self, path, image):
+        f = io.BytesIO(image)
+        geometry = read_header(f)
+        if geometry is None:
+            raise ValueError("not an ATR image")
+        sector_size, sector_count = geometry
+        max_sector = min(sector_count, 1023)
+        dirty = changed_sectors(self.images.get(path), image, sector_size)
+        old_chains = self.chains.get(path, {})
+
+        chains = {}
+        prefix = os.path.splitext(os.path.basename(path))[0]
+        with span("update_disk", atr=path, sectors=-1 if dirty is None else len(dirty)):
+            for fname, start, flag in read_directory(f, sector_size):
+                chain = walk_chain(f, start, sector_size, max_sector)
+                chains[fname] = chain
+                if dirty is not None and fname in old_chains and old_chains[fname] == chain \
+                        and not dirty.intersection(chain) and not dirty.intersection(DIR_SECTORS):
+                    continue
+                data = bytes(read_file(f, start, sector_size, max_sector))
+                key = f"{path}:{fname}"
+                if self.state["files"].get(key, {}).get("sha256") == sha256(data):
+                    continue
+                _write_atomic(os.path.join(self.out_dir, prefix, fname), data)
+                count("files_extracted")
+                self.submit(key, fname, data, prefix)
+        # Only a fully read image becomes the base for the next sector diff
+        self.images[path] = image
+        self.chains[path] = chains
+        for key in [k for k in self.state["files"] if k.startswith(f"{path}:")]:
+            if key.split(":", 1)[1] not in chains:
+                self.forget_file(key)
+
+    def forget_input(self, path):
+        del self.state["inputs"][path]
+        self.images.pop(path, None)
+        self.chains.pop(path, None)
+        for key in [k for k in self.state["files"] if k == path or k.startswith(f"{path}:")]:
+            self.forget_file(key)
+
+    def forget_file(self, key):
+        self.failed.pop(key, None)
+        entry = self.state["files"].pop(key, {})
+        for name in entry.get("outputs", []):
+            try:
+                os.unlink(os.path.join(self.out_dir, name))
+            except FileNotFoundError:
+                pass
+        log.info(f"Removed {key}")
+
+    # --- Frames ---
+
+    def submit(self, key, name, data, subdir=""):
+        # Schedule a rebuild of one file node; coalesces with a running one
+        self.pending[key] = (name, data, subdir, time.perf_counter())
+        if key not in self.running:
+            self.running[key] = asyncio.create_task(self._build(key))
+
+    async def _build(self, key):
+        try:
+            while key in self.pending:
+                name, data, subdir, queued = self.pending.pop(key)
+                try:
+                    await self._build_one(key, name, data, subdir, queued)
+                except Exception as e:
+                    # One bad frame must not stop the watcher
+                    log.warning(f"{key}: build failed ({e.__class__.__name__}: {e}), retrying on the next poll")
+                    count("build_errors")
+                    if isinstance(e, BrokenProcessPool) and self.own_executor:
+                        self.executor.shutdown(wait=False)
+                        self.executor = self._new_executor()
+                    if key not in self.pending:
+                        self.failed[key] = (name, data, subdir)
+        finally:
+            del self.running[key]
+
+    async def _build_one(self, key, name, data, subdir, queued):
+        loop = asyncio.get_running_loop()
+        digest = sha256(data)
+        entry = self.state["files"].get(key)
+        if entry and entry["sha256"] == digest:
+            return
+        async with self.limit:
+            with span("build_frame", file=key):
+                kind, outputs = await loop.run_in_executor(self.executor, render_outputs, data, name)
+        outputs = {os.path.join(subdir, n): blob for n, blob in outputs.items()}
+        if key in self.pending:
+            return          # newer bytes arrived meanwhile, this result is stale
+        old = set(entry["outputs"]) if entry else set()
+        for out_name, blob in outputs.items():
+            _write_atomic(os.path.join(self.out_dir, out_name), blob)
+        for stale in old - set(outputs):
+            try:
+                os.unlink(os.path.join(self.out_dir, stale))
+            except FileNotFoundError:
+                pass
+        self.state["files"][key] = {"sha256": digest, "kind": kind, "outputs": sorted(outputs)}
+        count("frames_built", 1 if outputs else 0)
+        if outputs:
+            log.info(f"{key}: {kind} -> {', '.join(sorted(outputs))} "
+                     f"({(time.perf_counter() - queued) * 1000:.0f} ms)")
+
+    async def drain(self):
+        while self.running:
+            await asyncio.gather(*list(self.running.values()))
+
+    async def run_once(self):
+        changed = await self.scan()
+        await self.drain()
+        self.save_state()
+        return changed
+
+    async def watch(self, interval=0.5):
+        # Polling goes on while frames build, so a save during a build is
+        # seen (and coalesced) right away. The state is written once no
+        # build is running: before that it would record inputs whose
+        # outputs aren't built yet.
+        log.info(f"Watching {', '.join(self.inputs)} -> {self.out_dir}")
+        unsaved = False
+        while True:
+            if await self.scan():
+                unsaved = True
+            if unsaved and not self.running:
+                self.save_state()
+                unsaved = False
+            await asyncio.sleep(interval)
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild extracted files, frame PNGs and thumbnails as inputs change.")
+    parser.add_argument("inputs", nargs="+", help="ATR images, files or directories (e.g. extracted/)")
+    parser.add_argument("--out", default="build", help="output directory (default build/)")
+    parser.add_argument("--jobs", type=int, default=None, help="concurrent frame builds (default: CPU count)")
+    parser.add_argument("--interval", type=float, default=0.5, help="polling interval in seconds")
+    parser.add_argument("--once", action="store_true", help="bring outputs up to date and exit")
+    args = parser.parse_args()
+    setup_logging()
+
+    async def run():
+        pipeline = Pipeline(args.inputs, args.out, args.jobs)
+        try:
+            if args.once:
+                n = await pipeline.run_once()
+                log.info(f"{n} input(s) changed")
+            else:
+                await pipeline.watch(args.interval)
+        finally:
+            pipeline.executor.shutdown()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+from instrument import count
+
+# The rolling XOR cipher of the game's pictures and card font:
+#
+#   Enc[i] = Raw[i] ^ ((seed + i) & 0xFF)
+#
+# Kept apart from decrypt_images.py (seed search, result cache, PNG output)
+# so modules that only need the cipher, like charset.py, don't pull those in.
+
+def decrypt(payload, seed):
+    # The cipher is its own inverse, so this also encrypts.
+    decrypted = bytearray()
+    s = seed
+    for b in payload:
+        decrypted.append(b ^ s)
+        s = (s + 1) & 0xFF
+    count("bytes_decrypted", len(decrypted))
+    return decrypted